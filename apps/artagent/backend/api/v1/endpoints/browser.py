@@ -75,6 +75,7 @@ from apps.artagent.backend.voice import (
     VoiceHandlerConfig,
     pcm16le_rms,
 )
+from ..events.call_routing import get_call_session_router
 from ..schemas.realtime import RealtimeStatusResponse
 
 logger = get_logger("api.v1.endpoints.browser")
@@ -610,6 +611,9 @@ async def _bind_call_session(
             except Exception:
                 pass
 
+    # Other replicas may have cached this call as unmapped
+    await get_call_session_router().rebind(call_connection_id, session_id)
+
     conn_manager = getattr(app_state, "conn_manager", None)
     if conn_manager:
         try:
@@ -743,7 +747,11 @@ async def _cleanup_conversation(
             # Persist analytics
             if memory_manager and hasattr(websocket.app.state, "cosmos"):
                 try:
-                    await build_and_flush(memory_manager, websocket.app.state.cosmos)
+                    await build_and_flush(
+                        memory_manager,
+                        websocket.app.state.cosmos,
+                        getattr(websocket.app.state, "analytics_writer", None),
+                    )
                 except Exception as e:
                     logger.error("[%s] Analytics persist error: %s", session_id, e)
 
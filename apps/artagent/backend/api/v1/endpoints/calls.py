@@ -5,7 +5,6 @@ Call Management Endpoints
 REST API endpoints for managing phone calls through Azure Communication Services.
 """
 
-import asyncio
 from typing import Any
 
 from apps.artagent.backend.api.v1.schemas.call import (
@@ -502,21 +501,16 @@ async def terminate_call(request: Request, payload: CallTerminateRequest) -> Cal
             detail="ACS infrastructure not initialized",
         )
 
-    acs_client = getattr(acs_caller, "client", None)
-    if not acs_client:
+    call_control = getattr(acs_caller, "call_control", None)
+    if not call_control:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail="ACS client unavailable",
         )
 
     try:
-        call_conn = acs_client.get_call_connection(payload.call_id)
-        # hang_up is a synchronous SDK method - run in executor to avoid blocking
-        loop = asyncio.get_running_loop()
-        await asyncio.wait_for(
-            loop.run_in_executor(None, lambda: call_conn.hang_up(is_for_everyone=True)),
-            timeout=5.0,
-        )
+        # Timeout and retries are applied per attempt by the call-control facade
+        await call_control.hang_up(payload.call_id)
     except TimeoutError:
         raise HTTPException(
             status_code=status.HTTP_504_GATEWAY_TIMEOUT,
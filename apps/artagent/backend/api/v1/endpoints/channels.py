@@ -53,7 +53,12 @@ def get_context_manager_from_state(request: Request) -> CustomerContextManager:
         logger.warning("CustomerContextManager not in app.state, creating fallback instance")
         cosmos = getattr(request.app.state, "cosmos", None)
         redis = getattr(request.app.state, "redis", None)
-        context_mgr = CustomerContextManager(cosmos_manager=cosmos, redis_manager=redis)
+        # No flush loop runs for an ad-hoc instance, so write straight through
+        context_mgr = CustomerContextManager(
+            cosmos_manager=cosmos,
+            redis_manager=redis,
+            durability="write_through",
+        )
     return context_mgr
 
 
@@ -332,7 +337,11 @@ async def webchat_websocket(websocket: WebSocket, customer_id: str):
         # Fallback
         cosmos = getattr(websocket.app.state, "cosmos", None)
         redis = getattr(websocket.app.state, "redis", None)
-        context_mgr = CustomerContextManager(cosmos_manager=cosmos, redis_manager=redis)
+        context_mgr = CustomerContextManager(
+            cosmos_manager=cosmos,
+            redis_manager=redis,
+            durability="write_through",
+        )
 
     try:
         # Accept connection
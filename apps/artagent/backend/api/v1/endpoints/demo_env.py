@@ -17,6 +17,10 @@ from src.stateful.state_managment import MemoManager
 
 # Import MOCK_CLAIMS for test scenario support
 from apps.artagent.backend.registries.toolstore.insurance.constants import MOCK_CLAIMS
+from apps.artagent.backend.registries.toolstore.profile_lookup import (
+    get_profile_lookup_cache,
+    with_lookup_keys,
+)
 
 __all__ = ["router"]
 
@@ -1421,7 +1425,8 @@ def _serialize_demo_user(response: DemoUserResponse) -> dict:
             "claims": [c.model_dump(mode="json") for c in response.claims] if response.claims else None,
         },
     }
-    return document
+    # Normalized keys for the indexed claim/policy/identity lookups used by tools
+    return with_lookup_keys(document)
 
 
 async def _persist_demo_user(response: DemoUserResponse) -> None:
@@ -1453,6 +1458,9 @@ async def _persist_demo_user(response: DemoUserResponse) -> None:
             detail="Unable to persist demo profile.",
         ) from exc
 
+    # A re-created profile may reuse a cached name or claim number
+    get_profile_lookup_cache().clear()
+
 
 async def _append_phrase_bias_entries(profile: DemoUserProfile, request: Request) -> None:
     """Add demo user's key identifiers to the shared phrase list manager if configured."""
@@ -11,6 +11,7 @@ impacting real-time audio processing.
 """
 
 import asyncio
+import json
 import os
 import re
 import time
@@ -19,11 +20,12 @@ from dataclasses import dataclass, field
 from typing import Any
 
 from config import (
+    HEALTH_MONITOR_INTERVAL,
     get_provider_status,
     refresh_appconfig_cache,
 )
 from fastapi import APIRouter, HTTPException, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import BaseModel
 
 
@@ -62,12 +64,15 @@ from apps.artagent.backend.api.v1.schemas.health import (
     ReadinessResponse,
     ServiceCheck,
 )
+from apps.artagent.backend.api.v1.utils.health_monitor import HealthComponent, HealthMonitor
 from utils.ml_logging import get_logger
 
 logger = get_logger("v1.health")
 
 router = APIRouter()
 
+_STREAM_KEEPALIVE_S = 15.0
+
 
 # ==============================================================================
 # AGENT REGISTRY - Dynamic Agent Discovery
@@ -435,6 +440,11 @@ async def health_check(request: Request) -> HealthResponse:
     summary="Comprehensive Readiness Check",
     description="""
     Comprehensive readiness probe that checks all critical dependencies with timeouts.
+
+    Results come from a background health monitor. Checks run concurrently and
+    each component is only re-checked once its cached result is older than its
+    staleness bound (5s for Redis, 10-60s for configuration checks), so probe
+    storms do not reach Redis. `age_ms` on each check reports the cache age.
     
     This endpoint verifies:
     - Redis connectivity and performance
@@ -443,6 +453,7 @@ async def health_check(request: Request) -> HealthResponse:
     - ACS caller configuration and connectivity
     - RT Agents initialization
     - Authentication configuration (when ENABLE_AUTH_VALIDATION=True)
+    - App Configuration provider status
     - Event system health
     
     When authentication validation is enabled, checks:
@@ -450,7 +461,7 @@ async def health_check(request: Request) -> HealthResponse:
     - AZURE_TENANT_ID is set and is a valid GUID  
     - ALLOWED_CLIENT_IDS contains at least one valid GUID
     
-    Returns 503 if any critical services are unhealthy, 200 if all systems are ready.
+    Returns 503 if all critical services are unhealthy, 200 otherwise.
     """,
     tags=["Health"],
     responses={
@@ -517,93 +528,120 @@ async def readiness_check(
     request: Request,
 ) -> ReadinessResponse:
     """
-    Comprehensive readiness probe: checks all critical dependencies with timeouts.
-    Returns 503 if any critical services are unhealthy.
+    Comprehensive readiness probe served from the health monitor's cached snapshot.
+    Only components past their staleness bound are re-checked, concurrently.
+    Returns 503 if all critical services are unhealthy.
     """
     start_time = time.time()
-    health_checks: list[ServiceCheck] = []
-    overall_status = "ready"
-    timeout = 1.0  # seconds per check
+    monitor = get_health_monitor(request.app)
+    response_data = _build_readiness(await monitor.get_checks(), start_time)
 
-    async def fast_ping(check_fn, *args, component=None):
-        try:
-            result = await asyncio.wait_for(check_fn(*args), timeout=timeout)
-            return result
-        except Exception as e:
-            return ServiceCheck(
-                component=component or check_fn.__name__,
-                status="unhealthy",
-                error=str(e),
-                check_time_ms=round((time.time() - start_time) * 1000, 2),
-            )
+    # Return appropriate status code
+    status_code = 200 if response_data.status != "unhealthy" else 503
+    return JSONResponse(content=response_data.dict(), status_code=status_code)
 
-    # Pre-compute active session count (thread-safe)
-    active_sessions = 0
-    try:
-        if hasattr(request.app.state, "session_manager"):
-            active_sessions = await request.app.state.session_manager.get_session_count()  # type: ignore[attr-defined]
-    except Exception:
-        active_sessions = -1  # signal error fetching sessions
 
-    # Check Redis connectivity (minimal – no verbose details)
-    redis_status = await fast_ping(_check_redis_fast, request.app.state.redis, component="redis")
-    health_checks.append(redis_status)
+@router.get(
+    "/readiness/stream",
+    summary="Readiness Change Stream",
+    description="""
+    Server-sent events stream of dependency health.
 
-    # Check Azure OpenAI client
-    aoai_status = await fast_ping(
-        _check_azure_openai_fast,
-        request.app.state.aoai_client,
-        component="azure_openai",
-    )
-    health_checks.append(aoai_status)
+    Sends a `snapshot` event with the current readiness payload, then a `change`
+    event whenever a component's status changes. A keepalive comment is sent
+    every 15 seconds while nothing changes.
+    """,
+    tags=["Health"],
+)
+async def readiness_stream(request: Request) -> StreamingResponse:
+    """Stream readiness snapshot and status changes as server-sent events."""
+    monitor = get_health_monitor(request.app)
+    monitor.start()
 
-    # Check Speech Services (configuration & pool readiness)
-    speech_status = await fast_ping(
-        _check_speech_configuration_fast,
-        getattr(request.app.state, "stt_pool", None),
-        getattr(request.app.state, "tts_pool", None),
-        component="speech_services",
+    async def events():
+        changes = monitor.subscribe()
+        try:
+            snapshot = _build_readiness(await monitor.get_checks(), time.time())
+            yield _sse("snapshot", snapshot.dict())
+            while not await request.is_disconnected():
+                try:
+                    change = await asyncio.wait_for(changes.get(), timeout=_STREAM_KEEPALIVE_S)
+                except TimeoutError:
+                    yield ": keepalive\n\n"
+                    continue
+                yield _sse("change", change)
+        finally:
+            monitor.unsubscribe(changes)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
     )
-    health_checks.append(speech_status)
 
-    # Check ACS Caller
-    acs_status = await fast_ping(
-        _check_acs_caller_fast, request.app.state.acs_caller, component="acs_caller"
-    )
-    health_checks.append(acs_status)
 
-    # Check RT Agents (dynamic discovery via registry)
-    agent_status = await fast_ping(
-        _check_rt_agents_fast,
-        request.app.state,
-        component="rt_agents",
-    )
-    health_checks.append(agent_status)
+def _sse(event: str, data: dict[str, Any]) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
 
-    # Check Authentication Configuration
-    auth_config_status = await fast_ping(
-        _check_auth_configuration_fast,
-        component="auth_configuration",
-    )
-    health_checks.append(auth_config_status)
 
-    # Determine overall status
+def _build_readiness(health_checks: list[ServiceCheck], start_time: float) -> ReadinessResponse:
+    """Derive overall readiness from component checks."""
+    overall_status = "ready"
     failed_checks = [check for check in health_checks if check.status != "healthy"]
     if failed_checks:
         overall_status = "degraded" if len(failed_checks) < len(health_checks) else "unhealthy"
 
-    response_time = round((time.time() - start_time) * 1000, 2)
-
-    response_data = ReadinessResponse(
+    return ReadinessResponse(
         status=overall_status,
         timestamp=time.time(),
-        response_time_ms=response_time,
+        response_time_ms=round((time.time() - start_time) * 1000, 2),
         checks=health_checks,
     )
 
-    # Return appropriate status code
-    status_code = 200 if overall_status != "unhealthy" else 503
-    return JSONResponse(content=response_data.dict(), status_code=status_code)
+
+def get_health_monitor(app: Any) -> HealthMonitor:
+    """
+    Return the app's health monitor, creating it on first use.
+
+    Checks read ``app.state`` when they run, so the monitor can be created
+    before every dependency is initialized. Redis is the only check that
+    leaves the process, so it gets the tightest staleness bound.
+    """
+    monitor = getattr(app.state, "health_monitor", None)
+    if monitor is not None:
+        return monitor
+
+    state = app.state
+    monitor = HealthMonitor(
+        [
+            HealthComponent(
+                "redis", lambda: _check_redis_fast(getattr(state, "redis", None)), max_age_s=5.0
+            ),
+            HealthComponent(
+                "azure_openai",
+                lambda: _check_azure_openai_fast(getattr(state, "aoai_client", None)),
+                max_age_s=30.0,
+            ),
+            HealthComponent(
+                "speech_services",
+                lambda: _check_speech_configuration_fast(
+                    getattr(state, "stt_pool", None), getattr(state, "tts_pool", None)
+                ),
+                max_age_s=10.0,
+            ),
+            HealthComponent(
+                "acs_caller",
+                lambda: _check_acs_caller_fast(getattr(state, "acs_caller", None)),
+                max_age_s=30.0,
+            ),
+            HealthComponent("rt_agents", lambda: _check_rt_agents_fast(state), max_age_s=30.0),
+            HealthComponent("auth_configuration", _check_auth_configuration_fast, max_age_s=60.0),
+            HealthComponent("app_configuration", _check_appconfig_fast, max_age_s=30.0),
+        ],
+        interval_s=HEALTH_MONITOR_INTERVAL,
+    )
+    app.state.health_monitor = monitor
+    return monitor
 
 
 @router.get(
@@ -13,9 +13,10 @@ WebSocket Flow:
 """
 
 import asyncio
-import json
 import uuid
 
+from apps.artagent.backend.api.v1.events.call_routing import get_call_session_router
+from apps.artagent.backend.src.orchestration.session_scenarios import evict_session_scenarios
 from apps.artagent.backend.src.ws_helpers.shared_ws import send_agent_inventory
 from apps.artagent.backend.voice import (
     TransportType,
@@ -23,6 +24,7 @@ from apps.artagent.backend.voice import (
     VoiceHandlerConfig,
     VoiceLiveSDKHandler,
 )
+from apps.artagent.backend.voice.shared import AUDIO_DATA_KIND, decode_acs_frame
 from config import ACS_STREAMING_MODE
 from fastapi import APIRouter, HTTPException, WebSocket, WebSocketDisconnect
 from fastapi.websockets import WebSocketState
@@ -62,24 +64,19 @@ async def _resolve_stream_mode(redis_mgr, call_connection_id: str | None) -> Str
 async def _resolve_session_id(
     app_state, call_connection_id: str | None, query_params: dict, headers: dict
 ) -> str:
-    """Resolve session ID: query params > headers > Redis > generate new."""
+    """Resolve session ID: query params > headers > call routing (Redis-backed) > generate new."""
     session_id = query_params.get("session_id") or headers.get("x-session-id")
+    router = get_call_session_router()
     if session_id:
+        router.bind(call_connection_id, session_id)
         return session_id
 
     if call_connection_id and app_state:
-        redis_mgr = getattr(app_state, "redis", None)
-        if redis_mgr:
-            for key in [
-                f"call_session_map:{call_connection_id}",
-                f"call_session_mapping:{call_connection_id}",
-            ]:
-                try:
-                    value = await redis_mgr.get_value_async(key)
-                    if value:
-                        return value.decode() if isinstance(value, bytes) else str(value)
-                except Exception:
-                    pass
+        session_id = await router.resolve(
+            call_connection_id, redis_mgr=getattr(app_state, "redis", None)
+        )
+        if session_id:
+            return session_id
 
     return f"media_{call_connection_id}" if call_connection_id else f"media_{uuid.uuid4().hex[:8]}"
 
@@ -373,14 +370,16 @@ async def _process_media_stream(
 
                 # Handle message based on streaming mode
                 if stream_mode == StreamMode.MEDIA:
-                    try:
-                        parsed_msg = json.loads(msg_text)
-                    except json.JSONDecodeError:
+                    frame = decode_acs_frame(msg_text)
+                    if frame is None:
                         logger.warning(
                             f"[{call_connection_id}] Failed to parse message as JSON"
                         )
                         continue
-                    await handler.handle_media_message(parsed_msg)
+                    if frame.kind == AUDIO_DATA_KIND:
+                        handler.handle_audio_frame(frame.data, frame.silent)
+                    else:
+                        await handler.handle_media_message(frame.message)
                 elif stream_mode == StreamMode.TRANSCRIPTION:
                     await handler.handle_transcription_message(msg_text)
                 elif stream_mode == StreamMode.VOICE_LIVE:
@@ -476,6 +475,9 @@ async def _cleanup_websocket_resources(
                 except Exception as e:
                     logger.error("Error unregistering connection: %s", e)
 
+            # Drop cached session scenarios (Redis keeps the durable copy)
+            evict_session_scenarios(session_id)
+
             # Close WebSocket if still connected
             if (
                 websocket.client_state == WebSocketState.CONNECTED
@@ -8,6 +8,7 @@ Supports Phase 3 Dashboard Integration for the telemetry plan.
 Endpoints:
 - GET /api/v1/metrics/sessions - List active sessions with basic metrics
 - GET /api/v1/metrics/session/{session_id} - Get detailed metrics for a session
+- GET /api/v1/metrics/runtime - Event-loop lag and thread-pool saturation
 """
 
 import json
@@ -424,3 +425,23 @@ async def get_metrics_summary(
         "session_ids": list(manager_data["sessions"].keys()),
         "note": "For detailed latency analysis, use Application Insights KQL queries from TELEMETRY_PLAN.md",
     }
+
+
+@router.get(
+    "/runtime",
+    summary="Get event-loop and executor metrics",
+    description="Event-loop lag, slow-callback origins and thread-pool saturation for this replica.",
+    tags=["Session Metrics"],
+)
+async def get_runtime_metrics(request: Request) -> dict[str, Any]:
+    """
+    Get process runtime health.
+
+    Reports heartbeat lag percentiles and the code that was running when the
+    loop stalled, plus queue wait, run time and busy threads for the default
+    and speech executors.
+    """
+    monitor = getattr(request.app.state, "runtime_monitor", None)
+    if monitor is None:
+        return {"enabled": False}
+    return {"enabled": True, **monitor.snapshot()}
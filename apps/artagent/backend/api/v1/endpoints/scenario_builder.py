@@ -54,6 +54,7 @@ from apps.artagent.backend.src.orchestration.session_scenarios import (
     get_session_scenarios,
     list_session_scenarios,
     list_session_scenarios_by_session,
+    load_session_scenarios_async,
     remove_session_scenario,
     set_session_scenario_async,
 )
@@ -774,6 +775,7 @@ async def get_session_scenario_config(
     request: Request,
 ) -> SessionScenarioResponse:
     """Get the dynamic scenario for a session."""
+    await load_session_scenarios_async(session_id)
     scenario = get_session_scenario(session_id)
 
     if not scenario:
@@ -869,6 +871,7 @@ async def update_session_scenario(
                 detail=f"start_agent '{normalized_start_agent}' not found in registry or session agents",
             )
 
+    await load_session_scenarios_async(session_id)
     existing = get_session_scenario(session_id)
     created_at = time.time()
 
@@ -967,6 +970,7 @@ async def reset_session_scenario(
     request: Request,
 ) -> dict[str, Any]:
     """Remove the dynamic scenario for a session."""
+    await load_session_scenarios_async(session_id)
     removed = remove_session_scenario(session_id)
 
     if not removed:
@@ -1001,6 +1005,7 @@ async def set_active_scenario_endpoint(
         get_session_scenario,
     )
     
+    await load_session_scenarios_async(session_id)
     success = set_active_scenario(session_id, scenario_name)
     
     if not success:
@@ -1106,6 +1111,7 @@ async def list_scenarios_for_session(
     """
     from apps.artagent.backend.src.orchestration.session_scenarios import get_active_scenario_name
     
+    await load_session_scenarios_async(session_id)
     session_scenarios = list_session_scenarios_by_session(session_id)
     active_name = get_active_scenario_name(session_id)
     
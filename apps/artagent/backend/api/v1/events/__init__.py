@@ -6,6 +6,11 @@ Simplified event processing system inspired by Azure's Event Processor pattern.
 Provides clean call event handling without complex middleware.
 """
 
+from .call_routing import (
+    CallSessionRouter,
+    get_call_session_router,
+    reset_call_session_router,
+)
 from .handlers import CallEventHandlers
 from .processor import (
     CallEventProcessor,
@@ -27,6 +32,10 @@ __all__ = [
     "CallEventProcessor",
     "get_call_event_processor",
     "reset_call_event_processor",
+    # Call → session routing
+    "CallSessionRouter",
+    "get_call_session_router",
+    "reset_call_session_router",
     # Handlers and types
     "CallEventHandlers",
     "CallEventContext",
@@ -24,12 +24,14 @@ from apps.artagent.backend.src.ws_helpers.envelopes import (
     make_status_envelope,
 )
 from apps.artagent.backend.src.ws_helpers.shared_ws import broadcast_session_envelope
+from azure.communication.callautomation import PhoneNumberIdentifier
 from azure.core.messaging import CloudEvent
 from config import DTMF_VALIDATION_ENABLED
 from opentelemetry import trace
 from opentelemetry.trace import SpanKind
 from utils.ml_logging import get_logger
 
+from .call_routing import get_call_session_router
 from .types import ACSEventTypes, CallEventContext
 
 logger = get_logger("v1.events.handlers")
@@ -226,8 +228,9 @@ class CallEventHandlers:
             logger.info(f"📞 Call connected: {context.call_connection_id}")
 
             # Extract target phone from call connected event
-            call_conn = context.acs_caller.get_call_connection(context.call_connection_id)
-            participants = call_conn.list_participants()
+            participants = await context.acs_caller.call_control.list_participants(
+                context.call_connection_id
+            )
 
             caller_participant = None
             acs_participant = None
@@ -252,7 +255,7 @@ class CallEventHandlers:
                 try:
                     await DTMFValidationLifecycle.setup_aws_connect_validation_flow(
                         context,
-                        call_conn,
+                        caller_participant.identifier if caller_participant else None,
                     )
                 except Exception as e:
                     logger.error(
@@ -380,6 +383,9 @@ class CallEventHandlers:
             # Clean up call state
             await CallEventHandlers._cleanup_call_state(context)
 
+            # Drop the cached route here and on other replicas
+            await get_call_session_router().invalidate(context.call_connection_id)
+
     @staticmethod
     async def handle_call_transfer_accepted(context: CallEventContext) -> None:
         """
@@ -559,49 +565,11 @@ class CallEventHandlers:
         context: CallEventContext,
     ) -> str | None:
         """Retrieve the browser session ID mapped to a call connection."""
-        key_suffix = context.call_connection_id
-        if not key_suffix:
-            return None
-
-        keys_to_try = [
-            f"call_session_map:{key_suffix}",
-            f"call_session_mapping:{key_suffix}",
-        ]
-
-        # Fallback to redis manager helper if available
-        redis_mgr = getattr(context, "redis_mgr", None)
-        if redis_mgr and hasattr(redis_mgr, "get_value_async"):
-            for redis_key in keys_to_try:
-                try:
-                    redis_value = await redis_mgr.get_value_async(redis_key)
-                    if redis_value:
-                        return (
-                            redis_value.decode("utf-8")
-                            if isinstance(redis_value, (bytes, bytearray))
-                            else str(redis_value)
-                        )
-                except Exception as exc:
-                    logger.warning(
-                        "Failed to fetch session mapping %s via redis_mgr: %s",
-                        redis_key,
-                        exc,
-                    )
-
-        # Final fallback: use connection manager call context (if available)
-        conn_manager = getattr(context.app_state, "conn_manager", None)
-        if conn_manager and hasattr(conn_manager, "get_call_context"):
-            try:
-                ctx = await conn_manager.get_call_context(key_suffix)
-                if ctx:
-                    return ctx.get("browser_session_id") or ctx.get("session_id")
-            except Exception as exc:
-                logger.warning(
-                    "Failed to fetch session mapping %s via conn_manager: %s",
-                    key_suffix,
-                    exc,
-                )
-
-        return None
+        return await get_call_session_router().resolve(
+            context.call_connection_id,
+            redis_mgr=getattr(context, "redis_mgr", None),
+            conn_manager=getattr(context.app_state, "conn_manager", None),
+        )
 
     @staticmethod
     def _describe_transfer_target(event_data: dict[str, Any]) -> str | None:
@@ -909,13 +877,10 @@ class CallEventHandlers:
         """
         try:
             if context.acs_caller:
-                call_conn = context.acs_caller.get_call_connection(context.call_connection_id)
-                if not call_conn:
-                    logger.error("Call connection not found for %s", context.call_connection_id)
-                    return
-
-                await call_conn.start_continuous_dtmf_recognition(
-                    context.call_connection_id, target_phone
+                await context.acs_caller.call_control.start_continuous_dtmf_recognition(
+                    context.call_connection_id,
+                    PhoneNumberIdentifier(target_phone),
+                    operation_context=f"dtmf_recognition_{context.call_connection_id}",
                 )
                 logger.info(f"🔢 DTMF recognition started for {target_phone}")
         except Exception as e:
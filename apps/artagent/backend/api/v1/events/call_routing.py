@@ -0,0 +1,244 @@
+"""
+Call Session Routing
+====================
+
+In-process ``call_connection_id -> session_id`` table used to route ACS
+webhook events to UI sessions without a Redis round trip per event.
+
+- Populated when calls are created or answered and when media connects.
+- Redis (``call_session_map:*`` / ``call_session_mapping:*``) is a
+  read-through backstop for calls bound on another replica. Misses are
+  cached briefly so unmapped calls don't hit Redis on every event.
+- Disconnect invalidates the entry locally and, through the connection
+  manager's distributed bus, on every other replica.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any
+
+from utils.ml_logging import get_logger
+
+logger = get_logger("v1.events.call_routing")
+
+CALL_SESSION_KEYS: tuple[str, ...] = ("call_session_map:{}", "call_session_mapping:{}")
+INVALIDATE_TOPIC = "call_routing.invalidate"
+
+_MAX_ROUTES = 10_000
+_ROUTE_TTL_S = 24 * 3600.0
+_NEGATIVE_TTL_S = 2.0
+
+
+class CallSessionRouter:
+    """Bounded LRU of call → session routes with negative caching."""
+
+    def __init__(
+        self,
+        *,
+        max_routes: int = _MAX_ROUTES,
+        route_ttl_s: float = _ROUTE_TTL_S,
+        negative_ttl_s: float = _NEGATIVE_TTL_S,
+    ):
+        """
+        Initialize the router.
+
+        :param max_routes: Maximum cached routes before the least recently used is evicted
+        :param route_ttl_s: Lifetime of a positive route (matches the Redis key TTL)
+        :param negative_ttl_s: Lifetime of a cached miss
+        """
+        self._routes: OrderedDict[str, tuple[str | None, float]] = OrderedDict()
+        self._inflight: dict[str, asyncio.Future[str | None]] = {}
+        self._max_routes = max_routes
+        self._route_ttl_s = route_ttl_s
+        self._negative_ttl_s = negative_ttl_s
+        self._conn_manager: Any = None
+        self._stats = {
+            "hits": 0,
+            "negative_hits": 0,
+            "redis_lookups": 0,
+            "redis_hits": 0,
+            "invalidations": 0,
+        }
+
+    def attach_bus(self, conn_manager: Any) -> None:
+        """Receive invalidations from other replicas via the connection manager."""
+        if conn_manager is None or conn_manager is self._conn_manager:
+            return
+        self._conn_manager = conn_manager
+        if hasattr(conn_manager, "add_control_handler"):
+            conn_manager.add_control_handler(
+                INVALIDATE_TOPIC, lambda data: self.forget(data.get("call_connection_id"))
+            )
+
+    def bind(self, call_connection_id: str | None, session_id: str | None) -> None:
+        """Record the session for a call (replaces any cached miss)."""
+        if not call_connection_id or not session_id:
+            return
+        self._store(call_connection_id, session_id, self._route_ttl_s)
+
+    def bind_unmapped(self, call_connection_id: str | None) -> None:
+        """Record that a call has no browser session (e.g. an answered inbound call)."""
+        if call_connection_id:
+            self._store(call_connection_id, None, self._route_ttl_s)
+
+    async def rebind(self, call_connection_id: str | None, session_id: str | None) -> None:
+        """Bind a call that other replicas may already have cached, and tell them."""
+        if not call_connection_id or not session_id:
+            return
+        self.bind(call_connection_id, session_id)
+        await self._publish_invalidation(call_connection_id)
+
+    def forget(self, call_connection_id: str | None) -> None:
+        """Drop the local route for a call."""
+        if call_connection_id and self._routes.pop(call_connection_id, None) is not None:
+            self._stats["invalidations"] += 1
+
+    async def invalidate(self, call_connection_id: str | None) -> None:
+        """Drop the route here and on every replica sharing the bus."""
+        if not call_connection_id:
+            return
+        self.forget(call_connection_id)
+        await self._publish_invalidation(call_connection_id)
+
+    def peek(self, call_connection_id: str) -> tuple[bool, str | None]:
+        """Return ``(cached, session_id)`` without touching Redis."""
+        entry = self._routes.get(call_connection_id)
+        if entry is None:
+            return False, None
+        session_id, expires_at = entry
+        if expires_at <= time.monotonic():
+            del self._routes[call_connection_id]
+            return False, None
+        self._routes.move_to_end(call_connection_id)
+        return True, session_id
+
+    async def resolve(
+        self,
+        call_connection_id: str | None,
+        redis_mgr: Any = None,
+        conn_manager: Any = None,
+    ) -> str | None:
+        """
+        Return the session for a call, reading through to Redis on a miss.
+
+        Concurrent lookups for the same uncached call share one Redis read.
+
+        :param call_connection_id: ACS call connection ID
+        :param redis_mgr: Redis manager used as the backstop
+        :param conn_manager: Connection manager whose call context is the last fallback
+        :return: Session ID, or None if the call is not mapped
+        """
+        if not call_connection_id:
+            return None
+
+        cached, session_id = self.peek(call_connection_id)
+        if cached:
+            self._stats["hits" if session_id else "negative_hits"] += 1
+            return session_id
+
+        pending = self._inflight.get(call_connection_id)
+        if pending is not None:
+            return await asyncio.shield(pending)
+
+        future: asyncio.Future[str | None] = asyncio.get_running_loop().create_future()
+        self._inflight[call_connection_id] = future
+        try:
+            session_id = await self._load(call_connection_id, redis_mgr, conn_manager)
+            # A bind() that landed during the lookup wins over what we read
+            cached, bound = self.peek(call_connection_id)
+            if cached and bound:
+                session_id = bound
+            else:
+                ttl = self._route_ttl_s if session_id else self._negative_ttl_s
+                self._store(call_connection_id, session_id, ttl)
+            future.set_result(session_id)
+            return session_id
+        finally:
+            # _load swallows lookup errors, so only cancellation gets here undone
+            if not future.done():
+                future.cancel()
+            self._inflight.pop(call_connection_id, None)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Return routing table size and hit counters."""
+        return {**self._stats, "routes": len(self._routes)}
+
+    def clear(self) -> None:
+        """Drop every cached route."""
+        self._routes.clear()
+
+    async def _publish_invalidation(self, call_connection_id: str) -> None:
+        publish = getattr(self._conn_manager, "publish_control", None)
+        if publish is not None:
+            await publish(INVALIDATE_TOPIC, {"call_connection_id": call_connection_id})
+
+    def _store(self, call_connection_id: str, session_id: str | None, ttl_s: float) -> None:
+        self._routes[call_connection_id] = (session_id, time.monotonic() + ttl_s)
+        self._routes.move_to_end(call_connection_id)
+        while len(self._routes) > self._max_routes:
+            self._routes.popitem(last=False)
+
+    async def _load(
+        self, call_connection_id: str, redis_mgr: Any, conn_manager: Any
+    ) -> str | None:
+        if redis_mgr and hasattr(redis_mgr, "get_value_async"):
+            self._stats["redis_lookups"] += 1
+            for template in CALL_SESSION_KEYS:
+                redis_key = template.format(call_connection_id)
+                try:
+                    value = await redis_mgr.get_value_async(redis_key)
+                except Exception as exc:
+                    logger.warning("Failed to fetch session mapping %s: %s", redis_key, exc)
+                    continue
+                if value:
+                    self._stats["redis_hits"] += 1
+                    return value.decode("utf-8") if isinstance(value, (bytes, bytearray)) else str(value)
+
+        if conn_manager and hasattr(conn_manager, "get_call_context"):
+            try:
+                ctx = await conn_manager.get_call_context(call_connection_id)
+                if ctx:
+                    return ctx.get("browser_session_id") or ctx.get("session_id")
+            except Exception as exc:
+                logger.warning(
+                    "Failed to fetch session mapping %s via conn_manager: %s",
+                    call_connection_id,
+                    exc,
+                )
+        return None
+
+
+# Global router instance
+_global_router: CallSessionRouter | None = None
+
+
+def get_call_session_router() -> CallSessionRouter:
+    """
+    Get the global call session router.
+
+    :return: Global call session router instance
+    :rtype: CallSessionRouter
+    """
+    global _global_router
+    if _global_router is None:
+        _global_router = CallSessionRouter()
+    return _global_router
+
+
+def reset_call_session_router() -> None:
+    """
+    Reset the global router (primarily for testing).
+    """
+    global _global_router
+    _global_router = None
+
+
+__all__ = [
+    "CALL_SESSION_KEYS",
+    "CallSessionRouter",
+    "get_call_session_router",
+    "reset_call_session_router",
+]
@@ -0,0 +1,89 @@
+"""
+V1 Event Metrics
+================
+
+Per-event-type processing latency for ACS webhook events.
+
+Latencies are exported as an OpenTelemetry histogram (``acs.event.latency``,
+attributed by ``event.type``) and kept in a small fixed-bucket histogram per
+event type so ``CallEventProcessor.get_stats()`` can report percentiles
+without retaining samples.
+"""
+
+from __future__ import annotations
+
+import bisect
+from typing import Any
+
+from apps.artagent.backend.voice.shared.metrics_factory import LazyHistogram, LazyMeter
+
+_meter = LazyMeter("acs.events", version="1.0.0")
+
+_event_latency_histogram: LazyHistogram = _meter.histogram(
+    name="acs.event.latency",
+    description="ACS webhook event processing latency in milliseconds",
+    unit="ms",
+)
+
+# Upper bounds (ms); the final bucket catches everything above the last bound.
+LATENCY_BUCKETS_MS: tuple[float, ...] = (
+    1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000,
+)
+
+
+class EventLatencyHistogram:
+    """Fixed-memory latency histogram for a single event type."""
+
+    __slots__ = ("counts", "count", "total_ms", "max_ms")
+
+    def __init__(self) -> None:
+        self.counts = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def record(self, value_ms: float) -> None:
+        self.counts[bisect.bisect_left(LATENCY_BUCKETS_MS, value_ms)] += 1
+        self.count += 1
+        self.total_ms += value_ms
+        if value_ms > self.max_ms:
+            self.max_ms = value_ms
+
+    def quantile(self, q: float) -> float:
+        """Upper bound of the bucket containing quantile ``q`` (0-1)."""
+        if self.count == 0:
+            return 0.0
+        target = q * self.count
+        running = 0
+        for idx, bucket_count in enumerate(self.counts):
+            running += bucket_count
+            if running >= target:
+                if idx < len(LATENCY_BUCKETS_MS):
+                    return float(min(LATENCY_BUCKETS_MS[idx], self.max_ms))
+                return self.max_ms
+        return self.max_ms
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "avg_ms": round(self.total_ms / self.count, 2) if self.count else 0.0,
+            "p50_ms": self.quantile(0.50),
+            "p95_ms": self.quantile(0.95),
+            "p99_ms": self.quantile(0.99),
+            "max_ms": round(self.max_ms, 2),
+        }
+
+
+def record_event_latency(event_type: str, latency_ms: float, *, success: bool = True) -> None:
+    """Export an event processing latency sample to OpenTelemetry."""
+    _event_latency_histogram.record(
+        latency_ms,
+        attributes={"event.type": event_type, "event.success": success},
+    )
+
+
+__all__ = [
+    "EventLatencyHistogram",
+    "LATENCY_BUCKETS_MS",
+    "record_event_latency",
+]
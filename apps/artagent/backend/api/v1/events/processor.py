@@ -4,6 +4,11 @@ V1 Call Event Processor
 
 Simplified event processor inspired by Azure's CallAutomationEventProcessor.
 Focuses on call correlation and handler registration without complex middleware.
+
+Batches are grouped by callConnectionId: events for one call run in order,
+different calls run concurrently (bounded), and slow side effects such as
+starting call recording are handed to a background queue so the webhook can
+be acknowledged immediately.
 """
 
 import asyncio
@@ -12,11 +17,19 @@ from collections import defaultdict
 from typing import Any
 
 from azure.core.messaging import CloudEvent
-from config import AZURE_STORAGE_CONTAINER_URL, ENABLE_ACS_CALL_RECORDING
+from config import (
+    ACS_EVENT_MAX_CONCURRENCY,
+    ACS_EVENT_SIDE_EFFECT_RETRIES,
+    AZURE_STORAGE_CONTAINER_URL,
+    ENABLE_ACS_CALL_RECORDING,
+)
 from opentelemetry import trace
 from opentelemetry.trace import SpanKind
 from utils.ml_logging import get_logger
 
+from .call_routing import get_call_session_router
+from .metrics import EventLatencyHistogram, record_event_latency
+from .side_effects import SideEffectQueue
 from .types import ACSEventTypes, CallEventContext, CallEventHandler, RecordingPreferences
 
 logger = get_logger("v1.events.processor")
@@ -29,12 +42,17 @@ class CallEventProcessor:
 
     Key features:
     - Call correlation by callConnectionId
+    - Per-call ordering, cross-call concurrency (bounded)
     - Simple handler registration per event type
-    - No complex middleware or retry logic
+    - Background side effects with retry (webhook isn't held up)
     - Direct integration with legacy handlers
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        max_concurrency: int = ACS_EVENT_MAX_CONCURRENCY,
+        side_effect_retries: int = ACS_EVENT_SIDE_EFFECT_RETRIES,
+    ):
         # Event handlers by event type
         self._handlers: dict[str, list[CallEventHandler]] = defaultdict(list)
 
@@ -45,6 +63,17 @@ class CallEventProcessor:
         self._recording_lock = asyncio.Lock()
         self._recordings_started: set[str] = set()
 
+        # Concurrency: bounded fan-out across calls, strict order within a call
+        self._call_semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        self._call_locks: dict[str, asyncio.Lock] = {}
+        self._call_lock_refs: dict[str, int] = {}
+
+        # Slow side effects (recording start) run after the webhook is acknowledged
+        self._side_effects = SideEffectQueue(max_retries=side_effect_retries)
+
+        # Per-event-type processing latency
+        self._latency: dict[str, EventLatencyHistogram] = defaultdict(EventLatencyHistogram)
+
         # Simple metrics
         self._stats = {
             "events_processed": 0,
@@ -99,6 +128,9 @@ class CallEventProcessor:
         """
         Process a list of CloudEvents from ACS webhook.
 
+        Events are grouped by call connection ID. Each group runs in arrival
+        order; groups for different calls run concurrently.
+
         :param events: List of CloudEvent objects from webhook
         :type events: List[CloudEvent]
         :param request_state: FastAPI request app state for dependencies
@@ -110,17 +142,30 @@ class CallEventProcessor:
             "call_event_processor.process_events",
             kind=SpanKind.INTERNAL,
             attributes={"events.count": len(events)},
-        ):
-            processed_count = 0
-            failed_count = 0
-
+        ) as span:
+            # Group by call, preserving arrival order within each call
+            groups: dict[str | None, list[CloudEvent]] = {}
             for event in events:
-                try:
-                    await self._process_single_event(event, request_state)
-                    processed_count += 1
-                except Exception as e:
-                    failed_count += 1
-                    logger.error(f"❌ Failed to process event {event.type}: {e}")
+                call_connection_id = self._extract_call_connection_id(event)
+                groups.setdefault(call_connection_id, []).append(event)
+
+            span.set_attribute("events.calls", len(groups))
+
+            if len(groups) == 1:
+                (call_connection_id, group), = groups.items()
+                outcomes = [
+                    await self._process_call_events(group, call_connection_id, request_state)
+                ]
+            else:
+                outcomes = await asyncio.gather(
+                    *(
+                        self._process_call_events(group, call_connection_id, request_state)
+                        for call_connection_id, group in groups.items()
+                    )
+                )
+
+            processed_count = sum(processed for processed, _ in outcomes)
+            failed_count = sum(failed for _, failed in outcomes)
 
             self._stats["events_processed"] += processed_count
             self._stats["events_failed"] += failed_count
@@ -134,7 +179,86 @@ class CallEventProcessor:
                 "timestamp": time.time(),
             }
 
-    async def _process_single_event(self, event: CloudEvent, request_state: Any) -> None:
+    async def _process_call_events(
+        self,
+        events: list[CloudEvent],
+        call_connection_id: str | None,
+        request_state: Any,
+    ) -> tuple[int, int]:
+        """
+        Process one call's events in order.
+
+        Holds the per-call lock so events for the same call arriving in
+        concurrent webhook batches are also handled in order.
+
+        :return: Tuple of (processed_count, failed_count)
+        """
+        processed = 0
+        failed = 0
+        call_lock = self._get_call_lock(call_connection_id)
+
+        try:
+            async with self._call_semaphore:
+                async with call_lock:
+                    for event in events:
+                        started = time.perf_counter()
+                        success = True
+                        try:
+                            await self._process_single_event(
+                                event, request_state, call_connection_id=call_connection_id
+                            )
+                            processed += 1
+                        except Exception as e:
+                            success = False
+                            failed += 1
+                            logger.error(f"❌ Failed to process event {event.type}: {e}")
+                        finally:
+                            elapsed_ms = (time.perf_counter() - started) * 1000
+                            self._latency[event.type].record(elapsed_ms)
+                            record_event_latency(event.type, elapsed_ms, success=success)
+        finally:
+            if call_connection_id:
+                self._release_call_lock(call_connection_id)
+
+        return processed, failed
+
+    def _get_call_lock(self, call_connection_id: str | None) -> asyncio.Lock:
+        """
+        Per-call lock; events without a call ID share no ordering.
+
+        Every call must be paired with _release_call_lock() for the same ID.
+        """
+        if not call_connection_id:
+            return asyncio.Lock()
+        lock = self._call_locks.get(call_connection_id)
+        if lock is None:
+            lock = self._call_locks[call_connection_id] = asyncio.Lock()
+        self._call_lock_refs[call_connection_id] = (
+            self._call_lock_refs.get(call_connection_id, 0) + 1
+        )
+        return lock
+
+    def _release_call_lock(self, call_connection_id: str) -> None:
+        """
+        Drop one reference to a call's lock, deleting it at zero.
+
+        Batches count from the moment they fetch the lock, so one still
+        queued on the concurrency semaphore keeps the lock alive for the
+        next batch of the same call.
+        """
+        refs = self._call_lock_refs.get(call_connection_id, 0) - 1
+        if refs > 0:
+            self._call_lock_refs[call_connection_id] = refs
+        else:
+            self._call_lock_refs.pop(call_connection_id, None)
+            self._call_locks.pop(call_connection_id, None)
+
+    async def _process_single_event(
+        self,
+        event: CloudEvent,
+        request_state: Any,
+        call_connection_id: str | None = None,
+    ) -> None:
         """
         Process a single CloudEvent.
 
@@ -142,9 +266,11 @@ class CallEventProcessor:
         :type event: CloudEvent
         :param request_state: FastAPI request app state for dependencies
         :type request_state: Any
+        :param call_connection_id: Pre-extracted call connection ID (optional)
+        :type call_connection_id: Optional[str]
         """
         # Extract call connection ID
-        call_connection_id = self._extract_call_connection_id(event)
+        call_connection_id = call_connection_id or self._extract_call_connection_id(event)
         if not call_connection_id:
             logger.warning(f"⚠️ No call connection ID found in event {event.type}")
             return
@@ -152,7 +278,11 @@ class CallEventProcessor:
         # Track active calls
         if event.type == ACSEventTypes.CALL_CONNECTED:
             self._active_calls.add(call_connection_id)
-            await self._maybe_start_call_recording(call_connection_id, event, request_state)
+            await self._side_effects.submit(
+                "start_call_recording",
+                lambda: self._maybe_start_call_recording(call_connection_id, event, request_state),
+                call_connection_id=call_connection_id,
+            )
         elif event.type == ACSEventTypes.CALL_DISCONNECTED:
             self._active_calls.discard(call_connection_id)
             await self._mark_recording_finished(call_connection_id)
@@ -275,8 +405,32 @@ class CallEventProcessor:
             "active_calls": len(self._active_calls),
             "registered_handlers": sum(len(handlers) for handlers in self._handlers.values()),
             "event_types": list(self._handlers.keys()),
+            "event_latency_ms": {
+                event_type: histogram.snapshot()
+                for event_type, histogram in self._latency.items()
+            },
+            "side_effects": self._side_effects.get_stats(),
+            "call_routing": get_call_session_router().get_stats(),
         }
 
+    async def drain_side_effects(self, timeout: float | None = None) -> bool:
+        """
+        Wait for queued side effects (e.g. recording start) to finish.
+
+        :param timeout: Maximum seconds to wait (None waits indefinitely)
+        :return: True if everything finished before the timeout
+        :rtype: bool
+        """
+        return await self._side_effects.drain(timeout)
+
+    async def shutdown(self, timeout: float = 5.0) -> None:
+        """
+        Drain and stop background side-effect workers.
+
+        :param timeout: Maximum seconds to wait for pending side effects
+        """
+        await self._side_effects.shutdown(timeout)
+
     def get_active_calls(self) -> set[str]:
         """
         Get set of currently active call connection IDs.
@@ -289,7 +443,15 @@ class CallEventProcessor:
     async def _maybe_start_call_recording(
         self, call_connection_id: str, event: CloudEvent, request_state: Any
     ) -> None:
-        """Start ACS call recording when enabled via feature toggle."""
+        """
+        Start ACS call recording when enabled via feature toggle.
+
+        Runs on the background side-effect queue; a failed ``start_recording``
+        is re-raised so the queue retries it.
+        """
+
+        if call_connection_id not in self._active_calls:
+            return
 
         recording_preferences = getattr(request_state, "recording_preferences", None)
         recording_requested: bool | None = None
@@ -357,58 +519,61 @@ class CallEventProcessor:
                 server_call_id = data.get("serverCallId") or data.get("server_call_id")
 
             if not server_call_id:
-                call_connection = acs_caller.get_call_connection(call_connection_id)
-                if call_connection:
-                    try:
-                        properties = await asyncio.to_thread(call_connection.get_call_properties)
-                        server_call_id = getattr(properties, "server_call_id", None) or getattr(
-                            properties, "serverCallId", None
-                        )
-                    except Exception as exc:
-                        logger.debug(
-                            "Failed to fetch serverCallId from call properties",
-                            exc_info=False,
-                            extra={
-                                "call_connection_id": call_connection_id,
-                                "error": str(exc),
-                            },
-                        )
+                try:
+                    properties = await acs_caller.call_control.get_call_properties(
+                        call_connection_id
+                    )
+                    server_call_id = getattr(properties, "server_call_id", None) or getattr(
+                        properties, "serverCallId", None
+                    )
+                except Exception as exc:
+                    logger.debug(
+                        "Failed to fetch serverCallId from call properties",
+                        exc_info=False,
+                        extra={
+                            "call_connection_id": call_connection_id,
+                            "error": str(exc),
+                        },
+                    )
+        except Exception as exc:
+            logger.error(
+                "Unexpected error during ACS call recording setup",
+                extra={
+                    "call_connection_id": call_connection_id,
+                    "error": str(exc),
+                },
+            )
+            return
 
-            if not server_call_id:
-                logger.debug(
-                    "Call recording skipped: serverCallId unavailable",
-                    extra={"call_connection_id": call_connection_id},
-                )
-                return
+        if not server_call_id:
+            logger.debug(
+                "Call recording skipped: serverCallId unavailable",
+                extra={"call_connection_id": call_connection_id},
+            )
+            return
 
-            try:
-                await asyncio.to_thread(acs_caller.start_recording, server_call_id)
-                async with self._recording_lock:
-                    self._recordings_started.add(call_connection_id)
-                logger.info(
-                    "Started ACS call recording",
-                    extra={
-                        "call_connection_id": call_connection_id,
-                        "server_call_id": server_call_id,
-                    },
-                )
-            except Exception as exc:
-                logger.error(
-                    "Failed to start ACS call recording",
-                    extra={
-                        "call_connection_id": call_connection_id,
-                        "server_call_id": server_call_id,
-                        "error": str(exc),
-                    },
-                )
+        try:
+            await acs_caller.start_recording(server_call_id)
         except Exception as exc:
             logger.error(
-                "Unexpected error during ACS call recording setup",
+                "Failed to start ACS call recording",
                 extra={
                     "call_connection_id": call_connection_id,
+                    "server_call_id": server_call_id,
                     "error": str(exc),
                 },
             )
+            raise
+
+        async with self._recording_lock:
+            self._recordings_started.add(call_connection_id)
+        logger.info(
+            "Started ACS call recording",
+            extra={
+                "call_connection_id": call_connection_id,
+                "server_call_id": server_call_id,
+            },
+        )
 
     async def _mark_recording_finished(self, call_connection_id: str) -> None:
         """Clear recording state when a call ends."""
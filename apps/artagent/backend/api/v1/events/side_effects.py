@@ -0,0 +1,234 @@
+"""
+V1 Event Side-Effect Queue
+==========================
+
+Background queue for slow call side effects (e.g. starting ACS recording).
+
+The webhook acknowledges ACS as soon as handlers finish; side effects are
+drained by a small worker pool with retry and exponential backoff so a slow
+REST call for one call never holds up events for other calls.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any
+
+from utils.ml_logging import get_logger
+
+logger = get_logger("v1.events.side_effects")
+
+SideEffectFactory = Callable[[], Awaitable[Any]]
+
+
+@dataclass
+class _SideEffect:
+    """A queued side effect job."""
+
+    key: str
+    name: str
+    call_connection_id: str | None
+    factory: SideEffectFactory
+    enqueued_at: float
+    attempts: int = 0
+
+
+class SideEffectQueue:
+    """
+    Bounded background queue with retry for event side effects.
+
+    Key features:
+    - Lazy worker start on first submit (bound to the running loop)
+    - De-duplication of pending jobs by key
+    - Exponential backoff with jitter between retries
+    - Drain on shutdown
+    """
+
+    def __init__(
+        self,
+        workers: int = 4,
+        max_retries: int = 3,
+        base_backoff_s: float = 0.5,
+        max_backoff_s: float = 8.0,
+        maxsize: int = 1000,
+    ):
+        self._worker_count = max(1, workers)
+        self._max_retries = max(0, max_retries)
+        self._base_backoff_s = base_backoff_s
+        self._max_backoff_s = max_backoff_s
+        self._maxsize = maxsize
+
+        self._queue: asyncio.Queue[_SideEffect] | None = None
+        self._workers: list[asyncio.Task] = []
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._pending_keys: set[str] = set()
+        self._retry_tasks: set[asyncio.Task] = set()
+
+        self._stats = {
+            "submitted": 0,
+            "deduplicated": 0,
+            "succeeded": 0,
+            "retried": 0,
+            "failed": 0,
+        }
+
+    def _ensure_workers(self) -> asyncio.Queue[_SideEffect]:
+        """Start workers on the current loop (restarting if the loop changed)."""
+        loop = asyncio.get_running_loop()
+        if self._queue is None or self._loop is not loop:
+            self._loop = loop
+            self._queue = asyncio.Queue(maxsize=self._maxsize)
+            self._pending_keys.clear()
+            self._retry_tasks.clear()
+            self._workers = [
+                loop.create_task(self._worker(i), name=f"acs-side-effect-{i}")
+                for i in range(self._worker_count)
+            ]
+        return self._queue
+
+    async def submit(
+        self,
+        name: str,
+        factory: SideEffectFactory,
+        *,
+        call_connection_id: str | None = None,
+        key: str | None = None,
+    ) -> bool:
+        """
+        Queue a side effect for background execution.
+
+        :param name: Side effect name (used for logs and stats)
+        :param factory: Zero-arg callable returning the awaitable to run
+        :param call_connection_id: Call the side effect belongs to
+        :param key: De-duplication key (defaults to ``name:call_connection_id``)
+        :return: False if an identical job is already pending
+        """
+        queue = self._ensure_workers()
+        key = key or f"{name}:{call_connection_id}"
+        if key in self._pending_keys:
+            self._stats["deduplicated"] += 1
+            return False
+
+        job = _SideEffect(
+            key=key,
+            name=name,
+            call_connection_id=call_connection_id,
+            factory=factory,
+            enqueued_at=time.perf_counter(),
+        )
+        self._pending_keys.add(key)
+        self._stats["submitted"] += 1
+        try:
+            queue.put_nowait(job)
+        except asyncio.QueueFull:
+            logger.warning(
+                "Side-effect queue full; applying backpressure",
+                extra={"side_effect": name, "call_connection_id": call_connection_id},
+            )
+            await queue.put(job)
+        return True
+
+    async def _worker(self, index: int) -> None:
+        queue = self._queue
+        while True:
+            job = await queue.get()
+            try:
+                await self._run(job)
+            finally:
+                queue.task_done()
+
+    async def _run(self, job: _SideEffect) -> None:
+        job.attempts += 1
+        try:
+            await job.factory()
+        except Exception as exc:
+            if job.attempts <= self._max_retries:
+                self._stats["retried"] += 1
+                delay = min(self._max_backoff_s, self._base_backoff_s * 2 ** (job.attempts - 1))
+                delay *= 0.5 + random.random() / 2
+                logger.warning(
+                    f"Side effect {job.name} failed (attempt {job.attempts}); retrying in {delay:.2f}s",
+                    extra={"call_connection_id": job.call_connection_id, "error": str(exc)},
+                )
+                self._schedule_retry(job, delay)
+                return
+
+            self._stats["failed"] += 1
+            self._pending_keys.discard(job.key)
+            logger.error(
+                f"❌ Side effect {job.name} failed after {job.attempts} attempts: {exc}",
+                extra={"call_connection_id": job.call_connection_id},
+            )
+            return
+
+        self._stats["succeeded"] += 1
+        self._pending_keys.discard(job.key)
+        logger.debug(
+            f"Side effect {job.name} completed",
+            extra={
+                "call_connection_id": job.call_connection_id,
+                "attempts": job.attempts,
+                "total_ms": round((time.perf_counter() - job.enqueued_at) * 1000, 1),
+            },
+        )
+
+    def _schedule_retry(self, job: _SideEffect, delay: float) -> None:
+        """Re-queue after a delay without occupying a worker."""
+        queue = self._queue
+
+        async def _requeue() -> None:
+            await asyncio.sleep(delay)
+            await queue.put(job)
+
+        task = asyncio.get_running_loop().create_task(_requeue())
+        self._retry_tasks.add(task)
+        task.add_done_callback(self._retry_tasks.discard)
+
+    async def drain(self, timeout: float | None = None) -> bool:
+        """
+        Wait until all queued (and retrying) side effects have finished.
+
+        :return: True if drained before the timeout
+        """
+        if self._queue is None or self._loop is not asyncio.get_running_loop():
+            return True
+
+        async def _wait() -> None:
+            while self._pending_keys:
+                await self._queue.join()
+                if self._retry_tasks:
+                    await asyncio.gather(*list(self._retry_tasks), return_exceptions=True)
+
+        try:
+            await asyncio.wait_for(_wait(), timeout)
+            return True
+        except TimeoutError:
+            return False
+
+    async def shutdown(self, timeout: float = 5.0) -> None:
+        """Drain pending side effects, then stop workers."""
+        drained = await self.drain(timeout)
+        if not drained:
+            logger.warning(f"Side-effect queue shutdown with {len(self._pending_keys)} pending")
+        for task in [*self._workers, *self._retry_tasks]:
+            task.cancel()
+        await asyncio.gather(*self._workers, *self._retry_tasks, return_exceptions=True)
+        self._workers = []
+        self._queue = None
+        self._loop = None
+        self._pending_keys.clear()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Return queue statistics."""
+        return {
+            **self._stats,
+            "pending": len(self._pending_keys),
+            "queued": self._queue.qsize() if self._queue is not None else 0,
+        }
+
+
+__all__ = ["SideEffectQueue", "SideEffectFactory"]
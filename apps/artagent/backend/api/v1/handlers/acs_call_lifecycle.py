@@ -36,6 +36,7 @@ from src.stateful.state_managment import MemoManager
 from utils.ml_logging import get_logger
 
 from ..events import get_call_event_processor
+from ..events.call_routing import get_call_session_router
 
 # V1 API specific imports
 # Note: MediaHandler now supports both ACS and Browser via TransportType
@@ -349,6 +350,10 @@ class ACSLifecycleHandler:
                         )
 
                 # Store browser session ID mapping for media endpoint coordination
+                if browser_session_id:
+                    get_call_session_router().bind(call_id, browser_session_id)
+                else:
+                    get_call_session_router().bind_unmapped(call_id)
                 if browser_session_id and redis_mgr:
                     try:
                         # Store the mapping: call_connection_id -> browser_session_id
@@ -589,6 +594,8 @@ class ACSLifecycleHandler:
 
         call_connection_id = getattr(answer_result, "call_connection_id", None)
         if call_connection_id:
+            # Inbound calls have no browser session until one binds to them
+            get_call_session_router().bind_unmapped(call_connection_id)
             safe_set_span_attributes(
                 span,
                 {
@@ -20,7 +20,7 @@ import random
 import string
 
 from apps.artagent.backend.src.services.acs.session_terminator import terminate_session
-from azure.communication.callautomation import CallConnectionClient
+from azure.communication.callautomation import CommunicationIdentifier
 from opentelemetry import trace
 from opentelemetry.trace import SpanKind
 from utils.ml_logging import get_logger
@@ -76,18 +76,7 @@ class DTMFValidationLifecycle:
                 span.set_status(trace.Status(trace.StatusCode.ERROR, "No ACS caller"))
                 return
 
-            # Get target phone from call (async call)
-            call_conn = context.acs_caller.get_call_connection(context.call_connection_id)
-
-            # Start DTMF recognition in a non-blocking way using an executor
-            loop = asyncio.get_event_loop()
-            await loop.run_in_executor(
-                None,
-                lambda: call_conn.start_continuous_dtmf_recognition(
-                    target_participant=DTMFValidationLifecycle._get_target_participant(call_conn),
-                    operation_context=f"dtmf_recognition_{context.call_connection_id}",
-                ),
-            )
+            await DTMFValidationLifecycle._start_dtmf_recognition(context)
 
     @staticmethod
     def is_dtmf_validation_gate_open(memory_manager, call_connection_id: str) -> bool:
@@ -127,9 +116,9 @@ class DTMFValidationLifecycle:
 
     @staticmethod
     async def setup_aws_connect_validation_flow(
-        context: CallEventContext, call_conn: CallConnectionClient
+        context: CallEventContext, target_participant: CommunicationIdentifier | None = None
     ) -> None:
-        """Set up AWS Connect-style validation flow."""
+        """Set up AWS Connect-style validation flow for the caller (looked up if not given)."""
         try:
             # Generate 3 random validation digits
             validation_digits = "".join(random.choices(string.digits, k=3))
@@ -145,7 +134,7 @@ class DTMFValidationLifecycle:
                     await context.memo_manager.persist_to_redis_async(context.redis_mgr)
 
             # Start DTMF recognition
-            await DTMFValidationLifecycle._start_dtmf_recognition(context, call_conn)
+            await DTMFValidationLifecycle._start_dtmf_recognition(context, target_participant)
 
         except Exception as e:
             logger.error(f"❌ Error setting up AWS Connect validation flow: {e}")
@@ -337,9 +326,7 @@ class DTMFValidationLifecycle:
         # Fallback to direct hang-up if terminator not available
         try:
             if context.acs_caller:
-                call_conn = context.acs_caller.get_call_connection(context.call_connection_id)
-                if call_conn:
-                    call_conn.hang_up(is_for_everyone=True)
+                await context.acs_caller.call_control.hang_up(context.call_connection_id)
         except Exception as exc:
             logger.error(f"Direct hang-up failed during DTMF cancel: {exc}")
 
@@ -512,25 +499,27 @@ class DTMFValidationLifecycle:
 
     @staticmethod
     async def _start_dtmf_recognition(
-        context: CallEventContext, call_conn: CallConnectionClient
+        context: CallEventContext, target_participant: CommunicationIdentifier | None = None
     ) -> None:
-        """Start DTMF recognition (simplified)."""
+        """Start continuous DTMF recognition on the caller (simplified)."""
         try:
-            # Get target participant (caller)
-            participants = call_conn.list_participants()
-            caller_participant = None
-
-            for participant in participants:
-                if (
-                    hasattr(participant.identifier, "kind")
-                    and participant.identifier.kind == "phone_number"
-                ):
-                    caller_participant = participant
-                    break
-
-            if caller_participant:
-                call_conn.start_continuous_dtmf_recognition(
-                    target_participant=caller_participant.identifier,
+            call_control = context.acs_caller.call_control
+            if target_participant is None:
+                # Get target participant (caller)
+                participants = await call_control.list_participants(context.call_connection_id)
+                target_participant = next(
+                    (
+                        participant.identifier
+                        for participant in participants
+                        if getattr(participant.identifier, "kind", None) == "phone_number"
+                    ),
+                    None,
+                )
+
+            if target_participant:
+                await call_control.start_continuous_dtmf_recognition(
+                    context.call_connection_id,
+                    target_participant,
                     operation_context=f"dtmf_recognition_{context.call_connection_id}",
                 )
                 logger.info(f"Started DTMF recognition for {context.call_connection_id}")
@@ -172,6 +172,9 @@ class ServiceCheck(BaseModel):
         description="Additional details about the check",
         json_schema_extra={"example": "Connected to Redis successfully"},
     )
+    age_ms: float | None = Field(
+        None, description="Age of the cached check result in milliseconds", example=850.0
+    )
     model_config = ConfigDict(
         json_schema_extra={
             "example": {
@@ -179,6 +182,7 @@ class ServiceCheck(BaseModel):
                 "status": "healthy",
                 "check_time_ms": 12.5,
                 "details": "Connected to Redis successfully",
+                "age_ms": 850.0,
             }
         }
     )
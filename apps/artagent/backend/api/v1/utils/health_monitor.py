@@ -0,0 +1,194 @@
+"""
+Health Monitor
+==============
+
+Background dependency health for readiness probes. Checks run concurrently,
+each component has its own staleness bound, and probes read a cached
+snapshot instead of pinging Redis (and friends) on every request.
+
+- A background loop refreshes components shortly before they go stale.
+- ``get_checks()`` only re-runs components older than their bound; probes
+  arriving together share one in-flight check per component.
+- ``subscribe()`` returns a queue that receives an event whenever a
+  component changes status.
+
+Usage:
+    monitor = HealthMonitor([HealthComponent("redis", check_redis, max_age_s=5.0)])
+    monitor.start()
+    checks = await monitor.get_checks()
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import time
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from typing import Any
+
+from apps.artagent.backend.api.v1.schemas.health import ServiceCheck
+from utils.ml_logging import get_logger
+
+logger = get_logger("v1.health_monitor")
+
+_SUBSCRIBER_QUEUE_SIZE = 64
+
+
+@dataclass
+class HealthComponent:
+    """A dependency check and how long its result stays fresh."""
+
+    name: str
+    check: Callable[[], Awaitable[ServiceCheck]]
+    max_age_s: float = 10.0
+    timeout_s: float = 1.0
+
+
+@dataclass
+class _Entry:
+    result: ServiceCheck
+    checked_at: float
+
+
+class HealthMonitor:
+    """Cached, concurrently refreshed health of a fixed set of components."""
+
+    def __init__(
+        self,
+        components: Iterable[HealthComponent],
+        *,
+        interval_s: float = 2.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize the monitor.
+
+        Args:
+            components: Components to check, in reporting order.
+            interval_s: Background loop period in seconds.
+            clock: Monotonic time source (injectable for tests).
+        """
+        self._components = {c.name: c for c in components}
+        self._interval = interval_s
+        self._clock = clock
+        self._entries: dict[str, _Entry] = {}
+        self._inflight: dict[str, asyncio.Task[None]] = {}
+        self._subscribers: set[asyncio.Queue[dict[str, Any]]] = set()
+        self._task: asyncio.Task[None] | None = None
+
+        self.checks_run = 0
+
+    @property
+    def running(self) -> bool:
+        """Whether the background refresh loop is active."""
+        return self._task is not None and not self._task.done()
+
+    def due(self, horizon_s: float = 0.0) -> list[str]:
+        """Components that are missing or will be stale within ``horizon_s``."""
+        now = self._clock()
+        return [
+            name
+            for name, component in self._components.items()
+            if (entry := self._entries.get(name)) is None
+            or now - entry.checked_at + horizon_s >= component.max_age_s
+        ]
+
+    async def refresh(self, names: Iterable[str] | None = None) -> None:
+        """Run the given checks (default: all) concurrently, joining any in flight."""
+        names = list(self._components) if names is None else list(names)
+        tasks = [self._inflight.get(name) or self._start_check(name) for name in names]
+        if tasks:
+            # Shield so a cancelled probe doesn't cancel checks other probes await
+            await asyncio.gather(*(asyncio.shield(t) for t in tasks))
+
+    async def get_checks(self) -> list[ServiceCheck]:
+        """Return cached results, refreshing only stale components."""
+        stale = self.due()
+        if stale:
+            await self.refresh(stale)
+        now = self._clock()
+        return [
+            entry.result.model_copy(
+                update={"age_ms": round((now - entry.checked_at) * 1000, 2)}
+            )
+            for name in self._components
+            if (entry := self._entries.get(name)) is not None
+        ]
+
+    def subscribe(self) -> asyncio.Queue[dict[str, Any]]:
+        """Return a queue that receives status-change events."""
+        queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue(maxsize=_SUBSCRIBER_QUEUE_SIZE)
+        self._subscribers.add(queue)
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue[dict[str, Any]]) -> None:
+        """Stop delivering events to ``queue``."""
+        self._subscribers.discard(queue)
+
+    def start(self) -> None:
+        """Start the background refresh loop (idempotent)."""
+        if not self.running:
+            self._task = asyncio.create_task(self._run(), name="health-monitor")
+
+    async def stop(self) -> None:
+        """Stop the background loop and cancel in-flight checks."""
+        tasks = [t for t in (self._task, *self._inflight.values()) if t is not None]
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.refresh(self.due(horizon_s=self._interval))
+            except Exception as exc:  # pragma: no cover - checks never raise
+                logger.warning(f"Health monitor refresh failed: {exc}")
+            await asyncio.sleep(self._interval)
+
+    def _start_check(self, name: str) -> asyncio.Task[None]:
+        task = asyncio.create_task(self._run_check(self._components[name]))
+        self._inflight[name] = task
+        task.add_done_callback(lambda _t, n=name: self._inflight.pop(n, None))
+        return task
+
+    async def _run_check(self, component: HealthComponent) -> None:
+        start = time.perf_counter()
+        try:
+            result = await asyncio.wait_for(component.check(), timeout=component.timeout_s)
+        except Exception as exc:
+            error = str(exc) or f"timed out after {component.timeout_s}s"
+            result = ServiceCheck(
+                component=component.name,
+                status="unhealthy",
+                error=error,
+                check_time_ms=round((time.perf_counter() - start) * 1000, 2),
+            )
+        self.checks_run += 1
+
+        previous = self._entries.get(component.name)
+        self._entries[component.name] = _Entry(result, self._clock())
+        if previous is not None and previous.result.status != result.status:
+            logger.info(
+                f"Health of {component.name} changed: {previous.result.status} -> {result.status}"
+            )
+            self._publish(
+                {
+                    **result.model_dump(),
+                    "previous_status": previous.result.status,
+                    "timestamp": time.time(),
+                }
+            )
+
+    def _publish(self, event: dict[str, Any]) -> None:
+        for queue in self._subscribers:
+            if queue.full():
+                # Slow consumer: drop its oldest event rather than block checks
+                queue.get_nowait()
+            queue.put_nowait(event)
+
+
+__all__ = ["HealthComponent", "HealthMonitor"]
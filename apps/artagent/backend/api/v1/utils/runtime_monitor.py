@@ -0,0 +1,437 @@
+"""
+Runtime Monitor
+===============
+
+Event-loop lag and thread-pool saturation for the backend process.
+
+- ``LoopLagMonitor`` schedules a heartbeat on the event loop and records how
+  late each beat fires. A watchdog thread notices overdue beats and samples
+  the loop thread's stack, so slow callbacks are attributed to the code that
+  was running (``path:function:line``) without timing every callback.
+- ``InstrumentedExecutor`` is a ``ThreadPoolExecutor`` that records queue
+  wait (submit -> start), run time and busy workers, plus run time per
+  submitting function. It is installed as the loop's default executor
+  (``run_in_executor(None, ...)`` and ``asyncio.to_thread``) and as
+  ``app.state.speech_executor``.
+- ``RuntimeMonitor`` owns both, exports OpenTelemetry metrics and serves
+  ``snapshot()`` for ``GET /api/v1/metrics/runtime``.
+
+Usage:
+    monitor = RuntimeMonitor(speech_workers=8)
+    monitor.start()          # inside the running loop
+    monitor.snapshot()
+    await monitor.stop()
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import contextvars
+import sys
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+from pathlib import Path
+from typing import Any
+
+from apps.artagent.backend.api.v1.events.metrics import EventLatencyHistogram
+from apps.artagent.backend.voice.shared.metrics_factory import (
+    LazyCounter,
+    LazyHistogram,
+    LazyMeter,
+)
+from opentelemetry import metrics
+from opentelemetry.metrics import CallbackOptions, Observation
+from utils.ml_logging import get_logger
+
+logger = get_logger("v1.runtime_monitor")
+
+_meter = LazyMeter("runtime", version="1.0.0")
+
+_loop_lag_histogram: LazyHistogram = _meter.histogram(
+    name="runtime.event_loop.lag",
+    description="Event-loop heartbeat lateness in milliseconds",
+    unit="ms",
+)
+_slow_callback_counter: LazyCounter = _meter.counter(
+    name="runtime.event_loop.slow_callbacks",
+    description="Event-loop stalls above the slow-callback threshold, by origin",
+    unit="1",
+)
+_queue_wait_histogram: LazyHistogram = _meter.histogram(
+    name="runtime.executor.queue_wait",
+    description="Time executor work waited for a free thread in milliseconds",
+    unit="ms",
+)
+_run_time_histogram: LazyHistogram = _meter.histogram(
+    name="runtime.executor.run_time",
+    description="Executor work run time in milliseconds",
+    unit="ms",
+)
+
+_MAX_ORIGINS = 256
+_TOP_ORIGINS = 5
+_OVERFLOW_ORIGIN = "<other>"
+_PROJECT_ROOT = Path(__file__).resolve().parents[6]
+_LOOP_MODULES = frozenset({"asyncio", "selectors", "concurrent", "threading", "contextlib", "uvloop"})
+
+
+# ============================================================================
+# Origin attribution
+# ============================================================================
+
+
+class _OriginStats:
+    """Count, total and max duration per origin, bounded in size."""
+
+    def __init__(self, max_origins: int = _MAX_ORIGINS) -> None:
+        self._max = max_origins
+        self._stats: dict[str, list[float]] = {}
+
+    def record(self, origin: str, duration_ms: float) -> bool:
+        """Add a sample; returns True the first time ``origin`` is seen."""
+        if origin not in self._stats and len(self._stats) >= self._max:
+            origin = _OVERFLOW_ORIGIN
+        entry = self._stats.get(origin)
+        if entry is None:
+            entry = self._stats[origin] = [0, 0.0, 0.0]
+        entry[0] += 1
+        entry[1] += duration_ms
+        entry[2] = max(entry[2], duration_ms)
+        return entry[0] == 1
+
+    def top(self, limit: int = _TOP_ORIGINS) -> list[dict[str, Any]]:
+        ranked = sorted(self._stats.items(), key=lambda item: item[1][1], reverse=True)
+        return [
+            {"origin": origin, "count": count, "total_ms": round(total, 2), "max_ms": round(peak, 2)}
+            for origin, (count, total, peak) in ranked[:limit]
+        ]
+
+
+def callable_origin(fn: Any) -> str:
+    """Name the function behind executor work (unwraps partials and ``to_thread``)."""
+    while isinstance(fn, partial):
+        inner = fn.func
+        # asyncio.to_thread submits partial(Context.run, func, *args)
+        if isinstance(getattr(inner, "__self__", None), contextvars.Context) and fn.args:
+            fn = fn.args[0]
+        else:
+            fn = inner
+    fn = getattr(fn, "__func__", fn)
+    module = getattr(fn, "__module__", None) or "?"
+    name = getattr(fn, "__qualname__", None) or type(fn).__qualname__
+    return f"{module}.{name}"
+
+
+def frame_origin(frame: Any) -> str:
+    """Describe the innermost project frame of a stack (else the innermost non-loop frame)."""
+    fallback = None
+    while frame is not None:
+        module = frame.f_globals.get("__name__", "")
+        if module != __name__ and module.partition(".")[0] not in _LOOP_MODULES:
+            code = frame.f_code
+            path = Path(code.co_filename)
+            fallback = fallback or f"{path.name}:{code.co_name}:{frame.f_lineno}"
+            if "site-packages" not in path.parts and path.is_relative_to(_PROJECT_ROOT):
+                return f"{path.relative_to(_PROJECT_ROOT)}:{code.co_name}:{frame.f_lineno}"
+        frame = frame.f_back
+    return fallback or "unknown"
+
+
+# ============================================================================
+# Executor
+# ============================================================================
+
+
+class InstrumentedExecutor(ThreadPoolExecutor):
+    """Thread pool recording queue wait, run time and saturation."""
+
+    def __init__(self, name: str, max_workers: int | None = None) -> None:
+        """
+        Initialize the executor.
+
+        Args:
+            name: Pool name used in metrics and thread names.
+            max_workers: Worker threads (None for the ThreadPoolExecutor default).
+        """
+        super().__init__(max_workers=max_workers, thread_name_prefix=f"{name}-pool")
+        self.name = name
+        self._lock = threading.Lock()
+        self._attributes = {"executor": name}
+        self._queued = 0
+        self._busy = 0
+        self._peak_queued = 0
+        self._peak_busy = 0
+        self._submitted = 0
+        self._completed = 0
+        self._queue_wait = EventLatencyHistogram()
+        self._run_time = EventLatencyHistogram()
+        self._origins = _OriginStats()
+
+    @property
+    def max_workers(self) -> int:
+        return self._max_workers
+
+    @property
+    def busy(self) -> int:
+        return self._busy
+
+    @property
+    def queued(self) -> int:
+        return self._queued
+
+    def submit(self, fn, /, *args, **kwargs) -> Future:
+        origin = callable_origin(fn)
+        submitted_at = time.perf_counter()
+        with self._lock:
+            self._submitted += 1
+            self._queued += 1
+            self._peak_queued = max(self._peak_queued, self._queued)
+
+        def run():
+            started_at = time.perf_counter()
+            with self._lock:
+                self._queued -= 1
+                self._busy += 1
+                self._peak_busy = max(self._peak_busy, self._busy)
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                self._finish(origin, started_at - submitted_at, time.perf_counter() - started_at)
+
+        try:
+            return super().submit(run)
+        except RuntimeError:
+            with self._lock:
+                self._queued -= 1
+            raise
+
+    def _finish(self, origin: str, wait_s: float, run_s: float) -> None:
+        wait_ms, run_ms = wait_s * 1000, run_s * 1000
+        with self._lock:
+            self._busy -= 1
+            self._completed += 1
+            self._queue_wait.record(wait_ms)
+            self._run_time.record(run_ms)
+            self._origins.record(origin, run_ms)
+        _queue_wait_histogram.record(wait_ms, attributes=self._attributes)
+        _run_time_histogram.record(run_ms, attributes=self._attributes)
+
+    def snapshot(self) -> dict[str, Any]:
+        """Current saturation plus queue-wait and run-time percentiles."""
+        with self._lock:
+            return {
+                "name": self.name,
+                "max_workers": self._max_workers,
+                "busy": self._busy,
+                "queued": self._queued,
+                "utilization": round(self._busy / self._max_workers, 3),
+                "peak_busy": self._peak_busy,
+                "peak_queued": self._peak_queued,
+                "submitted": self._submitted,
+                "completed": self._completed,
+                "queue_wait_ms": self._queue_wait.snapshot(),
+                "run_time_ms": self._run_time.snapshot(),
+                "top_origins": self._origins.top(),
+            }
+
+
+# ============================================================================
+# Event loop
+# ============================================================================
+
+
+class LoopLagMonitor:
+    """Heartbeat-based event-loop lag with stall attribution."""
+
+    def __init__(self, *, interval_s: float = 0.1, slow_threshold_ms: float = 100.0) -> None:
+        """
+        Initialize the monitor.
+
+        Args:
+            interval_s: Heartbeat period in seconds.
+            slow_threshold_ms: Lag above which a stall is counted and attributed.
+        """
+        self._interval_s = interval_s
+        self._slow_threshold_ms = slow_threshold_ms
+        self._lag = EventLatencyHistogram()
+        self._origins = _OriginStats()
+        self._lock = threading.Lock()
+        self._task: asyncio.Task[None] | None = None
+        self._watchdog: threading.Thread | None = None
+        self._stopped = threading.Event()
+        self._loop_thread_id: int | None = None
+        self._last_beat = time.perf_counter()
+        self._stall_origin: str | None = None
+        self.slow_callbacks = 0
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Start the heartbeat on the running loop and the watchdog thread."""
+        if self.running:
+            return
+        self._loop_thread_id = threading.get_ident()
+        self._last_beat = time.perf_counter()
+        self._stopped.clear()
+        self._task = asyncio.create_task(self._heartbeat(), name="loop-lag-monitor")
+        self._watchdog = threading.Thread(
+            target=self._watch, name="loop-lag-watchdog", daemon=True
+        )
+        self._watchdog.start()
+
+    async def stop(self) -> None:
+        self._stopped.set()
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    def record_lag(self, lag_ms: float, origin: str | None = None) -> None:
+        """Record one heartbeat's lateness; stalls above the threshold are attributed."""
+        with self._lock:
+            self._lag.record(lag_ms)
+            if lag_ms < self._slow_threshold_ms:
+                return
+            origin = origin or "unknown"
+            self.slow_callbacks += 1
+            first_seen = self._origins.record(origin, lag_ms)
+        _slow_callback_counter.add(1, attributes={"origin": origin})
+        if first_seen:
+            logger.warning(f"Event loop blocked for {lag_ms:.0f} ms at {origin}")
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "interval_ms": round(self._interval_s * 1000, 1),
+                "slow_threshold_ms": self._slow_threshold_ms,
+                "lag_ms": self._lag.snapshot(),
+                "slow_callbacks": self.slow_callbacks,
+                "top_origins": self._origins.top(),
+            }
+
+    async def _heartbeat(self) -> None:
+        while True:
+            scheduled = time.perf_counter()
+            await asyncio.sleep(self._interval_s)
+            now = time.perf_counter()
+            lag_ms = max(0.0, (now - scheduled - self._interval_s) * 1000)
+            with self._lock:
+                self._last_beat = now
+                origin, self._stall_origin = self._stall_origin, None
+            self.record_lag(lag_ms, origin)
+            _loop_lag_histogram.record(lag_ms)
+
+    def _watch(self) -> None:
+        # Sample the loop thread while a beat is overdue; the heartbeat reports it
+        period = max(0.005, self._slow_threshold_ms / 2000)
+        while not self._stopped.wait(period):
+            with self._lock:
+                overdue_ms = (time.perf_counter() - self._last_beat - self._interval_s) * 1000
+                if overdue_ms < self._slow_threshold_ms or self._stall_origin is not None:
+                    continue
+            frame = sys._current_frames().get(self._loop_thread_id)
+            origin = frame_origin(frame)
+            with self._lock:
+                self._stall_origin = self._stall_origin or origin
+
+
+# ============================================================================
+# Process monitor
+# ============================================================================
+
+
+class RuntimeMonitor:
+    """Loop lag plus instrumented default and speech executors."""
+
+    def __init__(
+        self,
+        *,
+        lag_interval_s: float = 0.1,
+        slow_callback_ms: float = 100.0,
+        default_workers: int | None = None,
+        speech_workers: int | None = None,
+    ) -> None:
+        """
+        Initialize the monitor.
+
+        Args:
+            lag_interval_s: Heartbeat period in seconds.
+            slow_callback_ms: Loop stall threshold for attribution.
+            default_workers: Default executor size (None for the Python default).
+            speech_workers: Dedicated speech (TTS synthesis) executor size; size it
+                to the TTS pool so concurrent calls do not queue behind it.
+        """
+        self.loop_lag = LoopLagMonitor(interval_s=lag_interval_s, slow_threshold_ms=slow_callback_ms)
+        self.default_executor = InstrumentedExecutor("default", default_workers or None)
+        self.speech_executor = InstrumentedExecutor("speech", speech_workers or None)
+        self._gauges_registered = False
+
+    @property
+    def executors(self) -> tuple[InstrumentedExecutor, ...]:
+        return (self.default_executor, self.speech_executor)
+
+    def start(self) -> None:
+        """Install the default executor on the running loop and start the heartbeat."""
+        loop = asyncio.get_running_loop()
+        # set_default_executor drops the old pool without shutting it down
+        previous = getattr(loop, "_default_executor", None)
+        loop.set_default_executor(self.default_executor)
+        if previous is not None and previous is not self.default_executor:
+            previous.shutdown(wait=False)
+        self.loop_lag.start()
+        self._register_gauges()
+
+    async def stop(self) -> None:
+        await self.loop_lag.stop()
+        # The loop shuts its default executor down itself
+        self.speech_executor.shutdown(wait=False, cancel_futures=True)
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "timestamp": time.time(),
+            "event_loop": self.loop_lag.snapshot(),
+            "executors": {executor.name: executor.snapshot() for executor in self.executors},
+        }
+
+    def _register_gauges(self) -> None:
+        if self._gauges_registered:
+            return
+        self._gauges_registered = True
+        meter = metrics.get_meter("runtime", version="1.0.0")
+
+        def observe(attr: str):
+            def callback(_options: CallbackOptions):
+                return [
+                    Observation(getattr(executor, attr), {"executor": executor.name})
+                    for executor in self.executors
+                ]
+
+            return callback
+
+        meter.create_observable_gauge(
+            "runtime.executor.busy",
+            callbacks=[observe("busy")],
+            description="Executor threads currently running work",
+            unit="1",
+        )
+        meter.create_observable_gauge(
+            "runtime.executor.queued",
+            callbacks=[observe("queued")],
+            description="Executor work waiting for a free thread",
+            unit="1",
+        )
+
+
+__all__ = [
+    "InstrumentedExecutor",
+    "LoopLagMonitor",
+    "RuntimeMonitor",
+    "callable_origin",
+    "frame_origin",
+]
@@ -12,15 +12,45 @@ switching between voice, WhatsApp, and web chat.
 
 from __future__ import annotations
 
+import asyncio
+import json
 import os
+import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
-from typing import Any
+from typing import Any, Literal
 
+from opentelemetry import metrics
 from utils.ml_logging import get_logger
 
 logger = get_logger("channels.context")
 
+# The global meter proxies to the real provider once telemetry is configured.
+# (voice.shared.metrics_factory is not importable here: the voice package
+# imports this module.)
+_meter = metrics.get_meter("channels.customer_context", version="1.0.0")
+_flush_duration_histogram = _meter.create_histogram(
+    "customer_context.flush.duration",
+    unit="ms",
+    description="Write-behind flush duration",
+)
+_flushed_counter = _meter.create_counter(
+    "customer_context.flush.documents",
+    unit="1",
+    description="Customer contexts written to Cosmos DB by write-behind flushes",
+)
+_coalesced_counter = _meter.create_counter(
+    "customer_context.writes.coalesced",
+    unit="1",
+    description="Saves absorbed into an already pending Cosmos upsert",
+)
+_flush_failure_counter = _meter.create_counter(
+    "customer_context.flush.failures",
+    unit="1",
+    description="Customer context upserts that failed and were requeued",
+)
+
 
 @dataclass
 class SessionInfo:
@@ -194,14 +224,26 @@ class CustomerContextManager:
     """
     Manages customer context persistence in Cosmos DB.
 
-    Provides CRUD operations for CustomerContext with caching
-    via Redis for fast lookups during active conversations.
+    Contexts are served from a small in-process cache (L1), then Redis (L2),
+    then Cosmos DB. Saves update L1 and Redis immediately. With the default
+    ``write_behind`` durability, Cosmos upserts are coalesced per customer
+    and flushed on an interval, when a session ends and at shutdown, so a
+    burst of chat messages costs one upsert instead of one per message.
+    ``write_through`` upserts on every save, as before.
+
+    All store calls are async; the synchronous Cosmos client runs in a
+    worker thread so it never blocks the event loop.
     """
 
     def __init__(
         self,
         cosmos_manager: Any = None,
         redis_manager: Any = None,
+        *,
+        durability: Literal["write_behind", "write_through"] = "write_behind",
+        flush_interval_s: float = 2.0,
+        local_ttl_s: float = 30.0,
+        max_local_entries: int = 1024,
     ):
         """
         Initialize the context manager.
@@ -209,12 +251,75 @@ class CustomerContextManager:
         Args:
             cosmos_manager: Cosmos DB manager instance
             redis_manager: Redis manager instance for caching
+            durability: "write_behind" (batched Cosmos upserts) or
+                "write_through" (upsert on every save)
+            flush_interval_s: Write-behind flush interval
+            local_ttl_s: How long clean contexts stay in the in-process cache;
+                keeps cross-replica updates visible through Redis
+            max_local_entries: In-process cache bound
         """
+        if durability not in ("write_behind", "write_through"):
+            raise ValueError(f"Unknown durability mode: {durability}")
+
         self.cosmos = cosmos_manager
         self.redis = redis_manager
+        self.durability = durability
         self._collection_name = os.getenv("COSMOS_CUSTOMER_CONTEXT_COLLECTION", "customer_contexts")
         self._cache_ttl = 3600  # 1 hour cache TTL
-        logger.info("CustomerContextManager initialized")
+        self._flush_interval_s = flush_interval_s
+        self._local_ttl_s = local_ttl_s
+        self._max_local_entries = max_local_entries
+
+        # customer_id -> (context, loaded_at); dirty contexts are never evicted
+        self._local: OrderedDict[str, tuple[CustomerContext, float]] = OrderedDict()
+        self._dirty: dict[str, CustomerContext] = {}
+        self._loading: dict[str, asyncio.Future[CustomerContext]] = {}
+        self._flush_lock = asyncio.Lock()
+        self._flush_task: asyncio.Task | None = None
+        self._stats = {
+            "local_hits": 0,
+            "redis_hits": 0,
+            "cosmos_loads": 0,
+            "saves": 0,
+            "coalesced": 0,
+            "flushes": 0,
+            "flushed": 0,
+            "flush_failures": 0,
+        }
+        self._last_flush_ms = 0.0
+        logger.info("CustomerContextManager initialized | durability=%s", durability)
+
+    # ─────────────────────────────────────────────────────────────────────────
+    # Lifecycle
+    # ─────────────────────────────────────────────────────────────────────────
+
+    def start(self) -> None:
+        """Start the write-behind flush loop (no-op for write-through)."""
+        if self.durability == "write_behind" and self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_loop(), name="customer-context-flush")
+
+    async def stop(self) -> None:
+        """Stop the flush loop and flush everything still pending."""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_task = None
+        await self.flush()
+
+    async def _flush_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self._flush_interval_s)
+            try:
+                await self.flush()
+            except Exception as e:  # pragma: no cover - defensive log only
+                logger.error("Customer context flush loop error: %s", e)
+
+    # ─────────────────────────────────────────────────────────────────────────
+    # Public API
+    # ─────────────────────────────────────────────────────────────────────────
 
     async def get_or_create(
         self,
@@ -224,6 +329,9 @@ class CustomerContextManager:
         """
         Get existing customer context or create new one.
 
+        Concurrent lookups for the same customer share one load, so they
+        all see (and update) the same context instance.
+
         Args:
             customer_id: Unique customer identifier
             phone_number: Optional phone number
@@ -231,47 +339,110 @@ class CustomerContextManager:
         Returns:
             CustomerContext instance
         """
-        # Try cache first
-        cached = await self._get_from_cache(customer_id)
-        if cached:
-            logger.debug("Customer context cache hit: %s", customer_id)
-            return cached
+        local = self._get_local(customer_id)
+        if local is not None:
+            self._stats["local_hits"] += 1
+            return local
 
-        # Try Cosmos DB
-        if self.cosmos:
-            doc = await self._get_from_cosmos(customer_id)
-            if doc:
-                context = CustomerContext.from_dict(doc)
-                await self._set_cache(context)
-                logger.debug("Customer context loaded from Cosmos: %s", customer_id)
-                return context
+        pending = self._loading.get(customer_id)
+        if pending is not None:
+            return await asyncio.shield(pending)
 
-        # Create new context
-        context = CustomerContext(
-            customer_id=customer_id,
-            phone_number=phone_number or customer_id,
-        )
-        await self.save(context)
-        logger.info("Created new customer context: %s", customer_id)
-        return context
+        future: asyncio.Future[CustomerContext] = asyncio.get_running_loop().create_future()
+        self._loading[customer_id] = future
+        try:
+            context = await self._load_or_create(customer_id, phone_number)
+            future.set_result(context)
+            return context
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()  # mark retrieved when nobody else is waiting
+            raise
+        finally:
+            self._loading.pop(customer_id, None)
 
     async def save(self, context: CustomerContext) -> None:
         """
-        Save customer context to Cosmos DB and cache.
+        Save customer context to cache and Cosmos DB.
+
+        In write-behind mode the Cosmos upsert is queued and coalesced with
+        any other pending save for the same customer.
 
         Args:
             context: CustomerContext to save
         """
         context.updated_at = datetime.now(UTC)
+        self._stats["saves"] += 1
+        self._put_local(context)
 
-        # Save to Cosmos DB
         if self.cosmos:
-            await self._save_to_cosmos(context)
+            if self.durability == "write_through":
+                await self._save_to_cosmos(context)
+            else:
+                if context.customer_id in self._dirty:
+                    self._stats["coalesced"] += 1
+                    _coalesced_counter.add(1)
+                self._dirty[context.customer_id] = context
 
-        # Update cache
         await self._set_cache(context)
         logger.debug("Saved customer context: %s", context.customer_id)
 
+    async def flush(self, customer_id: str | None = None) -> int:
+        """
+        Write pending contexts to Cosmos DB.
+
+        Args:
+            customer_id: Flush only this customer (e.g. at session end);
+                None flushes everything pending.
+
+        Returns:
+            Number of contexts written
+        """
+        if customer_id is None:
+            batch, self._dirty = self._dirty, {}
+        else:
+            context = self._dirty.pop(customer_id, None)
+            batch = {customer_id: context} if context else {}
+        if not batch:
+            return 0
+
+        written = 0
+        start = time.perf_counter()
+        async with self._flush_lock:
+            for cid, context in batch.items():
+                try:
+                    await self._save_to_cosmos(context)
+                    written += 1
+                except Exception:
+                    self._stats["flush_failures"] += 1
+                    _flush_failure_counter.add(1)
+                    # Requeue unless a newer save already did
+                    self._dirty.setdefault(cid, context)
+
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        self._stats["flushes"] += 1
+        self._stats["flushed"] += written
+        self._last_flush_ms = elapsed_ms
+        _flush_duration_histogram.record(elapsed_ms)
+        _flushed_counter.add(written)
+        logger.debug(
+            "Customer context flush | written=%d failed=%d elapsed_ms=%.1f",
+            written,
+            len(batch) - written,
+            elapsed_ms,
+        )
+        return written
+
+    def get_stats(self) -> dict[str, Any]:
+        """Cache and write-behind counters for monitoring."""
+        return {
+            **self._stats,
+            "durability": self.durability,
+            "pending": len(self._dirty),
+            "local_entries": len(self._local),
+            "last_flush_ms": round(self._last_flush_ms, 2),
+        }
+
     async def get_by_phone(self, phone_number: str) -> CustomerContext | None:
         """
         Look up customer context by phone number.
@@ -320,7 +491,7 @@ class CustomerContextManager:
         summary: str | None = None,
     ) -> CustomerContext | None:
         """
-        End a customer's session.
+        End a customer's session and flush its context to Cosmos DB.
 
         Args:
             customer_id: Customer identifier
@@ -334,6 +505,7 @@ class CustomerContextManager:
         context = await self.get_or_create(customer_id)
         context.end_session(session_id, status, summary)
         await self.save(context)
+        await self.flush(customer_id)
         return context
 
     async def update_customer_data(
@@ -380,15 +552,67 @@ class CustomerContextManager:
     # Private Methods
     # ─────────────────────────────────────────────────────────────────────────
 
+    async def _load_or_create(
+        self,
+        customer_id: str,
+        phone_number: str | None,
+    ) -> CustomerContext:
+        """Resolve a context from Redis, then Cosmos DB, else create it."""
+        cached = await self._get_from_cache(customer_id)
+        if cached:
+            self._stats["redis_hits"] += 1
+            self._put_local(cached)
+            logger.debug("Customer context cache hit: %s", customer_id)
+            return cached
+
+        if self.cosmos:
+            doc = await self._get_from_cosmos(customer_id)
+            if doc:
+                self._stats["cosmos_loads"] += 1
+                context = CustomerContext.from_dict(doc)
+                self._put_local(context)
+                await self._set_cache(context)
+                logger.debug("Customer context loaded from Cosmos: %s", customer_id)
+                return context
+
+        context = CustomerContext(
+            customer_id=customer_id,
+            phone_number=phone_number or customer_id,
+        )
+        await self.save(context)
+        logger.info("Created new customer context: %s", customer_id)
+        return context
+
+    def _get_local(self, customer_id: str) -> CustomerContext | None:
+        """Get context from the in-process cache."""
+        dirty = self._dirty.get(customer_id)
+        if dirty is not None:
+            return dirty
+        entry = self._local.get(customer_id)
+        if entry is None:
+            return None
+        context, loaded_at = entry
+        if time.monotonic() - loaded_at > self._local_ttl_s:
+            del self._local[customer_id]
+            return None
+        self._local.move_to_end(customer_id)
+        return context
+
+    def _put_local(self, context: CustomerContext) -> None:
+        """Insert into the in-process cache, evicting least recently used."""
+        self._local[context.customer_id] = (context, time.monotonic())
+        self._local.move_to_end(context.customer_id)
+        while len(self._local) > self._max_local_entries:
+            self._local.popitem(last=False)
+
     async def _get_from_cache(self, customer_id: str) -> CustomerContext | None:
         """Get context from Redis cache."""
         if not self.redis:
             return None
         try:
             key = f"customer_context:{customer_id}"
-            data = self.redis.get(key)
+            data = await self.redis.get_value_async(key)
             if data:
-                import json
                 return CustomerContext.from_dict(json.loads(data))
         except Exception as e:
             logger.warning("Cache get failed: %s", e)
@@ -399,9 +623,12 @@ class CustomerContextManager:
         if not self.redis:
             return
         try:
-            import json
             key = f"customer_context:{context.customer_id}"
-            self.redis.set(key, json.dumps(context.to_dict()), ex=self._cache_ttl)
+            await self.redis.set_value_async(
+                key,
+                json.dumps(context.to_dict()),
+                ttl_seconds=self._cache_ttl,
+            )
         except Exception as e:
             logger.warning("Cache set failed: %s", e)
 
@@ -410,7 +637,7 @@ class CustomerContextManager:
         if not self.cosmos:
             return None
         try:
-            return self.cosmos.find_one({"customer_id": customer_id})
+            return await asyncio.to_thread(self.cosmos.read_document, {"customer_id": customer_id})
         except Exception as e:
             logger.warning("Cosmos get failed: %s", e)
         return None
@@ -421,7 +648,11 @@ class CustomerContextManager:
             return
         try:
             doc = context.to_dict()
-            self.cosmos.upsert_one({"customer_id": context.customer_id}, doc)
+            await asyncio.to_thread(
+                self.cosmos.upsert_document,
+                document=doc,
+                query={"customer_id": context.customer_id},
+            )
         except Exception as e:
             logger.error("Cosmos save failed: %s", e)
             raise
@@ -65,6 +65,8 @@ from .constants import (  # API Paths; Voice; Messages; Audio; Languages
 from .settings import (  # Azure Communication Services; Security; Azure Identity; Azure OpenAI; Azure Speech; Azure Storage & Cosmos; Azure AI Foundry; Voice & TTS (per-agent voice is defined in agent.yaml); Feature Flags; Documentation; Monitoring; Connection Management; Pool Settings; Session Management; Speech Recognition; Warm Pool Settings; Validation
     ACS_AUDIENCE,
     ACS_CONNECTION_STRING,
+    ACS_EVENT_MAX_CONCURRENCY,
+    ACS_EVENT_SIDE_EFFECT_RETRIES,
     AZURE_AI_FOUNDRY_PROJECT_ENDPOINT,
     ACS_ENDPOINT,
     ACS_ISSUER,
@@ -73,6 +75,10 @@ from .settings import (  # Azure Communication Services; Security; Azure Identit
     ACS_STREAMING_MODE,
     ALLOWED_CLIENT_IDS,
     ALLOWED_ORIGINS,
+    ANALYTICS_BATCH_SIZE,
+    ANALYTICS_FLUSH_INTERVAL_MS,
+    ANALYTICS_QUEUE_SIZE,
+    ANALYTICS_SPILL_DIR,
     AOAI_REQUEST_TIMEOUT,
     AUDIO_FORMAT,
     AZURE_CLIENT_ID,
@@ -93,11 +99,19 @@ from .settings import (  # Azure Communication Services; Security; Azure Identit
     AZURE_VOICE_LIVE_MODEL,
     BACKEND_AUTH_CLIENT_ID,
     BASE_URL,
+    CASCADE_HISTORY_MAX_TOKENS,
+    CASCADE_HISTORY_MAX_TURNS,
+    CASCADE_HISTORY_MIN_TURNS,
+    CASCADE_HISTORY_SUMMARY_ENABLED,
+    CASCADE_HISTORY_TRIM_WITHOUT_SUMMARY,
     CONNECTION_CRITICAL_THRESHOLD,
     CONNECTION_QUEUE_SIZE,
     CONNECTION_TIMEOUT_SECONDS,
     CONNECTION_WARNING_THRESHOLD,
+    CUSTOMER_CONTEXT_DURABILITY,
+    CUSTOMER_CONTEXT_FLUSH_INTERVAL_MS,
     DEBUG_MODE,
+    DEFAULT_EXECUTOR_WORKERS,
     DEFAULT_MAX_TOKENS,
     DEFAULT_TEMPERATURE,
     DEFAULT_TTS_VOICE,
@@ -118,7 +132,9 @@ from .settings import (  # Azure Communication Services; Security; Azure Identit
     ENTRA_JWKS_URL,
     ENVIRONMENT,
     GREETING_VOICE_TTS,  # Deprecated alias for DEFAULT_TTS_VOICE
+    HEALTH_MONITOR_INTERVAL,
     HEARTBEAT_INTERVAL_SECONDS,
+    LOOP_LAG_INTERVAL_MS,
     MAX_CONCURRENT_SESSIONS,
     MAX_WEBSOCKET_CONNECTIONS,
     METRICS_COLLECTION_INTERVAL,
@@ -136,6 +152,13 @@ from .settings import (  # Azure Communication Services; Security; Azure Identit
     SESSION_STATE_TTL,
     SESSION_TTL_SECONDS,
     SILENCE_DURATION_MS,
+    SLOW_CALLBACK_THRESHOLD_MS,
+    SPECULATIVE_TURN_ENABLED,
+    SPECULATIVE_TURN_EOU_STABILITY_MS,
+    SPECULATIVE_TURN_MIN_CHARS,
+    SPECULATIVE_TURN_STABILITY_MS,
+    SPEECH_EXECUTOR_WORKERS,
+    STT_INGEST_COALESCE_MS,
     STT_PROCESSING_TIMEOUT,
     TTS_CHUNK_SIZE,
     TTS_PROCESSING_TIMEOUT,
@@ -224,6 +247,8 @@ __all__ = [
     "initialize_appconfig",
     # Most-used settings (alphabetical)
     "ACS_CONNECTION_STRING",
+    "ACS_EVENT_MAX_CONCURRENCY",
+    "ACS_EVENT_SIDE_EFFECT_RETRIES",
     "ACS_ENDPOINT",
     "ACS_SOURCE_PHONE_NUMBER",
     "ALLOWED_ORIGINS",
@@ -233,11 +258,22 @@ __all__ = [
     "AZURE_AI_FOUNDRY_PROJECT_ENDPOINT",
     "AZURE_SPEECH_REGION",
     "BASE_URL",
+    "CUSTOMER_CONTEXT_DURABILITY",
+    "CUSTOMER_CONTEXT_FLUSH_INTERVAL_MS",
+    "ANALYTICS_BATCH_SIZE",
+    "ANALYTICS_FLUSH_INTERVAL_MS",
+    "ANALYTICS_QUEUE_SIZE",
+    "ANALYTICS_SPILL_DIR",
     "DEBUG_MODE",
     "ENABLE_AUTH_VALIDATION",
     "ENABLE_DOCS",
     "ENVIRONMENT",
     "GREETING_VOICE_TTS",
+    "HEALTH_MONITOR_INTERVAL",
+    "LOOP_LAG_INTERVAL_MS",
+    "SLOW_CALLBACK_THRESHOLD_MS",
+    "DEFAULT_EXECUTOR_WORKERS",
+    "SPEECH_EXECUTOR_WORKERS",
     "MAX_WEBSOCKET_CONNECTIONS",
     "POOL_SIZE_TTS",
     "POOL_SIZE_STT",
@@ -248,4 +284,14 @@ __all__ = [
     "WARM_POOL_WARMUP_TIMEOUT",
     "WARM_POOL_MAX_RETRIES",
     "SESSION_TTL_SECONDS",
+    "SPECULATIVE_TURN_ENABLED",
+    "SPECULATIVE_TURN_STABILITY_MS",
+    "SPECULATIVE_TURN_EOU_STABILITY_MS",
+    "SPECULATIVE_TURN_MIN_CHARS",
+    "CASCADE_HISTORY_MAX_TOKENS",
+    "CASCADE_HISTORY_MIN_TURNS",
+    "CASCADE_HISTORY_MAX_TURNS",
+    "CASCADE_HISTORY_SUMMARY_ENABLED",
+    "CASCADE_HISTORY_TRIM_WITHOUT_SUMMARY",
+    "STT_INGEST_COALESCE_MS",
 ]
@@ -195,6 +195,20 @@ AZURE_COSMOS_CONNECTION_STRING: str = os.getenv("AZURE_COSMOS_CONNECTION_STRING"
 AZURE_COSMOS_DATABASE_NAME: str = os.getenv("AZURE_COSMOS_DATABASE_NAME", "")
 AZURE_COSMOS_COLLECTION_NAME: str = os.getenv("AZURE_COSMOS_COLLECTION_NAME", "")
 
+# Omnichannel customer context: "write_behind" coalesces Cosmos upserts per
+# customer and flushes them on an interval; "write_through" upserts on every save
+CUSTOMER_CONTEXT_DURABILITY: str = os.getenv("CUSTOMER_CONTEXT_DURABILITY", "write_behind")
+CUSTOMER_CONTEXT_FLUSH_INTERVAL_MS: int = _env_int("CUSTOMER_CONTEXT_FLUSH_INTERVAL_MS", 2000)
+
+# Post-call analytics: hangups enqueue their document; a background writer
+# bulk-upserts batches once BATCH_SIZE are queued or FLUSH_INTERVAL_MS elapses.
+# Overflow and failed batches spill to ANALYTICS_SPILL_DIR (default: system temp
+# dir) and are replayed at startup.
+ANALYTICS_QUEUE_SIZE: int = _env_int("ANALYTICS_QUEUE_SIZE", 1000)
+ANALYTICS_BATCH_SIZE: int = _env_int("ANALYTICS_BATCH_SIZE", 50)
+ANALYTICS_FLUSH_INTERVAL_MS: int = _env_int("ANALYTICS_FLUSH_INTERVAL_MS", 1000)
+ANALYTICS_SPILL_DIR: str = os.getenv("ANALYTICS_SPILL_DIR", "")
+
 
 # ==============================================================================
 # AZURE AI FOUNDRY (for evaluation)
@@ -232,6 +246,25 @@ VAD_SEMANTIC_SEGMENTATION: bool = _env_bool("VAD_SEMANTIC_SEGMENTATION", False)
 SILENCE_DURATION_MS: int = _env_int("SILENCE_DURATION_MS", 1300)
 AUDIO_FORMAT: str = os.getenv("AUDIO_FORMAT", "pcm")
 STT_PROCESSING_TIMEOUT: float = _env_float("STT_PROCESSING_TIMEOUT", 10.0)
+# Coalesce caller audio into writes of this many ms before the STT push stream (0 = off)
+STT_INGEST_COALESCE_MS: int = _env_int("STT_INGEST_COALESCE_MS", 80)
+
+# Speculative turn start: begin the LLM request on a stable partial transcript
+SPECULATIVE_TURN_ENABLED: bool = _env_bool("SPECULATIVE_TURN_ENABLED", False)
+SPECULATIVE_TURN_STABILITY_MS: int = _env_int("SPECULATIVE_TURN_STABILITY_MS", 300)
+SPECULATIVE_TURN_EOU_STABILITY_MS: int = _env_int("SPECULATIVE_TURN_EOU_STABILITY_MS", 120)
+SPECULATIVE_TURN_MIN_CHARS: int = _env_int("SPECULATIVE_TURN_MIN_CHARS", 8)
+
+# Cascade conversation history window sent to the LLM
+CASCADE_HISTORY_MAX_TOKENS: int = _env_int("CASCADE_HISTORY_MAX_TOKENS", 6000)
+CASCADE_HISTORY_MIN_TURNS: int = _env_int("CASCADE_HISTORY_MIN_TURNS", 4)
+CASCADE_HISTORY_MAX_TURNS: int = _env_int("CASCADE_HISTORY_MAX_TURNS", 20)
+# Rolling summary of dropped turns (one extra LLM call each time the window slides).
+# The window only applies with a summary, unless trim-only is explicitly enabled.
+CASCADE_HISTORY_SUMMARY_ENABLED: bool = _env_bool("CASCADE_HISTORY_SUMMARY_ENABLED", False)
+CASCADE_HISTORY_TRIM_WITHOUT_SUMMARY: bool = _env_bool(
+    "CASCADE_HISTORY_TRIM_WITHOUT_SUMMARY", False
+)
 RECOGNIZED_LANGUAGE: list[str] = _env_list(
     "RECOGNIZED_LANGUAGE", "en-US,es-ES,fr-FR,ko-KR,it-IT,pt-PT,pt-BR"
 )
@@ -252,6 +285,10 @@ CONNECTION_CRITICAL_THRESHOLD: int = _env_int("CONNECTION_CRITICAL_THRESHOLD", 1
 CONNECTION_TIMEOUT_SECONDS: int = _env_int("CONNECTION_TIMEOUT_SECONDS", 300)
 HEARTBEAT_INTERVAL_SECONDS: int = _env_int("HEARTBEAT_INTERVAL_SECONDS", 30)
 
+# ACS webhook event processing (calls processed concurrently per batch)
+ACS_EVENT_MAX_CONCURRENCY: int = _env_int("ACS_EVENT_MAX_CONCURRENCY", 16)
+ACS_EVENT_SIDE_EFFECT_RETRIES: int = _env_int("ACS_EVENT_SIDE_EFFECT_RETRIES", 3)
+
 # Session lifecycle
 SESSION_TTL_SECONDS: int = _env_int("SESSION_TTL_SECONDS", 1800)
 SESSION_CLEANUP_INTERVAL: int = _env_int("SESSION_CLEANUP_INTERVAL", 300)
@@ -311,6 +348,11 @@ ENABLE_PERFORMANCE_LOGGING: bool = _env_bool("ENABLE_PERFORMANCE_LOGGING", True)
 ENABLE_TRACING: bool = _env_bool("ENABLE_TRACING", True)
 METRICS_COLLECTION_INTERVAL: int = _env_int("METRICS_COLLECTION_INTERVAL", 60)
 POOL_METRICS_INTERVAL: int = _env_int("POOL_METRICS_INTERVAL", 30)
+HEALTH_MONITOR_INTERVAL: float = _env_float("HEALTH_MONITOR_INTERVAL", 2.0)
+LOOP_LAG_INTERVAL_MS: int = _env_int("LOOP_LAG_INTERVAL_MS", 100)
+SLOW_CALLBACK_THRESHOLD_MS: int = _env_int("SLOW_CALLBACK_THRESHOLD_MS", 100)
+DEFAULT_EXECUTOR_WORKERS: int = _env_int("DEFAULT_EXECUTOR_WORKERS", 0)  # 0 = Python default
+SPEECH_EXECUTOR_WORKERS: int = _env_int("SPEECH_EXECUTOR_WORKERS", 0)  # 0 = POOL_SIZE_TTS
 
 
 # ==============================================================================
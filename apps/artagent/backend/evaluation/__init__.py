@@ -84,6 +84,12 @@ from apps.artagent.backend.evaluation.mocks import (
     build_context,
 )
 from apps.artagent.backend.evaluation.recorder import EventRecorder
+from apps.artagent.backend.evaluation.replay import (
+    RecordingOrchestrator,
+    ReplayBackend,
+    ReplayOrchestrator,
+    ReplayOrchestratorFactory,
+)
 from apps.artagent.backend.evaluation.scenario_runner import (
     ComparisonRunner,
     ScenarioRunner,
@@ -99,6 +105,11 @@ from apps.artagent.backend.evaluation.schemas import (
     TurnScore,
 )
 from apps.artagent.backend.evaluation.scorer import MetricsScorer
+from apps.artagent.backend.evaluation.suite_runner import (
+    EvaluationJob,
+    SuiteResult,
+    SuiteRunner,
+)
 from apps.artagent.backend.evaluation.wrappers import EvaluationOrchestratorWrapper
 
 __version__ = "0.2.0"  # Phase 3 complete
@@ -111,6 +122,14 @@ __all__ = [
     # Scenario runners
     "ScenarioRunner",
     "ComparisonRunner",
+    "SuiteRunner",
+    "SuiteResult",
+    "EvaluationJob",
+    # Offline replay
+    "ReplayBackend",
+    "ReplayOrchestrator",
+    "ReplayOrchestratorFactory",
+    "RecordingOrchestrator",
     # Mocks
     "MockMemoManager",
     "MockOrchestratorContext",
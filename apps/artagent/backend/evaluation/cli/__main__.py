@@ -18,6 +18,11 @@ Usage:
     python -m apps.artagent.backend.evaluation.cli compare \
         --input tests/eval_scenarios/ab_tests/fraud_detection_comparison.yaml
 
+    # Run a whole suite concurrently, offline against recorded LLM/tool output
+    python -m apps.artagent.backend.evaluation.cli suite \
+        --input tests/eval_scenarios --replay recordings.jsonl \
+        --concurrency 32 --processes 4
+
 Consolidation:
     This replaces multiple separate CLI files with a single entry point.
     Much simpler to maintain and use.
@@ -199,6 +204,54 @@ def cmd_compare(args: argparse.Namespace) -> int:
         return 1
 
 
+# =============================================================================
+# Subcommand: suite
+# =============================================================================
+
+
+def cmd_suite(args: argparse.Namespace) -> int:
+    """Run many scenarios/comparisons concurrently."""
+    from apps.artagent.backend.evaluation.replay import ReplayOrchestratorFactory
+    from apps.artagent.backend.evaluation.suite_runner import SuiteRunner
+
+    try:
+        jobs = SuiteRunner.discover(args.input)
+        if not jobs:
+            logger.error("No scenarios found")
+            return 1
+
+        factory = None
+        if args.replay or args.offline:
+            factory = ReplayOrchestratorFactory(
+                replay_path=args.replay,
+                strict=not args.synthesize_missing,
+                time_scale=args.time_scale,
+            )
+
+        runner = SuiteRunner(
+            output_dir=args.output,
+            orchestrator_factory=factory,
+            max_concurrency=args.concurrency,
+            processes=args.processes,
+            persist_events=args.persist_events,
+        )
+        result = asyncio.run(runner.run(jobs))
+
+        print("\n" + "=" * 70)
+        print(f"📊 SUITE: {len(result.summaries)}/{result.total} passed in {result.duration_s:.1f}s")
+        for name, error in sorted(result.failures.items()):
+            print(f"  ❌ {name}: {error}")
+        for name in result.flagged:
+            print(f"  ⚠️  {name}: {result.replay_misses[name]} synthesized turn(s)")
+        print("=" * 70 + "\n")
+
+        return 0 if not result.failures else 1
+
+    except Exception as e:
+        logger.exception(f"❌ Error running suite: {e}")
+        return 1
+
+
 # =============================================================================
 # Main CLI
 # =============================================================================
@@ -298,6 +351,68 @@ def main():
     )
     compare_parser.set_defaults(func=cmd_compare)
 
+    # -------------------------------------------------------------------------
+    # Subcommand: suite
+    # -------------------------------------------------------------------------
+    suite_parser = subparsers.add_parser(
+        "suite",
+        help="Run many scenarios/comparisons concurrently",
+    )
+    suite_parser.add_argument(
+        "--input",
+        "-i",
+        required=True,
+        type=Path,
+        nargs="+",
+        help="Scenario/comparison YAML files or directories",
+    )
+    suite_parser.add_argument(
+        "--output",
+        "-o",
+        type=Path,
+        help="Output directory (default: runs/)",
+    )
+    suite_parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=8,
+        help="Max scenarios in flight per process (default: 8)",
+    )
+    suite_parser.add_argument(
+        "--processes",
+        type=int,
+        default=1,
+        help="Worker processes to shard across (default: 1)",
+    )
+    suite_parser.add_argument(
+        "--replay",
+        type=Path,
+        help="Recorded LLM/tool JSONL to replay (runs fully offline)",
+    )
+    suite_parser.add_argument(
+        "--offline",
+        action="store_true",
+        help="Use the deterministic replay backend even without --replay",
+    )
+    suite_parser.add_argument(
+        "--synthesize-missing",
+        action="store_true",
+        help="Synthesize turns that have no recording instead of failing them "
+        "(affected scenarios are flagged; their tool checks pass by construction)",
+    )
+    suite_parser.add_argument(
+        "--time-scale",
+        type=float,
+        default=0.0,
+        help="Multiplier for recorded latencies (default: 0 = no sleeping)",
+    )
+    suite_parser.add_argument(
+        "--persist-events",
+        action="store_true",
+        help="Also write per-scenario events JSONL",
+    )
+    suite_parser.set_defaults(func=cmd_suite)
+
     # Parse and execute
     args = parser.parse_args()
 
@@ -11,11 +11,12 @@ EvaluationOrchestratorWrapper.
 
 from __future__ import annotations
 
+import functools
 import hashlib
 import json
 import subprocess
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 from apps.artagent.backend.evaluation.schemas import (
     EvalModelConfig,
@@ -29,6 +30,24 @@ from utils.ml_logging import get_logger
 logger = get_logger(__name__)
 
 
+@functools.lru_cache(maxsize=1)
+def _git_commit_sha() -> Optional[str]:
+    """Get current git commit SHA once per process (not once per recorder)."""
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            text=True,
+            timeout=2,
+            check=False,
+        )
+        if result.returncode == 0:
+            return result.stdout.strip()[:12]  # Short SHA
+    except Exception:
+        pass
+    return None
+
+
 class EventRecorder:
     """
     Records orchestration events to JSONL.
@@ -38,19 +57,31 @@ class EventRecorder:
     - Non-blocking: Synchronous writes (async optional for Phase 2)
     - Stateful: Tracks current turn state in memory
     - Resilient: Handles missing data gracefully
+    - Streaming: Finished events are kept in memory and pushed to ``on_event``,
+      so scorers never need to re-read the JSONL file
     """
 
-    def __init__(self, run_id: str, output_dir: Path):
+    def __init__(
+        self,
+        run_id: str,
+        output_dir: Optional[Path] = None,
+        on_event: Optional[Callable[[TurnEvent], None]] = None,
+    ):
         """
         Initialize event recorder.
 
         Args:
             run_id: Unique identifier for this evaluation run
-            output_dir: Directory to write events.jsonl
+            output_dir: Directory to write events.jsonl (None = in-memory only)
+            on_event: Optional callback invoked with each finished TurnEvent
         """
         self.run_id = run_id
-        self.output_path = output_dir / f"{run_id}_events.jsonl"
-        self.output_path.parent.mkdir(parents=True, exist_ok=True)
+        self.output_path: Optional[Path] = None
+        if output_dir is not None:
+            self.output_path = output_dir / f"{run_id}_events.jsonl"
+            self.output_path.parent.mkdir(parents=True, exist_ok=True)
+        self._on_event = on_event
+        self._events: List[TurnEvent] = []
 
         # In-memory state for current turn
         self._current_turn: Dict[str, Any] = {}
@@ -65,19 +96,7 @@ class EventRecorder:
 
     def _get_git_commit_sha(self) -> Optional[str]:
         """Get current git commit SHA for versioning."""
-        try:
-            result = subprocess.run(
-                ["git", "rev-parse", "HEAD"],
-                capture_output=True,
-                text=True,
-                timeout=2,
-                check=False,
-            )
-            if result.returncode == 0:
-                return result.stdout.strip()[:12]  # Short SHA
-        except Exception:
-            pass
-        return None
+        return _git_commit_sha()
 
     def record_turn_start(
         self,
@@ -288,9 +307,14 @@ class EventRecorder:
             error=error,
         )
 
+        self._events.append(event)
+        if self._on_event:
+            self._on_event(event)
+
         # Write to JSONL (append mode)
-        with open(self.output_path, "a") as f:
-            f.write(event.model_dump_json() + "\n")
+        if self.output_path is not None:
+            with open(self.output_path, "a") as f:
+                f.write(event.model_dump_json() + "\n")
 
         logger.info(
             f"Turn end | turn_id={turn_id} agent={agent} "
@@ -313,13 +337,19 @@ class EventRecorder:
 
     def get_events(self) -> List[TurnEvent]:
         """
-        Load all events from JSONL file.
+        Return all events recorded by this instance.
+
+        Falls back to the JSONL file when this recorder hasn't recorded
+        anything itself (e.g. re-opening a previous run).
 
         Returns:
             List of TurnEvent objects
         """
+        if self._events:
+            return list(self._events)
+
         events = []
-        if not self.output_path.exists():
+        if self.output_path is None or not self.output_path.exists():
             return events
 
         with open(self.output_path) as f:
@@ -0,0 +1,525 @@
+"""
+Replay Backend
+==============
+
+Deterministic local stand-in for the LLM and tool layer.
+
+Lets full evaluation suites run offline and reproducibly:
+- Recorded turns (JSONL or inline ``replay`` blocks in scenario YAML) are
+  replayed verbatim, including tool calls, tool results and handoffs
+- Turns without a recording fail by default. Non-strict backends instead
+  synthesize a hash-stable response that calls the scenario's expected
+  tools; such turns are marked ``synthesized`` and counted as misses, since
+  they pass tool assertions by construction
+- A RecordingOrchestrator wraps a live orchestrator to capture new recordings
+
+Design principles:
+- Standalone: No production code dependencies (mirrors OrchestratorResult shape)
+- Deterministic: Same inputs always produce the same outputs
+- Picklable factory: Safe to ship to worker processes for sharded runs
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import hashlib
+import json
+from collections import deque
+from collections.abc import Callable
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+from utils.ml_logging import get_logger
+
+logger = get_logger(__name__)
+
+
+# =============================================================================
+# Recorded Data
+# =============================================================================
+
+
+@dataclass
+class RecordedToolCall:
+    """A single recorded tool invocation."""
+
+    name: str
+    arguments: dict[str, Any] = field(default_factory=dict)
+    result: Any = None
+    latency_ms: float = 0.0
+
+
+@dataclass
+class RecordedTurn:
+    """A single recorded orchestrator turn (LLM output + tool activity)."""
+
+    agent: str
+    user_text: str
+    response_text: str = ""
+    tool_calls: list[RecordedToolCall] = field(default_factory=list)
+    handoff_to: str | None = None
+    latency_ms: float = 0.0
+    input_tokens: int | None = None
+    output_tokens: int | None = None
+    occurrence: int = 0
+    synthesized: bool = False
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> RecordedTurn:
+        """Build a RecordedTurn from a JSON/YAML mapping."""
+        return cls(
+            agent=data.get("agent", ""),
+            user_text=data.get("user_text", ""),
+            response_text=data.get("response_text", ""),
+            tool_calls=[RecordedToolCall(**tc) for tc in data.get("tool_calls", [])],
+            handoff_to=data.get("handoff_to"),
+            latency_ms=float(data.get("latency_ms", 0.0)),
+            input_tokens=data.get("input_tokens"),
+            output_tokens=data.get("output_tokens"),
+            occurrence=int(data.get("occurrence", 0)),
+        )
+
+
+@dataclass
+class ReplayResult:
+    """Result returned by ReplayOrchestrator (same shape as OrchestratorResult)."""
+
+    response_text: str = ""
+    tool_calls: list[dict[str, Any]] = field(default_factory=list)
+    agent_name: str | None = None
+    latency_ms: float | None = None
+    input_tokens: int | None = None
+    output_tokens: int | None = None
+    interrupted: bool = False
+    error: str | None = None
+    should_end_call: bool = False
+    metadata: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def response_tokens(self) -> int | None:
+        """Alias read by EvaluationOrchestratorWrapper."""
+        return self.output_tokens
+
+
+def _normalize(text: str) -> str:
+    """Normalize user text so whitespace/case noise doesn't break lookups."""
+    return " ".join(text.lower().split())
+
+
+def replay_key(agent: str, user_text: str, occurrence: int = 0) -> str:
+    """
+    Stable lookup key for a (agent, user_text) pair.
+
+    ``occurrence`` distinguishes repeats of the same utterance within a
+    scenario ("yes", "no"); the first occurrence keeps the unsuffixed key.
+    """
+    raw = f"{agent}\x1f{_normalize(user_text)}"
+    if occurrence:
+        raw += f"\x1f{occurrence}"
+    return hashlib.sha256(raw.encode()).hexdigest()[:24]
+
+
+@functools.lru_cache(maxsize=8)
+def _load_recordings(path: Path) -> tuple[RecordedTurn, ...]:
+    """Parse a recordings file once per process (shared by every scenario)."""
+    turns = []
+    with open(path) as f:
+        for line in f:
+            if line.strip():
+                turns.append(RecordedTurn.from_dict(json.loads(line)))
+    logger.info(f"Loaded {len(turns)} replay recordings from {path}")
+    return tuple(turns)
+
+
+# =============================================================================
+# Replay Backend
+# =============================================================================
+
+
+class ReplayBackend:
+    """
+    In-memory store of recorded turns with deterministic fallback synthesis.
+
+    Lookups are keyed on (agent, normalized user text, occurrence), where the
+    occurrence counts earlier lookups of the same utterance. A repeat without
+    its own recording falls back to the latest earlier one. When no recording
+    exists, ``strict=True`` (the default) raises and ``strict=False``
+    synthesizes a response marked ``synthesized``.
+    """
+
+    def __init__(
+        self,
+        recordings: list[RecordedTurn] | None = None,
+        *,
+        strict: bool = True,
+        default_latency_ms: float = 0.0,
+    ):
+        """
+        Initialize replay backend.
+
+        Args:
+            recordings: Pre-recorded turns
+            strict: Raise KeyError on a miss instead of synthesizing
+            default_latency_ms: Simulated latency for synthesized turns
+        """
+        self.strict = strict
+        self.default_latency_ms = default_latency_ms
+        self._turns: dict[str, RecordedTurn] = {}
+        self._expected_tools: dict[str, list[str]] = {}
+        self._seen: dict[str, int] = {}
+        self.hits = 0
+        self.misses = 0
+        for turn in recordings or []:
+            self.add(turn)
+
+    def __len__(self) -> int:
+        return len(self._turns)
+
+    def add(self, turn: RecordedTurn) -> None:
+        """Add (or replace) a recorded turn."""
+        self._turns[replay_key(turn.agent, turn.user_text, turn.occurrence)] = turn
+
+    def expect_tools(
+        self, agent: str, user_text: str, tools: list[str], occurrence: int = 0
+    ) -> None:
+        """Register expected tools used when synthesizing a missing turn."""
+        self._expected_tools[replay_key(agent, user_text, occurrence)] = list(tools)
+
+    def reset(self) -> None:
+        """Restart occurrence counting (e.g. before replaying a scenario again)."""
+        self._seen.clear()
+
+    def lookup(self, agent: str, user_text: str) -> RecordedTurn:
+        """
+        Return the recorded turn for (agent, user_text), synthesizing on a miss.
+
+        Raises:
+            KeyError: If strict and no recording exists
+        """
+        base = replay_key(agent, user_text)
+        occurrence = self._seen.get(base, 0)
+        self._seen[base] = occurrence + 1
+
+        for n in range(occurrence, -1, -1):
+            turn = self._turns.get(replay_key(agent, user_text, n))
+            if turn is not None:
+                self.hits += 1
+                return turn
+
+        self.misses += 1
+        if self.strict:
+            raise KeyError(f"No recording for agent={agent!r} user_text={user_text[:50]!r}")
+        tools = self._expected_tools.get(replay_key(agent, user_text, occurrence))
+        return self._synthesize(agent, user_text, tools or [])
+
+    def _synthesize(self, agent: str, user_text: str, tools: list[str]) -> RecordedTurn:
+        """Build a hash-stable stand-in turn."""
+        digest = replay_key(agent, user_text)[:8]
+        tool_calls = [
+            RecordedToolCall(
+                name=name,
+                arguments={"query": user_text},
+                result={"tool": name, "replay_id": digest, "success": True},
+            )
+            for name in tools
+        ]
+        return RecordedTurn(
+            agent=agent,
+            user_text=user_text,
+            response_text=f"I can help with that. Reference {digest}.",
+            tool_calls=tool_calls,
+            latency_ms=self.default_latency_ms,
+            input_tokens=len(user_text.split()) * 2,
+            output_tokens=6,
+            synthesized=True,
+        )
+
+    # -------------------------------------------------------------------------
+    # Loading / saving
+    # -------------------------------------------------------------------------
+
+    @classmethod
+    def from_jsonl(cls, path: Path, **kwargs: Any) -> ReplayBackend:
+        """Load recordings from a JSONL file (one RecordedTurn per line)."""
+        return cls(list(_load_recordings(Path(path))), **kwargs)
+
+    def load_scenario(self, scenario: dict[str, Any]) -> None:
+        """
+        Register inline ``replay`` blocks and expected tools from a scenario.
+
+        Turns are attributed to the scenario's ``agent`` (or session start
+        agent); a recorded ``handoff_to`` moves subsequent turns to the target.
+        """
+        agent = (
+            scenario.get("agent")
+            or (scenario.get("session_config") or {}).get("start_agent")
+            or "unknown"
+        )
+        occurrences: dict[str, int] = {}
+        for turn_data in scenario.get("turns", []):
+            user_text = turn_data.get("user_input", "")
+            base = replay_key(agent, user_text)
+            occurrence = occurrences.get(base, 0)
+            occurrences[base] = occurrence + 1
+            expectations = turn_data.get("expectations") or {}
+            self.expect_tools(agent, user_text, expectations.get("tools_called", []), occurrence)
+
+            replay = turn_data.get("replay")
+            if replay:
+                recorded = RecordedTurn.from_dict(
+                    {
+                        "agent": agent,
+                        "user_text": user_text,
+                        "occurrence": occurrence,
+                        **replay,
+                    }
+                )
+                self.add(recorded)
+                agent = recorded.handoff_to or agent
+
+    def dump(self, path: Path) -> None:
+        """Write all recordings to a JSONL file."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w") as f:
+            for turn in self._turns.values():
+                f.write(json.dumps(asdict(turn), default=str) + "\n")
+        logger.info(f"Wrote {len(self._turns)} replay recordings to {path}")
+
+
+# =============================================================================
+# Replay Orchestrator
+# =============================================================================
+
+
+class ReplayOrchestrator:
+    """
+    Drop-in orchestrator that replays turns from a ReplayBackend.
+
+    Drives the same callbacks as the real orchestrator (tool start/end, TTS,
+    agent switch) so EvaluationOrchestratorWrapper records it unchanged.
+    ``synthesized_turns`` counts turns served without a recording.
+    """
+
+    def __init__(
+        self,
+        backend: ReplayBackend,
+        agent_name: str,
+        model_override: dict[str, Any] | None = None,
+        time_scale: float = 1.0,
+    ):
+        """
+        Initialize replay orchestrator.
+
+        Args:
+            backend: Replay backend to serve turns from
+            agent_name: Starting agent
+            model_override: Model config reported to the recorder
+            time_scale: Multiplier for recorded latencies (0 = no sleeping)
+        """
+        self._backend = backend
+        self._active_agent = agent_name
+        self._time_scale = time_scale
+        self.synthesized_turns = 0
+        model = SimpleNamespace(**{"deployment_id": "replay", **(model_override or {})})
+        self.agents: dict[str, Any] = _ModelLookup(model)
+
+    async def _sleep(self, latency_ms: float) -> None:
+        if latency_ms > 0 and self._time_scale > 0:
+            await asyncio.sleep(latency_ms * self._time_scale / 1000)
+
+    async def process_turn(
+        self,
+        context: Any,
+        on_tts_chunk: Callable | None = None,
+        on_tool_start: Callable | None = None,
+        on_tool_end: Callable | None = None,
+        on_agent_switch: Callable | None = None,
+        **kwargs: Any,
+    ) -> ReplayResult:
+        """Replay one turn through the standard orchestrator callbacks."""
+        turn = self._backend.lookup(self._active_agent, context.user_text)
+        if turn.synthesized:
+            self.synthesized_turns += 1
+
+        tool_calls = []
+        for tc in turn.tool_calls:
+            if on_tool_start:
+                await on_tool_start(tc.name, tc.arguments)
+            await self._sleep(tc.latency_ms)
+            if on_tool_end:
+                await on_tool_end(tc.name, tc.result)
+            tool_calls.append({"name": tc.name, "arguments": tc.arguments})
+
+        await self._sleep(turn.latency_ms)
+
+        if turn.handoff_to and turn.handoff_to != self._active_agent:
+            previous = self._active_agent
+            self._active_agent = turn.handoff_to
+            if on_agent_switch:
+                await on_agent_switch(previous, turn.handoff_to)
+
+        if on_tts_chunk and turn.response_text:
+            await on_tts_chunk(turn.response_text)
+
+        return ReplayResult(
+            response_text=turn.response_text,
+            tool_calls=tool_calls,
+            agent_name=self._active_agent,
+            latency_ms=turn.latency_ms,
+            input_tokens=turn.input_tokens,
+            output_tokens=turn.output_tokens,
+            metadata={"synthesized": True} if turn.synthesized else {},
+        )
+
+
+class _ModelLookup(dict):
+    """Returns the same model config for every agent (wrapper reads ``agents[name].model``)."""
+
+    def __init__(self, model: Any):
+        super().__init__()
+        self._agent = SimpleNamespace(model=model)
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        return self._agent
+
+
+@dataclass
+class ReplayOrchestratorFactory:
+    """
+    Picklable orchestrator factory for ScenarioRunner.
+
+    Builds a fresh ReplayOrchestrator per scenario, seeded with the shared
+    recordings file (if any) plus the scenario's inline replay blocks.
+    """
+
+    replay_path: Path | None = None
+    strict: bool = True
+    time_scale: float = 1.0
+    default_latency_ms: float = 0.0
+
+    def __call__(
+        self,
+        agent_name: str,
+        model_override: dict[str, Any] | None,
+        scenario: dict[str, Any],
+    ) -> ReplayOrchestrator:
+        if self.replay_path:
+            backend = ReplayBackend.from_jsonl(
+                self.replay_path,
+                strict=self.strict,
+                default_latency_ms=self.default_latency_ms,
+            )
+        else:
+            backend = ReplayBackend(strict=self.strict, default_latency_ms=self.default_latency_ms)
+        backend.load_scenario(scenario)
+        return ReplayOrchestrator(
+            backend,
+            agent_name=agent_name,
+            model_override=model_override,
+            time_scale=self.time_scale,
+        )
+
+
+# =============================================================================
+# Recording Orchestrator
+# =============================================================================
+
+
+class RecordingOrchestrator:
+    """
+    Wraps a live orchestrator and captures every turn into a ReplayBackend.
+
+    Run a suite once against real services, then ``backend.dump(path)`` to
+    produce recordings for offline replay.
+    """
+
+    def __init__(self, orchestrator: Any, backend: ReplayBackend | None = None):
+        """
+        Initialize recording orchestrator.
+
+        Args:
+            orchestrator: Real orchestrator to delegate to
+            backend: Backend to record into (new one if omitted)
+        """
+        self._orchestrator = orchestrator
+        self.backend = backend or ReplayBackend()
+        self._occurrences: dict[str, int] = {}
+
+    async def process_turn(
+        self,
+        context: Any,
+        on_tool_start: Callable | None = None,
+        on_tool_end: Callable | None = None,
+        **kwargs: Any,
+    ) -> Any:
+        """Delegate the turn and record LLM/tool activity."""
+        loop = asyncio.get_running_loop()
+        agent = getattr(self._orchestrator, "_active_agent", None) or "unknown"
+        # In-flight starts keyed by tool-call id; callbacks that don't pass one
+        # are matched first-in, first-out per tool name
+        pending: dict[str, deque[tuple[dict[str, Any], float]]] = {}
+        tool_calls: list[RecordedToolCall] = []
+
+        async def _start(tool_name: str, arguments: Any, **kw: Any) -> None:
+            args = arguments if isinstance(arguments, dict) else {"raw": str(arguments)}
+            key = kw.get("tool_call_id") or tool_name
+            pending.setdefault(key, deque()).append((args, loop.time()))
+            if on_tool_start:
+                await on_tool_start(tool_name, arguments, **kw)
+
+        async def _end(tool_name: str, result: Any, **kw: Any) -> None:
+            starts = pending.get(kw.get("tool_call_id") or tool_name)
+            args, started = starts.popleft() if starts else ({}, loop.time())
+            tool_calls.append(
+                RecordedToolCall(
+                    name=tool_name,
+                    arguments=args,
+                    result=result,
+                    latency_ms=(loop.time() - started) * 1000,
+                )
+            )
+            if on_tool_end:
+                await on_tool_end(tool_name, result, **kw)
+
+        base = replay_key(agent, context.user_text)
+        occurrence = self._occurrences.get(base, 0)
+        self._occurrences[base] = occurrence + 1
+
+        started = loop.time()
+        result = await self._orchestrator.process_turn(
+            context, on_tool_start=_start, on_tool_end=_end, **kwargs
+        )
+        final_agent = getattr(self._orchestrator, "_active_agent", None) or agent
+
+        self.backend.add(
+            RecordedTurn(
+                agent=agent,
+                user_text=context.user_text,
+                response_text=getattr(result, "response_text", "") or "",
+                tool_calls=tool_calls,
+                handoff_to=final_agent if final_agent != agent else None,
+                latency_ms=(loop.time() - started) * 1000,
+                input_tokens=getattr(result, "input_tokens", None),
+                output_tokens=getattr(result, "output_tokens", None),
+                occurrence=occurrence,
+            )
+        )
+        return result
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._orchestrator, name)
+
+
+__all__ = [
+    "RecordedToolCall",
+    "RecordedTurn",
+    "ReplayResult",
+    "ReplayBackend",
+    "ReplayOrchestrator",
+    "ReplayOrchestratorFactory",
+    "RecordingOrchestrator",
+    "replay_key",
+]
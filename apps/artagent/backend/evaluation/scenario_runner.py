@@ -9,13 +9,16 @@ Design principles:
 - Delegates to existing components (EventRecorder, Wrapper, Scorer)
 - No duplication of orchestrator logic
 - Supports both single scenarios and A/B comparisons
+- Events stream to the scorer in memory (JSONL persistence is optional)
 """
 
 from __future__ import annotations
 
+import asyncio
+import json
 import time
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
 import yaml
 
@@ -28,13 +31,36 @@ from utils.ml_logging import get_logger
 
 logger = get_logger(__name__)
 
+# (agent_name, model_override, scenario) -> orchestrator exposing process_turn()
+OrchestratorFactory = Callable[[str, "dict[str, Any] | None", "dict[str, Any]"], Any]
+
+
+def validate_scenario(scenario: dict[str, Any]) -> dict[str, Any]:
+    """Validate the minimal scenario shape and return it."""
+    if "scenario_name" not in scenario:
+        raise ValueError("Scenario must have 'scenario_name' field")
+
+    if "turns" not in scenario:
+        raise ValueError("Scenario must have 'turns' field")
+
+    return scenario
+
+
+def scenario_agent(scenario: dict[str, Any]) -> str:
+    """Starting agent for a scenario (explicit agent, then session start agent)."""
+    return (
+        scenario.get("agent")
+        or (scenario.get("session_config") or {}).get("start_agent")
+        or "unknown"
+    )
+
 
 class ScenarioRunner:
     """
     Runs evaluation scenarios from YAML files.
 
     Handles:
-    - Loading YAML scenario definitions
+    - Loading YAML scenario definitions (or accepting an in-memory dict)
     - Setting up mock dependencies
     - Running multi-turn conversations
     - Delegating to EventRecorder for recording
@@ -43,8 +69,12 @@ class ScenarioRunner:
 
     def __init__(
         self,
-        scenario_path: Path,
+        scenario_path: Path | None = None,
         output_dir: Path | None = None,
+        *,
+        scenario: dict[str, Any] | None = None,
+        orchestrator_factory: OrchestratorFactory | None = None,
+        persist_events: bool = True,
     ):
         """
         Initialize scenario runner.
@@ -52,11 +82,25 @@ class ScenarioRunner:
         Args:
             scenario_path: Path to YAML scenario file
             output_dir: Output directory for results (default: runs/)
+            scenario: Already-loaded scenario dict (instead of scenario_path)
+            orchestrator_factory: Builds the orchestrator for this scenario
+                (e.g. ReplayOrchestratorFactory for offline runs)
+            persist_events: Also write events to JSONL (scoring always uses memory)
         """
+        if scenario is None and scenario_path is None:
+            raise ValueError("Either scenario_path or scenario must be provided")
+
         self.scenario_path = scenario_path
-        self.scenario = self._load_scenario(scenario_path)
+        if scenario is not None:
+            self.scenario = validate_scenario(scenario)
+        else:
+            self.scenario = self._load_scenario(scenario_path)
         self.output_dir = output_dir or Path("runs")
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self._orchestrator_factory = orchestrator_factory
+        self._persist_events = persist_events
+        # Turns the replay backend synthesized instead of replaying (set by run())
+        self.replay_misses = 0
 
     def _load_scenario(self, path: Path) -> dict[str, Any]:
         """Load and validate scenario YAML."""
@@ -65,12 +109,7 @@ class ScenarioRunner:
         with open(path) as f:
             scenario = yaml.safe_load(f)
 
-        # Basic validation
-        if "scenario_name" not in scenario:
-            raise ValueError("Scenario must have 'scenario_name' field")
-
-        if "turns" not in scenario:
-            raise ValueError("Scenario must have 'turns' field")
+        validate_scenario(scenario)
 
         logger.info(f"Loaded scenario: {scenario['scenario_name']}")
         return scenario
@@ -113,7 +152,7 @@ class ScenarioRunner:
             RunSummary with aggregated metrics
         """
         scenario_name = self.scenario["scenario_name"]
-        agent_name = self.scenario.get("agent", "unknown")
+        agent_name = scenario_agent(self.scenario)
 
         logger.info(f"Running scenario: {scenario_name}")
 
@@ -122,14 +161,19 @@ class ScenarioRunner:
         context_vars = self.scenario.get("metadata", {}).get("context", {})
         memo_manager = MockMemoManager(session_id, context_vars)
 
-        # Create recorder
+        # Create recorder (events stay in memory; JSONL only if persisting)
         run_id = f"{scenario_name}_{int(time.time())}"
-        recorder = EventRecorder(run_id=run_id, output_dir=self.output_dir)
+        recorder = EventRecorder(
+            run_id=run_id,
+            output_dir=self.output_dir if self._persist_events else None,
+        )
 
         # Create orchestrator (wrapped for recording)
-        # NOTE: This will be implemented when we integrate with real orchestrator
         model_override = self.scenario.get("model_override")
-        orchestrator = self._create_orchestrator(agent_name, model_override)
+        if self._orchestrator_factory is not None:
+            orchestrator = self._orchestrator_factory(agent_name, model_override, self.scenario)
+        else:
+            orchestrator = self._create_orchestrator(agent_name, model_override)
         eval_orchestrator = EvaluationOrchestratorWrapper(
             orchestrator=orchestrator,
             recorder=recorder,
@@ -151,6 +195,7 @@ class ScenarioRunner:
                 metadata={
                     "scenario_name": scenario_name,
                     **context_vars,
+                    "run_id": turn_id,
                 },
             )
 
@@ -163,9 +208,16 @@ class ScenarioRunner:
 
             logger.info(f"Turn {turn_id} complete: {len(result.response_text)} chars")
 
-        # Score the results
+        self.replay_misses = getattr(orchestrator, "synthesized_turns", 0)
+        if self.replay_misses:
+            logger.warning(
+                f"Scenario {scenario_name}: {self.replay_misses} turn(s) had no recording "
+                "and were synthesized; tool expectations are not meaningful"
+            )
+
+        # Score the results straight from the recorder (no JSONL round-trip)
         scorer = MetricsScorer()
-        events = scorer.load_events(self.output_dir / f"{run_id}_events.jsonl")
+        events = recorder.get_events()
 
         summary = scorer.generate_summary(
             events,
@@ -184,6 +236,42 @@ class ScenarioRunner:
         return summary
 
 
+def validate_comparison(comparison: dict[str, Any]) -> dict[str, Any]:
+    """Validate the minimal comparison shape and return it."""
+    if "comparison_name" not in comparison:
+        raise ValueError("Comparison must have 'comparison_name' field")
+
+    if "variants" not in comparison:
+        raise ValueError("Comparison must have 'variants' field")
+
+    if len(comparison["variants"]) < 2:
+        raise ValueError("Comparison must have at least 2 variants")
+
+    return comparison
+
+
+def build_variant_scenarios(comparison: dict[str, Any]) -> dict[str, dict[str, Any]]:
+    """
+    Expand a comparison into one in-memory scenario dict per variant.
+
+    Returns:
+        Dict mapping variant_id -> scenario dict (in YAML variant order)
+    """
+    comparison_name = comparison["comparison_name"]
+    scenarios = {}
+    for variant in comparison["variants"]:
+        variant_id = variant["variant_id"]
+        scenarios[variant_id] = {
+            "scenario_name": f"{comparison_name}_{variant_id}",
+            "agent": variant.get("agent"),
+            "model_override": variant.get("model_override"),
+            "session_config": comparison.get("session_config"),
+            "turns": comparison["turns"],
+            "metadata": comparison.get("metadata", {}),
+        }
+    return scenarios
+
+
 class ComparisonRunner:
     """
     Runs A/B comparison scenarios.
@@ -193,8 +281,13 @@ class ComparisonRunner:
 
     def __init__(
         self,
-        comparison_path: Path,
+        comparison_path: Path | None = None,
         output_dir: Path | None = None,
+        *,
+        comparison: dict[str, Any] | None = None,
+        orchestrator_factory: OrchestratorFactory | None = None,
+        max_concurrency: int = 4,
+        persist_events: bool = True,
     ):
         """
         Initialize comparison runner.
@@ -202,10 +295,23 @@ class ComparisonRunner:
         Args:
             comparison_path: Path to comparison YAML file
             output_dir: Output directory for results
+            comparison: Already-loaded comparison dict (instead of comparison_path)
+            orchestrator_factory: Passed through to each variant's ScenarioRunner
+            max_concurrency: Maximum number of variants running at once
+            persist_events: Also write per-variant events to JSONL
         """
+        if comparison is None and comparison_path is None:
+            raise ValueError("Either comparison_path or comparison must be provided")
+
         self.comparison_path = comparison_path
-        self.comparison = self._load_comparison(comparison_path)
+        if comparison is not None:
+            self.comparison = validate_comparison(comparison)
+        else:
+            self.comparison = self._load_comparison(comparison_path)
         self.output_dir = output_dir or Path("runs")
+        self._orchestrator_factory = orchestrator_factory
+        self._max_concurrency = max(1, max_concurrency)
+        self._persist_events = persist_events
 
     def _load_comparison(self, path: Path) -> dict[str, Any]:
         """Load and validate comparison YAML."""
@@ -214,25 +320,17 @@ class ComparisonRunner:
         with open(path) as f:
             comparison = yaml.safe_load(f)
 
-        # Validate
-        if "comparison_name" not in comparison:
-            raise ValueError("Comparison must have 'comparison_name' field")
-
-        if "variants" not in comparison:
-            raise ValueError("Comparison must have 'variants' field")
-
-        if len(comparison["variants"]) < 2:
-            raise ValueError("Comparison must have at least 2 variants")
+        validate_comparison(comparison)
 
         logger.info(f"Loaded comparison: {comparison['comparison_name']}")
         return comparison
 
     async def run(self) -> dict[str, RunSummary]:
         """
-        Run all variants and compare.
+        Run all variants concurrently (bounded by max_concurrency) and compare.
 
         Returns:
-            Dict mapping variant_id -> RunSummary
+            Dict mapping variant_id -> RunSummary (in YAML variant order)
         """
         comparison_name = self.comparison["comparison_name"]
         logger.info(f"Running comparison: {comparison_name}")
@@ -241,37 +339,26 @@ class ComparisonRunner:
         comparison_dir = self.output_dir / comparison_name
         comparison_dir.mkdir(parents=True, exist_ok=True)
 
-        results = {}
-
-        # Run each variant
-        for variant in self.comparison["variants"]:
-            variant_id = variant["variant_id"]
-            logger.info(f"Running variant: {variant_id}")
-
-            # Build scenario for this variant
-            scenario = {
-                "scenario_name": f"{comparison_name}_{variant_id}",
-                "agent": variant.get("agent"),
-                "model_override": variant.get("model_override"),
-                "turns": self.comparison["turns"],
-                "metadata": self.comparison.get("metadata", {}),
-            }
-
-            # Create temporary scenario file
-            scenario_path = comparison_dir / f"{variant_id}_scenario.yaml"
-            with open(scenario_path, "w") as f:
-                yaml.dump(scenario, f)
-
-            # Run scenario
-            runner = ScenarioRunner(
-                scenario_path=scenario_path,
-                output_dir=comparison_dir / variant_id,
-            )
-
-            summary = await runner.run()
-            results[variant_id] = summary
-
-            logger.info(f"Variant {variant_id} complete")
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+
+        async def run_variant(variant_id: str, scenario: dict[str, Any]) -> RunSummary:
+            async with semaphore:
+                logger.info(f"Running variant: {variant_id}")
+                runner = ScenarioRunner(
+                    scenario=scenario,
+                    output_dir=comparison_dir / variant_id,
+                    orchestrator_factory=self._orchestrator_factory,
+                    persist_events=self._persist_events,
+                )
+                summary = await runner.run()
+                logger.info(f"Variant {variant_id} complete")
+                return summary
+
+        scenarios = build_variant_scenarios(self.comparison)
+        summaries = await asyncio.gather(
+            *(run_variant(variant_id, scenario) for variant_id, scenario in scenarios.items())
+        )
+        results = dict(zip(scenarios.keys(), summaries, strict=True))
 
         # Compare results
         logger.info("Comparing variants...")
@@ -336,7 +423,6 @@ class ComparisonRunner:
         # Save comparison report
         comparison_path = output_dir / "comparison.json"
         with open(comparison_path, "w") as f:
-            import json
             json.dump(report, f, indent=2)
 
         logger.info(f"Comparison report saved: {comparison_path}")
@@ -364,4 +450,9 @@ class ComparisonRunner:
 __all__ = [
     "ScenarioRunner",
     "ComparisonRunner",
+    "OrchestratorFactory",
+    "build_variant_scenarios",
+    "scenario_agent",
+    "validate_comparison",
+    "validate_scenario",
 ]
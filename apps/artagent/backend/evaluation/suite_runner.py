@@ -0,0 +1,328 @@
+"""
+Suite Runner
+============
+
+Runs many scenarios and comparison variants concurrently.
+
+Design principles:
+- Flat job list: comparisons are expanded into one job per variant
+- Bounded concurrency: an asyncio.Semaphore caps in-flight scenarios
+- Optional sharding: jobs are balanced across worker processes by turn count
+- Failure isolation: one failing scenario never aborts the rest of the suite
+- In-memory scoring: events stream from EventRecorder to MetricsScorer
+
+Typical nightly usage (offline, reproducible):
+
+    runner = SuiteRunner(
+        orchestrator_factory=ReplayOrchestratorFactory(replay_path=Path("recordings.jsonl")),
+        max_concurrency=32,
+        processes=4,
+    )
+    result = asyncio.run(runner.run(SuiteRunner.discover([Path("tests/evaluation/scenarios")])))
+"""
+
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import time
+from collections import Counter
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import yaml
+from apps.artagent.backend.evaluation.scenario_runner import (
+    OrchestratorFactory,
+    ScenarioRunner,
+    build_variant_scenarios,
+    validate_comparison,
+    validate_scenario,
+)
+from apps.artagent.backend.evaluation.schemas import RunSummary
+from utils.ml_logging import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class EvaluationJob:
+    """A single scenario (or comparison variant) to run."""
+
+    name: str
+    scenario: dict[str, Any]
+    comparison_name: str | None = None
+    variant_id: str | None = None
+
+    @property
+    def weight(self) -> int:
+        """Relative cost used to balance shards (number of turns)."""
+        return max(1, len(self.scenario.get("turns", [])))
+
+
+@dataclass
+class SuiteResult:
+    """Outcome of a suite run."""
+
+    summaries: dict[str, RunSummary] = field(default_factory=dict)
+    failures: dict[str, str] = field(default_factory=dict)
+    # Scenario name -> turns synthesized by a non-strict replay backend
+    replay_misses: dict[str, int] = field(default_factory=dict)
+    duration_s: float = 0.0
+
+    @property
+    def total(self) -> int:
+        return len(self.summaries) + len(self.failures)
+
+    @property
+    def flagged(self) -> list[str]:
+        """Completed scenarios whose scores include synthesized (unrecorded) turns."""
+        return sorted(name for name, misses in self.replay_misses.items() if misses)
+
+    def merge(self, other: SuiteResult) -> None:
+        """Fold another (shard) result into this one."""
+        self.summaries.update(other.summaries)
+        self.failures.update(other.failures)
+        self.replay_misses.update(other.replay_misses)
+
+
+def expand_jobs(data: dict[str, Any]) -> list[EvaluationJob]:
+    """
+    Turn a loaded scenario or comparison YAML into evaluation jobs.
+
+    Args:
+        data: Parsed YAML (scenario or comparison)
+
+    Returns:
+        One job for a scenario, one job per variant for a comparison
+    """
+    if "variants" in data:
+        validate_comparison(data)
+        comparison_name = data["comparison_name"]
+        return [
+            EvaluationJob(
+                name=scenario["scenario_name"],
+                scenario=scenario,
+                comparison_name=comparison_name,
+                variant_id=variant_id,
+            )
+            for variant_id, scenario in build_variant_scenarios(data).items()
+        ]
+
+    validate_scenario(data)
+    return [EvaluationJob(name=data["scenario_name"], scenario=data)]
+
+
+def check_unique_names(jobs: list[EvaluationJob]) -> None:
+    """
+    Reject job lists with repeated names.
+
+    Results and output directories are keyed by job name, so a duplicate
+    would silently overwrite another scenario's summary.
+
+    Raises:
+        ValueError: If any name appears more than once
+    """
+    counts = Counter(job.name for job in jobs)
+    duplicates = sorted(name for name, count in counts.items() if count > 1)
+    if duplicates:
+        raise ValueError(f"Duplicate scenario names: {', '.join(duplicates)}")
+
+
+def shard_jobs(jobs: list[EvaluationJob], shards: int) -> list[list[EvaluationJob]]:
+    """
+    Split jobs into balanced shards (longest-processing-time first).
+
+    Deterministic: the same job list always produces the same shards.
+    """
+    shards = max(1, min(shards, len(jobs)))
+    buckets: list[list[EvaluationJob]] = [[] for _ in range(shards)]
+    loads = [0] * shards
+    for job in sorted(jobs, key=lambda j: (-j.weight, j.name)):
+        idx = loads.index(min(loads))
+        buckets[idx].append(job)
+        loads[idx] += job.weight
+    return [bucket for bucket in buckets if bucket]
+
+
+async def _run_jobs(
+    jobs: list[EvaluationJob],
+    output_dir: Path,
+    orchestrator_factory: OrchestratorFactory | None,
+    max_concurrency: int,
+    persist_events: bool,
+) -> SuiteResult:
+    """Run jobs on the current event loop under a concurrency limit."""
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+    result = SuiteResult()
+
+    async def run_one(job: EvaluationJob) -> None:
+        async with semaphore:
+            job_dir = output_dir / (job.comparison_name or "") / (job.variant_id or job.name)
+            try:
+                runner = ScenarioRunner(
+                    scenario=job.scenario,
+                    output_dir=job_dir,
+                    orchestrator_factory=orchestrator_factory,
+                    persist_events=persist_events,
+                )
+                result.summaries[job.name] = await runner.run()
+                if runner.replay_misses:
+                    result.replay_misses[job.name] = runner.replay_misses
+            except Exception as exc:
+                logger.error(f"Scenario failed | name={job.name} error={exc}")
+                result.failures[job.name] = f"{type(exc).__name__}: {exc}"
+
+    await asyncio.gather(*(run_one(job) for job in jobs))
+    return result
+
+
+def _run_shard(
+    jobs: list[EvaluationJob],
+    output_dir: Path,
+    orchestrator_factory: OrchestratorFactory | None,
+    max_concurrency: int,
+    persist_events: bool,
+) -> SuiteResult:
+    """Worker-process entry point: run one shard on a fresh event loop."""
+    return asyncio.run(
+        _run_jobs(jobs, output_dir, orchestrator_factory, max_concurrency, persist_events)
+    )
+
+
+class SuiteRunner:
+    """
+    Runs a suite of scenarios/comparisons concurrently, optionally sharded
+    across worker processes.
+
+    The orchestrator factory must be picklable when ``processes > 1``
+    (ReplayOrchestratorFactory is).
+    """
+
+    def __init__(
+        self,
+        output_dir: Path | None = None,
+        *,
+        orchestrator_factory: OrchestratorFactory | None = None,
+        max_concurrency: int = 8,
+        processes: int = 1,
+        persist_events: bool = False,
+    ):
+        """
+        Initialize suite runner.
+
+        Args:
+            output_dir: Root output directory (default: runs/)
+            orchestrator_factory: Builds the orchestrator for each scenario
+            max_concurrency: Max in-flight scenarios per process
+            processes: Number of worker processes (1 = run in this process)
+            persist_events: Also write per-scenario events JSONL
+        """
+        self.output_dir = output_dir or Path("runs")
+        self._orchestrator_factory = orchestrator_factory
+        self._max_concurrency = max(1, max_concurrency)
+        self._processes = max(1, processes)
+        self._persist_events = persist_events
+
+    @staticmethod
+    def discover(paths: Iterable[Path]) -> list[EvaluationJob]:
+        """
+        Load jobs from YAML files and/or directories (searched recursively).
+
+        Returns:
+            Jobs sorted by name for deterministic ordering
+
+        Raises:
+            ValueError: If two files define the same scenario name
+        """
+        files: list[Path] = []
+        for path in paths:
+            if path.is_dir():
+                files.extend(sorted(path.rglob("*.yaml")))
+            else:
+                files.append(path)
+
+        jobs: list[EvaluationJob] = []
+        for file in files:
+            with open(file) as f:
+                data = yaml.safe_load(f)
+            if not isinstance(data, dict):
+                continue
+            try:
+                jobs.extend(expand_jobs(data))
+            except ValueError as exc:
+                logger.warning(f"Skipping {file}: {exc}")
+
+        check_unique_names(jobs)
+        return sorted(jobs, key=lambda j: j.name)
+
+    async def run(self, jobs: list[EvaluationJob]) -> SuiteResult:
+        """
+        Run all jobs and collect summaries.
+
+        Args:
+            jobs: Jobs to run (see discover() / expand_jobs())
+
+        Returns:
+            SuiteResult with per-job summaries and failures
+
+        Raises:
+            ValueError: If two jobs share a name
+        """
+        check_unique_names(jobs)
+        start = time.perf_counter()
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        logger.info(
+            f"Running suite | jobs={len(jobs)} concurrency={self._max_concurrency} "
+            f"processes={self._processes}"
+        )
+
+        if self._processes == 1 or len(jobs) <= 1:
+            result = await _run_jobs(
+                jobs,
+                self.output_dir,
+                self._orchestrator_factory,
+                self._max_concurrency,
+                self._persist_events,
+            )
+        else:
+            result = SuiteResult()
+            shards = shard_jobs(jobs, self._processes)
+            loop = asyncio.get_running_loop()
+            ctx = multiprocessing.get_context("spawn")
+            with ProcessPoolExecutor(max_workers=len(shards), mp_context=ctx) as pool:
+                shard_results = await asyncio.gather(
+                    *(
+                        loop.run_in_executor(
+                            pool,
+                            _run_shard,
+                            shard,
+                            self.output_dir,
+                            self._orchestrator_factory,
+                            self._max_concurrency,
+                            self._persist_events,
+                        )
+                        for shard in shards
+                    )
+                )
+            for shard_result in shard_results:
+                result.merge(shard_result)
+
+        result.duration_s = time.perf_counter() - start
+        logger.info(
+            f"Suite complete | passed={len(result.summaries)} failed={len(result.failures)} "
+            f"synthesized={len(result.flagged)} duration={result.duration_s:.1f}s"
+        )
+        return result
+
+
+__all__ = [
+    "EvaluationJob",
+    "SuiteResult",
+    "SuiteRunner",
+    "check_unique_names",
+    "expand_jobs",
+    "shard_jobs",
+]
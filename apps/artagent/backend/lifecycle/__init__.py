@@ -7,8 +7,9 @@ Usage:
     from lifecycle import LifecycleManager, LifecycleStep
 
     manager = LifecycleManager()
-    manager.add_step("redis", start_redis, stop_redis)
-    manager.add_step("speech", start_speech)
+    manager.add_step("redis", start_redis, stop_redis, depends_on=())
+    manager.add_step("speech", start_speech, depends_on=())
+    manager.add_step("warmup", warm_up, depends_on=("redis", "speech"), critical=False)
 
     await manager.run_startup()
     # ... app runs ...
@@ -22,7 +23,11 @@ from .steps import (
     register_core_state_step,
     register_event_handlers_step,
     register_external_services_step,
+    register_health_monitor_step,
+    register_runtime_monitor_step,
     register_speech_pools_step,
+    register_token_broker_step,
+    register_tool_preload_step,
     register_warmup_step,
 )
 
@@ -36,4 +41,8 @@ __all__ = [
     "register_external_services_step",
     "register_agents_step",
     "register_event_handlers_step",
+    "register_tool_preload_step",
+    "register_health_monitor_step",
+    "register_runtime_monitor_step",
+    "register_token_broker_step",
 ]
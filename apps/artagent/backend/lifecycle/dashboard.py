@@ -17,6 +17,9 @@ if TYPE_CHECKING:
 def build_startup_dashboard(
     app: FastAPI,
     startup_results: list[tuple[str, float]],
+    *,
+    ready_time: float | None = None,
+    critical_path: list[tuple[str, float]] | None = None,
 ) -> str:
     """
     Build a clean, developer-friendly startup summary.
@@ -24,6 +27,7 @@ def build_startup_dashboard(
     Focuses on actionable information:
     - Environment and configuration
     - Key endpoints for testing
+    - Startup time and the step chain that determined it
     - Any warnings or issues
     """
     from apps.artagent.backend.config import (
@@ -78,11 +82,17 @@ def build_startup_dashboard(
     ]
 
     # Show startup timing (collapsed)
-    lines.append(f"  Startup: {total_time:.1f}s total")
+    if ready_time is not None:
+        lines.append(f"  Startup: ready in {ready_time:.1f}s ({total_time:.1f}s of step time)")
+    else:
+        lines.append(f"  Startup: {total_time:.1f}s total")
     step_summary = ", ".join(f"{name}:{dur:.1f}s" for name, dur in startup_results)
     if len(step_summary) > 55:
         step_summary = step_summary[:52] + "..."
     lines.append(f"    ({step_summary})")
+    if critical_path:
+        path_summary = " → ".join(f"{name}:{dur:.1f}s" for name, dur in critical_path)
+        lines.append(f"    Critical path: {path_summary}")
     lines.append("")
 
     # Key endpoints (most useful for developers)
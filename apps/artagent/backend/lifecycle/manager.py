@@ -3,13 +3,19 @@ Lifecycle Manager - Clean startup/shutdown orchestration.
 
 Provides a simple, maintainable way to manage application lifecycle without
 complex nested wrappers or excessive logging that overwhelms junior developers.
+
+Steps declare what they depend on and independent steps start concurrently.
+Non-critical steps (e.g. connection warmup) may finish after the app reports
+ready. Each run records per-step start/finish offsets so the dashboard can
+show which chain of steps actually determined time-to-ready.
 """
 
 from __future__ import annotations
 
+import asyncio
 import sys
 import time
-from collections.abc import Awaitable, Callable
+from collections.abc import Awaitable, Callable, Iterable
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
@@ -31,26 +37,36 @@ class LifecycleStep:
     name: str
     startup: Callable[[], Awaitable[None]]
     shutdown: Callable[[], Awaitable[None]] | None = None
+    depends_on: tuple[str, ...] = ()
+    critical: bool = True
     duration: float = 0.0
     success: bool = False
     error: str | None = None
+    # Offsets from the start of run_startup (seconds)
+    started_at: float = 0.0
+    finished_at: float = 0.0
+    # Dependency that finished last, i.e. the one this step actually waited on
+    gated_by: str | None = None
 
 
 @dataclass
 class LifecycleManager:
     """
-    Manages application startup and shutdown in a clean, sequential manner.
+    Manages application startup and shutdown as a dependency graph.
 
     Design goals:
     - Simple and readable for junior developers
     - Minimal console noise (single progress line)
     - Clear error reporting
     - Proper tracing for production observability
+    - Independent steps start concurrently; non-critical steps don't block ready
     """
 
     steps: list[LifecycleStep] = field(default_factory=list)
     executed_steps: list[LifecycleStep] = field(default_factory=list)
+    ready_time: float = 0.0
     _tracer: trace.Tracer = field(default=None, init=False)
+    _background: list[asyncio.Task] = field(default_factory=list, init=False)
 
     def __post_init__(self):
         self._tracer = trace.get_tracer(__name__)
@@ -60,57 +76,134 @@ class LifecycleManager:
         name: str,
         startup: Callable[[], Awaitable[None]],
         shutdown: Callable[[], Awaitable[None]] | None = None,
+        *,
+        depends_on: Iterable[str] | None = None,
+        critical: bool = True,
     ) -> None:
-        """Register a lifecycle step."""
-        self.steps.append(LifecycleStep(name=name, startup=startup, shutdown=shutdown))
+        """
+        Register a lifecycle step.
+
+        Args:
+            name: Unique step name.
+            startup: Async startup callable.
+            shutdown: Optional async cleanup callable.
+            depends_on: Steps that must finish first. None means "after the
+                previously registered step" (sequential, the original behaviour);
+                pass an empty tuple for a step with no dependencies.
+            critical: Critical steps must finish before the app reports ready and
+                their failure aborts startup. Non-critical steps run in the
+                background and only log failures.
+        """
+        if depends_on is None:
+            deps = (self.steps[-1].name,) if self.steps else ()
+        else:
+            deps = tuple(depends_on)
+        self.steps.append(
+            LifecycleStep(
+                name=name,
+                startup=startup,
+                shutdown=shutdown,
+                depends_on=deps,
+                critical=critical,
+            )
+        )
 
     async def run_startup(self) -> list[tuple[str, float]]:
         """
-        Execute all startup steps with progress feedback.
+        Execute startup steps with progress feedback.
+
+        Runs each step as soon as its dependencies have finished. Returns once
+        every critical step is done; non-critical steps keep running.
 
         Returns:
             List of (step_name, duration_seconds) for reporting.
+
+        Raises:
+            ValueError: If a dependency is unknown or the graph has a cycle.
         """
-        results: list[tuple[str, float]] = []
+        self._validate_graph()
         total = len(self.steps)
+        t0 = time.perf_counter()
 
         # Single-line progress indicator
         self._write_progress(f"Starting ({total} steps)...")
 
-        for i, step in enumerate(self.steps):
-            step_start = time.perf_counter()
+        tasks: dict[str, asyncio.Task] = {}
+        for step in self.steps:
+            tasks[step.name] = asyncio.create_task(
+                self._run_step(step, tasks, t0), name=f"startup.{step.name}"
+            )
 
-            with self._tracer.start_as_current_span(f"startup.{step.name}") as span:
-                try:
-                    await step.startup()
-                    step.success = True
-                except Exception as exc:
-                    step.error = str(exc)
-                    step.success = False
-                    span.record_exception(exc)
-                    span.set_status(Status(StatusCode.ERROR, str(exc)))
+        critical = [tasks[s.name] for s in self.steps if s.critical]
+        try:
+            await asyncio.gather(*critical)
+        except BaseException:
+            for task in tasks.values():
+                task.cancel()
+            await asyncio.gather(*tasks.values(), return_exceptions=True)
+            raise
+
+        self._background = [t for t in tasks.values() if not t.done()]
+        self.ready_time = time.perf_counter() - t0
+
+        pending = f", {len(self._background)} finishing in background" if self._background else ""
+        self._write_progress(f"✓ Ready in {self.ready_time:.1f}s{pending}\n")
+
+        return self.get_results_summary()
+
+    async def _run_step(
+        self,
+        step: LifecycleStep,
+        tasks: dict[str, asyncio.Task],
+        t0: float,
+    ) -> None:
+        """Wait for dependencies, then run one step."""
+        for dep in step.depends_on:
+            await tasks[dep]
+        if step.depends_on:
+            step.gated_by = max(
+                step.depends_on, key=lambda d: self._step(d).finished_at
+            )
+
+        step.started_at = time.perf_counter() - t0
+        with self._tracer.start_as_current_span(f"startup.{step.name}") as span:
+            span.set_attribute("critical", step.critical)
+            try:
+                await step.startup()
+                step.success = True
+            except Exception as exc:
+                step.error = str(exc)
+                step.success = False
+                span.record_exception(exc)
+                span.set_status(Status(StatusCode.ERROR, str(exc)))
+                if step.critical:
                     self._write_progress(f"✗ {step.name} failed: {exc}\n")
                     raise
-
-                step.duration = time.perf_counter() - step_start
+                logger.warning(f"Non-critical startup step '{step.name}' failed: {exc}")
+            finally:
+                step.finished_at = time.perf_counter() - t0
+                step.duration = step.finished_at - step.started_at
                 span.set_attribute("duration_sec", step.duration)
 
+        if step.success:
             self.executed_steps.append(step)
-            results.append((step.name, round(step.duration, 2)))
-
-            # Update progress indicator
-            progress = "·" * i + "●" + "·" * (total - i - 1)
-            self._write_progress(f"[{progress}] {step.name} ({step.duration:.1f}s)")
 
-        total_time = sum(d for _, d in results)
-        self._write_progress(f"✓ Ready in {total_time:.1f}s\n")
-
-        return results
+        # Update progress indicator
+        done = len(self.executed_steps)
+        progress = "●" * done + "·" * (len(self.steps) - done)
+        self._write_progress(f"[{progress}] {step.name} ({step.duration:.1f}s)")
 
     async def run_shutdown(self) -> None:
-        """Execute shutdown steps in reverse order."""
+        """Execute shutdown steps in reverse completion order."""
         self._write_progress("Shutting down...")
 
+        # Steps still warming up in the background are abandoned
+        for task in self._background:
+            task.cancel()
+        if self._background:
+            await asyncio.gather(*self._background, return_exceptions=True)
+        self._background = []
+
         for step in reversed(self.executed_steps):
             if step.shutdown is None:
                 continue
@@ -126,10 +219,58 @@ class LifecycleManager:
 
         self._write_progress("✓ Shutdown complete\n")
 
+    async def wait_background(self) -> None:
+        """Wait for non-critical steps still running after ready."""
+        if self._background:
+            await asyncio.gather(*self._background, return_exceptions=True)
+
     def get_results_summary(self) -> list[tuple[str, float]]:
         """Get timing results for dashboard display."""
         return [(s.name, round(s.duration, 2)) for s in self.executed_steps]
 
+    def get_critical_path(self) -> list[tuple[str, float]]:
+        """
+        Get the chain of critical steps that determined time-to-ready.
+
+        Walks back from the last critical step to finish, following the
+        dependency each step waited on.
+
+        Returns:
+            List of (step_name, duration_seconds), earliest first.
+        """
+        finished = [s for s in self.steps if s.critical and s.success]
+        if not finished:
+            return []
+        step: LifecycleStep | None = max(finished, key=lambda s: s.finished_at)
+        path: list[tuple[str, float]] = []
+        while step is not None:
+            path.append((step.name, round(step.duration, 2)))
+            step = self._step(step.gated_by) if step.gated_by else None
+        return list(reversed(path))
+
+    def _step(self, name: str) -> LifecycleStep:
+        return next(s for s in self.steps if s.name == name)
+
+    def _validate_graph(self) -> None:
+        """Reject unknown dependencies and cycles before starting anything."""
+        names = {s.name for s in self.steps}
+        if len(names) != len(self.steps):
+            raise ValueError("Duplicate lifecycle step names")
+        for step in self.steps:
+            unknown = set(step.depends_on) - names
+            if unknown:
+                raise ValueError(f"Step '{step.name}' depends on unknown steps: {sorted(unknown)}")
+
+        deps = {s.name: set(s.depends_on) for s in self.steps}
+        while deps:
+            ready = [name for name, d in deps.items() if not d]
+            if not ready:
+                raise ValueError(f"Lifecycle step dependency cycle: {sorted(deps)}")
+            for name in ready:
+                del deps[name]
+            for d in deps.values():
+                d.difference_update(ready)
+
     @staticmethod
     def _write_progress(message: str) -> None:
         """Write progress to stderr (single-line updates)."""
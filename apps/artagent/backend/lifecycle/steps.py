@@ -2,14 +2,30 @@
 Lifecycle Steps - Individual startup/shutdown functions.
 
 Each step is a self-contained unit responsible for initializing
-one component of the application. Steps can be composed and
-reordered as needed.
+one component of the application. Steps declare the steps they
+depend on; the LifecycleManager starts independent steps together.
+
+Dependency graph (step <- dependencies):
+
+    token_broker                   <- (none)
+    runtime*, core, speech, agents <- (none)
+    aoai, services, events   <- core
+    tools                    <- agents, events
+    warmup*                  <- speech, aoai
+    phrases*                 <- services
+    health*                  <- core, speech, aoai, services, agents
+
+    * non-critical: may finish after the app reports ready
+
+Register token_broker first: it finishes first, so it shuts down last,
+after every step that may still fetch tokens through the broker.
 """
 
 from __future__ import annotations
 
 import asyncio
 import os
+import tempfile
 from typing import TYPE_CHECKING
 
 from utils.ml_logging import get_logger
@@ -72,7 +88,7 @@ def register_core_state_step(manager: LifecycleManager, app: FastAPI) -> None:
         if hasattr(app.state, "conn_manager"):
             await app.state.conn_manager.stop()
 
-    manager.add_step("core", start, stop)
+    manager.add_step("core", start, stop, depends_on=())
 
 
 # ============================================================================
@@ -206,7 +222,7 @@ def register_speech_pools_step(manager: LifecycleManager, app: FastAPI) -> None:
         if tasks:
             await asyncio.gather(*tasks, return_exceptions=True)
 
-    manager.add_step("speech", start, stop)
+    manager.add_step("speech", start, stop, depends_on=())
 
 
 # ============================================================================
@@ -228,7 +244,7 @@ def register_aoai_step(manager: LifecycleManager, app: FastAPI) -> None:
         app.state.aoai_client_manager = aoai_manager
         app.state.aoai_client = await aoai_manager.get_client()
 
-    manager.add_step("aoai", start)
+    manager.add_step("aoai", start, depends_on=("core",))
 
 
 # ============================================================================
@@ -291,7 +307,7 @@ def register_warmup_step(manager: LifecycleManager, app: FastAPI) -> None:
         app.state.warmup_completed = True
         app.state.warmup_results = warmup_results
 
-    manager.add_step("warmup", start)
+    manager.add_step("warmup", start, depends_on=("speech", "aoai"), critical=False)
 
 
 # ============================================================================
@@ -302,9 +318,15 @@ def register_warmup_step(manager: LifecycleManager, app: FastAPI) -> None:
 def register_external_services_step(manager: LifecycleManager, app: FastAPI) -> None:
     """Register external services initialization step."""
     from apps.artagent.backend.config import (
+        ANALYTICS_BATCH_SIZE,
+        ANALYTICS_FLUSH_INTERVAL_MS,
+        ANALYTICS_QUEUE_SIZE,
+        ANALYTICS_SPILL_DIR,
         AZURE_COSMOS_COLLECTION_NAME,
         AZURE_COSMOS_CONNECTION_STRING,
         AZURE_COSMOS_DATABASE_NAME,
+        CUSTOMER_CONTEXT_DURABILITY,
+        CUSTOMER_CONTEXT_FLUSH_INTERVAL_MS,
     )
     from apps.artagent.backend.src.services import CosmosDBMongoCoreManager
     from apps.artagent.backend.src.services.acs.acs_caller import initialize_acs_caller_instance
@@ -335,13 +357,65 @@ def register_external_services_step(manager: LifecycleManager, app: FastAPI) ->
         app.state.customer_context_manager = CustomerContextManager(
             cosmos_manager=app.state.cosmos,
             redis_manager=getattr(app.state, "redis", None),
+            durability=CUSTOMER_CONTEXT_DURABILITY,
+            flush_interval_s=CUSTOMER_CONTEXT_FLUSH_INTERVAL_MS / 1000,
         )
+        app.state.customer_context_manager.start()
         logger.info("CustomerContextManager initialized with Cosmos and Redis")
 
-        # Hydrate phrase list from Cosmos (non-blocking)
+        # Batched post-call analytics writer (replays any spilled documents)
+        from src.postcall.writer import AnalyticsWriter
+        spill_dir = ANALYTICS_SPILL_DIR or tempfile.gettempdir()
+        app.state.analytics_writer = AnalyticsWriter(
+            app.state.cosmos,
+            max_queue=ANALYTICS_QUEUE_SIZE,
+            batch_size=ANALYTICS_BATCH_SIZE,
+            max_batch_age_s=ANALYTICS_FLUSH_INTERVAL_MS / 1000,
+            spill_path=os.path.join(spill_dir, "postcall_analytics_spill.jsonl"),
+        )
+        app.state.analytics_writer.start()
+
+    async def stop() -> None:
+        # Flush pending write-behind customer context on shutdown
+        context_manager = getattr(app.state, "customer_context_manager", None)
+        if context_manager:
+            await context_manager.stop()
+        # Drain queued post-call analytics
+        analytics_writer = getattr(app.state, "analytics_writer", None)
+        if analytics_writer:
+            await analytics_writer.stop()
+        # Close the async ACS call-control HTTP session
+        acs_caller = getattr(app.state, "acs_caller", None)
+        if acs_caller:
+            await acs_caller.close()
+
+    async def hydrate_phrases() -> None:
         await _hydrate_phrases_from_cosmos(app)
 
-    manager.add_step("services", start)
+    async def profile_indexes() -> None:
+        await asyncio.to_thread(_ensure_profile_lookup_indexes)
+
+    manager.add_step("services", start, stop, depends_on=("core",))
+    # Phrase bias is a recognition-quality improvement, not needed to accept calls
+    manager.add_step("phrases", hydrate_phrases, depends_on=("services",), critical=False)
+    # Without the indexes and backfill, lookups fall back to scanning $regex queries
+    manager.add_step("profile_indexes", profile_indexes, depends_on=("services",), critical=False)
+
+
+def _ensure_profile_lookup_indexes() -> None:
+    """Index the users collection for tool lookups and backfill lookup keys."""
+    from apps.artagent.backend.registries.toolstore.profile_lookup import ensure_lookup_indexes
+    from src.cosmosdb.config import get_database_name, get_users_collection_name
+    from src.cosmosdb.manager import CosmosDBMongoCoreManager
+
+    users = CosmosDBMongoCoreManager(
+        database_name=get_database_name(),
+        collection_name=get_users_collection_name(),
+    )
+    try:
+        ensure_lookup_indexes(users)
+    finally:
+        users.close_connection()
 
 
 async def _hydrate_phrases_from_cosmos(app: FastAPI) -> None:
@@ -431,7 +505,7 @@ def register_agents_step(manager: LifecycleManager, app: FastAPI) -> None:
         if not hasattr(app.state, "start_agent"):
             app.state.start_agent = "Concierge"
 
-    manager.add_step("agents", start)
+    manager.add_step("agents", start, depends_on=())
 
 
 # ============================================================================
@@ -441,6 +515,8 @@ def register_agents_step(manager: LifecycleManager, app: FastAPI) -> None:
 
 def register_event_handlers_step(manager: LifecycleManager, app: FastAPI) -> None:
     """Register the event handler initialization step."""
+    from apps.artagent.backend.api.v1.events.call_routing import get_call_session_router
+    from apps.artagent.backend.api.v1.events.processor import get_call_event_processor
     from apps.artagent.backend.api.v1.events.registration import register_default_handlers
     from apps.artagent.backend.registries.toolstore.registry import (
         initialize_tools as initialize_unified_tools,
@@ -459,4 +535,115 @@ def register_event_handlers_step(manager: LifecycleManager, app: FastAPI) -> Non
         except Exception as exc:
             logger.debug(f"Event handler registration skipped: {exc}")
 
-    manager.add_step("events", start)
+        # Call routing invalidations arrive over the distributed session bus
+        get_call_session_router().attach_bus(getattr(app.state, "conn_manager", None))
+
+    async def stop() -> None:
+        # Let queued side effects (e.g. recording start) finish before exit
+        await get_call_event_processor().shutdown()
+
+    # Depends on core so shutdown drains queued side effects before Redis goes away
+    manager.add_step("events", start, stop, depends_on=("core",))
+
+
+# ============================================================================
+# Step 8: Tool Modules (import only what loaded agents declare)
+# ============================================================================
+
+
+def register_tool_preload_step(manager: LifecycleManager, app: FastAPI) -> None:
+    """Register the step that imports tool modules used by loaded agents."""
+    from apps.artagent.backend.registries.toolstore.registry import load_tools
+
+    async def start() -> None:
+        agents = getattr(app.state, "unified_agents", {}) or {}
+        tool_names = {name for agent in agents.values() for name in agent.tool_names}
+        loaded = load_tools(tool_names)
+        logger.debug(f"Preloaded {loaded} tool modules for {len(tool_names)} agent tools")
+
+    manager.add_step("tools", start, depends_on=("agents", "events"))
+
+
+# ============================================================================
+# Step 9: Health Monitor (background dependency checks for /readiness)
+# ============================================================================
+
+
+def register_health_monitor_step(manager: LifecycleManager, app: FastAPI) -> None:
+    """Register the background dependency health monitor used by /readiness."""
+    from apps.artagent.backend.api.v1.endpoints.health import get_health_monitor
+
+    async def start() -> None:
+        get_health_monitor(app).start()
+
+    async def stop() -> None:
+        monitor = getattr(app.state, "health_monitor", None)
+        if monitor is not None:
+            await monitor.stop()
+
+    manager.add_step(
+        "health",
+        start,
+        stop,
+        depends_on=("core", "speech", "aoai", "services", "agents"),
+        critical=False,
+    )
+
+
+# ============================================================================
+# Step 10: Runtime Monitor (event-loop lag, executor saturation)
+# ============================================================================
+
+
+def register_runtime_monitor_step(manager: LifecycleManager, app: FastAPI) -> None:
+    """Register loop-lag monitoring and the instrumented default/speech executors."""
+    from apps.artagent.backend.api.v1.utils.runtime_monitor import RuntimeMonitor
+
+    async def start() -> None:
+        from config import (
+            DEFAULT_EXECUTOR_WORKERS,
+            LOOP_LAG_INTERVAL_MS,
+            POOL_SIZE_TTS,
+            SLOW_CALLBACK_THRESHOLD_MS,
+            SPEECH_EXECUTOR_WORKERS,
+        )
+
+        monitor = RuntimeMonitor(
+            lag_interval_s=LOOP_LAG_INTERVAL_MS / 1000,
+            slow_callback_ms=SLOW_CALLBACK_THRESHOLD_MS,
+            default_workers=DEFAULT_EXECUTOR_WORKERS or None,
+            # One synthesis thread per pooled synthesizer unless overridden
+            speech_workers=SPEECH_EXECUTOR_WORKERS or POOL_SIZE_TTS,
+        )
+        monitor.start()
+        app.state.runtime_monitor = monitor
+        app.state.speech_executor = monitor.speech_executor
+
+    async def stop() -> None:
+        monitor = getattr(app.state, "runtime_monitor", None)
+        if monitor is not None:
+            await monitor.stop()
+
+    manager.add_step("runtime", start, stop, depends_on=(), critical=False)
+
+
+# ============================================================================
+# Step 11: Token Broker (background AAD token refresh)
+# ============================================================================
+
+
+def register_token_broker_step(manager: LifecycleManager, app: FastAPI) -> None:
+    """Register shutdown of the shared token broker's refresh thread."""
+
+    async def start() -> None:
+        # The broker is created lazily by its first user
+        return None
+
+    async def stop() -> None:
+        from utils.token_broker import get_token_broker
+
+        # Stop background token refresh only if something created the broker
+        if get_token_broker.cache_info().currsize:
+            await asyncio.to_thread(get_token_broker().stop)
+
+    manager.add_step("token_broker", start, stop, depends_on=())
@@ -63,7 +63,11 @@ from lifecycle.steps import (
     register_core_state_step,
     register_event_handlers_step,
     register_external_services_step,
+    register_health_monitor_step,
+    register_runtime_monitor_step,
     register_speech_pools_step,
+    register_token_broker_step,
+    register_tool_preload_step,
     register_warmup_step,
 )
 from utils.ml_logging import get_logger
@@ -102,7 +106,9 @@ async def lifespan(app: FastAPI):
     tracer = trace.get_tracer(__name__)
     manager = LifecycleManager()
 
-    # Register all startup steps (order matters)
+    # Register all startup steps (each declares its dependencies)
+    register_token_broker_step(manager, app)
+    register_runtime_monitor_step(manager, app)
     register_core_state_step(manager, app)
     register_speech_pools_step(manager, app)
     register_aoai_step(manager, app)
@@ -110,13 +116,22 @@ async def lifespan(app: FastAPI):
     register_external_services_step(manager, app)
     register_agents_step(manager, app)
     register_event_handlers_step(manager, app)
+    register_tool_preload_step(manager, app)
+    register_health_monitor_step(manager, app)
 
     # Run startup
     with tracer.start_as_current_span("startup.lifespan"):
         startup_results = await manager.run_startup()
 
     # Log the dashboard (single info log)
-    logger.info(build_startup_dashboard(app, startup_results))
+    logger.info(
+        build_startup_dashboard(
+            app,
+            startup_results,
+            ready_time=manager.ready_time,
+            critical_path=manager.get_critical_path(),
+        )
+    )
 
     # ---- Application runs ----
     yield
@@ -32,7 +32,7 @@ Usage:
 from __future__ import annotations
 
 import time
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from typing import TYPE_CHECKING, Any, Literal, Protocol
 
 from apps.artagent.backend.registries.agentstore.base import (
@@ -314,6 +314,10 @@ class SessionAgentManager:
         self._redis = redis_mgr
         self._auto_persist = auto_persist
         self._custom_agents: dict[str, UnifiedAgent] = {}  # Custom agents created at runtime
+        # Resolved agents keyed by name → (base, config, modification_count, agent)
+        self._resolved: dict[
+            str, tuple[UnifiedAgent, SessionAgentConfig, int, UnifiedAgent]
+        ] = {}
         self._registry: SessionAgentRegistry = self._init_registry()
 
         logger.info(
@@ -366,9 +370,10 @@ class SessionAgentManager:
         """
         Get agent with session overrides applied.
 
-        Returns a new UnifiedAgent instance with:
-        - Base agent properties (or custom agent if dynamically created)
-        - Session-specific overrides merged in
+        Returns the base agent (or custom agent if dynamically created) when
+        the session has no overrides. Otherwise returns a UnifiedAgent with
+        the overrides merged in, memoized per override version so repeated
+        lookups return the same instance and keep its tool cache.
 
         Args:
             name: Agent name to retrieve
@@ -390,43 +395,61 @@ class SessionAgentManager:
 
         config = self._registry.agents.get(name)
         if not config or not config.has_overrides():
+            self._resolved.pop(name, None)
             return base  # No overrides, return base agent
 
-        return self._apply_overrides(base, config)
+        # Configs are replaced on reset/reload and bump modification_count on
+        # every update, so identity plus count pins the override version.
+        cached = self._resolved.get(name)
+        if (
+            cached is not None
+            and cached[0] is base
+            and cached[1] is config
+            and cached[2] == config.modification_count
+        ):
+            return cached[3]
+
+        agent = self._apply_overrides(base, config)
+        self._resolved[name] = (base, config, config.modification_count, agent)
+        return agent
 
     def _apply_overrides(
         self,
         base: UnifiedAgent,
         config: SessionAgentConfig,
     ) -> UnifiedAgent:
-        """Create new agent with session overrides applied."""
-        return UnifiedAgent(
-            name=base.name,
-            description=base.description,
-            greeting=config.greeting_override or base.greeting,
-            return_greeting=base.return_greeting,
-            handoff=base.handoff,
-            model=config.model_override or base.model,
-            voice=config.voice_override or base.voice,
-            session=base.session,
-            prompt_template=config.prompt_override or base.prompt_template,
-            tool_names=(
-                config.tool_names_override
-                if config.tool_names_override is not None
-                else base.tool_names
-            ),
-            template_vars={
-                **base.template_vars,
-                **(config.template_vars_override or {}),
-            },
-            metadata={
+        """Create new agent with session overrides applied.
+
+        Fields without an override are shared with the base agent rather
+        than copied.
+        """
+        changes: dict[str, Any] = {
+            "metadata": {
                 **base.metadata,
                 "_session_override": True,
                 "_override_source": config.source,
                 "_modification_count": config.modification_count,
             },
-            source_dir=base.source_dir,
-        )
+        }
+        if config.greeting_override:
+            changes["greeting"] = config.greeting_override
+        if config.model_override:
+            # Mode-specific models would otherwise win over the override
+            changes["model"] = config.model_override
+            changes["cascade_model"] = None
+            changes["voicelive_model"] = None
+        if config.voice_override:
+            changes["voice"] = config.voice_override
+        if config.prompt_override:
+            changes["prompt_template"] = config.prompt_override
+        if config.tool_names_override is not None:
+            changes["tool_names"] = config.tool_names_override
+        if config.template_vars_override:
+            changes["template_vars"] = {
+                **base.template_vars,
+                **config.template_vars_override,
+            }
+        return replace(base, **changes)
 
     @property
     def active_agent(self) -> str | None:
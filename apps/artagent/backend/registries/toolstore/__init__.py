@@ -21,7 +21,7 @@ Usage:
         initialize_tools,
     )
 
-    # Initialize all tools
+    # Register all tools (schemas from tool_manifest.json, modules load on first use)
     initialize_tools()
 
     # Get tools for an agent
@@ -42,6 +42,7 @@ from apps.artagent.backend.registries.toolstore.registry import (  # Types; Core
     initialize_tools,
     is_handoff_tool,
     list_tools,
+    load_tools,
     register_tool,
 )
 
@@ -56,6 +57,7 @@ __all__ = [
     "get_tools_for_agent",
     "execute_tool",
     "initialize_tools",
+    "load_tools",
     # Types
     "ToolDefinition",
     "ToolExecutor",
@@ -10,10 +10,14 @@ from __future__ import annotations
 import asyncio
 import os
 import random
-import re
 import string
 from typing import TYPE_CHECKING, Any
 
+from apps.artagent.backend.registries.toolstore.profile_lookup import (
+    find_claim,
+    find_user_by_identity,
+    find_user_by_ssn,
+)
 from apps.artagent.backend.registries.toolstore.registry import register_tool
 from utils.ml_logging import get_logger
 
@@ -301,20 +305,14 @@ async def _lookup_user_in_cosmos(
         )
         return None, "unavailable"
 
-    # First try: exact match on name + SSN
-    name_pattern = f"^{re.escape(full_name)}$"
-    query: dict[str, Any] = {
-        "verification_codes.ssn4": ssn_last_4,
-        "full_name": {"$regex": name_pattern, "$options": "i"},
-    }
-
     logger.info(
         "🔍 Cosmos identity lookup | full_name=%s | ssn_last_4=%s",
         full_name, ssn_last_4
     )
 
     try:
-        document = await asyncio.to_thread(cosmos.read_document, query)
+        # First try: exact match on name + SSN (indexed lookup keys)
+        document = await asyncio.to_thread(find_user_by_identity, cosmos, full_name, ssn_last_4)
         if document:
             logger.info(
                 "✓ Identity verified via Cosmos (exact match): %s",
@@ -323,8 +321,7 @@ async def _lookup_user_in_cosmos(
             return document, None
 
         # Second try: SSN-only lookup (in case speech-to-text misheard the name)
-        ssn_only_query: dict[str, Any] = {"verification_codes.ssn4": ssn_last_4}
-        document = await asyncio.to_thread(cosmos.read_document, ssn_only_query)
+        document = await asyncio.to_thread(find_user_by_ssn, cosmos, ssn_last_4)
         if document:
             actual_name = document.get("full_name", "unknown")
             logger.warning(
@@ -395,27 +392,18 @@ async def _lookup_claim_in_cosmos(
         )
         return None, None, "unavailable"
 
-    # Query for user with matching claim in demo_metadata.claims
-    query: dict[str, Any] = {
-        "demo_metadata.claims.claim_number": {"$regex": f"^{re.escape(claim_number)}$", "$options": "i"}
-    }
-
     logger.info("🔍 Cosmos claim lookup | claim_number=%s", claim_number)
 
     try:
-        document = await asyncio.to_thread(cosmos.read_document, query)
+        document, claim = await asyncio.to_thread(find_claim, cosmos, claim_number)
         if document:
-            # Extract the matching claim from the document
-            claims = document.get("demo_metadata", {}).get("claims", [])
-            claim_upper = claim_number.upper()
-            for claim in claims:
-                if claim.get("claim_number", "").upper() == claim_upper:
-                    logger.info(
-                        "✓ Claim found in Cosmos: %s (user: %s)",
-                        claim_number,
-                        document.get("client_id") or document.get("_id")
-                    )
-                    return document, claim, None
+            if claim is not None:
+                logger.info(
+                    "✓ Claim found in Cosmos: %s (user: %s)",
+                    claim_number,
+                    document.get("client_id") or document.get("_id")
+                )
+                return document, claim, None
             # Document matched but claim not in expected location
             logger.warning(
                 "⚠️ Document matched query but claim not found in demo_metadata.claims: %s",
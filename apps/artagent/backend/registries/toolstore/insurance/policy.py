@@ -14,9 +14,9 @@ Data Source:
 from __future__ import annotations
 
 import os
-import re
 from typing import TYPE_CHECKING, Any, Dict, List
 
+from apps.artagent.backend.registries.toolstore.profile_lookup import find_policy
 from apps.artagent.backend.registries.toolstore.registry import register_tool
 from utils.ml_logging import get_logger
 
@@ -161,21 +161,13 @@ def _lookup_policy_by_number_in_cosmos(policy_number: str) -> tuple[Dict[str, An
     if cosmos is None:
         return None, []
 
-    query: Dict[str, Any] = {
-        "demo_metadata.policies.policy_number": {"$regex": f"^{re.escape(policy_number)}$", "$options": "i"}
-    }
-    
     logger.info("🔍 Cosmos policy lookup by number | policy_number=%s", policy_number)
 
     try:
-        document = cosmos.read_document(query)
-        if document:
-            policies = document.get("demo_metadata", {}).get("policies", [])
-            policy_upper = policy_number.upper()
-            for policy in policies:
-                if policy.get("policy_number", "").upper() == policy_upper:
-                    logger.info("✓ Found policy %s in Cosmos", policy_number)
-                    return policy, policies
+        document, policy = find_policy(cosmos, policy_number)
+        if policy is not None:
+            logger.info("✓ Found policy %s in Cosmos", policy_number)
+            return policy, document.get("demo_metadata", {}).get("policies", [])
     except Exception as exc:  # pragma: no cover
         logger.warning("Cosmos policy lookup failed: %s", exc)
 
@@ -21,10 +21,10 @@ from __future__ import annotations
 import asyncio
 import os
 import random
-import re
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Any, Dict, List
 
+from apps.artagent.backend.registries.toolstore.profile_lookup import find_claim
 from apps.artagent.backend.registries.toolstore.registry import register_tool
 from apps.artagent.backend.registries.toolstore.insurance.constants import (
     SUBRO_FAX_NUMBER,
@@ -133,23 +133,13 @@ def _lookup_claim_in_cosmos_sync(claim_number: str) -> Dict[str, Any] | None:
     if cosmos is None:
         return None
 
-    # Query for user with matching claim in demo_metadata.claims
-    query: Dict[str, Any] = {
-        "demo_metadata.claims.claim_number": {"$regex": f"^{re.escape(claim_number)}$", "$options": "i"}
-    }
-
     logger.info("🔍 Cosmos claim lookup (subro) | claim_number=%s", claim_number)
 
     try:
-        document = cosmos.read_document(query)
-        if document:
-            # Extract the matching claim from the document
-            claims = document.get("demo_metadata", {}).get("claims", [])
-            claim_upper = claim_number.upper()
-            for claim in claims:
-                if claim.get("claim_number", "").upper() == claim_upper:
-                    logger.info("✓ Claim found in Cosmos (subro): %s", claim_number)
-                    return claim
+        _, claim = find_claim(cosmos, claim_number)
+        if claim is not None:
+            logger.info("✓ Claim found in Cosmos (subro): %s", claim_number)
+            return claim
     except Exception as exc:  # pragma: no cover
         logger.warning("Cosmos claim lookup failed (subro): %s", exc)
 
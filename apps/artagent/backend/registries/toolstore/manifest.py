@@ -0,0 +1,106 @@
+"""
+Tool Manifest Builder
+=====================
+
+Generates ``tool_manifest.json`` (tool name → module → schema) so the
+registry can serve schemas without importing tool modules, and reports the
+import cost of each tool module.
+
+Usage:
+    # Regenerate the manifest after adding or changing a tool
+    python -m apps.artagent.backend.registries.toolstore.manifest --write
+
+    # Import-time / memory report for every tool module
+    python -m apps.artagent.backend.registries.toolstore.manifest --profile
+
+Run in a fresh process: modules already imported cannot be attributed or timed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+from typing import Any
+
+from apps.artagent.backend.registries.toolstore import registry
+
+
+def build_manifest() -> dict[str, Any]:
+    """Import every tool module and record which module registers each tool."""
+    for module in registry.TOOL_MODULES:
+        registry._load_module(f"{registry._PACKAGE}.{module}")
+
+    tools = [
+        {
+            "name": defn.name,
+            "module": defn.module,
+            "is_handoff": defn.is_handoff,
+            "tags": sorted(defn.tags),
+            "schema": defn.schema,
+        }
+        for defn in sorted(registry._TOOL_DEFINITIONS.values(), key=lambda d: d.name)
+        if defn.module
+    ]
+    return {"version": 1, "tools": tools}
+
+
+def profile_imports() -> list[dict[str, Any]]:
+    """
+    Import each tool module in turn and measure its cost.
+
+    Times include whatever each module imports that was not already loaded,
+    so shared dependencies are charged to the first module that needs them.
+    """
+    rows = []
+    tracemalloc.start()
+    for module in registry.TOOL_MODULES:
+        before_tools = len(registry._TOOL_DEFINITIONS)
+        mem_before = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+        ok = registry._load_module(f"{registry._PACKAGE}.{module}")
+        elapsed = time.perf_counter() - start
+        rows.append(
+            {
+                "module": module,
+                "ok": ok,
+                "ms": round(elapsed * 1000, 1),
+                "kib": round((tracemalloc.get_traced_memory()[0] - mem_before) / 1024, 1),
+                "tools": len(registry._TOOL_DEFINITIONS) - before_tools,
+            }
+        )
+    tracemalloc.stop()
+    return sorted(rows, key=lambda r: r["ms"], reverse=True)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Tool manifest builder and import profiler")
+    parser.add_argument("--write", action="store_true", help="Write tool_manifest.json")
+    parser.add_argument("--profile", action="store_true", help="Print import-time report")
+    args = parser.parse_args()
+
+    if args.profile:
+        rows = profile_imports()
+        print(f"{'module':<26} {'ms':>8} {'KiB':>9} {'tools':>6}")
+        for row in rows:
+            status = "" if row["ok"] else "  (failed)"
+            print(f"{row['module']:<26} {row['ms']:>8.1f} {row['kib']:>9.1f} {row['tools']:>6}{status}")
+        print(
+            f"{'total':<26} {sum(r['ms'] for r in rows):>8.1f} "
+            f"{sum(r['kib'] for r in rows):>9.1f} {sum(r['tools'] for r in rows):>6}"
+        )
+
+    if args.write or not args.profile:
+        manifest = build_manifest()
+        text = json.dumps(manifest, indent=1, ensure_ascii=False) + "\n"
+        if args.write:
+            registry.MANIFEST_PATH.write_text(text, encoding="utf-8")
+            print(f"Wrote {len(manifest['tools'])} tools to {registry.MANIFEST_PATH}", file=sys.stderr)
+        else:
+            sys.stdout.write(text)
+
+
+if __name__ == "__main__":
+    main()
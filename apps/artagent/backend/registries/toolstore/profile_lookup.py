@@ -0,0 +1,305 @@
+"""
+Profile Lookups for Auth & Insurance Tools
+==========================================
+
+Exact-match lookups of demo user profiles by caller identity, claim number
+and policy number.
+
+Lookups used to run anchored, case-insensitive ``$regex`` queries, which
+cannot use a regular index and scan the users collection during a live call.
+Instead, normalized keys are written next to each profile at ingest::
+
+    "lookup_keys": {
+        "full_name": "ada lovelace",
+        "claim_numbers": ["clm-2024-001234"],
+        "policy_numbers": ["pol-auto-884512"],
+    }
+
+and queried with exact matches on indexed fields. A small in-process LRU
+sits in front, so repeated lookups within a call skip the database.
+
+Profiles written by other tools (e.g. the azd seed scripts) have no keys
+until ``ensure_lookup_indexes`` backfills them. On a miss, lookups retry
+with the old anchored ``$regex`` query restricted to documents without
+keys, so those profiles are still found, just more slowly.
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any
+
+from utils.ml_logging import get_logger
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from src.cosmosdb.manager import CosmosDBMongoCoreManager
+
+logger = get_logger("agents.tools.profile_lookup")
+
+LOOKUP_KEYS_FIELD = "lookup_keys"
+
+# Indexed fields backing the exact-match lookups
+LOOKUP_INDEXES: tuple[tuple[str, ...], ...] = (
+    ("verification_codes.ssn4", f"{LOOKUP_KEYS_FIELD}.full_name"),
+    (f"{LOOKUP_KEYS_FIELD}.claim_numbers",),
+    (f"{LOOKUP_KEYS_FIELD}.policy_numbers",),
+)
+
+_BACKFILL_BATCH_SIZE = 500
+
+
+def normalize_lookup_key(value: Any) -> str:
+    """Case- and whitespace-insensitive form of a name or reference number."""
+    return " ".join(str(value or "").split()).casefold()
+
+
+def _numbers(items: Any, field: str) -> list[str]:
+    keys: list[str] = []
+    for item in items or []:
+        value = item.get(field) if isinstance(item, dict) else None
+        if value:
+            key = normalize_lookup_key(value)
+            if key not in keys:
+                keys.append(key)
+    return keys
+
+
+def build_lookup_keys(document: dict[str, Any]) -> dict[str, Any]:
+    """Normalized lookup keys for a user profile document."""
+    demo_metadata = document.get("demo_metadata") or {}
+    return {
+        "full_name": normalize_lookup_key(document.get("full_name")),
+        "claim_numbers": _numbers(demo_metadata.get("claims"), "claim_number"),
+        "policy_numbers": _numbers(demo_metadata.get("policies"), "policy_number"),
+    }
+
+
+def with_lookup_keys(document: dict[str, Any]) -> dict[str, Any]:
+    """Return the document with its ``lookup_keys`` field set; call before every write."""
+    return {**document, LOOKUP_KEYS_FIELD: build_lookup_keys(document)}
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# INDEXES
+# ═══════════════════════════════════════════════════════════════════════════════
+
+
+def ensure_lookup_indexes(manager: CosmosDBMongoCoreManager, *, backfill: bool = True) -> bool:
+    """
+    Create the lookup indexes and backfill keys on profiles written before them.
+
+    Safe to run repeatedly; existing indexes are left untouched and only
+    documents missing ``lookup_keys`` are updated.
+    """
+    import pymongo
+
+    collection = manager.collection
+    try:
+        for fields in LOOKUP_INDEXES:
+            collection.create_index([(field, pymongo.ASCENDING) for field in fields])
+    except Exception as exc:
+        logger.warning("Failed to create profile lookup indexes: %s", exc)
+        return False
+
+    if backfill:
+        try:
+            updated = backfill_lookup_keys(manager)
+            if updated:
+                logger.info("Backfilled lookup keys on %d profiles", updated)
+        except Exception as exc:
+            logger.warning("Profile lookup key backfill failed: %s", exc)
+            return False
+    return True
+
+
+def backfill_lookup_keys(manager: CosmosDBMongoCoreManager) -> int:
+    """Write ``lookup_keys`` on every profile that lacks them. Returns the count updated."""
+    from pymongo import UpdateOne
+
+    cursor = manager.collection.find(
+        {LOOKUP_KEYS_FIELD: {"$exists": False}},
+        projection={
+            "full_name": 1,
+            "demo_metadata.claims.claim_number": 1,
+            "demo_metadata.policies.policy_number": 1,
+        },
+    )
+    updated = 0
+    batch: list[Any] = []
+    for document in cursor:
+        batch.append(
+            UpdateOne(
+                {"_id": document["_id"]},
+                {"$set": {LOOKUP_KEYS_FIELD: build_lookup_keys(document)}},
+            )
+        )
+        if len(batch) >= _BACKFILL_BATCH_SIZE:
+            updated += manager.collection.bulk_write(batch, ordered=False).modified_count
+            batch = []
+    if batch:
+        updated += manager.collection.bulk_write(batch, ordered=False).modified_count
+    return updated
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# LRU
+# ═══════════════════════════════════════════════════════════════════════════════
+
+
+class ProfileLookupCache:
+    """
+    Bounded LRU of profiles found by a lookup, with a short TTL.
+
+    Only hits are cached, so a profile created mid-call is found on the next
+    lookup. Thread-safe: sync tools call in from worker threads.
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl_s: float = 60.0) -> None:
+        self._max_entries = max_entries
+        self._ttl_s = ttl_s
+        self._entries: OrderedDict[tuple[str, str], tuple[float, dict[str, Any]]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, kind: str, key: str) -> dict[str, Any] | None:
+        with self._lock:
+            entry = self._entries.get((kind, key))
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    del self._entries[(kind, key)]
+                self.misses += 1
+                return None
+            self._entries.move_to_end((kind, key))
+            self.hits += 1
+            return entry[1]
+
+    def put(self, kind: str, key: str, document: dict[str, Any]) -> None:
+        with self._lock:
+            self._entries[(kind, key)] = (time.monotonic() + self._ttl_s, document)
+            self._entries.move_to_end((kind, key))
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_stats(self) -> dict[str, int]:
+        return {"size": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+_cache = ProfileLookupCache()
+
+
+def get_profile_lookup_cache() -> ProfileLookupCache:
+    """Return the process-wide profile lookup cache."""
+    return _cache
+
+
+def _anchored(value: str) -> dict[str, str]:
+    """Case-insensitive whole-value ``$regex`` for profiles without lookup keys."""
+    return {"$regex": f"^{re.escape(value.strip())}$", "$options": "i"}
+
+
+def _cached_find(
+    manager: CosmosDBMongoCoreManager,
+    kind: str,
+    key: str,
+    query: dict[str, Any],
+    fallback: dict[str, Any] | None = None,
+) -> dict[str, Any] | None:
+    document = _cache.get(kind, key)
+    if document is not None:
+        return document
+    document = manager.read_document(query)
+    if not document and fallback:
+        document = manager.read_document({**fallback, LOOKUP_KEYS_FIELD: {"$exists": False}})
+        if document:
+            logger.info("Profile %s found without lookup keys; backfill has not run for it", kind)
+    if document:
+        _cache.put(kind, key, document)
+    return document
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# LOOKUPS (sync; wrap in asyncio.to_thread from async tools)
+# ═══════════════════════════════════════════════════════════════════════════════
+
+
+def find_user_by_identity(
+    manager: CosmosDBMongoCoreManager, full_name: str, ssn_last_4: str
+) -> dict[str, Any] | None:
+    """Profile matching the caller's full name (any case) and SSN last 4."""
+    name_key = normalize_lookup_key(full_name)
+    return _cached_find(
+        manager,
+        "identity",
+        f"{ssn_last_4}|{name_key}",
+        {"verification_codes.ssn4": ssn_last_4, f"{LOOKUP_KEYS_FIELD}.full_name": name_key},
+        {"verification_codes.ssn4": ssn_last_4, "full_name": _anchored(full_name)},
+    )
+
+
+def find_user_by_ssn(manager: CosmosDBMongoCoreManager, ssn_last_4: str) -> dict[str, Any] | None:
+    """First profile with the given SSN last 4."""
+    return _cached_find(manager, "ssn4", ssn_last_4, {"verification_codes.ssn4": ssn_last_4})
+
+
+def _find_item(document: dict[str, Any] | None, section: str, field: str, key: str):
+    for item in (document or {}).get("demo_metadata", {}).get(section) or []:
+        if normalize_lookup_key(item.get(field)) == key:
+            return item
+    return None
+
+
+def find_claim(
+    manager: CosmosDBMongoCoreManager, claim_number: str
+) -> tuple[dict[str, Any] | None, dict[str, Any] | None]:
+    """Return (profile, claim) for a claim number, matching case-insensitively."""
+    key = normalize_lookup_key(claim_number)
+    document = _cached_find(
+        manager,
+        "claim",
+        key,
+        {f"{LOOKUP_KEYS_FIELD}.claim_numbers": key},
+        {"demo_metadata.claims.claim_number": _anchored(claim_number)},
+    )
+    return document, _find_item(document, "claims", "claim_number", key)
+
+
+def find_policy(
+    manager: CosmosDBMongoCoreManager, policy_number: str
+) -> tuple[dict[str, Any] | None, dict[str, Any] | None]:
+    """Return (profile, policy) for a policy number, matching case-insensitively."""
+    key = normalize_lookup_key(policy_number)
+    document = _cached_find(
+        manager,
+        "policy",
+        key,
+        {f"{LOOKUP_KEYS_FIELD}.policy_numbers": key},
+        {"demo_metadata.policies.policy_number": _anchored(policy_number)},
+    )
+    return document, _find_item(document, "policies", "policy_number", key)
+
+
+__all__ = [
+    "LOOKUP_KEYS_FIELD",
+    "ProfileLookupCache",
+    "backfill_lookup_keys",
+    "build_lookup_keys",
+    "ensure_lookup_indexes",
+    "find_claim",
+    "find_policy",
+    "find_user_by_identity",
+    "find_user_by_ssn",
+    "get_profile_lookup_cache",
+    "normalize_lookup_key",
+    "with_lookup_keys",
+]
@@ -5,6 +5,16 @@ Tool Registry Core
 Central registry for all agent tools.
 Self-contained - does not reference legacy vlagent/artagent structures.
 
+Tool modules are loaded lazily. ``initialize_tools()`` registers every tool
+from ``tool_manifest.json`` (name → module → schema) without importing the
+module that implements it. A module is imported the first time one of its
+tools is executed, or up front for tools that loaded agents declare
+(``load_tools``). Set ``TOOL_REGISTRY_LAZY=false`` or delete the manifest to
+import every module at startup. Regenerate the manifest after adding or
+changing a tool::
+
+    python -m apps.artagent.backend.registries.toolstore.manifest --write
+
 Usage:
     from apps.artagent.backend.registries.toolstore.registry import (
         register_tool,
@@ -17,9 +27,16 @@ Usage:
 from __future__ import annotations
 
 import asyncio
+import importlib
 import inspect
-from collections.abc import Awaitable, Callable
+import json
+import os
+import sys
+import threading
+import time
+from collections.abc import Awaitable, Callable, Iterable
 from dataclasses import dataclass, field
+from pathlib import Path
 from typing import Any, TypeAlias
 
 from pydantic import BaseModel
@@ -34,14 +51,19 @@ AsyncToolExecutor: TypeAlias = Callable[[dict[str, Any]], Awaitable[dict[str, An
 
 @dataclass
 class ToolDefinition:
-    """Complete tool definition with schema and executor."""
+    """Complete tool definition with schema and executor.
+
+    ``executor`` is None until ``module`` has been imported for tools
+    registered from the manifest.
+    """
 
     name: str
     schema: dict[str, Any]
-    executor: ToolExecutor
+    executor: ToolExecutor | None
     is_handoff: bool = False
     description: str = ""
     tags: set[str] = field(default_factory=set)
+    module: str = ""
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -51,6 +73,43 @@ class ToolDefinition:
 _TOOL_DEFINITIONS: dict[str, ToolDefinition] = {}
 _INITIALIZED: bool = False
 
+_PACKAGE = "apps.artagent.backend.registries.toolstore"
+MANIFEST_PATH = Path(__file__).with_name("tool_manifest.json")
+
+# Tool modules, relative to this package. Importing a module registers its tools.
+TOOL_MODULES: tuple[str, ...] = (
+    "auth",
+    "call_transfer",
+    "compliance",
+    "customer_intelligence",
+    "escalation",
+    "fraud",
+    "handoffs",
+    "knowledge_base",
+    "personalized_greeting",
+    "rag_retrieval",
+    "transfer_agency",
+    "voicemail",
+    # "document_intelligence",
+    # Banking tools
+    "banking.banking",
+    "banking.investments",
+    # Insurance tools
+    "insurance.fnol",
+    "insurance.policy",
+    "insurance.subro",
+    # Omnichannel tools
+    "channel_handoff",
+    # Utilities tools
+    "utilities.utilities",
+    "utilities.handoffs",
+    "utilities.extended",
+)
+
+# Module name -> import time in seconds (None if the import failed)
+_MODULE_LOAD_TIMES: dict[str, float | None] = {}
+_LOAD_LOCK = threading.RLock()
+
 
 def register_tool(
     name: str,
@@ -71,7 +130,9 @@ def register_tool(
     :param tags: Optional categorization tags (e.g., {'banking', 'auth'})
     :param override: If True, allow overriding existing registration
     """
-    if name in _TOOL_DEFINITIONS and not override:
+    existing = _TOOL_DEFINITIONS.get(name)
+    # Manifest placeholders are replaced when their module registers the real tool
+    if existing is not None and existing.executor is not None and not override:
         logger.debug("Tool '%s' already registered, skipping", name)
         return
 
@@ -82,6 +143,8 @@ def register_tool(
         is_handoff=is_handoff,
         description=schema.get("description", ""),
         tags=tags or set(),
+        # Module that called register_tool; importing it registers the tool again
+        module=existing.module if existing else sys._getframe(1).f_globals.get("__name__", ""),
     )
     logger.debug("Registered tool: %s (handoff=%s)", name, is_handoff)
 
@@ -93,8 +156,8 @@ def get_tool_schema(name: str) -> dict[str, Any] | None:
 
 
 def get_tool_executor(name: str) -> ToolExecutor | None:
-    """Get the executor for a registered tool."""
-    defn = _TOOL_DEFINITIONS.get(name)
+    """Get the executor for a registered tool, importing its module if needed."""
+    defn = _resolve(name)
     return defn.executor if defn else None
 
 
@@ -184,9 +247,10 @@ async def execute_tool(name: str, arguments: dict[str, Any]) -> dict[str, Any]:
     """
     Execute a registered tool with the given arguments.
 
-    Handles both sync and async executors.
+    Handles both sync and async executors. A tool module that is not loaded
+    yet is imported on a worker thread so the event loop keeps running.
     """
-    defn = _TOOL_DEFINITIONS.get(name)
+    defn = await _resolve_async(name)
     if not defn:
         return {
             "success": False,
@@ -195,6 +259,12 @@ async def execute_tool(name: str, arguments: dict[str, Any]) -> dict[str, Any]:
         }
 
     fn = defn.executor
+    if fn is None:
+        return {
+            "success": False,
+            "error": f"Tool '{name}' failed to load",
+            "message": f"Tool module '{defn.module}' could not be imported.",
+        }
     positional, keyword = _prepare_args(fn, arguments)
 
     try:
@@ -224,8 +294,12 @@ async def execute_tool(name: str, arguments: dict[str, Any]) -> dict[str, Any]:
 
 def initialize_tools() -> int:
     """
-    Load and register all tools.
-    
+    Register all tools.
+
+    Lazy mode (default, when the manifest exists) registers schemas from the
+    manifest without importing tool modules. Otherwise every tool module is
+    imported.
+
     Robust loading: if individual tool modules fail to import, they are logged
     as warnings but do not prevent other tools from loading.
 
@@ -237,53 +311,23 @@ def initialize_tools() -> int:
         logger.debug("Tools already initialized, skipping")
         return len(_TOOL_DEFINITIONS)
 
-    # Import tool modules - this triggers their registration
-    # Each module registers its tools at import time via register_tool()
-    # Wrapped in try-except to prevent single tool failures from breaking all tools
-    
-    tool_modules = [
-        ("auth", lambda: __import__("apps.artagent.backend.registries.toolstore.auth", fromlist=[""])),
-        ("call_transfer", lambda: __import__("apps.artagent.backend.registries.toolstore.call_transfer", fromlist=[""])),
-        ("compliance", lambda: __import__("apps.artagent.backend.registries.toolstore.compliance", fromlist=[""])),
-        ("customer_intelligence", lambda: __import__("apps.artagent.backend.registries.toolstore.customer_intelligence", fromlist=[""])),
-        ("escalation", lambda: __import__("apps.artagent.backend.registries.toolstore.escalation", fromlist=[""])),
-        ("fraud", lambda: __import__("apps.artagent.backend.registries.toolstore.fraud", fromlist=[""])),
-        ("handoffs", lambda: __import__("apps.artagent.backend.registries.toolstore.handoffs", fromlist=[""])),
-        ("knowledge_base", lambda: __import__("apps.artagent.backend.registries.toolstore.knowledge_base", fromlist=[""])),
-        ("personalized_greeting", lambda: __import__("apps.artagent.backend.registries.toolstore.personalized_greeting", fromlist=[""])),
-        ("rag_retrieval", lambda: __import__("apps.artagent.backend.registries.toolstore.rag_retrieval", fromlist=[""])),
-        ("transfer_agency", lambda: __import__("apps.artagent.backend.registries.toolstore.transfer_agency", fromlist=[""])),
-        ("voicemail", lambda: __import__("apps.artagent.backend.registries.toolstore.voicemail", fromlist=[""])),
-        # ("document_intelligence", lambda: __import__("apps.artagent.backend.registries.toolstore.document_intelligence", fromlist=[""])),
-        # Banking tools
-        ("banking.banking", lambda: __import__("apps.artagent.backend.registries.toolstore.banking.banking", fromlist=[""])),
-        ("banking.investments", lambda: __import__("apps.artagent.backend.registries.toolstore.banking.investments", fromlist=[""])),
-        # Insurance tools
-        ("insurance.fnol", lambda: __import__("apps.artagent.backend.registries.toolstore.insurance.fnol", fromlist=[""])),
-        ("insurance.policy", lambda: __import__("apps.artagent.backend.registries.toolstore.insurance.policy", fromlist=[""])),
-        ("insurance.subro", lambda: __import__("apps.artagent.backend.registries.toolstore.insurance.subro", fromlist=[""])),
-        # Omnichannel tools
-        ("channel_handoff", lambda: __import__("apps.artagent.backend.registries.toolstore.channel_handoff", fromlist=[""])),
-        # Utilities tools
-        ("utilities.utilities", lambda: __import__("apps.artagent.backend.registries.toolstore.utilities.utilities", fromlist=[""])),
-        ("utilities.handoffs", lambda: __import__("apps.artagent.backend.registries.toolstore.utilities.handoffs", fromlist=[""])),
-        ("utilities.extended", lambda: __import__("apps.artagent.backend.registries.toolstore.utilities.extended", fromlist=[""])),
-    ]
-    
-    failed_modules = []
-    for module_name, import_func in tool_modules:
-        try:
-            import_func()
-            logger.debug(f"✓ Loaded tool module: {module_name}")
-        except Exception as e:
-            failed_modules.append(module_name)
-            logger.warning(
-                f"Failed to load tool module '{module_name}': {type(e).__name__}: {e}",
-                exc_info=False  # Set to True for full stack trace in debug mode
+    with _LOAD_LOCK:
+        if _INITIALIZED:
+            return len(_TOOL_DEFINITIONS)
+
+        manifest = _read_manifest() if _lazy_enabled() else None
+        if manifest is not None:
+            _register_manifest(manifest)
+            _INITIALIZED = True
+            logger.info(
+                "Tool registry initialized from manifest with %d tools (modules load on demand)",
+                len(_TOOL_DEFINITIONS),
             )
+            return len(_TOOL_DEFINITIONS)
+
+        failed_modules = [m for m in TOOL_MODULES if not _load_module(f"{_PACKAGE}.{m}")]
+        _INITIALIZED = True
 
-    _INITIALIZED = True
-    
     if failed_modules:
         logger.warning(
             f"Tool registry initialized with {len(_TOOL_DEFINITIONS)} tools. "
@@ -291,14 +335,132 @@ def initialize_tools() -> int:
         )
     else:
         logger.info(f"Tool registry initialized successfully with {len(_TOOL_DEFINITIONS)} tools")
-    
+
     return len(_TOOL_DEFINITIONS)
 
 
+def load_tools(tool_names: Iterable[str]) -> int:
+    """
+    Import the modules behind the given tools ahead of their first call.
+
+    Used at startup for tools that loaded agents declare.
+
+    :param tool_names: Tool names to make executable
+    :return: Number of modules imported by this call
+    """
+    modules = {
+        defn.module
+        for name in tool_names
+        if (defn := _TOOL_DEFINITIONS.get(name)) is not None and defn.executor is None
+    }
+    return sum(1 for module in sorted(modules) if _load_module(module))
+
+
+def get_tool_load_report() -> list[tuple[str, float | None, int]]:
+    """
+    Import cost of tool modules loaded so far in this process.
+
+    :return: (module, seconds or None if failed, tool count) sorted by cost
+    """
+    counts: dict[str, int] = {}
+    for defn in _TOOL_DEFINITIONS.values():
+        if defn.module:
+            counts[defn.module] = counts.get(defn.module, 0) + 1
+    report = [(m, t, counts.get(m, 0)) for m, t in _MODULE_LOAD_TIMES.items()]
+    return sorted(report, key=lambda r: r[1] or 0.0, reverse=True)
+
+
+def _lazy_enabled() -> bool:
+    return os.getenv("TOOL_REGISTRY_LAZY", "true").lower() in ("true", "1", "yes", "on")
+
+
+def _read_manifest() -> dict[str, Any] | None:
+    try:
+        with MANIFEST_PATH.open(encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as exc:
+        logger.warning("Tool manifest unreadable, importing all tool modules: %s", exc)
+        return None
+
+
+def _register_manifest(manifest: dict[str, Any]) -> None:
+    for entry in manifest.get("tools", []):
+        name = entry["name"]
+        if name in _TOOL_DEFINITIONS:
+            continue
+        _TOOL_DEFINITIONS[name] = ToolDefinition(
+            name=name,
+            schema=entry["schema"],
+            executor=None,
+            is_handoff=entry.get("is_handoff", False),
+            description=entry["schema"].get("description", ""),
+            tags=set(entry.get("tags", [])),
+            module=entry["module"],
+        )
+
+
+def _load_module(module: str) -> bool:
+    """Import one tool module (fully qualified name) once."""
+    with _LOAD_LOCK:
+        if module in _MODULE_LOAD_TIMES:
+            return _MODULE_LOAD_TIMES[module] is not None
+
+        start = time.perf_counter()
+        try:
+            loaded = sys.modules.get(module)
+            if loaded is not None and any(
+                d.module == module and d.executor is None for d in _TOOL_DEFINITIONS.values()
+            ):
+                # Imported before a registry reset: run it again to re-register
+                importlib.reload(loaded)
+            else:
+                importlib.import_module(module)
+        except Exception as e:
+            _MODULE_LOAD_TIMES[module] = None
+            logger.warning(
+                f"Failed to load tool module '{module}': {type(e).__name__}: {e}",
+                exc_info=False,  # Set to True for full stack trace in debug mode
+            )
+            return False
+
+        elapsed = time.perf_counter() - start
+        _MODULE_LOAD_TIMES[module] = elapsed
+        logger.debug(f"✓ Loaded tool module: {module} ({elapsed * 1000:.1f}ms)")
+        return True
+
+
+def _resolve(name: str) -> ToolDefinition | None:
+    """Get a definition, importing its module on first use."""
+    defn = _TOOL_DEFINITIONS.get(name)
+    if defn is None or defn.executor is not None or not defn.module:
+        return defn
+    _load_module(defn.module)
+    defn = _TOOL_DEFINITIONS.get(name)
+    if defn is not None and defn.executor is None:
+        logger.warning(
+            "Tool '%s' is in the manifest but module '%s' did not register it; "
+            "regenerate the tool manifest",
+            name,
+            defn.module,
+        )
+    return defn
+
+
+async def _resolve_async(name: str) -> ToolDefinition | None:
+    """Like _resolve(), but imports the tool's module off the event loop."""
+    defn = _TOOL_DEFINITIONS.get(name)
+    if defn is not None and defn.executor is None and defn.module:
+        await asyncio.to_thread(_load_module, defn.module)
+    return _resolve(name)
+
+
 def reset_registry() -> None:
     """Reset the registry (for testing)."""
     global _INITIALIZED
     _TOOL_DEFINITIONS.clear()
+    _MODULE_LOAD_TIMES.clear()
     _INITIALIZED = False
 
 
@@ -312,6 +474,8 @@ __all__ = [
     "get_tools_for_agent",
     "execute_tool",
     "initialize_tools",
+    "load_tools",
+    "get_tool_load_report",
     "reset_registry",
     "ToolDefinition",
     "ToolExecutor",
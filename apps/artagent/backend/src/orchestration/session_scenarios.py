@@ -12,16 +12,24 @@ Session scenarios allow runtime customization of:
 - Handoff behavior (announced vs discrete)
 
 Storage Structure:
-- _session_scenarios: dict[session_id, dict[scenario_key, ScenarioConfig]]
-  In-memory cache for fast access. Keys are lowercase for case-insensitive lookup.
-  Also persisted to Redis via MemoManager.
-- _active_scenario: dict[session_id, scenario_key]
-  Tracks which scenario is currently active for each session (lowercase key).
+- SessionScenarioStore: session_id -> scenarios {scenario_key (lowercase) -> ScenarioConfig}
+  plus the active scenario key. In-memory cache for fast access, bounded by
+  size (LRU) and idle TTL. Sessions known to have no scenario are cached as
+  negative entries for a short time so repeated lookups skip Redis.
+  Also persisted to Redis via MemoManager, which remains the durable copy.
+- Async callers should await load_session_scenarios_async() before the sync
+  getters; misses then load off the event loop, once per session.
+- evict_session_scenarios() drops a session's entry at session teardown.
 """
 
 from __future__ import annotations
 
+import asyncio
+import json
+import time
+from collections import OrderedDict
 from collections.abc import Callable
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
 from apps.artagent.backend.src.orchestration.naming import (
@@ -29,7 +37,6 @@ from apps.artagent.backend.src.orchestration.naming import (
     SCENARIO_KEY_ALL,
     SCENARIO_KEY_CONFIG,
     find_scenario_by_name,
-    scenario_key,
 )
 from utils.ml_logging import get_logger
 
@@ -38,11 +45,145 @@ if TYPE_CHECKING:
 
 logger = get_logger(__name__)
 
-# Session-scoped dynamic scenarios: session_id -> {scenario_key (lowercase) -> ScenarioConfig}
-_session_scenarios: dict[str, dict[str, ScenarioConfig]] = {}
 
-# Track the active scenario for each session: session_id -> scenario_key (lowercase)
-_active_scenario: dict[str, str] = {}
+@dataclass
+class SessionScenarios:
+    """Cached scenarios for one session. No scenarios = known to have none."""
+
+    scenarios: dict[str, ScenarioConfig] = field(default_factory=dict)
+    active: str | None = None
+    expires_at: float = 0.0
+
+
+class SessionScenarioStore:
+    """
+    Bounded per-session scenario cache.
+
+    Entries are evicted least-recently-used beyond ``max_sessions`` and after
+    ``ttl_s`` without access. Negative entries (session has no scenario)
+    expire after ``negative_ttl_s`` so scenarios saved by another replica
+    show up quickly. Concurrent async loads for one session share a single
+    Redis read.
+    """
+
+    def __init__(
+        self,
+        max_sessions: int = 10_000,
+        ttl_s: float = 1800.0,
+        negative_ttl_s: float = 10.0,
+    ) -> None:
+        self._max_sessions = max_sessions
+        self._ttl_s = ttl_s
+        self._negative_ttl_s = negative_ttl_s
+        self._entries: OrderedDict[str, SessionScenarios] = OrderedDict()
+        self._loading: dict[str, asyncio.Future[SessionScenarios]] = {}
+        self._stats = {
+            "hits": 0,
+            "negative_hits": 0,
+            "misses": 0,
+            "loads": 0,
+            "shared_loads": 0,
+            "evictions": 0,
+        }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, session_id: str) -> SessionScenarios | None:
+        """Return the cached entry (possibly negative), or None if unknown."""
+        entry = self._entries.get(session_id)
+        now = time.monotonic()
+        if entry is None or entry.expires_at <= now:
+            if entry is not None:
+                del self._entries[session_id]
+            self._stats["misses"] += 1
+            return None
+        self._entries.move_to_end(session_id)
+        if entry.scenarios:
+            entry.expires_at = now + self._ttl_s
+            self._stats["hits"] += 1
+        else:
+            self._stats["negative_hits"] += 1
+        return entry
+
+    def peek(self, session_id: str) -> SessionScenarios | None:
+        """Return the cached entry without touching LRU order or stats."""
+        entry = self._entries.get(session_id)
+        if entry is None or entry.expires_at <= time.monotonic():
+            return None
+        return entry
+
+    def put(
+        self,
+        session_id: str,
+        scenarios: dict[str, ScenarioConfig],
+        active: str | None = None,
+    ) -> SessionScenarios:
+        """Cache a session's scenarios; an empty dict caches a negative result."""
+        ttl = self._ttl_s if scenarios else self._negative_ttl_s
+        entry = SessionScenarios(scenarios, active, time.monotonic() + ttl)
+        self._entries[session_id] = entry
+        self._entries.move_to_end(session_id)
+        while len(self._entries) > self._max_sessions:
+            self._entries.popitem(last=False)
+            self._stats["evictions"] += 1
+        return entry
+
+    def touch(self, session_id: str) -> None:
+        """Extend an entry after a local write turned it positive."""
+        entry = self._entries.get(session_id)
+        if entry is not None:
+            entry.expires_at = time.monotonic() + (
+                self._ttl_s if entry.scenarios else self._negative_ttl_s
+            )
+
+    def evict(self, session_id: str) -> bool:
+        return self._entries.pop(session_id, None) is not None
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def items(self) -> list[tuple[str, SessionScenarios]]:
+        now = time.monotonic()
+        return [(sid, e) for sid, e in self._entries.items() if e.expires_at > now]
+
+    async def load(
+        self,
+        session_id: str,
+        loader: Callable[[str], Any],
+    ) -> SessionScenarios:
+        """Return the cached entry, or run ``loader`` once for concurrent misses."""
+        entry = self.get(session_id)
+        if entry is not None:
+            return entry
+
+        pending = self._loading.get(session_id)
+        if pending is not None:
+            self._stats["shared_loads"] += 1
+            return await asyncio.shield(pending)
+
+        future: asyncio.Future[SessionScenarios] = asyncio.get_running_loop().create_future()
+        self._loading[session_id] = future
+        try:
+            self._stats["loads"] += 1
+            scenarios, active = await loader(session_id)
+            # A local write may have landed while the read was in flight
+            entry = self.peek(session_id) or self.put(session_id, scenarios, active)
+            future.set_result(entry)
+            return entry
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()  # mark retrieved when nobody else is waiting
+            raise
+        finally:
+            self._loading.pop(session_id, None)
+
+    def get_stats(self) -> dict[str, Any]:
+        return {**self._stats, "sessions": len(self._entries)}
+
+
+# Session-scoped dynamic scenarios and the active scenario key per session
+_store = SessionScenarioStore()
 
 # Callback for notifying the orchestrator adapter of scenario updates
 _scenario_update_callback: Callable[[str, ScenarioConfig], bool] | None = None
@@ -51,6 +192,11 @@ _scenario_update_callback: Callable[[str, ScenarioConfig], bool] | None = None
 _redis_manager: Any = None
 
 
+def get_session_scenario_store() -> SessionScenarioStore:
+    """Return the process-wide session scenario store."""
+    return _store
+
+
 def set_redis_manager(redis_mgr: Any) -> None:
     """Set the Redis manager reference for persistence operations."""
     global _redis_manager
@@ -139,104 +285,143 @@ def _parse_scenario_data(scenario_data: dict) -> ScenarioConfig:
     )
 
 
-def _load_scenarios_from_redis(session_id: str) -> dict[str, ScenarioConfig]:
+def _scenarios_from_corememory(
+    core: dict[str, Any],
+) -> tuple[dict[str, ScenarioConfig], str | None]:
     """
-    Load ALL scenarios for a session from Redis via MemoManager.
-    
+    Parse all scenarios and the active name from a session's core memory.
+
     Supports both new format (session_scenarios_all) and legacy format (session_scenario_config).
-    
+    """
+    # Try new multi-scenario format first
+    all_scenarios_data = core.get(SCENARIO_KEY_ALL)
+    active_name = core.get(SCENARIO_KEY_ACTIVE)
+
+    if all_scenarios_data and isinstance(all_scenarios_data, dict):
+        # New format: dict of {scenario_name: scenario_data}
+        loaded_scenarios: dict[str, ScenarioConfig] = {}
+        for scenario_name, scenario_data in all_scenarios_data.items():
+            try:
+                loaded_scenarios[scenario_name] = _parse_scenario_data(scenario_data)
+            except Exception as e:
+                logger.warning("Failed to parse scenario '%s': %s", scenario_name, e)
+
+        if loaded_scenarios:
+            if not (active_name and active_name in loaded_scenarios):
+                # Default to first scenario
+                active_name = next(iter(loaded_scenarios.keys()))
+            return loaded_scenarios, active_name
+
+    # Fall back to legacy single-scenario format
+    legacy_data = core.get(SCENARIO_KEY_CONFIG)
+    if legacy_data:
+        scenario = _parse_scenario_data(legacy_data)
+        return {scenario.name: scenario}, scenario.name
+
+    return {}, None
+
+
+def _decode_corememory(data: dict[str, str] | None) -> dict[str, Any]:
+    """Decode only the core memory field of a session hash (history is skipped)."""
+    from src.stateful.state_managment import MemoManager
+
+    raw = (data or {}).get(MemoManager._CORE_KEY)
+    if not raw:
+        return {}
+    core = json.loads(raw)
+    return core if isinstance(core, dict) else {}
+
+
+def _log_loaded(session_id: str, scenarios: dict[str, ScenarioConfig], active: str | None) -> None:
+    if scenarios:
+        logger.info(
+            "Loaded %d scenarios from Redis | session=%s active=%s",
+            len(scenarios),
+            session_id,
+            active,
+        )
+
+
+def _load_scenarios_from_redis(session_id: str) -> dict[str, ScenarioConfig]:
+    """
+    Load ALL scenarios for a session from Redis (sync) and cache the result.
+
+    Caches a negative entry when the session has none. Prefer
+    load_session_scenarios_async() from async code.
+
     Returns dict of scenario_name -> ScenarioConfig.
     """
     if not _redis_manager:
         return {}
-    
+
     try:
         from src.stateful.state_managment import MemoManager
-        
-        memo = MemoManager.from_redis(session_id, _redis_manager)
-        
-        # Try new multi-scenario format first
-        all_scenarios_data = memo.get_value_from_corememory(SCENARIO_KEY_ALL)
-        active_name = memo.get_value_from_corememory(SCENARIO_KEY_ACTIVE)
-        
-        if all_scenarios_data and isinstance(all_scenarios_data, dict):
-            # New format: dict of {scenario_name: scenario_data}
-            loaded_scenarios: dict[str, ScenarioConfig] = {}
-            for scenario_name, scenario_data in all_scenarios_data.items():
-                try:
-                    scenario = _parse_scenario_data(scenario_data)
-                    loaded_scenarios[scenario_name] = scenario
-                except Exception as e:
-                    logger.warning("Failed to parse scenario '%s': %s", scenario_name, e)
-            
-            if loaded_scenarios:
-                # Cache in memory
-                _session_scenarios[session_id] = loaded_scenarios
-                
-                # Set active scenario
-                if active_name and active_name in loaded_scenarios:
-                    _active_scenario[session_id] = active_name
-                else:
-                    # Default to first scenario
-                    _active_scenario[session_id] = next(iter(loaded_scenarios.keys()))
-                
-                logger.info(
-                    "Loaded %d scenarios from Redis | session=%s active=%s",
-                    len(loaded_scenarios),
-                    session_id,
-                    _active_scenario.get(session_id),
-                )
-                return loaded_scenarios
-        
-        # Fall back to legacy single-scenario format
-        legacy_data = memo.get_value_from_corememory(SCENARIO_KEY_CONFIG)
-        if legacy_data:
-            scenario = _parse_scenario_data(legacy_data)
-            
-            # Cache in memory
-            if session_id not in _session_scenarios:
-                _session_scenarios[session_id] = {}
-            _session_scenarios[session_id][scenario.name] = scenario
-            _active_scenario[session_id] = scenario.name
-            
-            logger.info(
-                "Loaded scenario from Redis (legacy format) | session=%s scenario=%s",
-                session_id,
-                scenario.name,
-            )
-            return {scenario.name: scenario}
-        
-        return {}
+
+        data = _redis_manager.get_session_data(MemoManager.build_redis_key(session_id))
+        scenarios, active = _scenarios_from_corememory(_decode_corememory(data))
     except Exception as e:
         logger.warning("Failed to load scenarios from Redis: %s", e)
         return {}
 
+    _store.put(session_id, scenarios, active)
+    _log_loaded(session_id, scenarios, active)
+    return scenarios
 
-def _load_scenario_from_redis(session_id: str) -> ScenarioConfig | None:
+
+async def _read_scenarios_async(
+    session_id: str,
+) -> tuple[dict[str, ScenarioConfig], str | None]:
+    from src.stateful.state_managment import MemoManager
+
+    data = await _redis_manager.get_session_data_async(MemoManager.build_redis_key(session_id))
+    scenarios, active = _scenarios_from_corememory(_decode_corememory(data))
+    _log_loaded(session_id, scenarios, active)
+    return scenarios, active
+
+
+async def load_session_scenarios_async(session_id: str) -> dict[str, ScenarioConfig]:
     """
-    Load scenario config from Redis via MemoManager.
-    
-    Returns the active ScenarioConfig if found, None otherwise.
-    Delegates to _load_scenarios_from_redis for actual loading.
+    Make sure a session's scenarios are cached, loading from Redis if needed.
+
+    Await this from async code before calling the sync getters so that a
+    cache miss reads Redis without blocking the event loop. Concurrent
+    calls for the same session share one read.
     """
-    scenarios = _load_scenarios_from_redis(session_id)
-    if not scenarios:
-        return None
-    
-    # Return the active scenario
-    active_name = _active_scenario.get(session_id)
-    if active_name and active_name in scenarios:
-        return scenarios[active_name]
-    
-    # Return first scenario as fallback
-    return next(iter(scenarios.values()), None)
+    entry = _store.get(session_id)
+    if entry is not None:
+        return dict(entry.scenarios)
+    if not _redis_manager:
+        return {}
+    try:
+        entry = await _store.load(session_id, _read_scenarios_async)
+    except Exception as e:
+        logger.warning("Failed to load scenarios from Redis: %s", e)
+        return {}
+    return dict(entry.scenarios)
+
+
+def _session_entry(session_id: str) -> SessionScenarios | None:
+    """Cached entry for a session, falling back to a sync Redis load on a miss."""
+    entry = _store.get(session_id)
+    if entry is None:
+        _load_scenarios_from_redis(session_id)
+        entry = _store.peek(session_id)
+    return entry
+
+
+def _writable_entry(session_id: str) -> SessionScenarios:
+    """Entry to mutate for a local write, keeping scenarios already in Redis."""
+    entry = _session_entry(session_id)
+    if entry is None:
+        entry = _store.put(session_id, {})
+    return entry
 
 
 def get_session_scenario(session_id: str, scenario_name: str | None = None) -> ScenarioConfig | None:
     """
     Get dynamic scenario for a session.
     
-    First checks in-memory cache, then falls back to Redis if not found.
+    First checks the in-memory store, then falls back to Redis on a miss.
     Uses case-insensitive lookup for scenario_name.
     
     Args:
@@ -246,66 +431,52 @@ def get_session_scenario(session_id: str, scenario_name: str | None = None) -> S
     Returns:
         The ScenarioConfig if found, None otherwise.
     """
-    session_scenarios = _session_scenarios.get(session_id, {})
-    
-    # Check in-memory cache first
-    if session_scenarios:
-        if scenario_name:
-            # Case-insensitive lookup
-            _, result = find_scenario_by_name(session_scenarios, scenario_name)
-            if result:
-                return result
-        else:
-            # Return active scenario if set, otherwise first scenario
-            active_key = _active_scenario.get(session_id)
-            if active_key and active_key in session_scenarios:
-                return session_scenarios[active_key]
-            return next(iter(session_scenarios.values()), None)
-    
-    # Not in memory - try loading from Redis
-    redis_scenario = _load_scenario_from_redis(session_id)
-    if redis_scenario:
-        if scenario_name is None:
-            return redis_scenario
-        # Case-insensitive compare
-        if scenario_key(redis_scenario.name) == scenario_key(scenario_name):
-            return redis_scenario
-    
-    return None
+    entry = _session_entry(session_id)
+    if entry is None or not entry.scenarios:
+        return None
+
+    session_scenarios = entry.scenarios
+    if scenario_name:
+        # Case-insensitive lookup
+        _, result = find_scenario_by_name(session_scenarios, scenario_name)
+        return result
+
+    # Return active scenario if set, otherwise first scenario
+    if entry.active and entry.active in session_scenarios:
+        return session_scenarios[entry.active]
+    return next(iter(session_scenarios.values()), None)
 
 
 def get_session_scenarios(session_id: str) -> dict[str, ScenarioConfig]:
     """
     Get all dynamic scenarios for a session.
     
-    Falls back to Redis if memory cache is empty.
+    Falls back to Redis on a cache miss.
     """
-    scenarios = _session_scenarios.get(session_id, {})
-    
-    # Fall back to Redis if memory cache is empty
-    if not scenarios:
-        # Use the multi-scenario loader to get all scenarios
-        scenarios = _load_scenarios_from_redis(session_id)
-    
-    return dict(scenarios)
+    entry = _session_entry(session_id)
+    return dict(entry.scenarios) if entry else {}
 
 
 def get_active_scenario_name(session_id: str) -> str | None:
     """
     Get the name of the currently active scenario for a session.
     
-    Falls back to Redis if not found in memory cache.
+    Falls back to Redis on a cache miss.
     """
-    active_name = _active_scenario.get(session_id)
-    
-    # Fall back to Redis if not in memory
-    if not active_name:
-        scenario = _load_scenario_from_redis(session_id)
-        if scenario:
-            # _load_scenario_from_redis sets _active_scenario
-            active_name = _active_scenario.get(session_id)
-    
-    return active_name
+    entry = _session_entry(session_id)
+    return entry.active if entry and entry.scenarios else None
+
+
+def evict_session_scenarios(session_id: str) -> bool:
+    """
+    Drop a session's cached scenarios at session teardown.
+
+    Redis keeps the durable copy, so a later lookup reloads it. Without a
+    Redis manager the cache is the only copy and is left in place.
+    """
+    if not _redis_manager:
+        return False
+    return _store.evict(session_id)
 
 
 def _serialize_scenario(scenario: ScenarioConfig) -> dict:
@@ -374,7 +545,8 @@ def _persist_scenario_to_redis(session_id: str, scenario: ScenarioConfig) -> Non
         memo = MemoManager.from_redis(session_id, _redis_manager)
         
         # Build dict of ALL scenarios for this session
-        session_scenarios = _session_scenarios.get(session_id, {})
+        entry = _store.peek(session_id)
+        session_scenarios = entry.scenarios if entry else {}
         all_scenarios_data = {}
         for name, sc in session_scenarios.items():
             all_scenarios_data[name] = _serialize_scenario(sc)
@@ -477,14 +649,16 @@ def set_active_scenario(session_id: str, scenario_name: str) -> bool:
     
     Returns True if the scenario exists and was set as active.
     """
-    session_scenarios = _session_scenarios.get(session_id, {})
+    entry = _session_entry(session_id)
+    if entry is None:
+        return False
     
     # Case-insensitive lookup
-    actual_key, scenario = find_scenario_by_name(session_scenarios, scenario_name)
+    actual_key, scenario = find_scenario_by_name(entry.scenarios, scenario_name)
     if not scenario:
         return False
     
-    _active_scenario[session_id] = actual_key
+    entry.active = actual_key
     
     # Persist the active scenario name to Redis so new calls use it
     if _redis_manager:
@@ -521,6 +695,22 @@ def set_active_scenario(session_id: str, scenario_name: str) -> bool:
     return True
 
 
+def _store_scenario(entry: SessionScenarios, session_id: str, scenario: ScenarioConfig) -> None:
+    """Store a scenario under its lowercase key and make it active."""
+    # Normalize scenario key to lowercase for case-insensitive storage
+    normalized_key = scenario.name.lower()
+    
+    # Remove any existing scenario with different casing (to avoid duplicates)
+    keys_to_remove = [k for k in entry.scenarios if k.lower() == normalized_key and k != normalized_key]
+    for old_key in keys_to_remove:
+        del entry.scenarios[old_key]
+        logger.debug("Removed duplicate scenario key | session=%s old_key=%s new_key=%s", session_id, old_key, normalized_key)
+    
+    entry.scenarios[normalized_key] = scenario
+    entry.active = normalized_key
+    _store.touch(session_id)
+
+
 def set_session_scenario(session_id: str, scenario: ScenarioConfig) -> None:
     """
     Set dynamic scenario for a session (sync version).
@@ -536,20 +726,7 @@ def set_session_scenario(session_id: str, scenario: ScenarioConfig) -> None:
     Scenario names are normalized to lowercase for case-insensitive storage.
     If a scenario with the same name (case-insensitive) already exists, it is updated.
     """
-    if session_id not in _session_scenarios:
-        _session_scenarios[session_id] = {}
-    
-    # Normalize scenario key to lowercase for case-insensitive storage
-    normalized_key = scenario.name.lower()
-    
-    # Remove any existing scenario with different casing (to avoid duplicates)
-    keys_to_remove = [k for k in _session_scenarios[session_id] if k.lower() == normalized_key and k != normalized_key]
-    for old_key in keys_to_remove:
-        del _session_scenarios[session_id][old_key]
-        logger.debug("Removed duplicate scenario key | session=%s old_key=%s new_key=%s", session_id, old_key, normalized_key)
-    
-    _session_scenarios[session_id][normalized_key] = scenario
-    _active_scenario[session_id] = normalized_key
+    _store_scenario(_writable_entry(session_id), session_id, scenario)
 
     # Notify the orchestrator adapter if callback is registered
     adapter_updated = False
@@ -585,20 +762,9 @@ async def set_session_scenario_async(session_id: str, scenario: ScenarioConfig)
     Scenario names are normalized to lowercase for case-insensitive storage.
     If a scenario with the same name (case-insensitive) already exists, it is updated.
     """
-    if session_id not in _session_scenarios:
-        _session_scenarios[session_id] = {}
-    
-    # Normalize scenario key to lowercase for case-insensitive storage
-    normalized_key = scenario.name.lower()
-    
-    # Remove any existing scenario with different casing (to avoid duplicates)
-    keys_to_remove = [k for k in _session_scenarios[session_id] if k.lower() == normalized_key and k != normalized_key]
-    for old_key in keys_to_remove:
-        del _session_scenarios[session_id][old_key]
-        logger.debug("Removed duplicate scenario key | session=%s old_key=%s new_key=%s", session_id, old_key, normalized_key)
-    
-    _session_scenarios[session_id][normalized_key] = scenario
-    _active_scenario[session_id] = normalized_key
+    # Load first so persisting "all scenarios" keeps the ones already in Redis
+    await load_session_scenarios_async(session_id)
+    _store_scenario(_writable_entry(session_id), session_id, scenario)
 
     # Notify the orchestrator adapter if callback is registered
     adapter_updated = False
@@ -639,7 +805,8 @@ async def _persist_scenario_to_redis_async(session_id: str, scenario: ScenarioCo
         memo = MemoManager.from_redis(session_id, _redis_manager)
         
         # Build dict of ALL scenarios for this session
-        session_scenarios = _session_scenarios.get(session_id, {})
+        entry = _store.peek(session_id)
+        session_scenarios = entry.scenarios if entry else {}
         all_scenarios_data = {}
         for name, sc in session_scenarios.items():
             all_scenarios_data[name] = _serialize_scenario(sc)
@@ -691,35 +858,32 @@ def remove_session_scenario(session_id: str, scenario_name: str | None = None) -
     Returns:
         True if removed, False if not found.
     """
-    if session_id not in _session_scenarios:
+    entry = _session_entry(session_id)
+    if entry is None or not entry.scenarios:
         return False
     
     if scenario_name:
         # Remove specific scenario
-        if scenario_name in _session_scenarios[session_id]:
-            del _session_scenarios[session_id][scenario_name]
+        if scenario_name in entry.scenarios:
+            del entry.scenarios[scenario_name]
             logger.info("Session scenario removed | session=%s scenario=%s", session_id, scenario_name)
             
             # Update active scenario if needed
-            if _active_scenario.get(session_id) == scenario_name:
-                remaining = _session_scenarios[session_id]
-                if remaining:
-                    _active_scenario[session_id] = next(iter(remaining.keys()))
+            if entry.active == scenario_name:
+                if entry.scenarios:
+                    entry.active = next(iter(entry.scenarios.keys()))
                 else:
-                    del _active_scenario[session_id]
+                    entry.active = None
                     # Clear from Redis when no scenarios remain
                     _clear_scenario_from_redis(session_id)
             
-            # Clean up empty session
-            if not _session_scenarios[session_id]:
-                del _session_scenarios[session_id]
+            # Empty session is now a negative entry
+            _store.touch(session_id)
             return True
         return False
     else:
         # Remove all scenarios for session
-        del _session_scenarios[session_id]
-        if session_id in _active_scenario:
-            del _active_scenario[session_id]
+        _store.put(session_id, {})
         # Clear from Redis
         _clear_scenario_from_redis(session_id)
         logger.info("All session scenarios removed | session=%s", session_id)
@@ -733,8 +897,8 @@ def list_session_scenarios() -> dict[str, ScenarioConfig]:
     Key format: "{session_id}:{scenario_name}" to ensure uniqueness.
     """
     result: dict[str, ScenarioConfig] = {}
-    for session_id, scenarios in _session_scenarios.items():
-        for scenario_name, scenario in scenarios.items():
+    for session_id, entry in _store.items():
+        for scenario_name, scenario in entry.scenarios.items():
             result[f"{session_id}:{scenario_name}"] = scenario
     return result
 
@@ -743,20 +907,9 @@ def list_session_scenarios_by_session(session_id: str) -> dict[str, ScenarioConf
     """
     Return all scenarios for a specific session (deduplicated by name, case-insensitive).
     
-    Falls back to Redis if memory cache is empty.
+    Falls back to Redis on a cache miss.
     """
-    scenarios = _session_scenarios.get(session_id, {})
-    
-    # Fall back to Redis if memory cache is empty
-    if not scenarios:
-        # Use the multi-scenario loader to get all scenarios
-        scenarios = _load_scenarios_from_redis(session_id)
-        if scenarios:
-            logger.debug(
-                "Loaded session scenarios from Redis | session=%s count=%d",
-                session_id,
-                len(scenarios),
-            )
+    scenarios = get_session_scenarios(session_id)
     
     # Deduplicate by lowercase name (keep latest)
     deduplicated: dict[str, ScenarioConfig] = {}
@@ -768,6 +921,7 @@ def list_session_scenarios_by_session(session_id: str) -> dict[str, ScenarioConf
 
 
 __all__ = [
+    "SessionScenarioStore",
     "get_session_scenario",
     "get_session_scenarios",
     "get_active_scenario_name",
@@ -776,6 +930,9 @@ __all__ = [
     "set_session_scenario_async",
     "set_redis_manager",
     "remove_session_scenario",
+    "evict_session_scenarios",
+    "load_session_scenarios_async",
+    "get_session_scenario_store",
     "list_session_scenarios",
     "list_session_scenarios_by_session",
     "register_scenario_update_callback",
@@ -24,6 +24,7 @@ Usage:
 
 from __future__ import annotations
 
+import functools
 import json
 import time
 import uuid
@@ -38,6 +39,7 @@ from apps.artagent.backend.src.orchestration.session_agents import (
     register_adapter_update_callback,
 )
 from apps.artagent.backend.src.orchestration.session_scenarios import (
+    evict_session_scenarios,
     register_scenario_update_callback,
 )
 from apps.artagent.backend.src.utils.tracing import (
@@ -53,6 +55,11 @@ from apps.artagent.backend.voice import (
     make_envelope,
     send_session_envelope,
 )
+from apps.artagent.backend.voice.speech_cascade.speculation import (
+    defer_until_commit,
+    is_speculative,
+    speculation_checkpoint,
+)
 from apps.artagent.backend.voice.voicelive.tool_helpers import (
     push_tool_end,
     push_tool_start,
@@ -182,10 +189,11 @@ def _get_or_create_adapter(
 
 
 def cleanup_adapter(session_id: str) -> None:
-    """Remove adapter for a completed session."""
+    """Remove adapter and cached scenarios for a completed session."""
     if session_id in _adapters:
         del _adapters[session_id]
         logger.debug("Cleaned up adapter for session: %s", session_id)
+    evict_session_scenarios(session_id)
 
 
 def update_session_agent(session_id: str, agent: UnifiedAgent, set_active: bool = False) -> bool:
@@ -410,12 +418,12 @@ async def route_turn(
     try:
         run_id = ws.state.lt.begin_run(label="turn")
         if hasattr(ws.state.lt, "set_current_run"):
-            ws.state.lt.set_current_run(run_id)
+            defer_until_commit(functools.partial(ws.state.lt.set_current_run, run_id))
     except Exception:
         run_id = uuid.uuid4().hex[:12]
 
-    # Store run_id in memory
-    cm.set_corememory("current_run_id", run_id)
+    # Store run_id in memory (a speculative turn waits for the final transcript)
+    defer_until_commit(functools.partial(cm.set_corememory, "current_run_id", run_id))
 
     # Get or create orchestrator adapter
     app_state = ws.app.state
@@ -539,7 +547,7 @@ async def route_turn(
                     logger.debug("Failed to emit agent_change envelope", exc_info=True)
 
             # Register agent switch callback on adapter
-            adapter.set_on_agent_switch(on_agent_switch)
+            defer_until_commit(functools.partial(adapter.set_on_agent_switch, on_agent_switch))
 
             # Define TTS chunk callback - uses speech_cascade's queue_tts for proper sequencing
             async def on_tts_chunk(text: str) -> None:
@@ -547,6 +555,9 @@ async def route_turn(
                 if not text or not text.strip():
                     return
 
+                # Hold output of a speculative turn until the final transcript commits it
+                await speculation_checkpoint()
+
                 normalized = text.strip()
                 stream_cache = _ensure_stream_cache(ws)
                 stream_cache.append(normalized)
@@ -614,6 +625,7 @@ async def route_turn(
             async def on_tool_start(tool_name: str, arguments_raw: object) -> None:
                 if not tool_name:
                     return
+                await speculation_checkpoint()
                 try:
                     args = _parse_tool_arguments(arguments_raw)
                     call_id = uuid.uuid4().hex[:10]
@@ -660,6 +672,8 @@ async def route_turn(
                 on_tool_start=on_tool_start,
                 on_tool_end=on_tool_end,
             )
+            # An error result can come back before a speculative turn is confirmed
+            await speculation_checkpoint()
 
             span.set_attribute("orchestrator.response_length", len(result.response_text or ""))
             span.set_attribute("orchestrator.agent", result.agent_name or "unknown")
@@ -738,14 +752,17 @@ async def route_turn(
             logger.exception("💥 route_turn crash – session=%s", session_id)
             span.set_attribute("orchestrator.error", "exception")
             try:
+                await speculation_checkpoint()
                 await _emit_orchestrator_error_status(ws, cm, exc)
             except Exception:
                 logger.debug("Failed to emit orchestrator error status", exc_info=True)
             raise
         finally:
-            # Persist conversation state
+            # Persist conversation state (nothing to persist for a discarded speculative turn)
             try:
-                if hasattr(cm, "persist_to_redis_async"):
+                if is_speculative():
+                    logger.debug("Skipping persist for discarded speculative turn")
+                elif hasattr(cm, "persist_to_redis_async"):
                     await cm.persist_to_redis_async(redis_mgr)
                 elif hasattr(cm, "persist_background"):
                     await cm.persist_background(redis_mgr)
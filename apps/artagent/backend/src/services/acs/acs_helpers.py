@@ -288,15 +288,11 @@ async def play_response(
             )
         for attempt in range(max_retries):
             try:
-                # Run the synchronous play_media call in a thread pool to avoid blocking
-                loop = asyncio.get_event_loop()
-                response = await loop.run_in_executor(
-                    None,
-                    lambda: call_conn.play_media(
-                        play_source=source,
-                        # play_to=participants,
-                        interrupt_call_media_operation=True,
-                    ),
+                response = await acs_caller.call_control.play_media(
+                    call_connection_id,
+                    source,
+                    # play_to=participants,
+                    interrupt_call_media_operation=True,
                 )
                 logger.info(
                     f"Successfully played media on attempt {attempt + 1} to play response: {sanitized_text}"
@@ -592,15 +588,11 @@ async def _play_response_direct(
 
         for attempt in range(max_retries):
             try:
-                # Run the synchronous play_media call in a thread pool to avoid blocking
-                loop = asyncio.get_event_loop()
-                response = await loop.run_in_executor(
-                    None,
-                    lambda: call_conn.play_media(
-                        play_source=source,
-                        # play_to=participants,
-                        interrupt_call_media_operation=True,
-                    ),
+                response = await acs_caller.call_control.play_media(
+                    call_connection_id,
+                    source,
+                    # play_to=participants,
+                    interrupt_call_media_operation=True,
                 )
                 logger.info(
                     f"Successfully played media on attempt {attempt + 1} to play response: {sanitized_text}"
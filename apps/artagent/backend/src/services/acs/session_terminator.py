@@ -5,9 +5,9 @@ from dataclasses import dataclass
 from datetime import UTC, datetime
 from enum import Enum, auto
 
-from azure.communication.callautomation import CallAutomationClient
 from fastapi import WebSocket
 from fastapi.websockets import WebSocketState
+from src.acs.call_control import AcsCallControl
 from utils.ml_logging import get_logger
 
 logger = get_logger("services.acs.session_terminator")
@@ -38,82 +38,56 @@ class TerminationResult:
     websocket_closed: bool
 
 
+def _is_call_gone(exc: Exception) -> bool:
+    """Heuristic: the call no longer exists (404/not found/already disconnected)."""
+    if getattr(exc, "status_code", None) == 404:
+        return True
+    error_msg = str(exc).lower()
+    return any(
+        phrase in error_msg
+        for phrase in ["not found", "404", "gone", "already disconnected", "call ended"]
+    )
+
+
 async def _hangup_acs_call(
     *,
-    acs_client: CallAutomationClient,
+    call_control: AcsCallControl,
     call_connection_id: str,
-    attempts: int = 2,  # Reduced from 3
-    base_backoff_s: float = 0.25,
-    timeout_s: float = 2.0,  # Reduced from 3.0
 ) -> bool:
     """
-    Best-effort hang-up with retries + timeout.
+    Best-effort hang-up.
 
-    :param acs_client: An initialized CallAutomationClient.
+    Per-attempt timeout and retries come from the call-control facade's
+    ``hang_up`` policy.
+
+    :param call_control: The ACS call-control facade.
     :param call_connection_id: The ACS call connection id.
-    :param attempts: Max retry attempts.
-    :param base_backoff_s: Initial backoff in seconds (exponential).
-    :param timeout_s: Per-attempt timeout seconds.
-    :return: True if hangup succeeded, False otherwise.
+    :return: True if hangup succeeded (or the call was already gone), False otherwise.
     """
-    for i in range(1, attempts + 1):
-        try:
-            logger.debug(f"Attempting ACS hangup for call {call_connection_id}, attempt {i}")
-
-            # hang_up is a synchronous SDK method - run in executor to avoid blocking
-            loop = asyncio.get_running_loop()
-            await asyncio.wait_for(
-                loop.run_in_executor(
-                    None,
-                    lambda: acs_client.get_call_connection(call_connection_id).hang_up(
-                        is_for_everyone=True
-                    ),
-                ),
-                timeout=timeout_s,
-            )
+    try:
+        logger.debug(f"Attempting ACS hangup for call {call_connection_id}")
+        await call_control.hang_up(call_connection_id)
+        logger.info("ACS hangup succeeded", extra={"call_connection_id": call_connection_id})
+        return True
+    except TimeoutError:
+        logger.warning(
+            "ACS hangup timed out",
+            extra={"call_connection_id": call_connection_id},
+        )
+    except Exception as exc:
+        # Check if this is actually a successful hangup disguised as an error
+        if _is_call_gone(exc):
             logger.info(
-                "ACS hangup succeeded",
-                extra={"call_connection_id": call_connection_id, "attempt": i},
+                "ACS hangup - call already disconnected",
+                extra={"call_connection_id": call_connection_id},
             )
             return True
+        logger.warning(
+            "ACS hangup failed",
+            extra={"call_connection_id": call_connection_id, "error": repr(exc)},
+        )
 
-        except TimeoutError:
-            logger.warning(
-                "ACS hangup timed out",
-                extra={
-                    "call_connection_id": call_connection_id,
-                    "attempt": i,
-                    "timeout_s": timeout_s,
-                },
-            )
-        except Exception as exc:
-            # Check if this is actually a successful hangup disguised as an error
-            error_msg = str(exc).lower()
-            if any(
-                phrase in error_msg
-                for phrase in ["not found", "404", "already disconnected", "call ended"]
-            ):
-                logger.info(
-                    "ACS hangup - call already disconnected",
-                    extra={"call_connection_id": call_connection_id, "attempt": i},
-                )
-                return True
-
-            logger.warning(
-                "ACS hangup failed",
-                extra={
-                    "call_connection_id": call_connection_id,
-                    "attempt": i,
-                    "error": repr(exc),
-                },
-            )
-
-        # Wait before retry (unless it's the last attempt)
-        if i < attempts:
-            backoff_time = base_backoff_s * (2 ** (i - 1))
-            await asyncio.sleep(backoff_time)
-
-    logger.error(f"ACS hangup failed after {attempts} attempts for call {call_connection_id}")
+    logger.error(f"ACS hangup failed for call {call_connection_id}")
     return False
 
 
@@ -156,7 +130,7 @@ def _cleanup_disconnect_event(ws: WebSocket, call_connection_id: str | None) ->
 async def _wait_for_acs_disconnect(
     *,
     ws: WebSocket,
-    acs_client: CallAutomationClient | None,
+    call_control: AcsCallControl | None,
     call_connection_id: str | None,
     max_wait_s: float = 5.0,  # Reduced from 10.0
     poll_interval_s: float = 0.5,
@@ -166,7 +140,7 @@ async def _wait_for_acs_disconnect(
 
     Strategy:
     1) If an event exists (set by your ACS webhook on CallDisconnected), await it.
-    2) Else, if we have an ACS client, poll a lightweight call API and treat 404/NotFound
+    2) Else, if we have call control, poll the call properties and treat 404/NotFound
        or clear disconnection signals as 'disconnected'.
     3) Time out after max_wait_s and proceed (return False).
 
@@ -192,21 +166,19 @@ async def _wait_for_acs_disconnect(
                 extra={"call_connection_id": call_connection_id},
             )
 
-    if not disconnected and acs_client:
+    if not disconnected and call_control:
         deadline = asyncio.get_event_loop().time() + max_wait_s
         while asyncio.get_event_loop().time() < deadline:
             try:
-                # Try a cheap call that fails once the call is gone.
-                conn = acs_client.get_call_connection(call_connection_id)
-                # Many versions support get_participants(); if the call is gone you'll get a 404/NotFound.
-                await conn.get_participants()  # type: ignore[attr-defined]
-                # If it didn't throw, call may still be up. Wait and retry.
+                # A cheap read that fails once the call is gone
+                props = await call_control.get_call_properties(call_connection_id)
+                if str(getattr(props, "call_connection_state", "")).lower() == "disconnected":
+                    disconnected = True
+                    break
                 await asyncio.sleep(poll_interval_s)
                 continue
             except Exception as exc:
-                # Heuristic: treat not found/404 as "disconnected"
-                msg = str(exc).lower()
-                if "not found" in msg or "404" in msg or "gone" in msg or "disconnected" in msg:
+                if _is_call_gone(exc) or "disconnected" in str(exc).lower():
                     logger.info(
                         "ACS disconnect inferred by polling",
                         extra={"call_connection_id": call_connection_id},
@@ -221,6 +193,7 @@ async def _wait_for_acs_disconnect(
                 "Timeout waiting for ACS disconnect (polling)",
                 extra={"call_connection_id": call_connection_id},
             )
+        call_control.release(call_connection_id)
 
     # Clean up the disconnect event to prevent memory leaks
     _cleanup_disconnect_event(ws, call_connection_id)
@@ -261,7 +234,7 @@ async def terminate_session(
     is_acs: bool,
     call_connection_id: str | None,
     reason: TerminationReason = TerminationReason.NORMAL,
-    acs_client: CallAutomationClient | None = None,
+    call_control: AcsCallControl | None = None,
     wait_for_disconnect_s: float = 5.0,  # Reduced from 10s
 ) -> TerminationResult:
     """
@@ -274,8 +247,8 @@ async def terminate_session(
     :param is_acs: True if the session is associated with ACS.
     :param call_connection_id: The ACS call connection id, if available.
     :param reason: The reason for termination.
-    :param acs_client: Optional explicit CallAutomationClient. If not provided,
-                       the function attempts to read `ws.app.state.acs_caller.client`.
+    :param call_control: Optional explicit AcsCallControl. If not provided,
+                         the function attempts to read `ws.app.state.acs_caller.call_control`.
     :param wait_for_disconnect_s: Max seconds to wait for ACS to disconnect before closing WS.
     :return: TerminationResult indicating what succeeded.
     """
@@ -293,11 +266,11 @@ async def terminate_session(
     except Exception:
         pass
 
-    # Resolve ACS client from app state if not passed
-    resolved_acs_client: CallAutomationClient | None = acs_client
-    if is_acs and call_connection_id and resolved_acs_client is None:
+    # Resolve ACS call control from app state if not passed
+    resolved_call_control: AcsCallControl | None = call_control
+    if is_acs and call_connection_id and resolved_call_control is None:
         try:
-            resolved_acs_client = ws.app.state.acs_caller.client  # type: ignore[attr-defined]
+            resolved_call_control = ws.app.state.acs_caller.call_control  # type: ignore[attr-defined]
         except Exception as exc:
             logger.warning(
                 "ACS client not available from app state",
@@ -310,7 +283,7 @@ async def terminate_session(
     # Handler cleanup is now managed by ConnectionManager during WebSocket disconnection
     # No need for manual handler cleanup here since ConnectionManager handles this automatically
 
-    if is_acs and call_connection_id and resolved_acs_client:
+    if is_acs and call_connection_id and resolved_call_control:
         acs_attempted = True
         try:
             try:
@@ -323,10 +296,8 @@ async def terminate_session(
                 logger.debug(f"Could not play goodbye message: {goodbye_exc}")
 
             acs_succeeded = await _hangup_acs_call(
-                acs_client=resolved_acs_client,
+                call_control=resolved_call_control,
                 call_connection_id=call_connection_id,
-                attempts=2,  # Reduced attempts for faster termination
-                timeout_s=2.0,  # Reduced timeout
             )
         except Exception as exc:
             logger.exception(
@@ -338,7 +309,7 @@ async def terminate_session(
     if is_acs and call_connection_id:
         disconnected = await _wait_for_acs_disconnect(
             ws=ws,
-            acs_client=resolved_acs_client,
+            call_control=resolved_call_control,
             call_connection_id=call_connection_id,
             max_wait_s=wait_for_disconnect_s,
         )
@@ -11,9 +11,17 @@ Features:
 - Thread-safe operations with async support
 - Integration with CosmosDB for persistence
 - Unified statistics interface for both endpoints
+
+Disconnect counters are plain in-memory increments; no I/O happens on the
+add/remove path. A background flusher periodically coalesces the increments
+since the last flush into one Cosmos ``$inc`` (run off the event loop) and
+one Redis ``HINCRBY`` pipeline, so replicas add to shared totals rather than
+overwriting each other.
 """
 
 import asyncio
+import contextlib
+from collections import Counter
 from datetime import datetime
 from typing import Any
 
@@ -24,6 +32,9 @@ from utils.ml_logging import get_logger
 logger = get_logger(__name__)
 tracer = trace.get_tracer(__name__)
 
+STATS_DOCUMENT_ID = "global_session_stats"
+STATS_REDIS_KEY = "session_stats:global"
+
 
 class SessionStatisticsManager:
     """
@@ -35,26 +46,46 @@ class SessionStatisticsManager:
     - Thread-safe operations
     """
 
-    def __init__(self, cosmos_manager: Any | None = None):
+    def __init__(
+        self,
+        cosmos_manager: Any | None = None,
+        redis_manager: Any | None = None,
+        flush_interval_s: float = 5.0,
+    ):
         """
         Initialize session statistics manager.
 
         :param cosmos_manager: CosmosDB manager for persistence
+        :param redis_manager: Redis manager for the cross-replica counter mirror
+        :param flush_interval_s: How often pending increments are flushed
         """
         self._lock = asyncio.Lock()
         self._active_media_sessions: dict[str, dict[str, Any]] = {}
         self._active_realtime_sessions: dict[str, dict[str, Any]] = {}
         self._total_disconnected_count = 0
         self._cosmos_manager = cosmos_manager
+        self._redis_manager = redis_manager
         self._stats_collection_name = "session_statistics"
+        self._flush_interval_s = flush_interval_s
+        self._flush_task: asyncio.Task | None = None
+        self._stop_event = asyncio.Event()
+        # Increments not yet applied to each sink; kept apart so a failure in
+        # one sink never re-applies an increment the other already accepted
+        self._pending_cosmos: Counter[str] = Counter()
+        self._pending_redis: Counter[str] = Counter()
 
     async def initialize(self) -> None:
         """
-        Initialize statistics manager and load persistent counters.
+        Initialize statistics manager, load persistent counters and start the flusher.
         """
         with tracer.start_span("session_stats_initialize", kind=SpanKind.INTERNAL) as span:
             try:
                 await self._load_persistent_counters()
+                if self._flush_task is None and (self._cosmos_manager or self._redis_manager):
+                    self._stop_event.clear()
+                    self._flush_task = asyncio.create_task(
+                        self._flush_loop(), name="session-stats-flusher"
+                    )
                 span.set_attribute("session_stats.initialization", "success")
                 logger.info("Session statistics manager initialized successfully")
             except Exception as e:
@@ -63,9 +94,22 @@ class SessionStatisticsManager:
                 logger.error(f"Failed to initialize session statistics manager: {e}")
                 raise
 
+    async def stop(self) -> None:
+        """
+        Stop the background flusher and flush pending increments.
+        """
+        if self._flush_task is not None:
+            # Let an in-flight flush finish rather than cancelling it mid-write
+            self._stop_event.set()
+            await self._flush_task
+            self._flush_task = None
+        await self.flush()
+
     async def _load_persistent_counters(self) -> None:
         """
         Load persistent counters from storage.
+
+        Disconnects counted before the load completes are kept and added on top.
         """
         if not self._cosmos_manager:
             logger.warning("No CosmosDB manager available, using in-memory counters")
@@ -74,13 +118,11 @@ class SessionStatisticsManager:
         try:
             stats_doc = await self._get_stats_document()
             if stats_doc:
-                self._total_disconnected_count = stats_doc.get("total_disconnected", 0)
-                logger.info(
-                    f"Loaded persistent total disconnected count: {self._total_disconnected_count}"
-                )
+                persisted = stats_doc.get("total_disconnected", 0)
+                self._total_disconnected_count += persisted
+                logger.info(f"Loaded persistent total disconnected count: {persisted}")
             else:
-                await self._create_initial_stats_document()
-                logger.info("Created initial session statistics document")
+                logger.info("No session statistics document yet; created on first flush")
         except Exception as e:
             logger.error(f"Failed to load persistent counters: {e}")
             # Continue with in-memory only
@@ -91,49 +133,61 @@ class SessionStatisticsManager:
         """
         try:
             collection = self._cosmos_manager.database[self._stats_collection_name]
-            stats_doc = collection.find_one({"_id": "global_session_stats"})
-            return stats_doc
+            return await asyncio.to_thread(collection.find_one, {"_id": STATS_DOCUMENT_ID})
         except Exception as e:
             logger.error(f"Failed to get stats document: {e}")
             return None
 
-    async def _create_initial_stats_document(self) -> None:
+    def _count_disconnect(self, session_type: str) -> None:
+        # No await between read and write, so this is atomic on the event loop
+        self._total_disconnected_count += 1
+        for pending in (self._pending_cosmos, self._pending_redis):
+            pending["total_disconnected"] += 1
+            pending[f"{session_type}_disconnected"] += 1
+
+    async def _flush_loop(self) -> None:
+        while not self._stop_event.is_set():
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._stop_event.wait(), self._flush_interval_s)
+            await self.flush()
+
+    async def flush(self) -> None:
         """
-        Create initial statistics document in storage.
+        Persist increments accumulated since the last flush.
         """
-        try:
-            collection = self._cosmos_manager.database[self._stats_collection_name]
-            initial_doc = {
-                "_id": "global_session_stats",
-                "total_disconnected": 0,
-                "created_at": datetime.utcnow().isoformat(),
-                "last_updated": datetime.utcnow().isoformat(),
-            }
-            collection.insert_one(initial_doc)
-        except Exception as e:
-            logger.error(f"Failed to create initial stats document: {e}")
+        if self._cosmos_manager and self._pending_cosmos:
+            increments, self._pending_cosmos = self._pending_cosmos, Counter()
+            try:
+                await asyncio.to_thread(self._persist_increments, dict(increments))
+            except Exception as e:
+                self._pending_cosmos.update(increments)
+                logger.error(f"Failed to persist counter update: {e}")
+
+        if self._redis_manager and self._pending_redis:
+            increments, self._pending_redis = self._pending_redis, Counter()
+            try:
+                await self._redis_manager.increment_hash_fields_async(
+                    STATS_REDIS_KEY, dict(increments)
+                )
+            except Exception as e:
+                self._pending_redis.update(increments)
+                logger.warning(f"Failed to mirror session counters to Redis: {e}")
 
-    async def _persist_counter_update(self) -> None:
+    def _persist_increments(self, increments: dict[str, int]) -> None:
         """
-        Persist the current disconnection counter to storage.
+        Apply coalesced increments to the statistics document (runs in a worker thread).
         """
-        if not self._cosmos_manager:
-            return
-
-        try:
-            collection = self._cosmos_manager.database[self._stats_collection_name]
-            collection.update_one(
-                {"_id": "global_session_stats"},
-                {
-                    "$set": {
-                        "total_disconnected": self._total_disconnected_count,
-                        "last_updated": datetime.utcnow().isoformat(),
-                    }
-                },
-                upsert=True,
-            )
-        except Exception as e:
-            logger.error(f"Failed to persist counter update: {e}")
+        now = datetime.utcnow().isoformat()
+        collection = self._cosmos_manager.database[self._stats_collection_name]
+        collection.update_one(
+            {"_id": STATS_DOCUMENT_ID},
+            {
+                "$inc": increments,
+                "$set": {"last_updated": now},
+                "$setOnInsert": {"created_at": now},
+            },
+            upsert=True,
+        )
 
     async def add_media_session(self, call_connection_id: str, handler: Any) -> None:
         """
@@ -163,16 +217,13 @@ class SessionStatisticsManager:
         async with self._lock:
             if call_connection_id in self._active_media_sessions:
                 del self._active_media_sessions[call_connection_id]
-                self._total_disconnected_count += 1
+                self._count_disconnect("media")
 
                 logger.info(
                     f"Removed media session {call_connection_id}. "
                     f"Active media sessions: {len(self._active_media_sessions)}, "
                     f"Total disconnected: {self._total_disconnected_count}"
                 )
-
-                # Persist the counter update
-                await self._persist_counter_update()
                 return True
             return False
 
@@ -207,16 +258,13 @@ class SessionStatisticsManager:
         async with self._lock:
             if session_id in self._active_realtime_sessions:
                 del self._active_realtime_sessions[session_id]
-                self._total_disconnected_count += 1
+                self._count_disconnect("realtime")
 
                 logger.info(
                     f"Removed realtime session {session_id}. "
                     f"Active realtime sessions: {len(self._active_realtime_sessions)}, "
                     f"Total disconnected: {self._total_disconnected_count}"
                 )
-
-                # Persist the counter update
-                await self._persist_counter_update()
                 return True
             return False
 
@@ -259,3 +307,16 @@ class SessionStatisticsManager:
         """Get total disconnection count."""
         async with self._lock:
             return self._total_disconnected_count
+
+    async def get_cluster_statistics(self) -> dict[str, int]:
+        """
+        Disconnect counters summed across replicas, from the Redis mirror.
+
+        Reflects increments flushed so far; empty when Redis is unavailable.
+        """
+        if not self._redis_manager:
+            return {}
+        raw = await self._redis_manager.get_session_data_async(STATS_REDIS_KEY)
+        return {
+            (k.decode() if isinstance(k, bytes) else k): int(v) for k, v in raw.items()
+        }
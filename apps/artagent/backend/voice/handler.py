@@ -65,8 +65,10 @@ from apps.artagent.backend.voice.speech_cascade.handler import (
     SpeechSDKThread,
     BargeInController,
     SpeechEvent,
+    SpeechEventChannel,
     SpeechEventType,
 )
+from apps.artagent.backend.voice.speech_cascade.speculation import SpeculationConfig
 from apps.artagent.backend.voice.messaging import (
     BrowserBargeInController,
     make_event_envelope,
@@ -79,6 +81,7 @@ from apps.artagent.backend.voice.messaging import (
 
 # Orchestration imports - session_agents OK, route_turn imported lazily to avoid circular
 from apps.artagent.backend.src.orchestration.session_agents import get_session_agent
+from apps.artagent.backend.src.orchestration.session_scenarios import load_session_scenarios_async
 from apps.artagent.backend.src.orchestration.naming import find_agent_by_name
 from apps.artagent.backend.voice.shared.config_resolver import resolve_orchestrator_config
 
@@ -87,7 +90,16 @@ from src.pools.session_manager import SessionContext
 from src.stateful.state_managment import MemoManager
 from src.speech.speech_recognizer import StreamingSpeechRecognizerFromBytes
 from src.enums.stream_modes import StreamMode
-from config import ACS_STREAMING_MODE, GREETING, STOP_WORDS
+from config import (
+    ACS_STREAMING_MODE,
+    GREETING,
+    SPECULATIVE_TURN_ENABLED,
+    SPECULATIVE_TURN_EOU_STABILITY_MS,
+    SPECULATIVE_TURN_MIN_CHARS,
+    SPECULATIVE_TURN_STABILITY_MS,
+    STOP_WORDS,
+    STT_INGEST_COALESCE_MS,
+)
 from fastapi import WebSocket, WebSocketDisconnect
 from fastapi.websockets import WebSocketState
 from utils.ml_logging import get_logger
@@ -191,6 +203,7 @@ class VoiceHandler:
     start()               - Initialize speech processing and play greeting
     run()                 - Browser: message loop | ACS: N/A
     handle_media_message()- ACS only: process one ACS JSON message
+    handle_audio_frame()  - ACS only: process one pre-decoded AudioData frame
     handle_barge_in()     - Single barge-in implementation (no duplication)
     stop()                - Cleanup resources
 
@@ -231,7 +244,7 @@ class VoiceHandler:
         self._orchestrator: CascadeOrchestratorAdapter | None = None
 
         # Thread management (inlined from SpeechCascadeHandler)
-        self._speech_queue: asyncio.Queue = asyncio.Queue(maxsize=50)
+        self._speech_queue = SpeechEventChannel(maxsize=50)
         self._thread_bridge = ThreadBridge()
         self._stt_thread: SpeechSDKThread | None = None
         self._route_turn_thread: RouteTurnThread | None = None
@@ -401,6 +414,12 @@ class VoiceHandler:
             on_announcement=handler._on_announcement,
             on_user_transcript=handler._on_user_transcript,
             on_tts_request=handler._on_tts_request,
+            speculation=SpeculationConfig(
+                enabled=SPECULATIVE_TURN_ENABLED,
+                stability_ms=SPECULATIVE_TURN_STABILITY_MS,
+                eou_stability_ms=SPECULATIVE_TURN_EOU_STABILITY_MS,
+                min_chars=SPECULATIVE_TURN_MIN_CHARS,
+            ),
         )
 
         handler._thread_bridge.set_main_loop(event_loop, session_key)
@@ -413,6 +432,7 @@ class VoiceHandler:
             speech_queue=handler._speech_queue,
             thread_bridge=handler._thread_bridge,
             barge_in_handler=handler._barge_in_controller.handle_barge_in,
+            ingest_coalesce_ms=STT_INGEST_COALESCE_MS,
         )
 
         # Store reference in context for external access
@@ -792,12 +812,9 @@ class VoiceHandler:
 
         elif kind == ACSMessageKind.AUDIO_DATA:
             audio_section = message.get("audioData", {}) or {}
-            audio_b64 = audio_section.get("data")
-            if audio_b64:
-                if not audio_section.get("silent", False):
-                    self._touch_activity()
-                audio_bytes = base64.b64decode(audio_b64)
-                self.write_audio(audio_bytes)
+            self.handle_audio_frame(
+                audio_section.get("data"), audio_section.get("silent", False)
+            )
 
         elif kind == ACSMessageKind.STOP_AUDIO:
             logger.info("[%s] ACS StopAudio received", self._session_short)
@@ -808,6 +825,24 @@ class VoiceHandler:
                 self._touch_activity()
             logger.info("[%s] DTMF tone: %s", self._session_short, tone)
 
+    def handle_audio_frame(self, audio_b64: str | None, silent: bool = False) -> None:
+        """
+        ACS mode: feed one AudioData payload to STT.
+
+        Used by the media endpoint with ``decode_acs_frame`` so the hot path
+        skips building a dict per frame. Silent frames are still written:
+        the recognizer needs them to detect end of speech.
+
+        Args:
+            audio_b64: Base64-encoded PCM16LE audio.
+            silent: ACS silence flag for the frame.
+        """
+        if not audio_b64:
+            return
+        if not silent:
+            self._touch_activity()
+        self.write_audio(base64.b64decode(audio_b64))
+
     # =========================================================================
     # Barge-In (Single Implementation)
     # =========================================================================
@@ -824,6 +859,10 @@ class VoiceHandler:
         """
         logger.info("[%s] Barge-in triggered", self._session_short)
 
+        # Hand buffered caller audio to STT now rather than at the next write
+        if self._stt_thread:
+            self._stt_thread.flush_audio("barge_in")
+
         # Signal TTS cancellation
         if self._context.cancel_event:
             self._context.cancel_event.set()
@@ -1107,6 +1146,9 @@ class VoiceHandler:
         session_short = self._session_short
 
         # Priority: 1. Scenario start_agent (explicit user selection), 2. Session agent, 3. Default
+        # Warm the scenario store off the event loop; config resolution is sync
+        await load_session_scenarios_async(config.session_id)
+
         scenario_start_agent = None
         if config.scenario:
             try:
@@ -1267,10 +1309,7 @@ class VoiceHandler:
         if self._thread_bridge:
             self._thread_bridge.queue_speech_result(self._speech_queue, event)
         else:
-            try:
-                self._speech_queue.put_nowait(event)
-            except asyncio.QueueFull:
-                logger.warning("[%s] Queue full, dropping event", self._session_short)
+            self._speech_queue.put_nowait(event)
 
     def queue_greeting(self, text: str) -> None:
         """
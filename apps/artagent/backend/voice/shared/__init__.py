@@ -15,6 +15,7 @@ Contents:
     - OrchestratorMetrics: Token tracking and TTFT metrics
     - GreetingService: Centralized greeting resolution
     - resolve_start_agent: Unified start agent resolution
+    - decode_acs_frame: Fast-path ACS media frame decoder
 
 Usage:
     from apps.artagent.backend.voice.shared import (
@@ -83,6 +84,13 @@ from .start_agent_resolver import (
     resolve_start_agent,
 )
 
+# ACS media frame decoding
+from .acs_frames import (
+    AUDIO_DATA_KIND,
+    ACSFrame,
+    decode_acs_frame,
+)
+
 # Voice session context (Phase 3)
 from .context import (
     TransportType,
@@ -122,6 +130,10 @@ __all__ = [
     "resolve_start_agent",
     "StartAgentResult",
     "StartAgentSource",
+    # ACS Media Frames
+    "ACSFrame",
+    "AUDIO_DATA_KIND",
+    "decode_acs_frame",
     # Voice Session Context (Phase 3)
     "TransportType",
     "VoiceSessionContext",
@@ -0,0 +1,104 @@
+"""
+ACS Media Frame Decoding
+========================
+
+Fast-path decoder for ACS media streaming WebSocket frames.
+
+ACS sends ~50 ``AudioData`` frames per second per call, all with the same
+fixed envelope::
+
+    {"kind":"AudioData","audioData":{"timestamp":"...","participantRawID":"...",
+     "data":"<base64 pcm>","silent":false}}
+
+Building a full dict for every frame just to read ``data`` and ``silent``
+is a fixed per-frame cost paid on the event loop for every concurrent call.
+``decode_acs_frame`` slices those two fields straight out of the text and
+falls back to ``json.loads`` for every other kind, or for any frame that
+does not match the compact envelope exactly.
+
+Usage:
+    frame = decode_acs_frame(text)
+    if frame is None:
+        ...  # not JSON
+    elif frame.kind == AUDIO_DATA_KIND:
+        handle(frame.data, frame.silent)
+    else:
+        handle_message(frame.message)
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, NamedTuple
+
+AUDIO_DATA_KIND = "AudioData"
+
+_KIND_MARKER = '"kind":"AudioData"'
+_DATA_MARKER = '"data":"'
+_SILENT_MARKER = '"silent":'
+# "kind" is serialized first by ACS; only look for it near the start of the frame
+_KIND_SCAN_CHARS = 48
+
+
+class ACSFrame(NamedTuple):
+    """Decoded ACS media frame.
+
+    ``data``/``silent`` are set for AudioData frames. ``message`` is the
+    parsed dict when the slow path was used, and None on the fast path.
+    """
+
+    kind: str | None
+    data: str | None
+    silent: bool
+    message: dict[str, Any] | None
+
+
+def decode_acs_frame(text: str) -> ACSFrame | None:
+    """
+    Decode one ACS media WebSocket text frame.
+
+    Args:
+        text: Raw frame text.
+
+    Returns:
+        Decoded frame, or None if the text is not a JSON object.
+    """
+    if text.find(_KIND_MARKER, 0, _KIND_SCAN_CHARS) >= 0:
+        start = text.find(_DATA_MARKER)
+        if start >= 0:
+            start += len(_DATA_MARKER)
+            end = text.find('"', start)
+            # Escaped characters (e.g. "\/") need a real JSON decode
+            if end >= 0 and text.find("\\", start, end) < 0:
+                silent_at = text.find(_SILENT_MARKER, end)
+                if silent_at < 0:
+                    silent_at = text.find(_SILENT_MARKER, 0, start)
+                silent = silent_at >= 0 and text.startswith(
+                    "true", silent_at + len(_SILENT_MARKER)
+                )
+                return ACSFrame(AUDIO_DATA_KIND, text[start:end], silent, None)
+
+    return _decode_json_frame(text)
+
+
+def _decode_json_frame(text: str) -> ACSFrame | None:
+    """Full JSON decode for non-audio frames and non-compact envelopes."""
+    try:
+        message = json.loads(text)
+    except (json.JSONDecodeError, TypeError):
+        return None
+    if not isinstance(message, dict):
+        return None
+
+    kind = message.get("kind") or message.get("Kind")
+    if kind == AUDIO_DATA_KIND:
+        section = message.get("audioData") or message.get("AudioData") or {}
+        return ACSFrame(kind, section.get("data"), bool(section.get("silent", False)), message)
+    return ACSFrame(kind, None, False, message)
+
+
+__all__ = [
+    "ACSFrame",
+    "AUDIO_DATA_KIND",
+    "decode_acs_frame",
+]
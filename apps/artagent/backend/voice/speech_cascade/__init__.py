@@ -48,6 +48,7 @@ _HANDLER_EXPORTS = {
     "RouteTurnThread",
     "SpeechCascadeHandler",
     "SpeechEvent",
+    "SpeechEventChannel",
     "SpeechEventType",
     "SpeechSDKThread",
     "ThreadBridge",
@@ -67,6 +68,7 @@ __all__ = [
     # Handler components (lazy-loaded)
     "SpeechCascadeHandler",
     "SpeechEvent",
+    "SpeechEventChannel",
     "SpeechEventType",
     "ThreadBridge",
     "RouteTurnThread",
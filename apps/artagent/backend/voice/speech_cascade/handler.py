@@ -9,7 +9,7 @@ can be composed with different transport handlers (ACS, VoiceLive, Websocket, et
 🧵 Thread 1: Speech SDK Thread (Never Blocks)
 - Continuous audio recognition
 - Immediate barge-in detection via on_partial callbacks
-- Cross-thread communication via run_coroutine_threadsafe
+- Cross-thread communication via SpeechEventChannel and run_coroutine_threadsafe
 
 🧵 Thread 2: Route Turn Thread (Blocks on Queue Only)
 - AI processing and response generation
@@ -40,12 +40,19 @@ import asyncio
 import threading
 import time
 import weakref
+from collections import deque
 from collections.abc import Awaitable, Callable
 from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import TYPE_CHECKING, Any, Protocol
 
+from apps.artagent.backend.voice.speech_cascade.audio_ingest import AudioIngestBuffer
+from apps.artagent.backend.voice.speech_cascade.metrics import record_speculation
+from apps.artagent.backend.voice.speech_cascade.speculation import (
+    SpeculationConfig,
+    SpeculativeTurnController,
+)
 from opentelemetry import trace
 from opentelemetry.trace import SpanKind
 from src.speech.speech_recognizer import StreamingSpeechRecognizerFromBytes
@@ -93,6 +100,175 @@ class SpeechEvent:
     is_greeting: bool = False
 
 
+def _running_loop() -> asyncio.AbstractEventLoop | None:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+class SpeechEventChannel:
+    """
+    Cross-thread channel from Speech SDK callback threads to the turn loop.
+
+    Producers on any thread call :meth:`put_nowait`, which never blocks and
+    never takes a lock: events are appended to a ``deque`` (atomic under the
+    GIL), and the event loop is woken with ``call_soon_threadsafe`` at most
+    once per batch, only when the consumer or partial observer is waiting.
+
+    - PARTIAL events are latest-wins: they share one slot, so a burst of
+      partials costs O(1) memory and one ``on_partial`` call with the newest
+      text. They never enter the ordered stream.
+    - Every other event is delivered in publish order (per producer thread)
+      to the single consumer awaiting :meth:`get`. Finals, greetings and TTS
+      responses are never dropped; recognizer ERROR events are shed once
+      ``maxsize`` events are already waiting.
+
+    ``get`` and ``get_nowait`` must run on the event loop. They, ``empty``
+    and ``qsize`` mirror ``asyncio.Queue``, so existing consumers work unchanged.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 50,
+        *,
+        on_partial: Callable[[SpeechEvent], None] | None = None,
+    ):
+        """
+        Initialize the channel.
+
+        Args:
+            maxsize: Waiting events beyond which recognizer errors are shed.
+            on_partial: Called on the event loop with the newest PARTIAL event.
+        """
+        self.maxsize = maxsize
+        self.on_partial = on_partial
+
+        self._events: deque[SpeechEvent] = deque()
+        self._partial: SpeechEvent | None = None
+
+        # Consumer/loop state (only written on the loop, read by producers)
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_thread_id: int | None = None
+        self._waiter: asyncio.Future | None = None
+        self._delivered_partial: SpeechEvent | None = None
+        self._wakeup_pending = False
+
+        self.published = 0
+        self.delivered = 0
+        self.partials_published = 0
+        self.partials_delivered = 0
+        self.dropped = 0
+        self.wakeups = 0
+
+    # ------------------------------------------------------------------ #
+    # Producer side (any thread)
+    # ------------------------------------------------------------------ #
+
+    def put_nowait(self, event: SpeechEvent) -> bool:
+        """Publish ``event``; returns False only if it was shed."""
+        if event.event_type == SpeechEventType.PARTIAL:
+            self._partial = event
+            self.partials_published += 1
+            if self.on_partial is not None:
+                self._notify()
+            return True
+
+        if event.event_type == SpeechEventType.ERROR and len(self._events) >= self.maxsize:
+            self.dropped += 1
+            return False
+
+        self._events.append(event)
+        self.published += 1
+        waiter = self._waiter
+        if waiter is not None and not waiter.done():
+            self._notify()
+        return True
+
+    async def put(self, event: SpeechEvent) -> None:
+        """``asyncio.Queue``-compatible alias for :meth:`put_nowait`."""
+        self.put_nowait(event)
+
+    def _notify(self) -> None:
+        loop = self._loop
+        if loop is None or self._wakeup_pending:
+            return
+        self._wakeup_pending = True
+        try:
+            if threading.get_ident() == self._loop_thread_id:
+                loop.call_soon(self._wake)
+            else:
+                loop.call_soon_threadsafe(self._wake)
+        except RuntimeError:
+            self._wakeup_pending = False  # loop closed
+
+    # ------------------------------------------------------------------ #
+    # Consumer side (event loop)
+    # ------------------------------------------------------------------ #
+
+    def _wake(self) -> None:
+        # Clear first: anything published from here on schedules a new wakeup
+        self._wakeup_pending = False
+        self.wakeups += 1
+
+        partial = self._partial
+        if partial is not None and partial is not self._delivered_partial:
+            self._delivered_partial = partial
+            if self.on_partial is not None:
+                self.partials_delivered += 1
+                try:
+                    self.on_partial(partial)
+                except Exception as e:
+                    logger.debug(f"Partial observer error: {e}")
+
+        waiter = self._waiter
+        if waiter is not None and not waiter.done() and self._events:
+            waiter.set_result(None)
+
+    def get_nowait(self) -> SpeechEvent:
+        try:
+            event = self._events.popleft()
+        except IndexError:
+            raise asyncio.QueueEmpty from None
+        self.delivered += 1
+        return event
+
+    async def get(self) -> SpeechEvent:
+        """Wait for the next ordered event (single consumer)."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._loop_thread_id = threading.get_ident()
+        while True:
+            if self._events:
+                return self.get_nowait()
+            waiter = loop.create_future()
+            self._waiter = waiter
+            try:
+                # Re-check after publishing the waiter so no wakeup is missed
+                if not self._events:
+                    await waiter
+            finally:
+                self._waiter = None
+
+    def empty(self) -> bool:
+        return not self._events
+
+    def qsize(self) -> int:
+        return len(self._events)
+
+    def get_stats(self) -> dict[str, int]:
+        return {
+            "published": self.published,
+            "delivered": self.delivered,
+            "waiting": len(self._events),
+            "partials_published": self.partials_published,
+            "partials_delivered": self.partials_delivered,
+            "dropped": self.dropped,
+            "wakeups": self.wakeups,
+        }
+
+
 class ResponseSender(Protocol):
     """Protocol for sending responses (TTS) to the transport layer."""
 
@@ -137,8 +313,6 @@ class ThreadBridge:
         self._route_turn_thread_ref: weakref.ReferenceType | None = None
         # Thread-safe flag to suppress barge-in during agent transitions/greetings
         self._suppress_barge_in = threading.Event()
-        # Lock for atomic queue eviction operations
-        self._queue_lock = threading.Lock()
 
     def set_main_loop(self, loop: asyncio.AbstractEventLoop, connection_id: str = None) -> None:
         """
@@ -218,95 +392,82 @@ class ThreadBridge:
         except Exception as e:
             logger.error(f"[{self.connection_id}] Failed to schedule barge-in: {e}")
 
-    def queue_speech_result(self, speech_queue: asyncio.Queue, event: SpeechEvent) -> None:
+    def forward_partial(self, text: str, language: str | None = None) -> None:
+        """
+        Forward a partial transcript to the Route Turn Thread for speculation.
+
+        Skipped while barge-in is suppressed (greeting/handoff audio echo).
+
+        Args:
+            text: Partial transcript text.
+            language: Detected language of the partial.
+        """
+        if self._suppress_barge_in.is_set():
+            return
+        if not self.main_loop or self.main_loop.is_closed():
+            return
+
+        route_turn_thread = (
+            self._route_turn_thread_ref() if self._route_turn_thread_ref is not None else None
+        )
+        if route_turn_thread is None or not route_turn_thread.speculation_enabled:
+            return
+
+        channel = route_turn_thread.speech_queue
+        if isinstance(channel, SpeechEventChannel):
+            # Latest-wins: a burst of partials costs one loop wakeup
+            channel.put_nowait(
+                SpeechEvent(event_type=SpeechEventType.PARTIAL, text=text, language=language)
+            )
+            return
+
+        try:
+            self.main_loop.call_soon_threadsafe(route_turn_thread.observe_partial, text, language)
+        except RuntimeError as e:
+            logger.debug(f"[{self.connection_id}] Failed to forward partial: {e}")
+
+    def queue_speech_result(
+        self, speech_queue: SpeechEventChannel | asyncio.Queue, event: SpeechEvent
+    ) -> None:
         """
         Queue speech recognition result for Route Turn Thread processing.
 
-        Thread-safe implementation that uses locking to prevent race conditions
-        during queue eviction operations.
+        Safe to call from Speech SDK callback threads and never blocks: a
+        :class:`SpeechEventChannel` accepts events from any thread, and a plain
+        ``asyncio.Queue`` is only touched on its event loop.
 
         Args:
-            speech_queue: Async queue for speech event transfer between threads.
+            speech_queue: Channel (or legacy asyncio queue) feeding the Route Turn Thread.
             event: Speech recognition event containing transcription results.
         """
         if not isinstance(event, SpeechEvent):
             logger.error(f"[{self.connection_id}] Non-SpeechEvent enqueued: {type(event).__name__}")
             return
 
-        try:
-            speech_queue.put_nowait(event)
-            if event.event_type != SpeechEventType.PARTIAL:
+        if isinstance(speech_queue, SpeechEventChannel):
+            if speech_queue.put_nowait(event) and event.event_type != SpeechEventType.PARTIAL:
                 logger.info(
-                    f"[{self.connection_id}] Enqueued speech event type={event.event_type.value} qsize={speech_queue.qsize()}"
+                    f"[{self.connection_id}] Enqueued speech event type={event.event_type.value} "
+                    f"qsize={speech_queue.qsize()}"
                 )
-        except asyncio.QueueFull:
-            # Only evict PARTIAL (interim) transcriptions - never drop TTS responses
-            if event.event_type == SpeechEventType.PARTIAL:
-                logger.debug(f"[{self.connection_id}] Queue full, dropping PARTIAL event")
-                return
+            return
 
-            # For important events (TTS, FINAL, etc.), try to evict PARTIAL events
-            # Use lock to make eviction atomic and prevent race conditions
-            with self._queue_lock:
-                evicted = False
-                try:
-                    # Drain queue while holding lock to prevent concurrent modifications
-                    temp_events = []
-                    while not speech_queue.empty():
-                        try:
-                            old_event = speech_queue.get_nowait()
-                            if not evicted and old_event.event_type == SpeechEventType.PARTIAL:
-                                evicted = True
-                                logger.debug(
-                                    f"[{self.connection_id}] Evicted PARTIAL to make room for {event.event_type.value}"
-                                )
-                            else:
-                                temp_events.append(old_event)
-                        except asyncio.QueueEmpty:
-                            break
-
-                    # Restore non-evicted events in original order
-                    for e in temp_events:
-                        try:
-                            speech_queue.put_nowait(e)
-                        except asyncio.QueueFull:
-                            logger.error(
-                                f"[{self.connection_id}] Lost event during eviction restore: {e.event_type.value}"
-                            )
-                            break
-                except Exception as exc:
-                    logger.debug(f"[{self.connection_id}] Queue eviction error: {exc}")
+        def _put() -> None:
+            try:
+                speech_queue.put_nowait(event)
+            except asyncio.QueueFull:
+                logger.warning(
+                    f"[{self.connection_id}] Queue full; dropping {event.event_type.value}"
+                )
 
-                # Now try to add the important event (still under lock)
-                try:
-                    speech_queue.put_nowait(event)
-                    logger.info(f"[{self.connection_id}] Enqueued {event.event_type.value} after eviction")
-                except asyncio.QueueFull:
-                    # For TTS_RESPONSE, use blocking put - must not drop
-                    if event.event_type == SpeechEventType.TTS_RESPONSE:
-                        logger.warning(f"[{self.connection_id}] Queue full for TTS, using blocking put")
-                        if self.main_loop and not self.main_loop.is_closed():
-                            try:
-                                future = asyncio.run_coroutine_threadsafe(
-                                    speech_queue.put(event), self.main_loop
-                                )
-                                future.result(timeout=5.0)  # Wait up to 5s for queue space
-                            except Exception as e:
-                                logger.error(f"[{self.connection_id}] Failed to queue TTS: {e}")
-                    else:
-                        logger.error(
-                            f"[{self.connection_id}] Queue still full after eviction; dropping {event.event_type.value}"
-                        )
-        except Exception:
-            # Fallback to run_coroutine_threadsafe
-            if self.main_loop and not self.main_loop.is_closed():
-                try:
-                    future = asyncio.run_coroutine_threadsafe(
-                        speech_queue.put(event), self.main_loop
-                    )
-                    future.result(timeout=0.1)
-                except Exception as e:
-                    logger.error(f"[{self.connection_id}] Failed to queue speech: {e}")
+        loop = self.main_loop
+        if loop is None or loop.is_closed() or _running_loop() is loop:
+            _put()
+            return
+        try:
+            loop.call_soon_threadsafe(_put)
+        except RuntimeError as e:
+            logger.error(f"[{self.connection_id}] Failed to queue speech: {e}")
 
 
 class SpeechSDKThread:
@@ -326,9 +487,10 @@ class SpeechSDKThread:
         recognizer: StreamingSpeechRecognizerFromBytes,
         thread_bridge: ThreadBridge,
         barge_in_handler: Callable,
-        speech_queue: asyncio.Queue,
+        speech_queue: SpeechEventChannel | asyncio.Queue,
         *,
         on_partial_transcript: Callable[[str, str, str | None], None] | None = None,
+        ingest_coalesce_ms: int = 0,
     ):
         """
         Initialize Speech SDK Thread.
@@ -340,6 +502,8 @@ class SpeechSDKThread:
             barge_in_handler: Handler to call on barge-in detection.
             speech_queue: Queue for final speech results.
             on_partial_transcript: Optional callback for partial transcripts.
+            ingest_coalesce_ms: Coalesce audio into writes of this duration
+                before the push stream. 0 writes every frame directly.
         """
         self.connection_id = connection_id
         self._conn_short = connection_id[-8:] if connection_id else "unknown"
@@ -355,6 +519,14 @@ class SpeechSDKThread:
         self.stop_event = threading.Event()
         self._stopped = False
 
+        self._ingest: AudioIngestBuffer | None = None
+        if ingest_coalesce_ms > 0:
+            self._ingest = AudioIngestBuffer(
+                self._write_to_recognizer,
+                coalesce_ms=ingest_coalesce_ms,
+                session_id=connection_id,
+            )
+
         self._setup_callbacks()
         self._pre_initialize_recognizer()
 
@@ -391,6 +563,8 @@ class SpeechSDKThread:
                 except Exception as e:
                     logger.error(f"[{self._conn_short}] Barge-in error: {e}")
 
+                self.thread_bridge.forward_partial(text.strip(), lang)
+
                 if self.on_partial_transcript:
                     try:
                         self.on_partial_transcript(text.strip(), lang, speaker_id)
@@ -467,6 +641,26 @@ class SpeechSDKThread:
         Args:
             audio_bytes: Raw audio bytes to process.
         """
+        if self._ingest:
+            self._ingest.write(audio_bytes)
+        else:
+            self._write_to_recognizer(audio_bytes)
+
+    def flush_audio(self, reason: str = "flush") -> None:
+        """
+        Write any coalesced audio to the recognizer immediately.
+
+        Args:
+            reason: Flush reason recorded in ingest metrics.
+        """
+        if not self._ingest:
+            return
+        try:
+            self._ingest.flush(reason)
+        except Exception as e:
+            logger.debug(f"[{self._conn_short}] Error flushing audio ({reason}): {e}")
+
+    def _write_to_recognizer(self, audio_bytes: bytes) -> None:
         if self.recognizer:
             self.recognizer.write_bytes(audio_bytes)
 
@@ -479,6 +673,7 @@ class SpeechSDKThread:
         due to user interruption.
         """
         logger.debug(f"[{self._conn_short}] STT timer stopped for barge-in")
+        self.flush_audio("barge_in")
         # Signal recognizer to finalize current audio buffer if supported
         if self.recognizer and hasattr(self.recognizer, "finalize_current_utterance"):
             try:
@@ -494,6 +689,7 @@ class SpeechSDKThread:
         try:
             logger.info(f"[{self._conn_short}] Stopping speech SDK thread")
             self._stopped = True
+            self.flush_audio("end_of_stream")
             self.thread_running = False
             self.recognizer_started = False
             self.stop_event.set()
@@ -545,7 +741,7 @@ class RouteTurnThread:
     def __init__(
         self,
         connection_id: str,
-        speech_queue: asyncio.Queue,
+        speech_queue: SpeechEventChannel | asyncio.Queue,
         orchestrator_func: Callable,
         memory_manager: MemoManager | None,
         *,
@@ -555,6 +751,7 @@ class RouteTurnThread:
         on_announcement: Callable[[SpeechEvent], Awaitable[None]] | None = None,
         on_user_transcript: Callable[[str], Awaitable[None]] | None = None,
         on_tts_request: Callable[[str, SpeechEventType], Awaitable[None]] | None = None,
+        speculation: SpeculationConfig | None = None,
     ):
         """
         Initialize Route Turn Thread.
@@ -571,6 +768,9 @@ class RouteTurnThread:
             on_user_transcript: Callback for final user transcripts (emitted to transport).
             on_tts_request: Callback for TTS playback requests. Signature:
                 (text, event_type, *, voice_name, voice_style, voice_rate) -> None
+            speculation: Optional speculative turn start settings. When enabled,
+                the orchestrator starts on a stable partial and the turn is
+                committed (or restarted) when the final transcript arrives.
         """
         self.connection_id = connection_id
         self._conn_short = connection_id[-8:] if connection_id else "unknown"
@@ -593,6 +793,57 @@ class RouteTurnThread:
         self._turn_number: int = 0
         self._active_turn_span: ConversationTurnSpan | None = None
 
+        # Speculative turn start (opt-in)
+        self._speculation: SpeculativeTurnController | None = None
+        if speculation and speculation.enabled:
+            self._speculation = SpeculativeTurnController(
+                speculation,
+                self._start_speculative_turn,
+                connection_id=connection_id,
+                can_speculate=self._can_speculate,
+                on_outcome=self._record_speculation_outcome,
+            )
+            if isinstance(speech_queue, SpeechEventChannel):
+                speech_queue.on_partial = self._on_partial_event
+
+    @property
+    def speculation_enabled(self) -> bool:
+        """Whether speculative turn start is active for this connection."""
+        return self._speculation is not None
+
+    def observe_partial(self, text: str, language: str | None = None) -> None:
+        """Feed a partial transcript to the speculation controller (main loop only)."""
+        if self._speculation and self.running:
+            self._speculation.observe_partial(text, language)
+
+    def _on_partial_event(self, event: SpeechEvent) -> None:
+        self.observe_partial(event.text, event.language)
+
+    def get_speculation_stats(self) -> dict[str, Any] | None:
+        """Return speculation hit rate and time-saved counters (None if disabled)."""
+        return self._speculation.stats.snapshot() if self._speculation else None
+
+    def _can_speculate(self) -> bool:
+        return (
+            self.running
+            and self.memory_manager is not None
+            and self.orchestrator_func is not None
+            and self.current_response_task is None
+            and self.speech_queue.empty()
+        )
+
+    def _start_speculative_turn(self, text: str) -> Awaitable[Any] | None:
+        return self.orchestrator_func(cm=self.memory_manager, transcript=text)
+
+    def _record_speculation_outcome(self, outcome: str, time_saved_ms: float | None) -> None:
+        session_id = getattr(self.memory_manager, "session_id", None) if self.memory_manager else None
+        record_speculation(
+            outcome,
+            session_id=session_id or self.connection_id,
+            call_connection_id=self.connection_id,
+            time_saved_ms=time_saved_ms,
+        )
+
     async def start(self) -> None:
         """Start the route turn processing loop."""
         if self.running:
@@ -690,6 +941,9 @@ class RouteTurnThread:
         # Increment turn counter
         self._turn_number += 1
 
+        # Resolve any speculative turn started from a stable partial
+        speculative = self._speculation.claim(event.text) if self._speculation else None
+
         # Get session_id from memory manager for correlation
         session_id = (
             getattr(self.memory_manager, "session_id", None) if self.memory_manager else None
@@ -725,6 +979,8 @@ class RouteTurnThread:
             try:
                 if not self.memory_manager:
                     logger.error(f"[{self._conn_short}] No memory manager available")
+                    if speculative:
+                        speculative.task.cancel()
                     return
 
                 # Emit user transcript via callback (for transport coordination)
@@ -743,8 +999,15 @@ class RouteTurnThread:
                     except Exception as e:
                         logger.warning(f"[{self._conn_short}] Failed to emit user transcript: {e}")
 
+                # Adopt the speculative turn: its LLM request is already in flight
+                if speculative:
+                    turn.record_tts_start()
+                    self.current_response_task = speculative.task
+                    speculative.commit()
+                    await self.current_response_task
+
                 # Call orchestrator (LLM processing happens here)
-                if self.orchestrator_func:
+                elif self.orchestrator_func:
                     # Record LLM start (approximation - actual first token comes from agent)
                     turn.record_tts_start()  # TTS will start streaming during orchestrator
 
@@ -842,6 +1105,8 @@ class RouteTurnThread:
 
         self._stopped = True
         self.running = False
+        if self._speculation:
+            self._speculation.reset()
         await self.cancel_current_processing()
         await self._end_active_turn()
 
@@ -968,6 +1233,8 @@ class SpeechCascadeHandler:
         transcript_emitter: TranscriptEmitter | None = None,
         response_sender: ResponseSender | None = None,
         redis_mgr: Any | None = None,
+        speculation: SpeculationConfig | None = None,
+        ingest_coalesce_ms: int = 0,
     ):
         """
         Initialize the speech cascade handler.
@@ -986,6 +1253,8 @@ class SpeechCascadeHandler:
             transcript_emitter: Protocol implementation for emitting transcripts.
             response_sender: Protocol implementation for sending TTS responses.
             redis_mgr: Optional redis manager for session persistence.
+            speculation: Optional speculative turn start settings.
+            ingest_coalesce_ms: Coalesce STT audio into writes of this duration (0 = off).
         """
         self.connection_id = connection_id
         self._conn_short = connection_id[-8:] if connection_id else "unknown"
@@ -1007,7 +1276,7 @@ class SpeechCascadeHandler:
         )
 
         # Cross-thread communication
-        self.speech_queue: asyncio.Queue = asyncio.Queue(maxsize=50)
+        self.speech_queue = SpeechEventChannel(maxsize=50)
         self.thread_bridge = ThreadBridge()
 
         # Barge-in controller
@@ -1025,6 +1294,7 @@ class SpeechCascadeHandler:
             on_announcement=on_announcement,
             on_user_transcript=on_user_transcript,
             on_tts_request=on_tts_request,
+            speculation=speculation,
         )
 
         # Speech SDK Thread
@@ -1035,6 +1305,7 @@ class SpeechCascadeHandler:
             barge_in_handler=self._handle_barge_in_with_stt_stop,
             speech_queue=self.speech_queue,
             on_partial_transcript=on_partial_transcript,
+            ingest_coalesce_ms=ingest_coalesce_ms,
         )
 
         self.thread_bridge.set_route_turn_thread(self.route_turn_thread)
@@ -1357,6 +1628,7 @@ class SpeechCascadeHandler:
 __all__ = [
     "SpeechCascadeHandler",
     "SpeechEvent",
+    "SpeechEventChannel",
     "SpeechEventType",
     "ThreadBridge",
     "SpeechSDKThread",
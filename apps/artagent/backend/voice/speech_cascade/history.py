@@ -0,0 +1,310 @@
+"""
+Conversation History Budgeting
+==============================
+
+Keeps the LLM request small on long calls. The agent's full per-agent
+thread is cut down to the most recent turns that fit a token budget.
+Older turns are folded into a rolling summary. Without a summary the
+history is left whole unless trim-only is explicitly enabled, since
+dropping turns silently loses things like identity verification.
+
+- Token counts are estimated once per message content and then cached,
+  so each turn only pays for new messages.
+- A turn is a user message plus everything up to the next user message,
+  so assistant tool calls are never split from their tool results.
+- The summary is stored in corememory under ``history_summary::<agent>``
+  with the number of history messages it covers and an anchor for the last
+  covered message. It is refreshed in the background (single-flight per
+  agent) so the hot path never waits on it.
+
+Usage:
+    budgeter = HistoryBudgeter(HistoryBudget(max_tokens=4000))
+    history = budgeter.apply(history, cm=memo_manager, agent="Concierge")
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
+
+from config import (
+    CASCADE_HISTORY_MAX_TOKENS,
+    CASCADE_HISTORY_MAX_TURNS,
+    CASCADE_HISTORY_MIN_TURNS,
+    CASCADE_HISTORY_SUMMARY_ENABLED,
+    CASCADE_HISTORY_TRIM_WITHOUT_SUMMARY,
+)
+from utils.ml_logging import get_logger
+
+if TYPE_CHECKING:
+    from src.stateful.state_managment import MemoManager
+
+logger = get_logger("cascade.history")
+
+# Per-message framing overhead used by chat completion token accounting.
+MESSAGE_OVERHEAD_TOKENS = 4
+SUMMARY_KEY_PREFIX = "history_summary::"
+SUMMARY_PREFIX = "Summary of the earlier conversation: "
+
+Summarizer = Callable[[str | None, list[dict[str, Any]]], Awaitable[str]]
+
+
+@lru_cache(maxsize=4096)
+def _estimate_text_tokens(text: str) -> int:
+    # ~4 characters per token for English; words bound it from below for short text
+    return max(len(text) // 4, len(text.split()))
+
+
+def estimate_tokens(message: dict[str, Any]) -> int:
+    """Estimate the prompt tokens for one chat message (cached per content)."""
+    content = message.get("content") or ""
+    if not isinstance(content, str):
+        content = json.dumps(content, default=str)
+    return MESSAGE_OVERHEAD_TOKENS + _estimate_text_tokens(content)
+
+
+def _anchor(message: dict[str, Any]) -> str:
+    content = message.get("content") or ""
+    return f"{message.get('role', '')}:{str(content)[:120]}"
+
+
+def _anchor_matches(history: list[dict[str, Any]], summary: dict[str, Any]) -> bool:
+    covered = summary.get("covered", 0)
+    if not covered or covered > len(history):
+        return False
+    return summary.get("anchor") == _anchor(history[covered - 1])
+
+
+def split_turns(history: list[dict[str, Any]]) -> list[list[dict[str, Any]]]:
+    """Group messages into turns, each starting at a user message."""
+    turns: list[list[dict[str, Any]]] = []
+    for msg in history:
+        if msg.get("role") == "user" or not turns:
+            turns.append([msg])
+        else:
+            turns[-1].append(msg)
+    return turns
+
+
+@dataclass(frozen=True)
+class HistoryBudget:
+    """History window settings."""
+
+    max_tokens: int = 6000
+    min_recent_turns: int = 4
+    max_recent_turns: int = 20
+    summarize: bool = False
+    trim_without_summary: bool = False
+
+    @classmethod
+    def from_settings(cls) -> HistoryBudget:
+        """Build from the CASCADE_HISTORY_* settings in config."""
+        return cls(
+            max_tokens=CASCADE_HISTORY_MAX_TOKENS,
+            min_recent_turns=CASCADE_HISTORY_MIN_TURNS,
+            max_recent_turns=CASCADE_HISTORY_MAX_TURNS,
+            summarize=CASCADE_HISTORY_SUMMARY_ENABLED,
+            trim_without_summary=CASCADE_HISTORY_TRIM_WITHOUT_SUMMARY,
+        )
+
+
+class HistoryBudgeter:
+    """Applies a HistoryBudget to a conversation thread."""
+
+    def __init__(self, budget: HistoryBudget, summarizer: Summarizer | None = None):
+        """
+        Initialize the budgeter.
+
+        Args:
+            budget: Token and turn limits.
+            summarizer: Async callable (previous_summary, messages) -> summary text.
+                If None, history is only trimmed with ``budget.trim_without_summary``.
+        """
+        self.budget = budget
+        self._summarizer = summarizer
+        self._pending: dict[str, asyncio.Task] = {}
+
+    def apply(
+        self,
+        history: list[dict[str, Any]],
+        *,
+        cm: MemoManager | None = None,
+        agent: str = "",
+        reserved_tokens: int = 0,
+    ) -> list[dict[str, Any]]:
+        """
+        Return the history to send: optional summary plus the recent turns.
+
+        Args:
+            history: Full conversation history (oldest first).
+            cm: MemoManager used to cache the rolling summary.
+            agent: Agent whose thread this is (summary cache key).
+            reserved_tokens: Tokens already used by the system prompt and user input.
+
+        Returns:
+            Trimmed history list (the input is not modified).
+        """
+        budget = self.budget
+        if budget.max_tokens <= 0 or not history:
+            return history
+        summarizing = budget.summarize and self._summarizer is not None
+        if not summarizing and not budget.trim_without_summary:
+            return history
+
+        turns = split_turns(history)
+        turn_tokens = [sum(estimate_tokens(m) for m in turn) for turn in turns]
+        if len(turns) <= budget.max_recent_turns and (
+            sum(turn_tokens) + reserved_tokens <= budget.max_tokens
+        ):
+            return history
+
+        summary = self._cached_summary(cm, agent)
+        summary_tokens = _estimate_text_tokens(summary["text"]) if summary else 0
+        available = budget.max_tokens - reserved_tokens - summary_tokens
+
+        kept = 0
+        used = 0
+        for tokens in reversed(turn_tokens):
+            if kept >= budget.max_recent_turns:
+                break
+            if kept >= budget.min_recent_turns and used + tokens > available:
+                break
+            kept += 1
+            used += tokens
+
+        older_count = sum(len(turn) for turn in turns[: len(turns) - kept])
+        recent = [m for turn in turns[len(turns) - kept :] for m in turn]
+        if older_count == 0:
+            return recent
+
+        if summarizing and cm is not None:
+            # Rebuild from scratch if the history prefix no longer lines up
+            incremental = summary if summary and _anchor_matches(history, summary) else None
+            covered = incremental["covered"] if incremental else 0
+            if covered < older_count:
+                self._schedule_summary(cm, agent, history[:older_count], incremental)
+
+        logger.debug(
+            "History budget applied | agent=%s kept_turns=%d dropped_msgs=%d tokens=%d summary=%s",
+            agent,
+            kept,
+            older_count,
+            used,
+            bool(summary),
+        )
+
+        if summary:
+            return [{"role": "system", "content": SUMMARY_PREFIX + summary["text"]}, *recent]
+        return recent
+
+    async def wait_pending(self) -> None:
+        """Wait for in-flight summary refreshes (tests/shutdown)."""
+        if self._pending:
+            await asyncio.gather(*self._pending.values(), return_exceptions=True)
+
+    def _cached_summary(self, cm: MemoManager | None, agent: str) -> dict[str, Any] | None:
+        if cm is None:
+            return None
+        try:
+            cached = cm.get_value_from_corememory(SUMMARY_KEY_PREFIX + agent)
+        except Exception:
+            return None
+        if isinstance(cached, dict) and cached.get("text"):
+            return cached
+        return None
+
+    def _schedule_summary(
+        self,
+        cm: MemoManager,
+        agent: str,
+        older: list[dict[str, Any]],
+        previous: dict[str, Any] | None,
+    ) -> None:
+        """Start a background summary refresh unless one is already running."""
+        key = SUMMARY_KEY_PREFIX + agent
+        if key in self._pending:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+
+        covered = previous["covered"] if previous else 0
+        new_messages = older[covered:]
+        previous_text = previous["text"] if previous else None
+
+        async def _refresh() -> None:
+            try:
+                text = await self._summarizer(previous_text, new_messages)
+                if text:
+                    cm.set_corememory(
+                        key,
+                        {
+                            "text": text.strip(),
+                            "covered": len(older),
+                            "anchor": _anchor(older[-1]),
+                        },
+                    )
+            except Exception as exc:
+                logger.warning("History summary refresh failed | agent=%s error=%s", agent, exc)
+            finally:
+                self._pending.pop(key, None)
+
+        self._pending[key] = loop.create_task(_refresh(), name=f"history-summary-{agent}")
+
+
+def make_aoai_summarizer(model_name: str) -> Summarizer:
+    """
+    Build a summarizer that calls the shared Azure OpenAI client.
+
+    Uses the conversation summarization prompt from ``src/agenticmemory``.
+    ``EphemeralSummaryAgent`` there is a stub that needs the letta SDK.
+    """
+    from src.agenticmemory.prompts.prompt_gpt_summarize import SYSTEM as SUMMARY_SYSTEM_PROMPT
+
+    async def _summarize(previous: str | None, messages: list[dict[str, Any]]) -> str:
+        from src.aoai.client import get_client
+
+        client = get_client()
+        if client is None:
+            return previous or ""
+
+        lines = []
+        if previous:
+            lines.append(f"Earlier summary: {previous}")
+        for msg in messages:
+            content = msg.get("content") or ""
+            if msg.get("role") in ("user", "assistant") and content and not content.startswith("{"):
+                lines.append(f"{msg['role']}: {content}")
+        if not lines:
+            return previous or ""
+
+        def _call() -> str:
+            response = client.chat.completions.create(
+                model=model_name,
+                messages=[
+                    {"role": "system", "content": SUMMARY_SYSTEM_PROMPT},
+                    {"role": "user", "content": "\n".join(lines)},
+                ],
+                temperature=0,
+                max_tokens=200,
+            )
+            return response.choices[0].message.content or ""
+
+        return await asyncio.to_thread(_call)
+
+    return _summarize
+
+
+__all__ = [
+    "HistoryBudget",
+    "HistoryBudgeter",
+    "Summarizer",
+    "estimate_tokens",
+    "make_aoai_summarizer",
+    "split_turns",
+]
@@ -10,6 +10,8 @@ Metrics tracked:
 - Turn processing latency
 - Barge-in detection latency
 - TTS synthesis and streaming latencies
+- Speculative turn start outcomes and time saved
+- STT audio ingest writes and coalescing delay
 
 Uses the shared metrics factory for lazy initialization, ensuring proper
 MeterProvider configuration before instrument creation.
@@ -93,6 +95,41 @@ _tts_counter: LazyCounter = _meter.counter(
     unit="1",
 )
 
+# Speculative turn start outcomes (committed / mismatched / invalidated)
+_speculation_counter: LazyCounter = _meter.counter(
+    name="speech_cascade.speculation.count",
+    description="Speculative turn starts by outcome",
+    unit="1",
+)
+
+# Latency saved by committed speculative turns (speculation start to final)
+_speculation_saved_histogram: LazyHistogram = _meter.histogram(
+    name="speech_cascade.speculation.time_saved",
+    description="Time saved by starting the LLM on a stable partial in milliseconds",
+    unit="ms",
+)
+
+# STT push stream writes after coalescing (by flush reason)
+_stt_ingest_write_counter: LazyCounter = _meter.counter(
+    name="speech_cascade.stt.ingest.writes",
+    description="Audio writes to the STT push stream",
+    unit="1",
+)
+
+# Audio frames received before coalescing
+_stt_ingest_frame_counter: LazyCounter = _meter.counter(
+    name="speech_cascade.stt.ingest.frames",
+    description="Audio frames received for STT before coalescing",
+    unit="1",
+)
+
+# Delay added to the oldest frame in each coalesced write
+_stt_ingest_latency_histogram: LazyHistogram = _meter.histogram(
+    name="speech_cascade.stt.ingest.added_latency",
+    description="Delay added by STT audio coalescing in milliseconds",
+    unit="ms",
+)
+
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # METRIC RECORDING FUNCTIONS
@@ -335,10 +372,75 @@ def record_tts_streaming(
     )
 
 
+def record_speculation(
+    outcome: str,
+    *,
+    session_id: str,
+    call_connection_id: str | None = None,
+    time_saved_ms: float | None = None,
+) -> None:
+    """
+    Record a speculative turn outcome.
+
+    :param outcome: committed, mismatched or invalidated
+    :param session_id: Session identifier for correlation
+    :param call_connection_id: Call connection ID
+    :param time_saved_ms: Time saved for committed speculations
+    """
+    _speculation_counter.add(
+        1,
+        attributes={"session.id": session_id, "speculation.outcome": outcome},
+    )
+    if time_saved_ms is not None:
+        attributes = build_session_attributes(
+            session_id,
+            call_connection_id=call_connection_id,
+            metric_type="speculation",
+        )
+        _speculation_saved_histogram.record(time_saved_ms, attributes=attributes)
+
+    logger.debug(
+        "📊 Speculation metric: outcome=%s saved=%s | session=%s",
+        outcome,
+        f"{time_saved_ms:.2f}ms" if time_saved_ms is not None else "-",
+        session_id,
+    )
+
+
+def record_stt_ingest_write(
+    frames: int,
+    added_latency_ms: float,
+    *,
+    reason: str,
+    session_id: str,
+    call_connection_id: str | None = None,
+) -> None:
+    """
+    Record one coalesced write to the STT push stream.
+
+    :param frames: Audio frames included in the write
+    :param added_latency_ms: Time the oldest frame waited in the buffer
+    :param reason: size, passthrough, barge_in or end_of_stream
+    :param session_id: Session identifier for correlation
+    :param call_connection_id: Call connection ID
+    """
+    attributes = build_session_attributes(
+        session_id,
+        call_connection_id=call_connection_id,
+        metric_type="stt_ingest",
+    )
+    _stt_ingest_frame_counter.add(frames, attributes=attributes)
+    _stt_ingest_latency_histogram.record(added_latency_ms, attributes=attributes)
+    attributes["stt.ingest.reason"] = reason
+    _stt_ingest_write_counter.add(1, attributes=attributes)
+
+
 __all__ = [
     "record_stt_recognition",
     "record_turn_processing",
     "record_barge_in",
     "record_tts_synthesis",
     "record_tts_streaming",
+    "record_speculation",
+    "record_stt_ingest_write",
 ]
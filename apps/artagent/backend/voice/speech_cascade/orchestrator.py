@@ -43,6 +43,7 @@ from __future__ import annotations
 
 import asyncio
 import contextvars
+import functools
 import inspect
 import json
 import os
@@ -70,7 +71,21 @@ from apps.artagent.backend.voice.shared.session_state import (
     sync_state_from_memo,
     sync_state_to_memo,
 )
-from apps.artagent.backend.voice.speech_cascade.tts_processor import TTSTextProcessor
+from apps.artagent.backend.voice.speech_cascade.history import (
+    HistoryBudget,
+    HistoryBudgeter,
+    estimate_tokens,
+    make_aoai_summarizer,
+)
+from apps.artagent.backend.voice.speech_cascade.speculation import (
+    defer_until_commit,
+    is_speculative,
+    speculation_checkpoint,
+)
+from apps.artagent.backend.voice.speech_cascade.tts_processor import (
+    StreamingTTSChunker,
+    TTSTextProcessor,
+)
 from opentelemetry import trace
 from opentelemetry.trace import SpanKind, Status, StatusCode
 from src.enums.monitoring import GenAIOperation, GenAIProvider, SpanAttr
@@ -257,6 +272,9 @@ class CascadeOrchestratorAdapter:
     # Channel handoff handler for voice → messaging transitions
     _channel_handoff_handler: ChannelHandoffHandler | None = field(default=None, init=False)
 
+    # Sliding-window history with rolling summary (keeps prompt size bounded)
+    _history_budgeter: HistoryBudgeter = field(default=None, init=False)  # type: ignore
+
     def __post_init__(self):
         """Initialize agent registry if not provided."""
         # Initialize metrics tracker
@@ -265,6 +283,10 @@ class CascadeOrchestratorAdapter:
             call_connection_id=self.config.call_connection_id,
             session_id=self.config.session_id,
         )
+        self._history_budgeter = HistoryBudgeter(
+            HistoryBudget.from_settings(),
+            summarizer=make_aoai_summarizer(self.config.model_name),
+        )
         
         if not self.agents:
             self._load_agents()
@@ -843,6 +865,11 @@ class CascadeOrchestratorAdapter:
     # Turn Processing
     # ─────────────────────────────────────────────────────────────────
 
+    def _start_turn_state(self) -> None:
+        """Reset per-turn adapter state at the start of a (committed) turn."""
+        self._cancel_event.clear()
+        self._metrics.start_turn()  # Increments turn count and resets TTFT tracking
+
     async def process_turn(
         self,
         context: OrchestratorContext | None = None,
@@ -888,8 +915,8 @@ class CascadeOrchestratorAdapter:
         Returns:
             OrchestratorResult with response and metadata
         """
-        self._cancel_event.clear()
-        self._metrics.start_turn()  # Increments turn count and resets TTFT tracking
+        # A speculative turn applies these only once the final transcript commits it
+        defer_until_commit(self._start_turn_state)
 
         # Support both calling patterns: context OR direct parameters
         if context is None:
@@ -901,7 +928,11 @@ class CascadeOrchestratorAdapter:
                 # Get history and append current user message
                 history = list(memo_manager.get_history(self._active_agent) or [])
                 if user_text:
-                    memo_manager.append_to_history(self._active_agent, "user", user_text)
+                    defer_until_commit(
+                        functools.partial(
+                            memo_manager.append_to_history, self._active_agent, "user", user_text
+                        )
+                    )
 
                 # Build context using helper (eliminates duplication)
                 session_context = self._build_session_context(memo_manager)
@@ -1238,6 +1269,9 @@ class CascadeOrchestratorAdapter:
                             )
 
                     # ─── RECORD & FINALIZE ───
+                    # Speculative turns only write history once the final transcript confirms them
+                    await speculation_checkpoint()
+
                     # Record turn using consolidated helper (in-memory, no I/O)
                     user_recorded, assistant_recorded = self._record_turn(
                         self._active_agent, context.user_text, response_text
@@ -1268,6 +1302,9 @@ class CascadeOrchestratorAdapter:
 
                 except asyncio.CancelledError:
                     span.set_status(Status(StatusCode.ERROR, "Cancelled"))
+                    if is_speculative():
+                        # Discarded speculative turn: the caller must not record anything
+                        raise
                     return OrchestratorResult(
                         response_text="",
                         agent_name=self._active_agent,
@@ -1327,8 +1364,19 @@ class CascadeOrchestratorAdapter:
         if system_content:
             messages.append({"role": "system", "content": system_content})
 
+        # Keep the most recent turns within the token budget; older turns are summarized
+        reserved_tokens = sum(estimate_tokens(m) for m in messages)
+        if context.user_text:
+            reserved_tokens += estimate_tokens({"content": context.user_text})
+        history = self._history_budgeter.apply(
+            context.conversation_history or [],
+            cm=self._current_memo_manager,
+            agent=agent.name or self._active_agent,
+            reserved_tokens=reserved_tokens,
+        )
+
         # Conversation history - expand any JSON-encoded tool messages
-        for msg in context.conversation_history:
+        for msg in history:
             role = msg.get("role", "")
             content = msg.get("content", "")
 
@@ -1522,10 +1570,8 @@ class CascadeOrchestratorAdapter:
                 tool_call_detected = False  # Track if tool calls are streaming
                 handoff_tool_detected = False  # Track if specifically a handoff tool
 
-                # Sentence buffer state for sentence-based TTS streaming
-                sentence_buffer = ""
-                # Primary breaks: sentence endings
-                primary_terms = ".!?"
+                # Incremental chunker: early clause-level first chunk, then full sentences
+                tts_chunker = StreamingTTSChunker()
 
                 def _put_chunk(text: str) -> None:
                     """Thread-safe put to async queue."""
@@ -1546,7 +1592,7 @@ class CascadeOrchestratorAdapter:
 
                 def _streaming_completion():
                     """Run in thread - consumes OpenAI stream."""
-                    nonlocal sentence_buffer, tool_call_detected, handoff_tool_detected
+                    nonlocal tool_call_detected, handoff_tool_detected
                     # Attach the parent span context in the thread
                     token = otel_context.attach(current_context)
                     try:
@@ -1660,24 +1706,16 @@ class CascadeOrchestratorAdapter:
                                 if getattr(delta, "content", None):
                                     text = delta.content
                                     collected_text.append(text)
-                                    sentence_buffer += self._sanitize_tts_text(text)
 
-                                    # Dispatch only on sentence boundaries.
-                                    while True:
-                                        term_idx = self._find_tts_boundary(
-                                            sentence_buffer, primary_terms, 0
-                                        )
-                                        if term_idx < 0:
-                                            break
-                                        dispatch, sentence_buffer = self._split_tts_buffer(
-                                            sentence_buffer, term_idx + 1
-                                        )
+                                    # Only newly streamed text is scanned for boundaries
+                                    for dispatch in tts_chunker.feed(text):
                                         _put_chunk(dispatch)
 
                             logger.debug("OpenAI stream completed | chunks=%d", chunk_count)
                             # Flush remaining buffer (only if no tool calls)
-                            if sentence_buffer.strip():
-                                _put_chunk(sentence_buffer)
+                            remaining = tts_chunker.flush()
+                            if remaining:
+                                _put_chunk(remaining)
                     except Exception as e:
                         logger.error("OpenAI stream error: %s", e)
                         stream_error.append(e)
@@ -1744,6 +1782,10 @@ class CascadeOrchestratorAdapter:
                 if stream_error:
                     raise stream_error[0]
 
+                # Nothing below (metrics, tool-call history, tool execution, handoffs)
+                # may run for a speculative turn the final transcript has not confirmed
+                await speculation_checkpoint()
+
                 response_text = "".join(collected_text).strip()
 
                 # Filter out incomplete tool calls (empty name or malformed)
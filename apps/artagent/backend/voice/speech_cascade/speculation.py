@@ -0,0 +1,366 @@
+"""
+Speculative Turn Start
+======================
+
+Starts the LLM request for a turn before the recognizer emits its final
+result, using a partial transcript that has stopped changing.
+
+The speculative orchestrator call runs inside a *commit gate*: LLM streaming
+proceeds immediately, but every externally visible side effect (TTS playback,
+tool execution, history writes) awaits ``speculation_checkpoint()`` until the
+final transcript confirms the hypothesis, and shared-state writes made at turn
+start are staged with ``defer_until_commit()``. On a match the gate opens and the
+already-running turn is adopted; on a mismatch the task is cancelled before
+anything reached the caller and the turn restarts from the final transcript.
+
+Usage:
+    controller = SpeculativeTurnController(
+        SpeculationConfig(enabled=True),
+        start_turn=lambda text: orchestrator_func(cm=cm, transcript=text),
+    )
+    controller.observe_partial("what is my balance")   # on every partial
+    speculative = controller.claim(final_text)          # on final
+    if speculative:
+        speculative.commit()
+        await speculative.task
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import re
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+from utils.ml_logging import get_logger
+
+logger = get_logger("speech_cascade.speculation")
+
+
+class _CommitGate(asyncio.Event):
+    """Commit gate that runs staged callbacks just before it opens."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.on_commit: list[Callable[[], None]] = []
+
+    def set(self) -> None:
+        callbacks, self.on_commit = self.on_commit, []
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception:
+                logger.debug("Speculation commit callback failed", exc_info=True)
+        super().set()
+
+
+# Commit gate for the speculative turn running in the current task context.
+_speculation_gate: contextvars.ContextVar[_CommitGate | None] = contextvars.ContextVar(
+    "speech_cascade_speculation_gate", default=None
+)
+
+_NORMALIZE_PUNCT = re.compile(r"[^\w\s']+")
+_NORMALIZE_SPACE = re.compile(r"\s+")
+
+# Closing phrases that strongly suggest the caller has finished speaking.
+_EOU_SUFFIXES: tuple[str, ...] = (
+    "please",
+    "thank you",
+    "thanks",
+    "that's all",
+    "that is all",
+)
+
+
+async def speculation_checkpoint() -> None:
+    """
+    Wait until the current speculative turn is committed.
+
+    No-op outside a speculative turn, so side-effect sites can call it
+    unconditionally.
+    """
+    gate = _speculation_gate.get()
+    if gate is not None and not gate.is_set():
+        await gate.wait()
+
+
+def defer_until_commit(callback: Callable[[], None]) -> None:
+    """
+    Run ``callback`` now, or when the current speculative turn commits.
+
+    For shared-state writes a turn makes before its first side effect
+    (turn counters, callbacks, memo keys); a discarded turn never runs them.
+    """
+    gate = _speculation_gate.get()
+    if gate is not None and not gate.is_set():
+        gate.on_commit.append(callback)
+    else:
+        callback()
+
+
+def is_speculative() -> bool:
+    """True while running inside a speculative turn that is not yet committed."""
+    gate = _speculation_gate.get()
+    return gate is not None and not gate.is_set()
+
+
+def normalize_transcript(text: str | None) -> str:
+    """Normalize a transcript for hypothesis matching (case, punctuation, spacing)."""
+    if not text:
+        return ""
+    text = _NORMALIZE_PUNCT.sub(" ", text.lower())
+    return _NORMALIZE_SPACE.sub(" ", text).strip()
+
+
+def looks_like_end_of_utterance(text: str) -> bool:
+    """Heuristic end-of-utterance check used to shorten the stability window."""
+    stripped = text.rstrip()
+    if stripped.endswith(("?", ".", "!")):
+        return True
+    normalized = normalize_transcript(stripped)
+    return normalized.endswith(_EOU_SUFFIXES)
+
+
+@dataclass(frozen=True)
+class SpeculationConfig:
+    """Speculative turn start settings."""
+
+    enabled: bool = False
+    stability_ms: int = 300
+    eou_stability_ms: int = 120
+    min_chars: int = 8
+
+
+@dataclass
+class SpeculationStats:
+    """Running speculation outcome counters for a single connection."""
+
+    started: int = 0
+    committed: int = 0
+    mismatched: int = 0
+    invalidated: int = 0
+    time_saved_ms_total: float = 0.0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of resolved speculations whose hypothesis matched the final."""
+        resolved = self.committed + self.mismatched
+        return self.committed / resolved if resolved else 0.0
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "started": self.started,
+            "committed": self.committed,
+            "mismatched": self.mismatched,
+            "invalidated": self.invalidated,
+            "hit_rate": round(self.hit_rate, 3),
+            "time_saved_ms_total": round(self.time_saved_ms_total, 1),
+            "avg_time_saved_ms": (
+                round(self.time_saved_ms_total / self.committed, 1) if self.committed else 0.0
+            ),
+        }
+
+
+@dataclass
+class SpeculativeTurn:
+    """An in-flight speculative orchestrator call."""
+
+    text: str
+    normalized: str
+    task: asyncio.Task
+    gate: asyncio.Event
+    started_at: float = field(default_factory=time.perf_counter)
+
+    def commit(self) -> None:
+        """Release side effects held by the commit gate."""
+        self.gate.set()
+
+    @property
+    def committed(self) -> bool:
+        return self.gate.is_set()
+
+
+class SpeculativeTurnController:
+    """
+    Tracks partial stability and manages one speculative turn at a time.
+
+    All methods must be called on the event loop thread.
+    """
+
+    def __init__(
+        self,
+        config: SpeculationConfig,
+        start_turn: Callable[[str], Awaitable[Any] | None],
+        *,
+        connection_id: str = "unknown",
+        can_speculate: Callable[[], bool] | None = None,
+        on_outcome: Callable[[str, float | None], None] | None = None,
+    ):
+        """
+        Initialize the controller.
+
+        Args:
+            config: Speculation settings.
+            start_turn: Returns the orchestrator awaitable for a transcript.
+            connection_id: Connection identifier for logging.
+            can_speculate: Returns False while a committed turn is in progress.
+            on_outcome: Called with (outcome, time_saved_ms) for metrics export.
+        """
+        self.config = config
+        self._start_turn = start_turn
+        self._conn_short = connection_id[-8:] if connection_id else "unknown"
+        self._can_speculate = can_speculate or (lambda: True)
+        self._on_outcome = on_outcome
+
+        self._candidate: str = ""
+        self._candidate_text: str = ""
+        self._timer: asyncio.TimerHandle | None = None
+        self._current: SpeculativeTurn | None = None
+        self.stats = SpeculationStats()
+
+    @property
+    def current(self) -> SpeculativeTurn | None:
+        return self._current
+
+    def observe_partial(self, text: str, language: str | None = None) -> None:
+        """Track a partial transcript and (re)arm the stability timer."""
+        if not self.config.enabled:
+            return
+
+        normalized = normalize_transcript(text)
+        if normalized == self._candidate:
+            return
+
+        # The caller kept talking: the running hypothesis is stale.
+        if self._current is not None and self._current.normalized != normalized:
+            self._discard("invalidated")
+
+        self._candidate = normalized
+        self._candidate_text = text
+        self._cancel_timer()
+
+        if len(normalized) < self.config.min_chars:
+            return
+
+        window_ms = (
+            self.config.eou_stability_ms
+            if looks_like_end_of_utterance(text)
+            else self.config.stability_ms
+        )
+        loop = asyncio.get_running_loop()
+        self._timer = loop.call_later(window_ms / 1000.0, self._launch)
+
+    def _launch(self) -> None:
+        """Start the speculative turn for the current stable candidate."""
+        self._timer = None
+        if self._current is not None or not self._can_speculate():
+            return
+
+        text = self._candidate_text
+        gate = _CommitGate()
+        ctx = contextvars.copy_context()
+        ctx.run(_speculation_gate.set, gate)
+
+        try:
+            coro = ctx.run(self._start_turn, text)
+        except Exception as exc:
+            logger.debug(f"[{self._conn_short}] Speculative start failed: {exc}")
+            return
+        if coro is None:
+            return
+
+        task = asyncio.get_running_loop().create_task(
+            _await(coro), name=f"speculative-turn-{self._conn_short}", context=ctx
+        )
+        self._current = SpeculativeTurn(
+            text=text, normalized=self._candidate, task=task, gate=gate
+        )
+        self.stats.started += 1
+        logger.debug(f"[{self._conn_short}] Speculative turn started: '{text}'")
+
+    def claim(self, final_text: str) -> SpeculativeTurn | None:
+        """
+        Resolve the pending speculation against the final transcript.
+
+        Returns the matching speculative turn (not yet committed) so the caller
+        can adopt its task, or None if there was no match.
+        """
+        self._cancel_timer()
+        self._candidate = ""
+        self._candidate_text = ""
+
+        current = self._current
+        if current is None:
+            return None
+        self._current = None
+
+        if current.task.done() and current.task.cancelled():
+            return None
+
+        if current.normalized != normalize_transcript(final_text):
+            self._cancel(current, "mismatched")
+            return None
+
+        time_saved_ms = (time.perf_counter() - current.started_at) * 1000.0
+        self.stats.committed += 1
+        self.stats.time_saved_ms_total += time_saved_ms
+        self._emit("committed", time_saved_ms)
+        logger.debug(
+            f"[{self._conn_short}] Speculative turn committed (saved {time_saved_ms:.0f}ms)"
+        )
+        return current
+
+    def reset(self) -> None:
+        """Drop any pending timer and uncommitted speculation."""
+        self._cancel_timer()
+        self._candidate = ""
+        self._candidate_text = ""
+        if self._current is not None:
+            self._discard("invalidated")
+
+    def _discard(self, outcome: str) -> None:
+        current, self._current = self._current, None
+        if current is not None:
+            self._cancel(current, outcome)
+
+    def _cancel(self, turn: SpeculativeTurn, outcome: str) -> None:
+        if not turn.task.done():
+            turn.task.cancel()
+        if outcome == "mismatched":
+            self.stats.mismatched += 1
+        else:
+            self.stats.invalidated += 1
+        self._emit(outcome, None)
+        logger.debug(f"[{self._conn_short}] Speculative turn {outcome}: '{turn.text}'")
+
+    def _cancel_timer(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def _emit(self, outcome: str, time_saved_ms: float | None) -> None:
+        if self._on_outcome:
+            try:
+                self._on_outcome(outcome, time_saved_ms)
+            except Exception:
+                logger.debug("Speculation outcome callback failed", exc_info=True)
+
+
+async def _await(awaitable: Awaitable[Any]) -> Any:
+    return await awaitable
+
+
+__all__ = [
+    "SpeculationConfig",
+    "SpeculationStats",
+    "SpeculativeTurn",
+    "SpeculativeTurnController",
+    "defer_until_commit",
+    "is_speculative",
+    "looks_like_end_of_utterance",
+    "normalize_transcript",
+    "speculation_checkpoint",
+]
@@ -8,12 +8,78 @@ Handles:
 - Markdown sanitization for TTS
 - Sentence boundary detection
 - Text buffer splitting
+- Incremental token-level chunking with an early first chunk
 
 Original location: orchestrator.py lines 1199-1242
 """
 
 import re
 
+# Abbreviations whose trailing period does not end a sentence (lowercase, no final dot).
+TTS_ABBREVIATIONS: frozenset[str] = frozenset(
+    {
+        "mr", "mrs", "ms", "dr", "prof", "sr", "jr", "st", "mt", "ft", "rd", "ave", "blvd",
+        "apt", "ste", "dept", "inc", "ltd", "corp", "llc", "vs", "approx", "acct",
+        "a.m", "p.m", "e.g", "i.e", "u.s", "u.k", "d.c", "ph.d",
+    }
+)
+
+# Abbreviations that are also ordinary sentence-final words ("the answer is no.").
+# Their period only counts as an abbreviation before a number ("No. 5", "Jan. 3")
+# or, for "co", before a company suffix ("Co. Ltd").
+TTS_AMBIGUOUS_ABBREVIATIONS: frozenset[str] = frozenset(
+    {
+        "no", "nos", "co", "etc", "est", "vol", "fig", "ref", "tel", "ext",
+        "jan", "feb", "mar", "apr", "jun", "jul", "aug", "sep", "sept", "oct", "nov", "dec",
+        "mon", "tue", "wed", "thu", "fri", "sat", "sun",
+    }
+)
+_COMPANY_SUFFIXES = frozenset({"ltd", "inc", "llc", "corp", "plc"})
+
+# Conjunctions that open a new clause; the early first chunk may end just before them.
+TTS_CLAUSE_CONJUNCTIONS: tuple[str, ...] = (
+    "and", "but", "so", "because", "which", "while", "although", "or", "then",
+)
+
+_SENTENCE_TERM_RE = re.compile(r"[.!?]")
+_FIRST_CHUNK_RE = re.compile(
+    r"[.!?]|[,;:]|\s(?:" + "|".join(TTS_CLAUSE_CONJUNCTIONS) + r")\s",
+    re.IGNORECASE,
+)
+_CLOSING_PUNCT = "\"')]}"
+# Characters to re-scan on the next feed so split conjunction matches are not missed.
+_RESCAN_CHARS = max(len(c) for c in TTS_CLAUSE_CONJUNCTIONS) + 2
+_WORD_RE = re.compile(r"[A-Za-z]+")
+
+
+def _is_abbreviation(text: str, idx: int) -> bool | None:
+    """
+    True if the period at ``idx`` terminates an abbreviation.
+
+    Returns None when that depends on text that has not arrived yet (an
+    ambiguous abbreviation at the end of the buffer).
+    """
+    start = idx
+    while start > 0 and not text[start - 1].isspace():
+        start -= 1
+    token = text[start:idx].lstrip("\"'([{").lower()
+    if token in TTS_ABBREVIATIONS:
+        return True
+    if token not in TTS_AMBIGUOUS_ABBREVIATIONS:
+        return False
+
+    following = text[idx + 1 :].lstrip()
+    if not following:
+        return None
+    if following[0].isdigit():
+        return True
+    word = _WORD_RE.match(following)
+    if token != "co" or word is None:
+        return False
+    if word.end() == len(following):
+        return None  # the next word may still be streaming
+    return word.group().lower() in _COMPANY_SUFFIXES
+
 
 class TTSTextProcessor:
     """
@@ -117,6 +183,8 @@ class TTSTextProcessor:
                 prev_char = text[idx - 1 : idx]
                 if prev_char.isdigit() and next_char.isdigit():
                     continue  # This is likely a decimal number
+                if _is_abbreviation(text, idx):
+                    continue  # Dr. Smith, e.g. this
 
             # Found a valid boundary!
             return idx
@@ -165,31 +233,15 @@ class TTSTextProcessor:
 
         Returns:
             Tuple of (complete_sentences, remaining_buffer)
-        """
-        # Sanitize and add to buffer
-        sanitized = cls.sanitize_tts_text(text_chunk)
-        sentence_buffer += sanitized
-
-        # Extract complete sentences
-        complete_sentences = []
 
-        while True:
-            # Find next sentence boundary
-            boundary_idx = cls.find_tts_boundary(sentence_buffer, cls.PRIMARY_TERMS, 0)
-
-            if boundary_idx < 0:
-                # No complete sentence yet
-                break
-
-            # Split at boundary
-            sentence, sentence_buffer = cls.split_tts_buffer(
-                sentence_buffer, boundary_idx + 1
-            )
-
-            if sentence.strip():
-                complete_sentences.append(sentence)
-
-        return complete_sentences, sentence_buffer
+        Note:
+            This stateless helper re-scans ``sentence_buffer`` on every call.
+            Streaming callers should keep a ``StreamingTTSChunker`` instead.
+        """
+        chunker = StreamingTTSChunker(adaptive_first_chunk=False)
+        chunker.buffer = sentence_buffer
+        complete_sentences = chunker.feed(text_chunk)
+        return complete_sentences, chunker.buffer
 
     @classmethod
     def flush_buffer(cls, sentence_buffer: str) -> str | None:
@@ -205,3 +257,128 @@ class TTSTextProcessor:
         if sentence_buffer and sentence_buffer.strip():
             return sentence_buffer
         return None
+
+
+class StreamingTTSChunker:
+    """
+    Incremental TTS chunker for token streams.
+
+    Each ``feed`` only scans text that has not been scanned before, so cost is
+    linear in the response length rather than quadratic in sentence length.
+
+    The first chunk of a response may end at a clause boundary (comma, colon,
+    semicolon or before a conjunction) once ``first_chunk_min_words`` words
+    are buffered, so first audio does not wait for a long opening sentence.
+    After that, chunks end on full sentences only.
+
+    Usage:
+        chunker = StreamingTTSChunker()
+        for token in stream:
+            for chunk in chunker.feed(token):
+                speak(chunk)
+        tail = chunker.flush()
+    """
+
+    def __init__(self, *, first_chunk_min_words: int = 5, adaptive_first_chunk: bool = True):
+        """
+        Initialize the chunker.
+
+        Args:
+            first_chunk_min_words: Words required before a clause boundary may end
+                the first chunk.
+            adaptive_first_chunk: Allow the early clause-level first chunk.
+        """
+        self.buffer = ""
+        self.first_chunk_min_words = max(1, first_chunk_min_words)
+        self._first_emitted = not adaptive_first_chunk
+        self._scan_pos = 0
+
+    def feed(self, text: str) -> list[str]:
+        """
+        Add streamed text and return any chunks that are ready for TTS.
+
+        Args:
+            text: New text from the LLM stream (markdown is sanitized here)
+
+        Returns:
+            Ready chunks, in order (possibly empty)
+        """
+        sanitized = TTSTextProcessor.sanitize_tts_text(text)
+        if not sanitized:
+            return []
+        self.buffer += sanitized
+
+        chunks: list[str] = []
+        while True:
+            end = self._next_boundary()
+            if end < 0:
+                break
+            chunk, self.buffer = TTSTextProcessor.split_tts_buffer(self.buffer, end)
+            self._scan_pos = 0
+            if chunk.strip():
+                chunks.append(chunk)
+                self._first_emitted = True
+        return chunks
+
+    def flush(self) -> str | None:
+        """Return and clear any remaining buffered text (end of stream)."""
+        remaining = TTSTextProcessor.flush_buffer(self.buffer)
+        self.buffer = ""
+        self._scan_pos = 0
+        return remaining
+
+    def _next_boundary(self) -> int:
+        """Return the split index of the next ready boundary, or -1."""
+        buf = self.buffer
+        pattern = _SENTENCE_TERM_RE if self._first_emitted else _FIRST_CHUNK_RE
+        for match in pattern.finditer(buf, self._scan_pos):
+            idx = match.start()
+            char = buf[idx]
+            if char in ".!?":
+                end = self._sentence_end(buf, idx)
+            elif char in ",;:":
+                end = self._clause_end(buf, idx, idx + 1)
+            else:
+                # Whitespace before a conjunction: end the chunk before the conjunction
+                end = self._clause_end(buf, idx, idx)
+            if end is None:
+                # Undecidable until more text arrives; resume from here next time
+                self._scan_pos = idx
+                return -1
+            if end >= 0:
+                return end
+        self._scan_pos = max(self._scan_pos, len(buf) - _RESCAN_CHARS)
+        return -1
+
+    @staticmethod
+    def _sentence_end(buf: str, idx: int) -> int | None:
+        next_char = buf[idx + 1 : idx + 2]
+        if not next_char:
+            return None
+        end = idx + 1
+        if not next_char.isspace():
+            if next_char not in _CLOSING_PUNCT:
+                return -1
+            after = buf[idx + 2 : idx + 3]
+            if not after:
+                return None
+            if not after.isspace():
+                return -1
+            end = idx + 2
+        if buf[idx] == ".":
+            abbreviation = _is_abbreviation(buf, idx)
+            if abbreviation is None:
+                return None
+            if abbreviation:
+                return -1
+        return end
+
+    def _clause_end(self, buf: str, idx: int, end: int) -> int | None:
+        next_char = buf[idx + 1 : idx + 2]
+        if not next_char:
+            return None
+        if buf[idx] in ",;:" and not next_char.isspace():
+            return -1  # 1,000 / 10:30
+        if len(buf[:idx].split()) < self.first_chunk_min_words:
+            return -1
+        return end
@@ -3,6 +3,7 @@
 from .handler import VoiceLiveSDKHandler
 from .metrics import (
     record_llm_ttft,
+    record_session_update,
     record_stt_latency,
     record_tts_ttfb,
     record_turn_complete,
@@ -23,6 +24,7 @@ __all__ = [
     "record_tts_ttfb",
     "record_stt_latency",
     "record_turn_complete",
+    "record_session_update",
     "LiveOrchestrator",
     "TRANSFER_TOOL_NAMES",
     "CALL_CENTER_TRIGGER_PHRASES",
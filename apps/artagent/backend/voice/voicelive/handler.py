@@ -39,7 +39,9 @@ from apps.artagent.backend.src.ws_helpers.shared_ws import (
 
 # Import config resolver for scenario-aware agent loading
 from apps.artagent.backend.voice.shared import (
+    AUDIO_DATA_KIND,
     DEFAULT_START_AGENT,
+    decode_acs_frame,
     resolve_from_app_state,
     resolve_orchestrator_config,
 )
@@ -862,6 +864,14 @@ class VoiceLiveSDKHandler:
                 # ─────────────────────────────────────────────────────────────
                 agents = None
                 orchestrator_config = None
+
+                if self.session_id:
+                    # Warm the scenario store off the event loop; config resolution is sync
+                    from apps.artagent.backend.src.orchestration.session_scenarios import (
+                        load_session_scenarios_async,
+                    )
+
+                    await load_session_scenarios_async(self.session_id)
                 
                 # Resolve scenario from multiple sources (priority order):
                 # 1. websocket.state.scenario (set by browser endpoint)
@@ -1212,13 +1222,21 @@ class VoiceLiveSDKHandler:
             logger.debug("VoiceLive handler inactive; dropping media message")
             return
 
-        try:
-            payload = json.loads(message_data)
-        except json.JSONDecodeError:
+        frame = decode_acs_frame(message_data)
+        if frame is None:
             logger.debug("Skipping non-JSON media message")
             return
 
-        kind = payload.get("kind") or payload.get("Kind")
+        kind = frame.kind
+
+        if kind == AUDIO_DATA_KIND:
+            # Forward the base64 payload untouched; silent frames never leave the process
+            if frame.silent or not frame.data:
+                return
+            await self._connection.input_audio_buffer.append(audio=frame.data)
+            return
+
+        payload = frame.message
 
         if kind == "AudioMetadata":
             metadata = payload.get("payload", {})
@@ -1231,16 +1249,6 @@ class VoiceLiveSDKHandler:
             )
             return
 
-        if kind == "AudioData":
-            audio_section = payload.get("audioData") or payload.get("AudioData") or {}
-            if audio_section.get("silent"):
-                return
-            encoded = audio_section.get("data")
-            if not encoded:
-                return
-            await self._connection.input_audio_buffer.append(audio=encoded)
-            return
-
         if kind == "StopAudio":
             if self._manual_commit_enabled:
                 await self._commit_input_buffer()
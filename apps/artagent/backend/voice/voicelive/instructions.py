@@ -0,0 +1,206 @@
+"""
+Session Instruction Composer for VoiceLive
+==========================================
+
+Builds the instructions sent with ``session.update`` after each turn:
+rendered agent prompt, scenario handoff instructions and conversation recap.
+
+Each section is cached and only rebuilt when its inputs change:
+
+- base prompt: per agent, keyed by a fingerprint of the template variables
+  the prompt actually references
+- handoff instructions: per agent and scenario
+- recap: per section (user messages, collected slots, last response)
+
+The composer also remembers a digest of the last instructions sent so the
+orchestrator can skip the network round-trip when nothing changed.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from collections.abc import Iterable
+from functools import lru_cache
+from typing import Any
+
+from jinja2 import Environment, meta
+from utils.ml_logging import get_logger
+
+logger = get_logger("voicelive.instructions")
+
+_env = Environment()
+
+
+@lru_cache(maxsize=256)
+def _template_variables(template: str) -> frozenset[str] | None:
+    """Names a prompt template reads, or None if it cannot be parsed."""
+    try:
+        return frozenset(meta.find_undeclared_variables(_env.parse(template)))
+    except Exception:
+        return None
+
+
+def _fingerprint(values: Any) -> str:
+    try:
+        encoded = json.dumps(values, sort_keys=True, default=str)
+    except (TypeError, ValueError):
+        encoded = repr(values)
+    return hashlib.blake2b(encoded.encode(), digest_size=16).hexdigest()
+
+
+def instructions_digest(instructions: str) -> str:
+    """Content hash used to detect unchanged instructions."""
+    return hashlib.blake2b(instructions.encode(), digest_size=16).hexdigest()
+
+
+class InstructionComposer:
+    """
+    Per-session cache of rendered instruction sections.
+
+    Not thread-safe; owned by a single LiveOrchestrator.
+    """
+
+    def __init__(self) -> None:
+        # agent name -> (agent, fingerprint, rendered prompt)
+        self._base: dict[str, tuple[Any, str, str]] = {}
+        # agent name -> (scenario, handoff instructions)
+        self._handoff: dict[str, tuple[Any, str]] = {}
+        self._history: tuple[tuple[str, ...], str] = ((), "")
+        self._slots: tuple[str | None, str] = (None, "")
+        self._last_response: tuple[str | None, str] = (None, "")
+        self._last_sent: str | None = None
+
+        self.base_renders = 0
+        self.base_hits = 0
+        self.sent = 0
+        self.skipped = 0
+        self.bytes_saved = 0
+
+    # ------------------------------------------------------------------ #
+    # Sections
+    # ------------------------------------------------------------------ #
+
+    def base_instructions(self, agent: Any, context_vars: dict[str, Any]) -> str:
+        """Rendered agent prompt, re-rendered only when referenced inputs change."""
+        template = getattr(agent, "prompt_template", None) or ""
+        names = _template_variables(template) if isinstance(template, str) else None
+        if names is None:
+            fingerprint = _fingerprint(context_vars)
+        else:
+            fingerprint = _fingerprint({k: context_vars.get(k) for k in sorted(names)})
+        fingerprint = f"{hash(template)}:{fingerprint}"
+
+        cached = self._base.get(agent.name)
+        if cached is not None and cached[0] is agent and cached[1] == fingerprint:
+            self.base_hits += 1
+            return cached[2]
+
+        rendered = agent.render_prompt(context_vars) or ""
+        self._base[agent.name] = (agent, fingerprint, rendered)
+        self.base_renders += 1
+        return rendered
+
+    def handoff_instructions(self, scenario: Any, agent_name: str) -> str:
+        """Scenario handoff instructions for an agent, built once per scenario."""
+        cached = self._handoff.get(agent_name)
+        if cached is not None and cached[0] is scenario:
+            return cached[1]
+
+        text = scenario.build_handoff_instructions(agent_name) or ""
+        self._handoff[agent_name] = (scenario, text)
+        if text:
+            logger.info(
+                "[LiveOrchestrator] Built handoff instructions | agent=%s len=%d",
+                agent_name,
+                len(text),
+            )
+        return text
+
+    def conversation_recap(
+        self,
+        user_messages: Iterable[str],
+        slots: dict[str, Any] | None,
+        last_response: str | None,
+    ) -> str:
+        """
+        Explicit recap of the conversation so far.
+
+        Each section is rebuilt only when its input changed since the last call.
+        """
+        messages = tuple(user_messages)
+        if messages != self._history[0]:
+            text = ""
+            if messages:
+                lines = [
+                    "## CONVERSATION CONTEXT (DO NOT FORGET)",
+                    "The user has said the following in this conversation:",
+                ]
+                lines.extend(f'  {i}. "{msg}"' for i, msg in enumerate(messages, 1))
+                lines.append("")
+                lines.append(
+                    "IMPORTANT: Remember and refer back to what the user has already told you. "
+                    "Do NOT ask them to repeat information they've already provided."
+                )
+                text = "\n".join(lines)
+            self._history = (messages, text)
+
+        slots_key = _fingerprint(slots) if slots else None
+        if slots_key != self._slots[0]:
+            text = ""
+            if slots:
+                lines = ["", "## COLLECTED INFORMATION"]
+                lines.extend(f"  - {key}: {value}" for key, value in slots.items() if value)
+                text = "\n".join(lines)
+            self._slots = (slots_key, text)
+
+        if last_response != self._last_response[0]:
+            text = ""
+            if last_response:
+                shown = last_response if len(last_response) <= 200 else last_response[:200] + "..."
+                text = f'\n## YOUR LAST RESPONSE\nYou last said: "{shown}"'
+            self._last_response = (last_response, text)
+
+        return "\n".join(
+            section
+            for section in (self._history[1], self._slots[1], self._last_response[1])
+            if section
+        )
+
+    # ------------------------------------------------------------------ #
+    # Change detection
+    # ------------------------------------------------------------------ #
+
+    def is_current(self, digest: str) -> bool:
+        """True if these instructions are already what the session has."""
+        return digest == self._last_sent
+
+    def mark_sent(self, digest: str) -> None:
+        self._last_sent = digest
+        self.sent += 1
+
+    def mark_skipped(self, size_bytes: int) -> None:
+        self.skipped += 1
+        self.bytes_saved += size_bytes
+
+    def invalidate(self) -> None:
+        """Forget what was sent; call when the session instructions were replaced elsewhere."""
+        self._last_sent = None
+
+    def clear(self) -> None:
+        """Drop all cached sections (e.g. on scenario change)."""
+        self._base.clear()
+        self._handoff.clear()
+        self._last_sent = None
+
+    def get_stats(self) -> dict[str, int]:
+        return {
+            "sent": self.sent,
+            "skipped": self.skipped,
+            "bytes_saved": self.bytes_saved,
+            "base_renders": self.base_renders,
+            "base_hits": self.base_hits,
+        }
+
+
+__all__ = ["InstructionComposer", "instructions_digest"]
@@ -66,6 +66,20 @@ _turn_counter: LazyCounter = _meter.counter(
 )
 
 
+# Session instruction updates (sent vs skipped because nothing changed)
+_session_update_counter: LazyCounter = _meter.counter(
+    name="voicelive.session_update.count",
+    description="Session instruction updates, by outcome (sent or skipped)",
+    unit="1",
+)
+
+_session_update_bytes_saved: LazyCounter = _meter.counter(
+    name="voicelive.session_update.bytes_saved",
+    description="Instruction bytes not sent because the content was unchanged",
+    unit="By",
+)
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # METRIC RECORDING FUNCTIONS
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -280,3 +294,25 @@ __all__ = [
     "record_stt_latency",
     "record_turn_complete",
 ]
+
+
+def record_session_update(
+    size_bytes: int,
+    *,
+    sent: bool,
+    session_id: str,
+    agent_name: str | None = None,
+) -> None:
+    """
+    Record a session instruction update that was sent or skipped.
+
+    :param size_bytes: Size of the composed instructions in bytes
+    :param sent: False when the update was skipped because nothing changed
+    :param session_id: Session identifier for correlation
+    :param agent_name: Optional active agent name
+    """
+    attributes = build_session_attributes(session_id, agent_name=agent_name)
+    attributes["outcome"] = "sent" if sent else "skipped"
+    _session_update_counter.add(1, attributes=attributes)
+    if not sent:
+        _session_update_bytes_saved.add(size_bytes, attributes=attributes)
@@ -55,6 +55,11 @@ from apps.artagent.backend.voice.shared.session_state import (
     sync_state_from_memo,
     sync_state_to_memo,
 )
+from apps.artagent.backend.voice.voicelive.instructions import (
+    InstructionComposer,
+    instructions_digest,
+)
+from apps.artagent.backend.voice.voicelive.metrics import record_session_update
 from azure.ai.voicelive.models import (
     AssistantMessageItem,
     FunctionCallOutputItem,
@@ -276,6 +281,8 @@ class LiveOrchestrator:
         self._last_session_update_time: float = 0.0
         self._session_update_min_interval: float = 2.0  # Min seconds between updates
         self._pending_session_update: bool = False
+        # Cached instruction sections; skips session.update when nothing changed
+        self._instruction_composer = InstructionComposer()
 
         if self.messenger:
             try:
@@ -535,6 +542,7 @@ class LiveOrchestrator:
         # and injects the wrong handoff instructions for the new scenario
         if hasattr(self, "_cached_orchestrator_config"):
             delattr(self, "_cached_orchestrator_config")
+        self._instruction_composer.clear()
 
         # Clear visited agents for fresh scenario experience
         self.visited_agents.clear()
@@ -608,6 +616,7 @@ class LiveOrchestrator:
                 # CRITICAL: Apply the FULL agent session config, not just instructions
                 # This includes voice, tools, VAD settings, etc.
                 # This is the same as what _switch_to() does during handoffs
+                self._instruction_composer.invalidate()
                 await agent.apply_voicelive_session(
                     self.conn,
                     system_vars=system_vars,
@@ -771,22 +780,20 @@ class LiveOrchestrator:
                 context_vars["last_assistant_response"] = self._last_assistant_message
 
             # Render base instructions from agent prompt template
-            base_instructions = agent._agent.render_prompt(context_vars) or ""
+            # (cached per agent until a variable the template reads changes)
+            composer = self._instruction_composer
+            base_instructions = composer.base_instructions(agent._agent, context_vars)
 
             # Inject handoff instructions from scenario configuration
             # Use the cached orchestrator config (supports both file-based and session-scoped)
             config = self._orchestrator_config
             if config.scenario and agent._agent.name:
                 # Use scenario.build_handoff_instructions directly (works for session scenarios)
-                handoff_instructions = config.scenario.build_handoff_instructions(agent._agent.name)
+                handoff_instructions = composer.handoff_instructions(
+                    config.scenario, agent._agent.name
+                )
                 if handoff_instructions:
                     base_instructions = f"{base_instructions}\n\n{handoff_instructions}" if base_instructions else handoff_instructions
-                    logger.info(
-                        "[LiveOrchestrator] Injected handoff instructions | agent=%s scenario=%s len=%d",
-                        agent._agent.name,
-                        config.scenario_name,
-                        len(handoff_instructions),
-                    )
             else:
                 logger.debug(
                     "[LiveOrchestrator] No scenario or agent name for handoff instructions | scenario=%s agent=%s",
@@ -807,12 +814,27 @@ class LiveOrchestrator:
             if not updated_instructions:
                 return
 
+            # Skip the network round-trip when the session already has these instructions
+            digest = instructions_digest(updated_instructions)
+            size_bytes = len(updated_instructions.encode())
+            if composer.is_current(digest):
+                composer.mark_skipped(size_bytes)
+                record_session_update(
+                    size_bytes, sent=False, session_id=self._session_id or "", agent_name=self.active
+                )
+                logger.debug("[LiveOrchestrator] Session instructions unchanged | agent=%s", self.active)
+                return
+
             # Update session with new instructions
             from azure.ai.voicelive.models import RequestSession
 
             await self.conn.session.update(
                 session=RequestSession(instructions=updated_instructions)
             )
+            composer.mark_sent(digest)
+            record_session_update(
+                size_bytes, sent=True, session_id=self._session_id or "", agent_name=self.active
+            )
 
             logger.debug(
                 "[LiveOrchestrator] Updated session | agent=%s history_len=%d slots=%s",
@@ -828,39 +850,14 @@ class LiveOrchestrator:
         Build an explicit conversation recap to inject into instructions.
 
         This ensures the realtime model remembers what was discussed,
-        even if it tends to forget context between turns.
+        even if it tends to forget context between turns. Sections are
+        maintained incrementally by the instruction composer.
         """
-        parts = []
-
-        # Add conversation history recap
-        if self._user_message_history and len(self._user_message_history) > 0:
-            parts.append("## CONVERSATION CONTEXT (DO NOT FORGET)")
-            parts.append("The user has said the following in this conversation:")
-            for i, msg in enumerate(self._user_message_history, 1):
-                parts.append(f"  {i}. \"{msg}\"")
-            parts.append("")
-            parts.append("IMPORTANT: Remember and refer back to what the user has already told you. Do NOT ask them to repeat information they've already provided.")
-
-        # Add collected slots/information
-        slots = self._system_vars.get("slots", {})
-        if slots:
-            parts.append("")
-            parts.append("## COLLECTED INFORMATION")
-            for key, value in slots.items():
-                if value:
-                    parts.append(f"  - {key}: {value}")
-
-        # Add last assistant response for context
-        if self._last_assistant_message:
-            parts.append("")
-            parts.append("## YOUR LAST RESPONSE")
-            # Truncate if too long
-            last_resp = self._last_assistant_message
-            if len(last_resp) > 200:
-                last_resp = last_resp[:200] + "..."
-            parts.append(f'You last said: "{last_resp}"')
-
-        return "\n".join(parts) if parts else ""
+        return self._instruction_composer.conversation_recap(
+            self._user_message_history,
+            self._system_vars.get("slots", {}),
+            self._last_assistant_message,
+        )
 
     def _schedule_throttled_session_update(self) -> None:
         """
@@ -1353,6 +1350,8 @@ class LiveOrchestrator:
                     session_id = (
                         getattr(self.messenger, "session_id", None) if self.messenger else None
                     )
+                    # Session instructions are replaced; next context update must be sent
+                    self._instruction_composer.invalidate()
                     await agent.apply_voicelive_session(
                         self.conn,
                         system_vars=system_vars,
@@ -17,36 +17,30 @@ from azure.communication.callautomation import (
     StreamingTransportType,
     TranscriptionOptions,
 )
+from azure.communication.callautomation.aio import (
+    CallConnectionClient as AsyncCallConnectionClient,
+)
 from azure.core.exceptions import HttpResponseError
-from opentelemetry import trace
-from opentelemetry.trace import SpanKind
 from utils.azure_auth import get_credential
 from utils.ml_logging import get_logger
 
+from src.acs.call_control import AcsCallControl
 from src.enums.stream_modes import StreamMode
 
 logger = get_logger("src.acs")
-tracer = trace.get_tracer(__name__)
-
-
-def _endpoint_host_from_client(client: CallAutomationClient) -> str:
-    try:
-        endpoint = getattr(getattr(client, "_config", None), "endpoint", None)
-        if endpoint:
-            return str(endpoint).replace("https://", "").replace("http://", "")
-    except Exception:
-        pass
-    return "acs.communication.azure.com"
 
 
 async def wait_for_call_connected(
-    call_conn: CallConnectionClient,
+    call_conn: AsyncCallConnectionClient,
     *,
     timeout: float = 30.0,
     poll_interval: float = 0.01,  # Poll every 10ms for low latency
 ) -> CallConnectionProperties:
     """
     Block until the call reaches the **Connected** state.
+
+    ``call_conn`` is an aio connection client, e.g. from
+    :meth:`AcsCallControl.get_call_connection`.
     """
     deadline = datetime.utcnow() + timedelta(seconds=timeout)
 
@@ -54,7 +48,7 @@ async def wait_for_call_connected(
         time = datetime.utcnow()
         logger.info("🕐 Waiting for call to connect...")
         try:
-            props: CallConnectionProperties = call_conn.get_call_properties()
+            props: CallConnectionProperties = await call_conn.get_call_properties()
             state = str(props.call_connection_state).lower()
 
             if state == "connected":
@@ -154,6 +148,7 @@ class AcsCaller:
             if acs_connection_string:
                 logger.info("Using ACS connection string for authentication")
                 self.client = CallAutomationClient.from_connection_string(acs_connection_string)
+                self.call_control = AcsCallControl.from_connection_string(acs_connection_string)
             else:
                 if not acs_endpoint:
                     raise ValueError("acs_endpoint is required when not using connection string")
@@ -164,6 +159,7 @@ class AcsCaller:
                 credentials = get_credential()
 
                 self.client = CallAutomationClient(endpoint=acs_endpoint, credential=credentials)
+                self.call_control = AcsCallControl.from_endpoint(acs_endpoint)
 
         except Exception as e:
             logger.error(f"Failed to initialize ACS client: {e}")
@@ -210,7 +206,6 @@ class AcsCaller:
         self, target_number: str, stream_mode: StreamMode = StreamMode.MEDIA
     ) -> dict:
         """Start a new call with live transcription over websocket."""
-        call = self.client
         src = PhoneNumberIdentifier(self.source_number)
         dest = PhoneNumberIdentifier(target_number)
 
@@ -246,23 +241,14 @@ class AcsCaller:
 
             logger.debug("Creating call to %s via callback %s", target_number, self.callback_url)
 
-            endpoint_host = _endpoint_host_from_client(call)
-            with tracer.start_as_current_span(
-                "Azure.Communication.CallAutomation.CreateCall",
-                kind=SpanKind.CLIENT,
-                attributes={
-                    "peer.service": "azure.communication",
-                    "net.peer.name": endpoint_host,
-                },
-            ):
-                result = call.create_call(
-                    target_participant=dest,
-                    source_caller_id_number=src,
-                    callback_url=self.callback_url,
-                    cognitive_services_endpoint=cognitive_services_endpoint,
-                    transcription=transcription,
-                    media_streaming=media_streaming,
-                )
+            result = await self.call_control.create_call(
+                dest,
+                callback_url=self.callback_url,
+                source_caller_id_number=src,
+                cognitive_services_endpoint=cognitive_services_endpoint,
+                transcription=transcription,
+                media_streaming=media_streaming,
+            )
 
             logger.info("Call created: %s", result.call_connection_id)
             return {"status": "created", "call_id": result.call_connection_id}
@@ -307,22 +293,13 @@ class AcsCaller:
                 logger.warning(f"Invalid stream_mode '{stream_mode}', defaulting to transcription")
                 transcription = self.transcription_opts
 
-            endpoint_host = _endpoint_host_from_client(self.client)
-            with tracer.start_as_current_span(
-                "Azure.Communication.CallAutomation.AnswerCall",
-                kind=SpanKind.CLIENT,
-                attributes={
-                    "peer.service": "azure.communication",
-                    "net.peer.name": endpoint_host,
-                },
-            ):
-                result = self.client.answer_call(
-                    incoming_call_context=incoming_call_context,
-                    callback_url=self.callback_url,
-                    cognitive_services_endpoint=cognitive_services_endpoint,
-                    transcription=transcription,
-                    media_streaming=media_streaming,
-                )
+            result = await self.call_control.answer_call(
+                incoming_call_context,
+                callback_url=self.callback_url,
+                cognitive_services_endpoint=cognitive_services_endpoint,
+                transcription=transcription,
+                media_streaming=media_streaming,
+            )
 
             logger.info(f"Incoming call answered: {result.call_connection_id}")
             return result
@@ -344,49 +321,39 @@ class AcsCaller:
             logger.error(f"Error retrieving CallConnectionClient: {e}", exc_info=True)
             return None
 
-    def start_recording(self, server_call_id: str):
+    async def start_recording(self, server_call_id: str):
         """
         Start recording the call.
+
+        Errors are logged and re-raised so callers can retry.
         """
         try:
-            endpoint_host = _endpoint_host_from_client(self.client)
-            with tracer.start_as_current_span(
-                "Azure.Communication.CallAutomation.StartRecording",
-                kind=SpanKind.CLIENT,
-                attributes={
-                    "peer.service": "azure.communication",
-                    "net.peer.name": endpoint_host,
-                },
-            ):
-                self.client.start_recording(
-                    server_call_id=server_call_id,
-                    recording_state_callback_url=self.recording_callback_url,
-                    recording_content_type=RecordingContent.AUDIO,
-                    recording_channel_type=RecordingChannel.UNMIXED,
-                    recording_format_type=RecordingFormat.WAV,
-                    recording_storage=AzureBlobContainerRecordingStorage(
-                        container_url=self.recording_storage_container_url,
-                    ),
-                )
-            logger.info(f"Started recording for call {server_call_id}")
+            result = await self.call_control.start_recording(
+                server_call_id=server_call_id,
+                recording_state_callback_url=self.recording_callback_url,
+                recording_content_type=RecordingContent.AUDIO,
+                recording_channel_type=RecordingChannel.UNMIXED,
+                recording_format_type=RecordingFormat.WAV,
+                recording_storage=AzureBlobContainerRecordingStorage(
+                    container_url=self.recording_storage_container_url,
+                ),
+            )
         except Exception as e:
             logger.error(f"Error starting recording for call {server_call_id}: {e}")
+            raise
+        logger.info(f"Started recording for call {server_call_id}")
+        return result
 
-    def stop_recording(self, server_call_id: str):
+    async def stop_recording(self, recording_id: str):
         """
-        Stop recording the call.
+        Stop a recording started with :meth:`start_recording`.
         """
         try:
-            endpoint_host = _endpoint_host_from_client(self.client)
-            with tracer.start_as_current_span(
-                "Azure.Communication.CallAutomation.StopRecording",
-                kind=SpanKind.CLIENT,
-                attributes={
-                    "peer.service": "azure.communication",
-                    "net.peer.name": endpoint_host,
-                },
-            ):
-                self.client.stop_recording(server_call_id=server_call_id)
-            logger.info(f"Stopped recording for call {server_call_id}")
+            await self.call_control.stop_recording(recording_id)
+            logger.info(f"Stopped recording {recording_id}")
         except Exception as e:
-            logger.error(f"Error stopping recording for call {server_call_id}: {e}")
+            logger.error(f"Error stopping recording {recording_id}: {e}")
+
+    async def close(self) -> None:
+        """Close the async call-control client."""
+        await self.call_control.close()
@@ -0,0 +1,304 @@
+"""
+Async call control for Azure Communication Services.
+
+:class:`AcsCallControl` wraps the aio Call Automation client, so answering,
+dialling, hang-up, media, DTMF and recording requests never block the event
+loop. Each operation runs under its own timeout and retry budget instead of
+the SDK's built-in retry policy:
+
+- Requests that never reached the service, or were throttled (429), are
+  always retried.
+- Timeouts and 5xx responses are retried only for operations that are safe to
+  repeat (hang-up, property reads, DTMF and media cancellation).
+
+``CallConnectionClient`` instances are cached per call and share the parent
+client's HTTP pipeline; :meth:`AcsCallControl.release` drops one once the call
+has ended.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any, TypeVar
+from urllib.parse import urlparse
+
+from azure.communication.callautomation import CallConnectionProperties, CallParticipant
+from azure.communication.callautomation.aio import CallAutomationClient, CallConnectionClient
+from azure.core.credentials import AccessToken
+from azure.core.exceptions import HttpResponseError, ServiceRequestError, ServiceResponseError
+from opentelemetry import trace
+from opentelemetry.trace import SpanKind
+from utils.ml_logging import get_logger
+from utils.token_broker import TokenBroker, get_token_broker
+
+logger = get_logger("src.acs.call_control")
+tracer = trace.get_tracer(__name__)
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class OperationPolicy:
+    """Timeout and retry budget for one call-control operation."""
+
+    timeout_s: float
+    retries: int = 0
+    # Safe to repeat after a timeout or 5xx (the first attempt may have applied)
+    idempotent: bool = False
+
+
+DEFAULT_POLICIES: dict[str, OperationPolicy] = {
+    "create_call": OperationPolicy(timeout_s=10.0, retries=1),
+    "answer_call": OperationPolicy(timeout_s=5.0, retries=1),
+    "hang_up": OperationPolicy(timeout_s=2.0, retries=2, idempotent=True),
+    "get_call_properties": OperationPolicy(timeout_s=3.0, retries=2, idempotent=True),
+    "list_participants": OperationPolicy(timeout_s=3.0, retries=2, idempotent=True),
+    "play_media": OperationPolicy(timeout_s=5.0, retries=1),
+    "cancel_all_media_operations": OperationPolicy(timeout_s=3.0, retries=2, idempotent=True),
+    "start_continuous_dtmf_recognition": OperationPolicy(timeout_s=3.0, retries=2, idempotent=True),
+    "stop_continuous_dtmf_recognition": OperationPolicy(timeout_s=3.0, retries=2, idempotent=True),
+    "start_recording": OperationPolicy(timeout_s=5.0, retries=1),
+    "stop_recording": OperationPolicy(timeout_s=5.0, retries=2, idempotent=True),
+}
+
+
+class _BrokerAsyncCredential:
+    """Async credential view of the shared token broker for the aio client."""
+
+    def __init__(self, broker: TokenBroker) -> None:
+        self._broker = broker
+
+    async def get_token(self, *scopes: str, **kwargs: Any) -> AccessToken:
+        # The SDK policy caches the token, so this runs only on refresh;
+        # a thread keeps a first-use fetch off the event loop.
+        return await asyncio.to_thread(self._broker.get_token, scopes[0])
+
+    async def close(self) -> None:
+        return None
+
+    async def __aenter__(self) -> _BrokerAsyncCredential:
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        return None
+
+
+def _is_retryable(exc: BaseException, idempotent: bool) -> bool:
+    if isinstance(exc, ServiceRequestError):
+        return True  # never reached the service
+    if isinstance(exc, HttpResponseError) and exc.status_code == 429:
+        return True
+    if not idempotent:
+        return False
+    if isinstance(exc, (asyncio.TimeoutError, ServiceResponseError)):
+        return True
+    return isinstance(exc, HttpResponseError) and (exc.status_code or 0) >= 500
+
+
+class AcsCallControl:
+    """Non-blocking ACS call-control facade with per-operation timeouts and retries."""
+
+    def __init__(
+        self,
+        client: CallAutomationClient,
+        *,
+        endpoint_host: str = "acs.communication.azure.com",
+        policies: dict[str, OperationPolicy] | None = None,
+        backoff_base_s: float = 0.2,
+        max_cached_connections: int = 1024,
+    ) -> None:
+        self._client = client
+        self._endpoint_host = endpoint_host
+        self._policies = {**DEFAULT_POLICIES, **(policies or {})}
+        self._backoff_base_s = backoff_base_s
+        self._max_cached_connections = max_cached_connections
+        self._connections: OrderedDict[str, CallConnectionClient] = OrderedDict()
+
+        self.calls = 0
+        self.retries = 0
+        self.failures = 0
+
+    @classmethod
+    def from_connection_string(cls, conn_str: str, **kwargs: Any) -> AcsCallControl:
+        # The facade owns retries; disable the SDK's own retry policy
+        client = CallAutomationClient.from_connection_string(conn_str, retry_total=0)
+        endpoint = conn_str.split("endpoint=", 1)[-1].split(";", 1)[0]
+        return cls(client, endpoint_host=urlparse(endpoint).netloc or endpoint, **kwargs)
+
+    @classmethod
+    def from_endpoint(
+        cls, endpoint: str, *, broker: TokenBroker | None = None, **kwargs: Any
+    ) -> AcsCallControl:
+        credential = _BrokerAsyncCredential(broker or get_token_broker())
+        client = CallAutomationClient(endpoint=endpoint, credential=credential, retry_total=0)
+        return cls(client, endpoint_host=urlparse(endpoint).netloc or endpoint, **kwargs)
+
+    # ------------------------------------------------------------------ #
+    # Call connections
+    # ------------------------------------------------------------------ #
+
+    def get_call_connection(self, call_connection_id: str) -> CallConnectionClient:
+        """Cached aio ``CallConnectionClient`` for a call (shares the client pipeline)."""
+        conn = self._connections.get(call_connection_id)
+        if conn is None:
+            conn = self._client.get_call_connection(call_connection_id)
+            self._connections[call_connection_id] = conn
+            while len(self._connections) > self._max_cached_connections:
+                self._connections.popitem(last=False)
+        else:
+            self._connections.move_to_end(call_connection_id)
+        return conn
+
+    def release(self, call_connection_id: str) -> None:
+        """Forget the cached connection client for an ended call."""
+        self._connections.pop(call_connection_id, None)
+
+    # ------------------------------------------------------------------ #
+    # Operations
+    # ------------------------------------------------------------------ #
+
+    async def create_call(self, target_participant: Any, **kwargs: Any) -> Any:
+        return await self._run(
+            "create_call", lambda: self._client.create_call(target_participant, **kwargs)
+        )
+
+    async def answer_call(
+        self, incoming_call_context: str, callback_url: str, **kwargs: Any
+    ) -> Any:
+        return await self._run(
+            "answer_call",
+            lambda: self._client.answer_call(incoming_call_context, callback_url, **kwargs),
+        )
+
+    async def hang_up(self, call_connection_id: str, *, is_for_everyone: bool = True) -> None:
+        conn = self.get_call_connection(call_connection_id)
+        try:
+            await self._run(
+                "hang_up",
+                lambda: conn.hang_up(is_for_everyone=is_for_everyone),
+                call_connection_id=call_connection_id,
+            )
+        finally:
+            self.release(call_connection_id)
+
+    async def get_call_properties(self, call_connection_id: str) -> CallConnectionProperties:
+        conn = self.get_call_connection(call_connection_id)
+        return await self._run(
+            "get_call_properties", conn.get_call_properties, call_connection_id=call_connection_id
+        )
+
+    async def list_participants(self, call_connection_id: str) -> list[CallParticipant]:
+        conn = self.get_call_connection(call_connection_id)
+
+        async def _collect() -> list[CallParticipant]:
+            return [participant async for participant in conn.list_participants()]
+
+        return await self._run("list_participants", _collect, call_connection_id=call_connection_id)
+
+    async def play_media(self, call_connection_id: str, play_source: Any, **kwargs: Any) -> Any:
+        conn = self.get_call_connection(call_connection_id)
+        return await self._run(
+            "play_media",
+            lambda: conn.play_media(play_source, **kwargs),
+            call_connection_id=call_connection_id,
+        )
+
+    async def cancel_all_media_operations(self, call_connection_id: str) -> None:
+        conn = self.get_call_connection(call_connection_id)
+        await self._run(
+            "cancel_all_media_operations",
+            conn.cancel_all_media_operations,
+            call_connection_id=call_connection_id,
+        )
+
+    async def start_continuous_dtmf_recognition(
+        self, call_connection_id: str, target_participant: Any, **kwargs: Any
+    ) -> None:
+        conn = self.get_call_connection(call_connection_id)
+        await self._run(
+            "start_continuous_dtmf_recognition",
+            lambda: conn.start_continuous_dtmf_recognition(target_participant, **kwargs),
+            call_connection_id=call_connection_id,
+        )
+
+    async def stop_continuous_dtmf_recognition(
+        self, call_connection_id: str, target_participant: Any, **kwargs: Any
+    ) -> None:
+        conn = self.get_call_connection(call_connection_id)
+        await self._run(
+            "stop_continuous_dtmf_recognition",
+            lambda: conn.stop_continuous_dtmf_recognition(target_participant, **kwargs),
+            call_connection_id=call_connection_id,
+        )
+
+    async def start_recording(self, **kwargs: Any) -> Any:
+        return await self._run("start_recording", lambda: self._client.start_recording(**kwargs))
+
+    async def stop_recording(self, recording_id: str) -> None:
+        await self._run("stop_recording", lambda: self._client.stop_recording(recording_id))
+
+    async def close(self) -> None:
+        self._connections.clear()
+        await self._client.close()
+
+    def get_stats(self) -> dict[str, int]:
+        return {
+            "calls": self.calls,
+            "retries": self.retries,
+            "failures": self.failures,
+            "cached_connections": len(self._connections),
+        }
+
+    # ------------------------------------------------------------------ #
+    # Execution
+    # ------------------------------------------------------------------ #
+
+    async def _run(
+        self,
+        operation: str,
+        request: Callable[[], Awaitable[T]],
+        *,
+        call_connection_id: str | None = None,
+    ) -> T:
+        policy = self._policies[operation]
+        span_name = "".join(part.title() for part in operation.split("_"))
+        attributes = {"peer.service": "azure.communication", "net.peer.name": self._endpoint_host}
+        if call_connection_id:
+            attributes["call.connection.id"] = call_connection_id
+
+        self.calls += 1
+        with tracer.start_as_current_span(
+            f"Azure.Communication.CallAutomation.{span_name}",
+            kind=SpanKind.CLIENT,
+            attributes=attributes,
+        ) as span:
+            attempt = 0
+            while True:
+                try:
+                    result = await asyncio.wait_for(request(), timeout=policy.timeout_s)
+                    span.set_attribute("retry.count", attempt)
+                    return result
+                except Exception as exc:
+                    if attempt >= policy.retries or not _is_retryable(exc, policy.idempotent):
+                        self.failures += 1
+                        span.set_attribute("retry.count", attempt)
+                        raise
+                    attempt += 1
+                    self.retries += 1
+                    delay = self._backoff_base_s * 2 ** (attempt - 1) * random.uniform(0.5, 1.0)
+                    logger.warning(
+                        "ACS %s failed (%s); retry %d/%d in %.2fs",
+                        operation,
+                        type(exc).__name__,
+                        attempt,
+                        policy.retries,
+                        delay,
+                    )
+                    await asyncio.sleep(delay)
+
+
+__all__ = ["AcsCallControl", "DEFAULT_POLICIES", "OperationPolicy"]
@@ -18,8 +18,8 @@ from azure.identity import (
 )
 from dotenv import load_dotenv
 from openai import AzureOpenAI
-from utils.azure_auth import get_credential
 from utils.ml_logging import logging
+from utils.token_broker import get_token_broker
 
 logger = logging.getLogger(__name__)
 load_dotenv()
@@ -55,19 +55,17 @@ def create_azure_openai_client(
 
     logger.info("Using Azure AD authentication for Azure OpenAI")
 
-    resolved_credential = credential
-    if not resolved_credential:
-        if azure_client_id:
-            logger.info("Using user-assigned managed identity with client ID: %s", azure_client_id)
-            resolved_credential = ManagedIdentityCredential(client_id=azure_client_id)
-        else:
-            logger.info("Using DefaultAzureCredential for Azure OpenAI authentication")
-            resolved_credential = get_credential()
+    scope = "https://cognitiveservices.azure.com/.default"
+    if credential is None and azure_client_id:
+        logger.info("Using user-assigned managed identity with client ID: %s", azure_client_id)
+        credential = ManagedIdentityCredential(client_id=azure_client_id)
 
     try:
-        azure_ad_token_provider = get_bearer_token_provider(
-            resolved_credential, "https://cognitiveservices.azure.com/.default"
-        )
+        if credential is not None:
+            azure_ad_token_provider = get_bearer_token_provider(credential, scope)
+        else:
+            logger.info("Using DefaultAzureCredential for Azure OpenAI authentication")
+            azure_ad_token_provider = get_token_broker().bearer_token_provider(scope)
         client = AzureOpenAI(
             api_version=api_version,
             azure_endpoint=azure_endpoint,
@@ -78,14 +76,10 @@ def create_azure_openai_client(
     except Exception as exc:
         logger.error("Failed to create Azure OpenAI client with Azure AD: %s", exc)
         logger.info("Falling back to DefaultAzureCredential")
-        fallback_credential = get_credential()
-        azure_ad_token_provider = get_bearer_token_provider(
-            fallback_credential, "https://cognitiveservices.azure.com/.default"
-        )
         return AzureOpenAI(
             api_version=api_version,
             azure_endpoint=azure_endpoint,
-            azure_ad_token_provider=azure_ad_token_provider,
+            azure_ad_token_provider=get_token_broker().bearer_token_provider(scope),
         )
 
 
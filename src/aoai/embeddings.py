@@ -0,0 +1,204 @@
+"""
+Async embedding service with micro-batching and caching.
+
+Concurrent ``embed()`` calls made within a short window are sent as one
+embeddings request (up to ``max_batch_size`` inputs). Identical inputs share
+one in-flight request. Vectors are cached by normalized text and model in an
+in-process LRU, optionally backed by Redis so replicas and restarts reuse
+them.
+
+Vectors are returned as read-only ``float32`` arrays, and the same array is
+shared by every caller that asked for the same text.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import hashlib
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Sequence
+from typing import Any
+
+import numpy as np
+from utils.ml_logging import get_logger
+
+logger = get_logger("aoai.embeddings")
+
+# (texts, model) -> one vector per text, in order
+EmbedBackend = Callable[[list[str], str], Awaitable[Sequence[Sequence[float]]]]
+
+
+def normalize_embedding_text(text: str) -> str:
+    """Collapse whitespace so trivially different phrasings share a cache entry."""
+    return " ".join(str(text).split())
+
+
+class EmbeddingService:
+    """Micro-batching, de-duplicating, caching front end for an embeddings backend."""
+
+    def __init__(
+        self,
+        backend: EmbedBackend,
+        model: str,
+        *,
+        max_batch_size: int = 16,
+        batch_window_ms: float = 5.0,
+        cache_size: int = 4096,
+        redis_manager: Any | None = None,
+        redis_ttl_s: int = 7 * 24 * 3600,
+    ) -> None:
+        self._backend = backend
+        self.model = model
+        self._max_batch_size = max(1, max_batch_size)
+        self._batch_window_s = batch_window_ms / 1000
+        self._cache_size = cache_size
+        self._cache: OrderedDict[tuple[str, str], np.ndarray] = OrderedDict()
+        self._redis = redis_manager
+        self._redis_ttl_s = redis_ttl_s
+        self._inflight: dict[tuple[str, str], asyncio.Future] = {}
+        self._pending: dict[str, list[tuple[str, asyncio.Future]]] = {}
+        self._timers: dict[str, asyncio.TimerHandle] = {}
+        self._tasks: set[asyncio.Task] = set()
+
+        self.cache_hits = 0
+        self.redis_hits = 0
+        self.inflight_joins = 0
+        self.requests = 0
+        self.texts_embedded = 0
+
+    async def embed(self, text: str, model: str | None = None) -> np.ndarray:
+        """Embedding for ``text`` as a read-only float32 vector."""
+        model = model or self.model
+        key = (model, normalize_embedding_text(text))
+
+        vector = self._cache.get(key)
+        if vector is not None:
+            self._cache.move_to_end(key)
+            self.cache_hits += 1
+            return vector
+
+        future = self._inflight.get(key)
+        if future is not None:
+            self.inflight_joins += 1
+            return await asyncio.shield(future)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+
+        try:
+            vector = await self._redis_get(key) if self._redis else None
+        except asyncio.CancelledError:
+            # Callers may already be waiting on this future; still embed it
+            self._enqueue(model, key[1], future)
+            raise
+        if vector is not None:
+            self.redis_hits += 1
+            self._resolve(key, future, vector)
+        else:
+            self._enqueue(model, key[1], future)
+        return await asyncio.shield(future)
+
+    async def embed_many(self, texts: Sequence[str], model: str | None = None) -> list[np.ndarray]:
+        """Embeddings for several texts; batched and de-duplicated like ``embed``."""
+        return list(await asyncio.gather(*(self.embed(text, model) for text in texts)))
+
+    # ------------------------------------------------------------------ #
+    # Batching
+    # ------------------------------------------------------------------ #
+
+    def _enqueue(self, model: str, text: str, future: asyncio.Future) -> None:
+        batch = self._pending.setdefault(model, [])
+        batch.append((text, future))
+        if len(batch) >= self._max_batch_size:
+            self._flush(model)
+        elif model not in self._timers:
+            loop = asyncio.get_running_loop()
+            self._timers[model] = loop.call_later(self._batch_window_s, self._flush, model)
+
+    def _flush(self, model: str) -> None:
+        timer = self._timers.pop(model, None)
+        if timer is not None:
+            timer.cancel()
+        batch = self._pending.pop(model, None)
+        if batch:
+            task = asyncio.get_running_loop().create_task(self._run_batch(model, batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run_batch(self, model: str, batch: list[tuple[str, asyncio.Future]]) -> None:
+        texts = [text for text, _ in batch]
+        self.requests += 1
+        self.texts_embedded += len(texts)
+        try:
+            vectors = np.asarray(await self._backend(texts, model), dtype=np.float32)
+            if len(vectors) != len(texts):
+                raise ValueError(f"Expected {len(texts)} embeddings, got {len(vectors)}")
+        except Exception as exc:
+            logger.warning("Embedding batch of %d failed: %s", len(texts), exc)
+            for text, future in batch:
+                self._inflight.pop((model, text), None)
+                if not future.done():
+                    future.set_exception(exc)
+            return
+
+        for (text, future), vector in zip(batch, vectors, strict=True):
+            vector.setflags(write=False)
+            self._resolve((model, text), future, vector)
+        if self._redis:
+            await asyncio.gather(
+                *(
+                    self._redis_put((model, text), vector)
+                    for (text, _), vector in zip(batch, vectors, strict=True)
+                )
+            )
+
+    def _resolve(self, key: tuple[str, str], future: asyncio.Future, vector: np.ndarray) -> None:
+        self._cache[key] = vector
+        self._cache.move_to_end(key)
+        while len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+        self._inflight.pop(key, None)
+        if not future.done():
+            future.set_result(vector)
+
+    # ------------------------------------------------------------------ #
+    # Redis persistence
+    # ------------------------------------------------------------------ #
+
+    @staticmethod
+    def _redis_key(key: tuple[str, str]) -> str:
+        model, text = key
+        digest = hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+        return f"embedding:{model}:{digest}"
+
+    async def _redis_get(self, key: tuple[str, str]) -> np.ndarray | None:
+        try:
+            raw = await self._redis.get_value_async(self._redis_key(key))
+        except Exception as exc:
+            logger.debug("Embedding cache read failed: %s", exc)
+            return None
+        if not raw:
+            return None
+        # frombuffer over bytes is already read-only
+        return np.frombuffer(base64.b64decode(raw), dtype=np.float32)
+
+    async def _redis_put(self, key: tuple[str, str], vector: np.ndarray) -> None:
+        try:
+            encoded = base64.b64encode(vector.tobytes()).decode("ascii")
+            await self._redis.set_value_async(self._redis_key(key), encoded, self._redis_ttl_s)
+        except Exception as exc:
+            logger.debug("Embedding cache write failed: %s", exc)
+
+    def get_stats(self) -> dict[str, int]:
+        return {
+            "cached": len(self._cache),
+            "cache_hits": self.cache_hits,
+            "redis_hits": self.redis_hits,
+            "inflight_joins": self.inflight_joins,
+            "requests": self.requests,
+            "texts_embedded": self.texts_embedded,
+        }
+
+
+__all__ = ["EmbedBackend", "EmbeddingService", "normalize_embedding_text"]
@@ -3,6 +3,7 @@
 
 """
 
+import asyncio
 import base64
 import json
 import mimetypes
@@ -13,13 +14,12 @@ from dataclasses import dataclass
 from typing import Any, Literal
 
 import openai
-from azure.identity import get_bearer_token_provider
 from dotenv import load_dotenv
 from openai import AzureOpenAI
 from opentelemetry import trace
 from opentelemetry.trace import SpanKind, Status, StatusCode
-from utils.azure_auth import get_credential
 from utils.ml_logging import get_logger
+from utils.token_broker import get_token_broker
 from utils.trace_context import TraceContext
 
 from src.enums.monitoring import GenAIOperation, GenAIProvider, PeerService, SpanAttr
@@ -192,8 +192,8 @@ class AzureOpenAIManager:
         )
 
         if not self.api_key:
-            token_provider = get_bearer_token_provider(
-                get_credential(), "https://cognitiveservices.azure.com/.default"
+            token_provider = get_token_broker().bearer_token_provider(
+                "https://cognitiveservices.azure.com/.default"
             )
             self.openai_client = AzureOpenAI(
                 api_version=self.api_version,
@@ -1187,6 +1187,64 @@ class AzureOpenAIManager:
                 logger.error(f"Traceback: {traceback.format_exc()}")
                 return None, None
 
+    async def embed_texts(self, texts: list[str], model_name: str | None = None) -> list[list[float]]:
+        """
+        Embeds several texts in a single embeddings request, off the event loop.
+
+        :param texts: The texts to embed.
+        :param model_name: Embedding deployment; defaults to the manager's embedding model.
+        :return: One embedding per input text, in input order.
+        :raises Exception: If the API request fails.
+        """
+        embedding_model = model_name or self.embedding_model_name
+
+        with tracer.start_as_current_span(
+            f"{PeerService.AZURE_OPENAI}.{GenAIOperation.EMBEDDINGS}",
+            kind=SpanKind.CLIENT,
+        ) as llm_span:
+            api_start_time = time.perf_counter()
+            self._set_genai_span_attributes(
+                llm_span,
+                operation=GenAIOperation.EMBEDDINGS,
+                model=embedding_model,
+            )
+            llm_span.set_attribute("aoai.batch_size", len(texts))
+
+            response = await asyncio.to_thread(
+                self.openai_client.embeddings.create,
+                input=texts,
+                model=embedding_model,
+            )
+
+            llm_span.set_attribute(
+                SpanAttr.GENAI_CLIENT_OPERATION_DURATION.value,
+                (time.perf_counter() - api_start_time) * 1000,
+            )
+            if getattr(response, "usage", None):
+                llm_span.set_attribute(
+                    SpanAttr.GENAI_USAGE_INPUT_TOKENS.value, response.usage.prompt_tokens
+                )
+            llm_span.set_status(Status(StatusCode.OK))
+
+        return [item.embedding for item in sorted(response.data, key=lambda item: item.index)]
+
+    def create_embedding_service(self, redis_manager: Any | None = None, **kwargs):
+        """
+        Creates a micro-batching, caching :class:`~src.aoai.embeddings.EmbeddingService`
+        backed by :meth:`embed_texts`.
+
+        :param redis_manager: Optional Redis manager for a shared vector cache.
+        :param kwargs: Batching and cache options forwarded to the service.
+        """
+        from src.aoai.embeddings import EmbeddingService
+
+        return EmbeddingService(
+            self.embed_texts,
+            self.embedding_model_name,
+            redis_manager=redis_manager,
+            **kwargs,
+        )
+
     # ═══════════════════════════════════════════════════════════════════════════
     # RESPONSES API SUPPORT - Dual Endpoint Methods
     # ═══════════════════════════════════════════════════════════════════════════
@@ -10,6 +10,7 @@ and Azure best practices. Features include:
 - Structured logging and monitoring
 - Connection pooling and resource management
 - Input validation and security measures
+- Streaming block uploads with bounded memory and per-process concurrency
 
 Dependencies:
     azure-storage-blob>=12.19.0
@@ -27,6 +28,7 @@ Security Note:
     Connection strings and account keys are used only as fallback options.
 """
 
+import asyncio
 import logging
 import os
 from dataclasses import dataclass
@@ -34,7 +36,6 @@ from datetime import UTC, datetime, timedelta
 from enum import Enum
 from pathlib import Path
 
-import aiofiles
 from azure.core.exceptions import (
     ResourceNotFoundError,
 )
@@ -43,6 +44,13 @@ from azure.storage.blob import ContainerSasPermissions, generate_container_sas
 from azure.storage.blob.aio import BlobServiceClient
 from utils.azure_auth import get_credential
 
+from src.blob.upload import (
+    DEFAULT_BLOCK_SIZE,
+    DEFAULT_MAX_CONCURRENT_UPLOADS,
+    BlobUploadPipeline,
+    LiveWavUpload,
+)
+
 # Configure structured logging
 logger = logging.getLogger(__name__)
 
@@ -92,6 +100,8 @@ class AzureBlobHelper:
         connection_string: str | None = None,
         account_key: str | None = None,
         max_retry_attempts: int = 3,
+        block_size: int = DEFAULT_BLOCK_SIZE,
+        max_concurrent_uploads: int = DEFAULT_MAX_CONCURRENT_UPLOADS,
     ):
         """
         Initialize Azure Blob Helper with secure authentication.
@@ -102,6 +112,8 @@ class AzureBlobHelper:
             connection_string: Connection string (fallback auth)
             account_key: Account key (fallback auth)
             max_retry_attempts: Maximum retry attempts for failed operations
+            block_size: Block size for streamed uploads
+            max_concurrent_uploads: Uploads allowed to run at once in this process
         """
         # Configuration with validation
         self.account_name = account_name or os.getenv("AZURE_STORAGE_ACCOUNT_NAME")
@@ -115,6 +127,11 @@ class AzureBlobHelper:
         # Retry configuration
         self.max_retry_attempts = max_retry_attempts
 
+        # Chunked uploads: memory per upload is bounded by the block size
+        self._uploads = BlobUploadPipeline(
+            block_size=block_size, max_concurrent_uploads=max_concurrent_uploads
+        )
+
         # Initialize authentication and client
         self._credential = self._setup_authentication()
         self._blob_service: BlobServiceClient | None = None
@@ -379,9 +396,9 @@ class AzureBlobHelper:
 
             # Upload with metadata
             content_bytes = transcript.encode("utf-8")
-            await blob_client.upload_blob(
+            await self._uploads.upload_bytes(
+                blob_client,
                 content_bytes,
-                overwrite=True,
                 content_type="application/json",
                 metadata={
                     "call_id": call_id,
@@ -454,16 +471,13 @@ class AzureBlobHelper:
             # Get file size for monitoring
             file_size = wav_path.stat().st_size
 
-            # Read and upload file
+            # Stream the file in blocks rather than reading it into memory
             service = await self._get_blob_service()
             blob_client = service.get_blob_client(container=container_name, blob=blob_name)
 
-            async with aiofiles.open(wav_file_path, "rb") as f:
-                wav_data = await f.read()
-
-            await blob_client.upload_blob(
-                wav_data,
-                overwrite=True,
+            await self._uploads.upload_file(
+                blob_client,
+                wav_path,
                 content_type="audio/wav",
                 metadata={
                     "call_id": call_id,
@@ -509,7 +523,7 @@ class AzureBlobHelper:
 
         Args:
             call_id: Unique call identifier
-            wav_stream: Async stream of WAV data
+            wav_stream: WAV data as an async or sync iterable of bytes, or a file-like object
             container_name: Container name (uses default if not provided)
 
         Returns:
@@ -531,9 +545,9 @@ class AzureBlobHelper:
             service = await self._get_blob_service()
             blob_client = service.get_blob_client(container=container_name, blob=blob_name)
 
-            await blob_client.upload_blob(
-                wav_stream,
-                overwrite=True,
+            size = await self._uploads.upload_stream(
+                blob_client,
+                self._iter_blocks(wav_stream),
                 content_type="audio/wav",
                 metadata={
                     "call_id": call_id,
@@ -545,7 +559,8 @@ class AzureBlobHelper:
             duration = (datetime.now(UTC) - start_time).total_seconds() * 1000
 
             logger.info(
-                f"Streamed WAV data for call '{call_id}' to '{blob_name}' " f"in {duration:.2f}ms"
+                f"Streamed WAV data for call '{call_id}' to '{blob_name}' "
+                f"({size} bytes) in {duration:.2f}ms"
             )
 
             return BlobOperationResult(
@@ -553,6 +568,7 @@ class AzureBlobHelper:
                 operation_type=BlobOperationType.UPLOAD,
                 blob_name=blob_name,
                 container_name=container_name,
+                size_bytes=size,
                 duration_ms=duration,
             )
 
@@ -568,6 +584,92 @@ class AzureBlobHelper:
                 duration_ms=duration,
             )
 
+    async def _iter_blocks(self, stream):
+        """Yield bytes from an async/sync iterable or a (possibly async) file-like object."""
+        if hasattr(stream, "read"):
+            while True:
+                block = stream.read(self._uploads.block_size)
+                if asyncio.iscoroutine(block):
+                    block = await block
+                if not block:
+                    return
+                yield block
+        elif hasattr(stream, "__aiter__"):
+            async for block in stream:
+                yield block
+        else:
+            for block in stream:
+                yield block
+
+    async def start_live_wav_upload(
+        self,
+        call_id: str,
+        sample_rate: int = 16000,
+        channels: int = 1,
+        container_name: str | None = None,
+    ) -> tuple[str, LiveWavUpload]:
+        """
+        Start uploading a call recording while the call is live.
+
+        Write PCM frames to the returned upload as they arrive and call
+        ``finish()`` at hangup; the WAV header is added then.
+
+        Args:
+            call_id: Unique call identifier
+            sample_rate: PCM sample rate in Hz
+            channels: Number of interleaved channels
+            container_name: Container name (uses default if not provided)
+
+        Returns:
+            Tuple of (blob name, LiveWavUpload)
+        """
+        if not call_id or not call_id.strip():
+            raise ValueError("Call ID is required and cannot be empty")
+
+        container_name = container_name or self.container_name
+        started_at = datetime.now(UTC)
+        blob_name = f"audio/{started_at.strftime('%Y-%m-%d')}/{call_id}.wav"
+
+        service = await self._get_blob_service()
+        blob_client = service.get_blob_client(container=container_name, blob=blob_name)
+        upload = self._uploads.live_wav(
+            blob_client,
+            sample_rate=sample_rate,
+            channels=channels,
+            metadata={
+                "call_id": call_id,
+                "created_at": started_at.isoformat(),
+                "content_type": "audio_stream",
+            },
+        )
+        return blob_name, upload
+
+    async def save_call_artifacts(
+        self,
+        call_id: str,
+        transcript: str | None = None,
+        wav_file_path: str | None = None,
+        container_name: str | None = None,
+    ) -> list[BlobOperationResult]:
+        """
+        Upload a call's transcript and recording concurrently.
+
+        Args:
+            call_id: Unique call identifier
+            transcript: Transcript content as JSON string
+            wav_file_path: Path to local WAV file
+            container_name: Container name (uses default if not provided)
+
+        Returns:
+            One BlobOperationResult per artifact provided
+        """
+        uploads = []
+        if transcript is not None:
+            uploads.append(self.save_transcript_to_blob(call_id, transcript, container_name))
+        if wav_file_path is not None:
+            uploads.append(self.save_wav_to_blob(call_id, wav_file_path, container_name))
+        return list(await asyncio.gather(*uploads))
+
     async def get_transcript_from_blob(
         self, call_id: str, container_name: str | None = None
     ) -> BlobOperationResult:
@@ -899,6 +1001,22 @@ async def stream_wav_to_blob(call_id: str, wav_stream):
         raise Exception(result.error_message)
 
 
+async def save_call_artifacts(
+    call_id: str, transcript: str | None = None, wav_file_path: str | None = None
+):
+    """
+    Legacy wrapper for save_call_artifacts.
+
+    Note: This function is deprecated. Use AzureBlobHelper class instead.
+    """
+    helper = get_blob_helper()
+    results = await helper.save_call_artifacts(call_id, transcript, wav_file_path)
+
+    failed = [r.error_message for r in results if not r.success]
+    if failed:
+        raise Exception("; ".join(failed))
+
+
 async def get_transcript_from_blob(call_id: str) -> str:
     """
     Legacy wrapper for get_transcript_from_blob.
@@ -0,0 +1,311 @@
+"""
+Streaming, chunked uploads to Azure Block Blobs.
+
+Files and streams are read in fixed-size blocks and sent with ``stage_block``,
+then assembled with one ``commit_block_list``. Memory per upload is therefore
+bounded by ``block_size * max_block_concurrency`` whatever the file size.
+Each upload stages up to ``max_block_concurrency`` blocks in parallel, and at
+most ``max_concurrent_uploads`` uploads run per process.
+
+:class:`LiveWavUpload` streams PCM while a call is still live. The WAV header
+depends on the final data size, so it is staged last but listed first in the
+committed block list; no header rewrite or second pass is needed.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import struct
+from collections.abc import AsyncIterable, Iterable
+from pathlib import Path
+from typing import Any
+
+import aiofiles
+from azure.storage.blob import ContentSettings
+
+DEFAULT_BLOCK_SIZE = 4 * 1024 * 1024
+DEFAULT_BLOCK_CONCURRENCY = 4
+DEFAULT_MAX_CONCURRENT_UPLOADS = 4
+
+WAV_HEADER_SIZE = 44
+
+
+def _block_id(index: int) -> str:
+    # Block IDs within a blob must all have the same length
+    return base64.b64encode(f"block-{index:08d}".encode()).decode("ascii")
+
+
+def wav_header(data_size: int, sample_rate: int = 16000, channels: int = 1, sample_width: int = 2) -> bytes:
+    """Canonical 44-byte PCM WAV header for ``data_size`` bytes of audio."""
+    byte_rate = sample_rate * channels * sample_width
+    return struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF",
+        36 + data_size,
+        b"WAVE",
+        b"fmt ",
+        16,
+        1,
+        channels,
+        sample_rate,
+        byte_rate,
+        channels * sample_width,
+        sample_width * 8,
+        b"data",
+        data_size,
+    )
+
+
+class BlockBlobWriter:
+    """
+    Stages blocks for one blob with bounded parallelism, then commits them.
+
+    ``write`` buffers until a full block is available; staging waits when
+    ``max_block_concurrency`` blocks are already in flight, which is what
+    bounds memory for fast producers.
+    """
+
+    def __init__(
+        self,
+        blob_client: Any,
+        *,
+        block_size: int = DEFAULT_BLOCK_SIZE,
+        max_block_concurrency: int = DEFAULT_BLOCK_CONCURRENCY,
+    ) -> None:
+        self._blob_client = blob_client
+        self._block_size = block_size
+        self._slots = asyncio.Semaphore(max_block_concurrency)
+        self._buffer = bytearray()
+        self._block_ids: list[str] = []
+        self._tasks: set[asyncio.Task] = set()
+        self._next_index = 0
+        self._error: BaseException | None = None
+        self.bytes_written = 0
+
+    async def write(self, data: bytes) -> None:
+        self._raise_if_failed()
+        self.bytes_written += len(data)
+        if not self._buffer and len(data) == self._block_size:
+            # Whole-block reads (upload_file) are staged without copying
+            await self._stage(bytes(data))
+            return
+        self._buffer += data
+        while len(self._buffer) >= self._block_size:
+            block = bytes(self._buffer[: self._block_size])
+            del self._buffer[: self._block_size]
+            await self._stage(block)
+
+    def reserve_block(self) -> str:
+        """Reserve a block ID to be staged later (e.g. a trailing header)."""
+        block_id = _block_id(self._next_index)
+        self._next_index += 1
+        return block_id
+
+    async def stage_reserved(self, block_id: str, data: bytes) -> None:
+        await self._blob_client.stage_block(block_id, data, length=len(data))
+
+    async def _stage(self, block: bytes) -> None:
+        block_id = self.reserve_block()
+        self._block_ids.append(block_id)
+        await self._slots.acquire()
+        task = asyncio.create_task(self._stage_block(block_id, block))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _stage_block(self, block_id: str, block: bytes) -> None:
+        try:
+            await self._blob_client.stage_block(block_id, block, length=len(block))
+        except Exception as exc:
+            # Surfaced by the next write() or flush()
+            self._error = self._error or exc
+        finally:
+            self._slots.release()
+
+    def _raise_if_failed(self) -> None:
+        if self._error is not None:
+            raise self._error
+
+    async def flush(self) -> list[str]:
+        """Stage any buffered tail and wait for all blocks; returns their IDs in order."""
+        if self._buffer:
+            block, self._buffer = bytes(self._buffer), bytearray()
+            await self._stage(block)
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._raise_if_failed()
+        return list(self._block_ids)
+
+    async def commit(
+        self,
+        block_ids: list[str],
+        *,
+        content_type: str | None = None,
+        metadata: dict[str, str] | None = None,
+    ) -> None:
+        await self._blob_client.commit_block_list(
+            block_ids,
+            content_settings=ContentSettings(content_type=content_type) if content_type else None,
+            metadata=metadata,
+        )
+
+    async def abort(self) -> None:
+        """Cancel blocks still being staged; uncommitted blocks are discarded by the service."""
+        for task in list(self._tasks):
+            task.cancel()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+
+class LiveWavUpload:
+    """
+    Upload PCM audio as a WAV blob while it is being produced.
+
+    Call :meth:`write` with raw PCM frames as they arrive and :meth:`finish`
+    at hangup; the header is written then, once the data size is known.
+    """
+
+    def __init__(
+        self,
+        blob_client: Any,
+        *,
+        sample_rate: int = 16000,
+        channels: int = 1,
+        sample_width: int = 2,
+        metadata: dict[str, str] | None = None,
+        block_size: int = DEFAULT_BLOCK_SIZE,
+        max_block_concurrency: int = DEFAULT_BLOCK_CONCURRENCY,
+    ) -> None:
+        self._writer = BlockBlobWriter(
+            blob_client, block_size=block_size, max_block_concurrency=max_block_concurrency
+        )
+        self._header_id = self._writer.reserve_block()
+        self._format = (sample_rate, channels, sample_width)
+        self._metadata = metadata
+
+    @property
+    def bytes_written(self) -> int:
+        return self._writer.bytes_written
+
+    async def write(self, pcm: bytes) -> None:
+        await self._writer.write(pcm)
+
+    async def finish(self) -> int:
+        """Stage the header, commit the blob and return its total size."""
+        try:
+            data_ids = await self._writer.flush()
+            header = wav_header(self._writer.bytes_written, *self._format)
+            await self._writer.stage_reserved(self._header_id, header)
+            await self._writer.commit(
+                [self._header_id, *data_ids], content_type="audio/wav", metadata=self._metadata
+            )
+        except BaseException:
+            await self._writer.abort()
+            raise
+        return WAV_HEADER_SIZE + self._writer.bytes_written
+
+    async def abort(self) -> None:
+        await self._writer.abort()
+
+
+class BlobUploadPipeline:
+    """Chunked block uploads with a per-process limit on concurrent uploads."""
+
+    def __init__(
+        self,
+        *,
+        block_size: int = DEFAULT_BLOCK_SIZE,
+        max_block_concurrency: int = DEFAULT_BLOCK_CONCURRENCY,
+        max_concurrent_uploads: int = DEFAULT_MAX_CONCURRENT_UPLOADS,
+    ) -> None:
+        self.block_size = block_size
+        self.max_block_concurrency = max_block_concurrency
+        self._uploads = asyncio.Semaphore(max_concurrent_uploads)
+
+    def _writer(self, blob_client: Any) -> BlockBlobWriter:
+        return BlockBlobWriter(
+            blob_client,
+            block_size=self.block_size,
+            max_block_concurrency=self.max_block_concurrency,
+        )
+
+    async def upload_stream(
+        self,
+        blob_client: Any,
+        chunks: AsyncIterable[bytes] | Iterable[bytes],
+        *,
+        content_type: str | None = None,
+        metadata: dict[str, str] | None = None,
+    ) -> int:
+        """Upload chunks of any size as one block blob; returns bytes uploaded."""
+        async with self._uploads:
+            writer = self._writer(blob_client)
+            try:
+                if hasattr(chunks, "__aiter__"):
+                    async for chunk in chunks:
+                        await writer.write(chunk)
+                else:
+                    for chunk in chunks:
+                        await writer.write(chunk)
+                block_ids = await writer.flush()
+                await writer.commit(block_ids, content_type=content_type, metadata=metadata)
+            except BaseException:
+                await writer.abort()
+                raise
+            return writer.bytes_written
+
+    async def upload_file(
+        self,
+        blob_client: Any,
+        path: str | Path,
+        *,
+        content_type: str | None = None,
+        metadata: dict[str, str] | None = None,
+    ) -> int:
+        """Stream a local file in ``block_size`` reads; never holds the whole file."""
+
+        async def _read_blocks():
+            async with aiofiles.open(path, "rb") as f:
+                while block := await f.read(self.block_size):
+                    yield block
+
+        return await self.upload_stream(
+            blob_client, _read_blocks(), content_type=content_type, metadata=metadata
+        )
+
+    async def upload_bytes(
+        self,
+        blob_client: Any,
+        data: bytes,
+        *,
+        content_type: str | None = None,
+        metadata: dict[str, str] | None = None,
+    ) -> int:
+        """Single-shot upload for small payloads, still subject to the process limit."""
+        async with self._uploads:
+            await blob_client.upload_blob(
+                data,
+                overwrite=True,
+                content_settings=ContentSettings(content_type=content_type) if content_type else None,
+                metadata=metadata,
+            )
+            return len(data)
+
+    def live_wav(self, blob_client: Any, **kwargs: Any) -> LiveWavUpload:
+        """
+        Start a :class:`LiveWavUpload` with this pipeline's block settings.
+
+        Live uploads last as long as the call, so they do not take one of the
+        ``max_concurrent_uploads`` slots.
+        """
+        kwargs.setdefault("block_size", self.block_size)
+        kwargs.setdefault("max_block_concurrency", self.max_block_concurrency)
+        return LiveWavUpload(blob_client, **kwargs)
+
+
+__all__ = [
+    "BlobUploadPipeline",
+    "BlockBlobWriter",
+    "LiveWavUpload",
+    "wav_header",
+]
@@ -217,6 +217,28 @@ class CosmosDBMongoCoreManager:
             logger.error(f"Failed to upsert document for query {query}: {e}")
             raise
 
+    @_trace_cosmosdb("bulk_write")
+    def bulk_upsert_documents(self, documents: Sequence[dict[str, Any]]) -> int:
+        """
+        Upsert many documents by ``_id`` in a single unordered bulk write.
+        :param documents: Documents to upsert; each must carry an ``_id``.
+        :return: Number of documents inserted or modified.
+        """
+        if not documents:
+            return 0
+        requests = [
+            pymongo.UpdateOne({"_id": doc["_id"]}, {"$set": doc}, upsert=True) for doc in documents
+        ]
+        try:
+            result = self.collection.bulk_write(requests, ordered=False)
+            return result.upserted_count + result.modified_count
+        except NetworkTimeout as e:
+            logger.warning(f"Network timeout during bulk upsert of {len(requests)} documents: {e}")
+            raise
+        except PyMongoError as e:
+            logger.error(f"Failed to bulk upsert {len(requests)} documents: {e}")
+            raise
+
     @_trace_cosmosdb("find_one")
     def read_document(self, query: dict[str, Any]) -> dict[str, Any] | None:
         """
@@ -31,6 +31,9 @@ logger = get_logger(__name__)
 
 ClientType = Literal["dashboard", "conversation", "media", "other"]
 
+# Shares the session channel prefix so the existing subscription receives it
+_CONTROL_CHANNEL = "_control"
+
 
 @dataclass
 class ConnectionMeta:
@@ -236,6 +239,7 @@ class ThreadSafeConnectionManager:
         self._redis_listener_task: asyncio.Task | None = None
         self._redis_listener_stop: asyncio.Event | None = None
         self._redis_pubsub = None
+        self._control_handlers: dict[str, list[Callable[[dict[str, Any]], None]]] = {}
 
         # Out-of-band per-call context (for pre-initialized resources before WS exists)
         # Example: { call_id: { "lva_agent": <agent>, "pool": <pool>, "session_id": str, ... } }
@@ -629,6 +633,52 @@ class ThreadSafeConnectionManager:
             )
             return False
 
+    def add_control_handler(
+        self, topic: str, handler: Callable[[dict[str, Any]], None]
+    ) -> None:
+        """
+        Receive control messages published by other replicas on ``topic``.
+
+        Handlers run on the event loop and must not block. Messages published
+        by this node are not delivered back to it.
+        """
+        self._control_handlers.setdefault(topic, []).append(handler)
+
+    async def publish_control(self, topic: str, data: dict[str, Any]) -> bool:
+        """Publish a control message (e.g. cache invalidation) to other replicas."""
+        if not self._redis_mgr:
+            return False
+
+        serialized = json.dumps(
+            {
+                "control": topic,
+                "data": data,
+                "origin": self._node_id,
+                "published_at": time.time(),
+            }
+        )
+        try:
+            await self._redis_mgr.publish_channel_async(
+                self._session_channel_name(_CONTROL_CHANNEL), serialized
+            )
+            return True
+        except Exception as exc:  # noqa: BLE001
+            logger.warning(
+                "Distributed control publish failed",
+                extra={"topic": topic, "error": str(exc)},
+            )
+            return False
+
+    def _dispatch_control(self, topic: str, data: Any) -> None:
+        for handler in self._control_handlers.get(topic, ()):
+            try:
+                handler(data if isinstance(data, dict) else {})
+            except Exception as exc:  # noqa: BLE001
+                logger.error(
+                    "Distributed control handler failed",
+                    extra={"topic": topic, "error": str(exc)},
+                )
+
     async def _safe_send_to_connection(self, conn: "_Connection", payload: dict[str, Any]) -> None:
         """Safely send to a connection with proper error handling."""
         try:
@@ -761,6 +811,10 @@ class ThreadSafeConnectionManager:
                 if payload.get("origin") == self._node_id:
                     continue
 
+                if "control" in payload:
+                    self._dispatch_control(payload["control"], payload.get("data"))
+                    continue
+
                 session_id = payload.get("session_id")
                 envelope = payload.get("envelope")
                 if not session_id or not isinstance(envelope, dict):
@@ -1,10 +1,13 @@
 import asyncio
 import datetime
+from typing import Any
 
 from pymongo.errors import NetworkTimeout
 from utils.ml_logging import get_logger
 
 from src.cosmosdb.manager import CosmosDBMongoCoreManager
+from src.postcall.sketch import QuantileSketch
+from src.postcall.writer import AnalyticsWriter
 from src.stateful.state_managment import MemoManager
 
 logger = get_logger("postcall_analytics")
@@ -18,38 +21,55 @@ def _connectivity_hint(cosmos: CosmosDBMongoCoreManager) -> str:
     return f"nc -vz {primary_host} 10260"
 
 
-async def build_and_flush(cm: MemoManager, cosmos: CosmosDBMongoCoreManager):
-    """
-    Build analytics document from conversation manager and asynchronously upsert into
-    Cosmos DB (MongoDB API, _id = session_id). Executes the write on a worker thread to
-    avoid blocking the event loop and adds guidance when connectivity fails.
-    """
+def summarize_latency(raw_lat: dict[str, list[dict[str, Any]]]) -> dict[str, dict[str, Any]]:
+    """Per-stage count/avg/min/max plus p50/p90/p99 from a fixed-memory sketch."""
+    summary = {}
+    for stage, entries in raw_lat.items():
+        sketch = QuantileSketch()
+        sketch.extend(e["dur"] for e in entries if "dur" in e)
+        summary[stage] = sketch.summary()
+    return summary
+
+
+def build_analytics_document(cm: MemoManager) -> dict[str, Any]:
+    """Build the analytics document for a session (``_id`` = session_id)."""
     session_id = cm.session_id
     histories = cm.histories
     context = cm.context.copy()
     raw_lat = context.pop("latency_roundtrip", {})
 
-    summary = {}
-    for stage, entries in raw_lat.items():
-        durations = [e.get("dur", 0.0) for e in entries if "dur" in e]
-        count = len(durations)
-        summary[stage] = {
-            "count": count,
-            "avg": sum(durations) / count if count else 0.0,
-            "min": min(durations) if count else 0.0,
-            "max": max(durations) if count else 0.0,
-        }
-
-    doc = {
+    return {
         "_id": session_id,
         "session_id": session_id,
         "timestamp": datetime.datetime.utcnow().replace(microsecond=0).isoformat() + "Z",
         "histories": histories,
         "context": context,
-        "latency_summary": summary,
+        "latency_summary": summarize_latency(raw_lat),
         "agents": list(histories.keys()),
     }
 
+
+async def build_and_flush(
+    cm: MemoManager,
+    cosmos: CosmosDBMongoCoreManager,
+    writer: AnalyticsWriter | None = None,
+):
+    """
+    Build analytics document from conversation manager and persist it to Cosmos DB
+    (MongoDB API, _id = session_id).
+
+    With a running ``writer`` the document is queued for a batched background write
+    and this returns immediately. Otherwise it is upserted directly on a worker thread,
+    with guidance when connectivity fails.
+    """
+    doc = build_analytics_document(cm)
+    session_id = doc["_id"]
+
+    if writer is not None:
+        if writer.submit(doc):
+            logger.debug(f"Analytics document queued for session {session_id}")
+        return
+
     try:
         await asyncio.to_thread(cosmos.upsert_document, document=doc, query={"_id": session_id})
         logger.info(f"Analytics document upserted for session {session_id}")
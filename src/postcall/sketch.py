@@ -0,0 +1,107 @@
+"""
+Fixed-memory latency quantile sketch for post-call analytics.
+
+Values are counted in logarithmic buckets, so any quantile is reported
+within ``relative_accuracy`` of the true value (DDSketch-style). When more
+than ``max_buckets`` buckets are in use the lowest ones are merged, which
+keeps memory bounded and the upper percentiles (what latency reviews look
+at) accurate.
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Iterable
+from typing import Any
+
+_MIN_POSITIVE = 1e-9
+
+
+class QuantileSketch:
+    """Streaming count/sum/min/max plus approximate quantiles in bounded memory."""
+
+    __slots__ = ("_gamma", "_log_gamma", "_max_buckets", "_buckets", "_zeros", "count", "total", "min", "max")
+
+    def __init__(self, relative_accuracy: float = 0.01, max_buckets: int = 512) -> None:
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be between 0 and 1")
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._max_buckets = max_buckets
+        self._buckets: dict[int, int] = {}
+        self._zeros = 0
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, value: float) -> None:
+        value = float(value)
+        self.count += 1
+        self.total += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+        if value <= _MIN_POSITIVE:
+            self._zeros += 1
+            return
+        key = math.ceil(math.log(value) / self._log_gamma)
+        self._buckets[key] = self._buckets.get(key, 0) + 1
+        if len(self._buckets) > self._max_buckets:
+            self._collapse()
+
+    def extend(self, values: Iterable[float]) -> None:
+        for value in values:
+            self.add(value)
+
+    def _collapse(self) -> None:
+        lowest, second = sorted(self._buckets)[:2]
+        self._buckets[second] += self._buckets.pop(lowest)
+
+    def merge(self, other: QuantileSketch) -> None:
+        """Fold another sketch with the same accuracy into this one."""
+        if other._gamma != self._gamma:
+            raise ValueError("Cannot merge sketches with different accuracy")
+        for key, n in other._buckets.items():
+            self._buckets[key] = self._buckets.get(key, 0) + n
+        while len(self._buckets) > self._max_buckets:
+            self._collapse()
+        self._zeros += other._zeros
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def quantile(self, q: float) -> float:
+        """Approximate value at quantile ``q`` (0..1); 0.0 when empty."""
+        if not self.count:
+            return 0.0
+        rank = q * (self.count - 1)
+        seen = self._zeros
+        if rank < seen:
+            return max(self.min, 0.0)
+        for key in sorted(self._buckets):
+            seen += self._buckets[key]
+            if rank < seen:
+                estimate = 2 * self._gamma**key / (self._gamma + 1)
+                return min(max(estimate, self.min), self.max)
+        return self.max
+
+    def summary(self) -> dict[str, Any]:
+        """Summary in the shape stored on analytics documents."""
+        if not self.count:
+            return {"count": 0, "avg": 0.0, "min": 0.0, "max": 0.0, "p50": 0.0, "p90": 0.0, "p99": 0.0}
+        return {
+            "count": self.count,
+            "avg": self.total / self.count,
+            "min": self.min,
+            "max": self.max,
+            "p50": self.quantile(0.50),
+            "p90": self.quantile(0.90),
+            "p99": self.quantile(0.99),
+        }
+
+
+__all__ = ["QuantileSketch"]
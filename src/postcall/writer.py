@@ -0,0 +1,301 @@
+"""
+Queued, batched writer for post-call analytics documents.
+
+Hangups enqueue their analytics document and return immediately. A single
+background task groups queued documents into ``bulk_write`` batches, flushed
+when ``batch_size`` documents are waiting or the oldest has waited
+``max_batch_age_s``. Failed batches are retried with exponential backoff and
+jitter.
+
+Nothing is dropped silently:
+
+- when the queue is full, documents are appended to a JSON-lines spill file;
+- batches that still fail after all retries are spilled too;
+- spilled documents are replayed on the next ``start()``;
+- ``stop()`` drains the queue before returning, spilling whatever is left
+  if the drain times out.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import random
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from utils.ml_logging import get_logger
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from src.cosmosdb.manager import CosmosDBMongoCoreManager
+
+logger = get_logger("postcall_analytics.writer")
+
+_STOP = object()
+
+
+class AnalyticsWriter:
+    """Bounded analytics queue drained by a background bulk writer."""
+
+    def __init__(
+        self,
+        cosmos: CosmosDBMongoCoreManager,
+        *,
+        max_queue: int = 1000,
+        batch_size: int = 50,
+        max_batch_age_s: float = 1.0,
+        max_retries: int = 4,
+        retry_base_s: float = 0.25,
+        spill_path: str | os.PathLike[str] | None = None,
+    ) -> None:
+        self._cosmos = cosmos
+        self._queue: asyncio.Queue[Any] = asyncio.Queue(maxsize=max_queue)
+        self._batch_size = max(1, batch_size)
+        self._max_batch_age_s = max_batch_age_s
+        self._max_retries = max_retries
+        self._retry_base_s = retry_base_s
+        self._spill_path = Path(spill_path) if spill_path else None
+        self._task: asyncio.Task | None = None
+        self._closed = False
+
+        self.submitted = 0
+        self.written = 0
+        self.batches = 0
+        self.retries = 0
+        self.spilled = 0
+        self.replayed = 0
+        self.dropped = 0
+
+    # ------------------------------------------------------------------ #
+    # Producer side
+    # ------------------------------------------------------------------ #
+
+    def submit(self, document: dict[str, Any]) -> bool:
+        """
+        Queue a document for writing without blocking.
+
+        Returns False only if the document could be neither queued nor
+        spilled (queue full and no spill path configured).
+        """
+        self.submitted += 1
+        if not self._closed:
+            try:
+                self._queue.put_nowait((time.monotonic(), document))
+                return True
+            except asyncio.QueueFull:
+                pass
+        if self._spill([document]):
+            return True
+        self.dropped += 1
+        logger.error("Analytics queue full; dropped document %s", document.get("_id"))
+        return False
+
+    # ------------------------------------------------------------------ #
+    # Lifecycle
+    # ------------------------------------------------------------------ #
+
+    def start(self) -> None:
+        """Replay spilled documents and start the background writer."""
+        if self._task is not None:
+            return
+        self._closed = False
+        self._task = asyncio.create_task(self._run(), name="postcall-analytics-writer")
+
+    async def stop(self, timeout: float = 10.0) -> None:
+        """Stop accepting documents and drain the queue."""
+        self._closed = True
+        if self._task is None:
+            return
+        try:
+            self._queue.put_nowait(_STOP)
+        except asyncio.QueueFull:
+            pass  # the loop exits once it has drained the full queue
+        try:
+            await asyncio.wait_for(self._task, timeout)
+        except TimeoutError:
+            logger.warning("Analytics writer drain timed out; spilling remaining documents")
+        finally:
+            self._task = None
+            self._spill(self._drain_nowait())
+
+    # ------------------------------------------------------------------ #
+    # Writer loop
+    # ------------------------------------------------------------------ #
+
+    async def _run(self) -> None:
+        await self._replay_spill()
+        loop = asyncio.get_running_loop()
+        while True:
+            item = await self._queue.get()
+            if item is _STOP:
+                if self._queue.empty():
+                    return
+                continue
+            enqueued_at, document = item
+            batch = [document]
+            stopping = False
+            deadline = loop.time() + max(0.0, self._max_batch_age_s - (time.monotonic() - enqueued_at))
+            while len(batch) < self._batch_size:
+                if self._queue.empty():
+                    if self._closed:
+                        break
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+                    item = await self._get_within(remaining)
+                    if item is None:
+                        break
+                else:
+                    item = self._queue.get_nowait()
+                if item is _STOP:
+                    stopping = True
+                    continue
+                batch.append(item[1])
+
+            await self._write_batch(batch)
+            if (stopping or self._closed) and self._queue.empty():
+                return
+
+    async def _get_within(self, timeout: float) -> Any | None:
+        # Not asyncio.wait_for: on Python < 3.12 it can drop an item that was
+        # dequeued at the same moment the timeout fired
+        getter = asyncio.ensure_future(self._queue.get())
+        try:
+            done, _ = await asyncio.wait({getter}, timeout=timeout)
+        except asyncio.CancelledError:
+            if not getter.done():
+                getter.cancel()
+            elif not getter.cancelled() and getter.result() is not _STOP:
+                self._spill([getter.result()[1]])
+            raise
+        if done:
+            return getter.result()
+        getter.cancel()
+        try:
+            return await getter
+        except asyncio.CancelledError:
+            return None
+
+    async def _write_batch(self, batch: list[dict[str, Any]]) -> None:
+        # Last write wins within a batch, matching per-document upserts
+        documents = list({doc["_id"]: doc for doc in batch}.values())
+        try:
+            for attempt in range(self._max_retries + 1):
+                try:
+                    await asyncio.to_thread(self._cosmos.bulk_upsert_documents, documents)
+                    self.written += len(batch)
+                    self.batches += 1
+                    return
+                except Exception as exc:
+                    if attempt == self._max_retries:
+                        logger.error(
+                            "Analytics batch of %d failed after %d attempts; spilling: %s",
+                            len(documents),
+                            attempt + 1,
+                            exc,
+                        )
+                        self._spill(documents)
+                        return
+                    self.retries += 1
+                    delay = self._retry_base_s * (2**attempt) * random.uniform(0.5, 1.5)
+                    logger.warning(
+                        "Analytics batch write failed (attempt %d); retrying in %.2fs: %s",
+                        attempt + 1,
+                        delay,
+                        exc,
+                    )
+                    await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            # Stop timed out mid-write; keep the batch for the next start
+            self._spill(documents)
+            raise
+
+    def _drain_nowait(self) -> list[dict[str, Any]]:
+        documents = []
+        while not self._queue.empty():
+            item = self._queue.get_nowait()
+            if item is not _STOP:
+                documents.append(item[1])
+        return documents
+
+    # ------------------------------------------------------------------ #
+    # Spill file
+    # ------------------------------------------------------------------ #
+
+    def _spill(self, documents: list[dict[str, Any]]) -> bool:
+        if not documents:
+            return True
+        if self._spill_path is None:
+            return False
+        try:
+            self._spill_path.parent.mkdir(parents=True, exist_ok=True)
+            with self._spill_path.open("a", encoding="utf-8") as f:
+                for document in documents:
+                    f.write(json.dumps(document, default=str) + "\n")
+        except OSError as exc:
+            logger.error("Failed to spill %d analytics documents: %s", len(documents), exc)
+            return False
+        self.spilled += len(documents)
+        return True
+
+    def _claim_spill(self) -> Path | None:
+        """Move the spill file aside so new spills start a fresh file."""
+        if self._spill_path is None:
+            return None
+        claimed = self._spill_path.with_name(self._spill_path.name + ".replay")
+        if claimed.exists():
+            return claimed  # left over from an interrupted replay
+        if not self._spill_path.exists():
+            return None
+        try:
+            os.replace(self._spill_path, claimed)
+        except OSError as exc:
+            logger.warning("Failed to claim analytics spill file: %s", exc)
+            return None
+        return claimed
+
+    @staticmethod
+    def _read_spill(path: Path) -> list[dict[str, Any]]:
+        try:
+            lines = path.read_text(encoding="utf-8").splitlines()
+            path.unlink()
+        except OSError as exc:
+            logger.warning("Failed to read analytics spill file: %s", exc)
+            return []
+        return [json.loads(line) for line in lines if line.strip()]
+
+    async def _replay_spill(self) -> None:
+        # Claimed on the event loop, where submit() spills, so no append can
+        # land between reading the file and removing it
+        claimed = self._claim_spill()
+        if claimed is None:
+            return
+        # Written straight to Cosmos in batches so a large spill file never
+        # competes with live hangups for queue slots
+        documents = await asyncio.to_thread(self._read_spill, claimed)
+        for i in range(0, len(documents), self._batch_size):
+            try:
+                await self._write_batch(documents[i : i + self._batch_size])
+            except asyncio.CancelledError:
+                self._spill(documents[i + self._batch_size :])
+                raise
+        if documents:
+            self.replayed += len(documents)
+            logger.info("Replayed %d spilled analytics documents", len(documents))
+
+    def get_stats(self) -> dict[str, int]:
+        return {
+            "queued": self._queue.qsize(),
+            "submitted": self.submitted,
+            "written": self.written,
+            "batches": self.batches,
+            "retries": self.retries,
+            "spilled": self.spilled,
+            "replayed": self.replayed,
+            "dropped": self.dropped,
+        }
+
+
+__all__ = ["AnalyticsWriter"]
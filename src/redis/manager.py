@@ -18,6 +18,7 @@ from redis.exceptions import (
 from redis.exceptions import ConnectionError as RedisConnectionError
 from utils.azure_auth import get_credential
 from utils.ml_logging import get_logger
+from utils.token_broker import get_token_broker
 
 import redis
 from src.enums.monitoring import PeerService, SpanAttr
@@ -95,6 +96,10 @@ class AzureRedisManager:
 
         # AAD credential details
         self.credential = credential or get_credential()
+        # The shared broker keeps the default credential's token fresh ahead of expiry
+        self._token_broker = (
+            get_token_broker() if credential is None and not self.access_key else None
+        )
         self.scope = scope or os.getenv("REDIS_SCOPE") or "https://redis.azure.com/.default"
         self.user_name = user_name or os.getenv("REDIS_USER_NAME") or "user"
         self._auth_expires_at = 0  # For AAD token refresh tracking
@@ -270,7 +275,10 @@ class AzureRedisManager:
         if self.access_key:
             auth_kwargs = {"password": self.access_key}
         else:
-            token = self.credential.get_token(self.scope)
+            if self._token_broker is not None:
+                token = self._token_broker.get_token(self.scope)
+            else:
+                token = self.credential.get_token(self.scope)
             self.token_expiry = token.expires_on
             auth_kwargs = {"username": self.user_name, "password": token.token}
 
@@ -448,6 +456,22 @@ class AzureRedisManager:
 
         return self._execute_with_retry("HSET_FIELD", _hset_field_operation)
 
+    def increment_hash_fields(self, key: str, increments: dict[str, int]) -> dict[str, int]:
+        """HINCRBY several fields of a hash in one round trip; returns the new values."""
+        fields = [(field, int(amount)) for field, amount in increments.items() if amount]
+        if not fields:
+            return {}
+
+        def _hincrby_operation():
+            with self._redis_span("Redis.HINCRBY"):
+                pipe = self.redis_client.pipeline(transaction=False)
+                for field, amount in fields:
+                    pipe.hincrby(key, field, amount)
+                return dict(zip((field for field, _ in fields), pipe.execute(), strict=True))
+
+        # Increments are not idempotent: no blind retry, callers re-apply on failure
+        return self._execute_with_retry("HINCRBY", _hincrby_operation, retries=0)
+
     def delete_session(self, session_id: str) -> int:
         """Delete a session from Redis."""
 
@@ -505,6 +529,13 @@ class AzureRedisManager:
             self.logger.error(f"Error in update_session_field_async for session {session_id}: {e}")
             return False
 
+    async def increment_hash_fields_async(
+        self, key: str, increments: dict[str, int]
+    ) -> dict[str, int]:
+        """Async version of increment_hash_fields; raises so callers can re-apply."""
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(None, self.increment_hash_fields, key, increments)
+
     async def delete_session_async(self, session_id: str) -> int:
         """Async version of delete_session using thread pool executor."""
         try:
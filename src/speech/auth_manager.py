@@ -1,40 +1,42 @@
 """Azure Speech authentication helpers.
 
-Provides a shared token manager that wraps the repo's credential helper and
-applies Azure AD tokens to Speech SDK configurations with proper refresh and
-thread-safety. This centralises AAD token handling for both TTS and STT flows.
+Provides a shared token manager that applies Azure AD tokens to Speech SDK
+configurations. Tokens come from the process-wide :class:`TokenBroker`, which
+refreshes them in the background, so building a synthesizer or recognizer
+never waits on the identity endpoint. This centralises AAD token handling for
+both TTS and STT flows.
 """
 
 from __future__ import annotations
 
 import os
-import threading
-import time
 from functools import lru_cache
 
 import azure.cognitiveservices.speech as speechsdk
 from azure.core.credentials import AccessToken, TokenCredential
 from utils.azure_auth import get_credential
 from utils.ml_logging import get_logger
+from utils.token_broker import TokenBroker, get_token_broker
 
 logger = get_logger(__name__)
 
 # Speech service scope for Azure AD tokens
 _SPEECH_SCOPE = "https://cognitiveservices.azure.com/.default"
-# Refresh the cached token a little before it actually expires
-_REFRESH_SKEW_SECONDS = 120
 
 
 class SpeechTokenManager:
     """Caches Azure AD tokens and applies them to Speech SDK configs."""
 
-    def __init__(self, credential: TokenCredential, resource_id: str) -> None:
+    def __init__(
+        self,
+        credential: TokenCredential,
+        resource_id: str,
+        broker: TokenBroker | None = None,
+    ) -> None:
         if not resource_id:
             raise ValueError("AZURE_SPEECH_RESOURCE_ID is required for Azure AD authentication")
-        self._credential = credential
         self._resource_id = resource_id
-        self._token_lock = threading.Lock()
-        self._cached_token: AccessToken | None = None
+        self._broker = broker or TokenBroker(credential)
         self._warmed: bool = False
 
     @property
@@ -46,29 +48,23 @@ class SpeechTokenManager:
         """Return True if token has been pre-fetched."""
         return self._warmed
 
-    def _needs_refresh(self) -> bool:
-        if not self._cached_token:
-            return True
-        expiry_buffer = self._cached_token.expires_on - _REFRESH_SKEW_SECONDS
-        return time.time() >= expiry_buffer
-
     def get_token(self, force_refresh: bool = False) -> AccessToken:
-        """Return a valid Azure AD token, refreshing if required."""
-        with self._token_lock:
-            if force_refresh or self._needs_refresh():
-                logger.debug("Fetching new Azure Speech AAD token")
-                token = self._credential.get_token(_SPEECH_SCOPE)
-                self._cached_token = token
-            token = self._cached_token
-            if token is None:
-                raise RuntimeError("Failed to obtain Azure Speech token")
-            return token
+        """
+        Return a valid Azure AD token.
+
+        The cached token is served without locking; ``force_refresh`` (e.g.
+        after an auth failure) fetches a new one, shared by concurrent callers.
+        """
+        if force_refresh:
+            return self._broker.force_refresh(_SPEECH_SCOPE)
+        return self._broker.get_token(_SPEECH_SCOPE)
 
     def warm_token(self) -> bool:
         """
         Pre-fetch token during startup to avoid first-call latency.
 
-        Eliminates 100-300ms token acquisition latency on first Speech API call.
+        Eliminates 100-300ms token acquisition latency on first Speech API call
+        and registers the Speech scope for background refresh.
 
         Returns:
             True if token was successfully pre-fetched, False otherwise.
@@ -108,4 +104,6 @@ def get_speech_token_manager() -> SpeechTokenManager:
     resource_id = os.getenv("AZURE_SPEECH_RESOURCE_ID")
     if not resource_id:
         raise ValueError("AZURE_SPEECH_RESOURCE_ID must be set when using Azure AD authentication")
-    return SpeechTokenManager(credential=credential, resource_id=resource_id)
+    return SpeechTokenManager(
+        credential=credential, resource_id=resource_id, broker=get_token_broker()
+    )
@@ -841,7 +841,7 @@ class SpeechSynthesizer:
 
             try:
                 token_manager = get_speech_token_manager()
-                token_manager.apply_to_config(speech_config, force_refresh=True)
+                token_manager.apply_to_config(speech_config)
                 self._token_manager = token_manager
                 logger.debug("Successfully applied Azure AD token to SpeechConfig")
             except Exception as e:
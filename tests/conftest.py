@@ -39,6 +39,22 @@ if "config" not in sys.modules:
     config_mock.STOP_WORDS = ["stop", "cancel", "nevermind"]
     config_mock.DEFAULT_TTS_VOICE = "en-US-JennyNeural"
     config_mock.STT_PROCESSING_TIMEOUT = 5.0
+    config_mock.STT_INGEST_COALESCE_MS = 80
+    config_mock.HEALTH_MONITOR_INTERVAL = 2.0
+    config_mock.LOOP_LAG_INTERVAL_MS = 100
+    config_mock.SLOW_CALLBACK_THRESHOLD_MS = 100
+    config_mock.DEFAULT_EXECUTOR_WORKERS = 0
+    config_mock.SPEECH_EXECUTOR_WORKERS = 0
+    config_mock.POOL_SIZE_TTS = 50
+    config_mock.SPECULATIVE_TURN_ENABLED = False
+    config_mock.SPECULATIVE_TURN_STABILITY_MS = 300
+    config_mock.SPECULATIVE_TURN_EOU_STABILITY_MS = 120
+    config_mock.SPECULATIVE_TURN_MIN_CHARS = 8
+    config_mock.CASCADE_HISTORY_MAX_TOKENS = 6000
+    config_mock.CASCADE_HISTORY_MIN_TURNS = 4
+    config_mock.CASCADE_HISTORY_MAX_TURNS = 20
+    config_mock.CASCADE_HISTORY_SUMMARY_ENABLED = False
+    config_mock.CASCADE_HISTORY_TRIM_WITHOUT_SUMMARY = False
     config_mock.DEFAULT_VOICE_RATE = "+0%"
     config_mock.DEFAULT_VOICE_STYLE = "chat"
     config_mock.GREETING_VOICE_TTS = "en-US-JennyNeural"
@@ -47,6 +63,8 @@ if "config" not in sys.modules:
     config_mock.TTS_END = ["."]
     config_mock.DTMF_VALIDATION_ENABLED = False
     config_mock.ENABLE_ACS_CALL_RECORDING = False
+    config_mock.ACS_EVENT_MAX_CONCURRENCY = 16
+    config_mock.ACS_EVENT_SIDE_EFFECT_RETRIES = 3
     # ACS settings
     config_mock.ACS_CALL_CALLBACK_PATH = "/api/v1/calls/callback"
     config_mock.ACS_CONNECTION_STRING = "test-connection-string"
@@ -55,6 +73,12 @@ if "config" not in sys.modules:
     config_mock.ACS_WEBSOCKET_PATH = "/api/v1/media/stream"
     config_mock.AZURE_SPEECH_ENDPOINT = "https://test.cognitiveservices.azure.com"
     config_mock.AZURE_STORAGE_CONTAINER_URL = "https://test.blob.core.windows.net/container"
+    config_mock.CUSTOMER_CONTEXT_DURABILITY = "write_behind"
+    config_mock.CUSTOMER_CONTEXT_FLUSH_INTERVAL_MS = 2000
+    config_mock.ANALYTICS_QUEUE_SIZE = 1000
+    config_mock.ANALYTICS_BATCH_SIZE = 50
+    config_mock.ANALYTICS_FLUSH_INTERVAL_MS = 1000
+    config_mock.ANALYTICS_SPILL_DIR = ""
     config_mock.BASE_URL = "https://test.example.com"
     # Azure settings
     config_mock.AZURE_CLIENT_ID = "test-client-id"
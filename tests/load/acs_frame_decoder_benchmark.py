@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+ACS Frame Decoder Benchmark
+
+Compares the per-frame cost of the media WebSocket loop before and after the
+fast-path decoder:
+
+- legacy:   ``json.loads`` + dict lookups + ``base64.b64decode`` (cascade)
+- fastpath: ``decode_acs_frame`` + ``base64.b64decode`` (cascade)
+- forward:  ``decode_acs_frame`` only, silent frames dropped (VoiceLive)
+
+Usage:
+    python -m tests.load.acs_frame_decoder_benchmark
+    python -m tests.load.acs_frame_decoder_benchmark --frames captured_frames.txt --repeat 20
+
+Capture file format: one raw ACS WebSocket text frame per line, as received
+by ``/api/v1/media/stream``. Without a capture, 20 ms 16 kHz PCM frames are
+synthesized with the ACS envelope and ~30% silence.
+"""
+
+import argparse
+import base64
+import json
+import os
+import random
+import time
+from pathlib import Path
+
+from apps.artagent.backend.voice.shared.acs_frames import AUDIO_DATA_KIND, decode_acs_frame
+
+FRAME_BYTES = 640  # 20 ms of 16 kHz PCM16 mono
+
+
+def synthesize_frames(count: int, silent_ratio: float = 0.3) -> list[str]:
+    """Build ACS AudioData frames with the same shape ACS sends."""
+    rng = random.Random(7)
+    silence = base64.b64encode(bytes(FRAME_BYTES)).decode()
+    frames = [
+        json.dumps(
+            {
+                "kind": "AudioMetadata",
+                "audioMetadata": {
+                    "subscriptionId": "sub",
+                    "encoding": "PCM",
+                    "sampleRate": 16000,
+                    "channels": 1,
+                    "length": FRAME_BYTES,
+                },
+            },
+            separators=(",", ":"),
+        )
+    ]
+    for i in range(count):
+        silent = rng.random() < silent_ratio
+        frames.append(
+            json.dumps(
+                {
+                    "kind": "AudioData",
+                    "audioData": {
+                        "timestamp": f"2024-05-01T12:00:{i // 50 % 60:02d}.{i % 50 * 20:03d}Z",
+                        "participantRawID": "8:acs:00000000-0000-0000-0000-000000000000",
+                        "data": silence if silent else base64.b64encode(os.urandom(FRAME_BYTES)).decode(),
+                        "silent": silent,
+                    },
+                },
+                separators=(",", ":"),
+            )
+        )
+    return frames
+
+
+def load_frames(path: Path | None, count: int) -> list[str]:
+    if path is None:
+        return synthesize_frames(count)
+    with path.open() as f:
+        return [line.rstrip("\n") for line in f if line.strip()]
+
+
+def legacy(frames: list[str]) -> int:
+    written = 0
+    for text in frames:
+        message = json.loads(text)
+        if message.get("kind") == AUDIO_DATA_KIND:
+            section = message.get("audioData", {}) or {}
+            data = section.get("data")
+            if data:
+                written += len(base64.b64decode(data))
+    return written
+
+
+def fastpath(frames: list[str]) -> int:
+    written = 0
+    for text in frames:
+        frame = decode_acs_frame(text)
+        if frame is not None and frame.kind == AUDIO_DATA_KIND and frame.data:
+            written += len(base64.b64decode(frame.data))
+    return written
+
+
+def forward(frames: list[str]) -> int:
+    forwarded = 0
+    for text in frames:
+        frame = decode_acs_frame(text)
+        if frame is not None and frame.kind == AUDIO_DATA_KIND and not frame.silent and frame.data:
+            forwarded += len(frame.data)
+    return forwarded
+
+
+def run_benchmark(frames: list[str], repeat: int) -> dict[str, float]:
+    results = {}
+    for name, func in (("legacy", legacy), ("fastpath", fastpath), ("forward", forward)):
+        start = time.perf_counter()
+        for _ in range(repeat):
+            func(frames)
+        results[name] = (time.perf_counter() - start) / (repeat * len(frames)) * 1e6
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark ACS media frame decoding")
+    parser.add_argument("--frames", type=Path, help="Captured frames, one per line")
+    parser.add_argument("--count", type=int, default=3000, help="Synthetic frames (60 s of audio)")
+    parser.add_argument("--repeat", type=int, default=10, help="Passes over the frame set")
+    args = parser.parse_args()
+
+    frames = load_frames(args.frames, args.count)
+    results = run_benchmark(frames, args.repeat)
+
+    print(f"Frames: {len(frames)}  repeat: {args.repeat}")
+    baseline = results["legacy"]
+    for name, us in results.items():
+        # 50 frames/s per call: us/frame * 50 = us of loop time per call-second
+        print(
+            f"{name:>9}: {us:6.2f} us/frame  {us * 50 / 1000:6.3f} ms/call-second  "
+            f"speedup x{baseline / us:.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Blob Upload Benchmark
+
+Uploads a synthetic 1-hour call recording (16 kHz mono PCM16, ~115 MB) to a
+fake blob service that models per-request latency and per-connection
+bandwidth, and reports peak RSS and throughput for:
+
+- legacy:   read the whole file, then one ``upload_blob`` (previous
+            ``save_wav_to_blob``)
+- pipeline: ``BlobUploadPipeline.upload_file`` with staged blocks
+- live:     ``LiveWavUpload`` fed 20 ms frames as if the call were live
+
+Each mode runs in a fresh subprocess so peak RSS is not shared; ``baseline``
+only imports the modules, for reference.
+
+Usage:
+    python -m tests.load.blob_upload_benchmark
+    python -m tests.load.blob_upload_benchmark --minutes 60 --block-mb 4 --parallel 4
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+from src.blob.upload import BlobUploadPipeline
+
+SAMPLE_RATE = 16000
+BYTES_PER_SECOND = SAMPLE_RATE * 2
+
+
+class FakeBlobClient:
+    """Requests cost a fixed latency plus size / per-connection bandwidth."""
+
+    def __init__(self, latency_s: float = 0.005, bandwidth_mb_s: float = 100.0):
+        self.latency_s = latency_s
+        self.bandwidth = bandwidth_mb_s * 1024 * 1024
+        self.size = 0
+        self.requests = 0
+
+    async def _transfer(self, n: int) -> None:
+        self.requests += 1
+        await asyncio.sleep(self.latency_s + n / self.bandwidth)
+
+    async def upload_blob(self, data, **kwargs):
+        await self._transfer(len(data))
+        self.size = len(data)
+
+    async def stage_block(self, block_id, data, length=None):
+        await self._transfer(len(data))
+        self.size += len(data)
+
+    async def commit_block_list(self, block_list, **kwargs):
+        await self._transfer(0)
+
+
+def write_recording(path: str, minutes: float) -> int:
+    frame = bytes(range(256)) * 125  # 1 s of PCM16 at 16 kHz
+    total = int(minutes * 60)
+    with open(path, "wb") as f:
+        for _ in range(total):
+            f.write(frame)
+    return total * len(frame)
+
+
+async def run_mode(mode: str, path: str, block_size: int, parallel: int) -> dict:
+    client = FakeBlobClient()
+    pipeline = BlobUploadPipeline(block_size=block_size, max_block_concurrency=parallel)
+    start = time.perf_counter()
+    if mode == "baseline":
+        pass
+    elif mode == "legacy":
+        with open(path, "rb") as f:
+            data = f.read()
+        await client.upload_blob(data, overwrite=True)
+    elif mode == "pipeline":
+        await pipeline.upload_file(client, path)
+    else:
+        upload = pipeline.live_wav(client, sample_rate=SAMPLE_RATE)
+        frame_bytes = BYTES_PER_SECOND // 50
+        with open(path, "rb") as f:
+            while frame := f.read(frame_bytes):
+                await upload.write(frame)
+        await upload.finish()
+    elapsed = time.perf_counter() - start
+    peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return {"elapsed": elapsed, "peak_mb": peak_kb / 1024, "size": client.size, "requests": client.requests}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark chunked blob uploads")
+    parser.add_argument("--minutes", type=float, default=60, help="Recording length")
+    parser.add_argument("--block-mb", type=float, default=4, help="Block size in MiB")
+    parser.add_argument("--parallel", type=int, default=4, help="Blocks staged in parallel")
+    parser.add_argument("--mode", help=argparse.SUPPRESS)
+    parser.add_argument("--path", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    block_size = int(args.block_mb * 1024 * 1024)
+
+    if args.mode:
+        print(json.dumps(asyncio.run(run_mode(args.mode, args.path, block_size, args.parallel))))
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "call.pcm")
+        size = write_recording(path, args.minutes)
+        print(f"Recording: {args.minutes:.0f} min, {size / 1024 / 1024:.1f} MiB  block {args.block_mb} MiB  parallel {args.parallel}")
+        for mode in ("baseline", "legacy", "pipeline", "live"):
+            out = subprocess.run(
+                [sys.executable, "-m", "tests.load.blob_upload_benchmark", "--mode", mode, "--path", path,
+                 "--block-mb", str(args.block_mb), "--parallel", str(args.parallel)],
+                capture_output=True, text=True, check=True,
+            ).stdout.strip().splitlines()[-1]
+            r = json.loads(out)
+            if mode == "baseline":
+                print(f"{mode:>9}: peak RSS {r['peak_mb']:7.1f} MiB")
+                continue
+            print(
+                f"{mode:>9}: peak RSS {r['peak_mb']:7.1f} MiB  {r['elapsed']:6.2f} s  "
+                f"{r['size'] / 1024 / 1024 / r['elapsed']:7.1f} MiB/s  requests {r['requests']:4d}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Embedding Service Benchmark
+
+Replays a stream of FAQ-style queries (many repeated phrasings) from
+concurrent callers against a fake embeddings API with fixed latency:
+
+- direct:  one embeddings request per query (legacy ``generate_embedding``)
+- service: ``EmbeddingService`` micro-batching, in-flight de-dup and LRU
+
+Usage:
+    python -m tests.load.embedding_service_benchmark
+    python -m tests.load.embedding_service_benchmark --queries 2000 --distinct 100 --callers 20
+"""
+
+import argparse
+import asyncio
+import logging
+import random
+import statistics
+import time
+
+from src.aoai.embeddings import EmbeddingService
+
+
+class FakeEmbeddingsAPI:
+    def __init__(self, latency_s: float, dims: int = 1536):
+        self.latency_s = latency_s
+        self.dims = dims
+        self.requests = 0
+        self.inputs = 0
+
+    async def __call__(self, texts, model):
+        self.requests += 1
+        self.inputs += len(texts)
+        await asyncio.sleep(self.latency_s)
+        return [[float(len(t))] * self.dims for t in texts]
+
+
+async def run(name: str, queries: list[str], callers: int, latency_s: float):
+    api = FakeEmbeddingsAPI(latency_s)
+    service = EmbeddingService(api, "text-embedding-3-small")
+    per_query: list[float] = []
+
+    async def caller(chunk: list[str]):
+        for text in chunk:
+            start = time.perf_counter()
+            if name == "direct":
+                await api([text], "text-embedding-3-small")
+            else:
+                await service.embed(text)
+            per_query.append((time.perf_counter() - start) * 1000)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(caller(queries[i::callers]) for i in range(callers)))
+    return api, per_query, time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark embedding batching and caching")
+    parser.add_argument("--queries", type=int, default=1000, help="Total embedding requests")
+    parser.add_argument("--distinct", type=int, default=50, help="Distinct phrasings in the stream")
+    parser.add_argument("--callers", type=int, default=20, help="Concurrent callers")
+    parser.add_argument("--latency-ms", type=float, default=40.0, help="Simulated API latency")
+    args = parser.parse_args()
+    logging.getLogger("aoai.embeddings").setLevel(logging.WARNING)
+
+    rng = random.Random(5)
+    queries = [f"How do I check claim status option {rng.randrange(args.distinct)}" for _ in range(args.queries)]
+    print(f"Queries: {args.queries}  distinct: {args.distinct}  callers: {args.callers}  latency: {args.latency_ms} ms")
+    for name in ("direct", "service"):
+        api, per_query, elapsed = asyncio.run(run(name, queries, args.callers, args.latency_ms / 1000))
+        per_query.sort()
+        print(
+            f"{name:>8}: api requests {api.requests:5d}  inputs {api.inputs:5d}  "
+            f"p50 {statistics.median(per_query):7.2f} ms  p99 {per_query[int(len(per_query) * 0.99) - 1]:7.2f} ms  "
+            f"total {elapsed:6.2f} s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Post-Call Analytics Writer Benchmark
+
+Simulates a hangup storm against a Cosmos fake with a fixed per-request
+round trip and compares:
+
+- direct:  one ``upsert_document`` per hangup on a worker thread (legacy)
+- batched: hangups enqueue into ``AnalyticsWriter``, which bulk-upserts
+
+Reports how long hangup handlers block and how many requests reach Cosmos.
+
+Usage:
+    python -m tests.load.postcall_analytics_benchmark
+    python -m tests.load.postcall_analytics_benchmark --sessions 2000 --rtt-ms 8
+"""
+
+import argparse
+import asyncio
+import logging
+import time
+
+from src.postcall.writer import AnalyticsWriter
+
+
+class SimulatedCosmos:
+    def __init__(self, rtt_s: float):
+        self.rtt_s = rtt_s
+        self.requests = 0
+        self.documents = 0
+
+    def upsert_document(self, document, query):
+        time.sleep(self.rtt_s)
+        self.requests += 1
+        self.documents += 1
+
+    def bulk_upsert_documents(self, documents):
+        time.sleep(self.rtt_s)
+        self.requests += 1
+        self.documents += len(documents)
+        return len(documents)
+
+
+def _doc(i: int) -> dict:
+    return {"_id": f"session_{i}", "latency_summary": {"stt": {"count": 12, "p99": 0.42}}}
+
+
+async def run_direct(sessions: int, rtt_s: float):
+    cosmos = SimulatedCosmos(rtt_s)
+
+    async def hangup(i):
+        start = time.perf_counter()
+        await asyncio.to_thread(cosmos.upsert_document, _doc(i), {"_id": f"session_{i}"})
+        return time.perf_counter() - start
+
+    start = time.perf_counter()
+    waits = await asyncio.gather(*(hangup(i) for i in range(sessions)))
+    return cosmos, max(waits), time.perf_counter() - start
+
+
+async def run_batched(sessions: int, rtt_s: float, batch_size: int):
+    cosmos = SimulatedCosmos(rtt_s)
+    writer = AnalyticsWriter(cosmos, max_queue=sessions, batch_size=batch_size, max_batch_age_s=0.05)
+    writer.start()
+
+    start = time.perf_counter()
+    worst = 0.0
+    for i in range(sessions):
+        t0 = time.perf_counter()
+        writer.submit(_doc(i))
+        worst = max(worst, time.perf_counter() - t0)
+    await writer.stop(timeout=60)
+    return cosmos, worst, time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark post-call analytics persistence")
+    parser.add_argument("--sessions", type=int, default=1000, help="Hangups in the storm")
+    parser.add_argument("--rtt-ms", type=float, default=5.0, help="Simulated Cosmos round trip")
+    parser.add_argument("--batch-size", type=int, default=50, help="Documents per bulk write")
+    args = parser.parse_args()
+    logging.getLogger("postcall_analytics.writer").setLevel(logging.WARNING)
+
+    rtt_s = args.rtt_ms / 1000
+    print(f"Sessions: {args.sessions}  rtt: {args.rtt_ms} ms  batch size: {args.batch_size}")
+    for name, coro in (
+        ("direct", run_direct(args.sessions, rtt_s)),
+        ("batched", run_batched(args.sessions, rtt_s, args.batch_size)),
+    ):
+        cosmos, worst_wait, elapsed = asyncio.run(coro)
+        print(
+            f"{name:>8}: documents {cosmos.documents:6d}  requests {cosmos.requests:6d}  "
+            f"worst hangup wait {worst_wait * 1000:9.2f} ms  drained in {elapsed:6.2f} s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Profile Lookup Benchmark
+
+Compares claim and identity lookups against an in-memory users collection:
+
+- regex:   anchored case-insensitive ``$regex`` (legacy); no index can
+           serve it, so every lookup scans the collection
+- indexed: exact match on normalized ``lookup_keys`` served by an index
+- lru:     indexed lookups behind the in-process ``ProfileLookupCache``
+
+The collection models Mongo's behaviour: regex filters scan every document,
+equality filters on an indexed field are a hash lookup.
+
+Usage:
+    python -m tests.load.profile_lookup_benchmark
+    python -m tests.load.profile_lookup_benchmark --users 100000 --lookups 50 --repeat 3
+"""
+
+import argparse
+import random
+import re
+import statistics
+import time
+from collections import defaultdict
+
+from apps.artagent.backend.registries.toolstore import profile_lookup
+from apps.artagent.backend.registries.toolstore.profile_lookup import (
+    LOOKUP_INDEXES,
+    ProfileLookupCache,
+    find_claim,
+    find_user_by_identity,
+    with_lookup_keys,
+)
+
+FIRST = ["Ada", "Grace", "Alan", "Katherine", "Linus", "Barbara", "Edsger", "Margaret"]
+LAST = ["Lovelace", "Hopper", "Turing", "Johnson", "Torvalds", "Liskov", "Dijkstra", "Hamilton"]
+
+
+def _get(document, path):
+    value = document
+    for part in path.split("."):
+        value = value.get(part) if isinstance(value, dict) else None
+    return value
+
+
+class InMemoryUsers:
+    """Users collection: indexes serve equality filters, everything else scans."""
+
+    def __init__(self, documents: list[dict]):
+        self.documents = documents
+        self.indexes: dict[str, dict] = {}
+        self.scanned = 0
+        for fields in LOOKUP_INDEXES:
+            for field in fields:
+                index = defaultdict(list)
+                for document in documents:
+                    value = _get(document, field)
+                    for key in value if isinstance(value, list) else [value]:
+                        index[key].append(document)
+                self.indexes[field] = index
+
+    def _matches(self, document, path, condition):
+        value = _get(document, path)
+        if isinstance(condition, dict) and "$regex" in condition:
+            pattern = re.compile(condition["$regex"], re.IGNORECASE)
+            values = value if isinstance(value, list) else [value]
+            return any(isinstance(v, str) and pattern.search(v) for v in values)
+        return condition == value or (isinstance(value, list) and condition in value)
+
+    def read_document(self, query: dict):
+        indexed = [p for p, c in query.items() if p in self.indexes and not isinstance(c, dict)]
+        candidates = self.indexes[indexed[0]].get(query[indexed[0]], []) if indexed else self.documents
+        for document in candidates:
+            self.scanned += 1
+            if all(self._matches(document, p, c) for p, c in query.items()):
+                return document
+        return None
+
+
+def build_users(count: int) -> list[dict]:
+    rng = random.Random(7)
+    users = []
+    for i in range(count):
+        users.append(
+            with_lookup_keys(
+                {
+                    "_id": f"user_{i}",
+                    "client_id": f"user_{i}",
+                    "full_name": f"{rng.choice(FIRST)} {rng.choice(LAST)} {i}",
+                    "verification_codes": {"ssn4": f"{i % 10000:04d}"},
+                    "demo_metadata": {
+                        "claims": [{"claim_number": f"CLM-2024-{i:06d}", "status": "open"}],
+                        "policies": [{"policy_number": f"POL-AUTO-{i:06d}"}],
+                    },
+                }
+            )
+        )
+    return users
+
+
+def regex_claim(collection, claim_number):
+    return collection.read_document(
+        {"demo_metadata.claims.claim_number": {"$regex": f"^{re.escape(claim_number)}$", "$options": "i"}}
+    )
+
+
+def regex_identity(collection, full_name, ssn4):
+    return collection.read_document(
+        {"verification_codes.ssn4": ssn4, "full_name": {"$regex": f"^{re.escape(full_name)}$", "$options": "i"}}
+    )
+
+
+def run(name, collection, targets, repeat):
+    timings = []
+    for user in targets:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            claim = user["demo_metadata"]["claims"][0]["claim_number"].lower()
+            if name == "regex":
+                regex_claim(collection, claim)
+                regex_identity(collection, user["full_name"].upper(), user["verification_codes"]["ssn4"])
+            else:
+                find_claim(collection, claim)
+                find_user_by_identity(collection, user["full_name"].upper(), user["verification_codes"]["ssn4"])
+            timings.append((time.perf_counter() - start) * 1e6)
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark profile lookups")
+    parser.add_argument("--users", type=int, default=100000, help="Profiles in the collection")
+    parser.add_argument("--lookups", type=int, default=50, help="Distinct callers looked up")
+    parser.add_argument("--repeat", type=int, default=3, help="Lookups per caller (tools per call)")
+    args = parser.parse_args()
+
+    users = build_users(args.users)
+    targets = random.Random(11).sample(users, min(args.lookups, len(users)))
+    print(f"Users: {args.users}  callers: {len(targets)}  lookups per caller: {args.repeat}")
+
+    original = profile_lookup._cache
+    try:
+        results = {}
+        for name in ("regex", "indexed", "lru"):
+            collection = InMemoryUsers(users)
+            # "indexed" disables the LRU so every lookup reaches the collection
+            profile_lookup._cache = ProfileLookupCache(max_entries=0 if name == "indexed" else 1024)
+            timings = run(name, collection, targets, args.repeat)
+            results[name] = (timings, collection.scanned)
+    finally:
+        profile_lookup._cache = original
+
+    baseline = statistics.mean(results["regex"][0])
+    for name, (timings, scanned) in results.items():
+        timings.sort()
+        mean = statistics.mean(timings)
+        print(
+            f"{name:>8}: p50 {statistics.median(timings):10.1f} us  "
+            f"p99 {timings[int(len(timings) * 0.99) - 1]:10.1f} us  "
+            f"docs scanned {scanned:10d}  speedup x{baseline / mean:.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
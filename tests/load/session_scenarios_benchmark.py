@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Session Scenario Store Benchmark
+
+Compares scenario lookups for many concurrent sessions, most of which never
+save a custom scenario:
+
+- legacy: unbounded per-session dicts, positive results only; every miss is a
+          synchronous read and full decode of the session hash
+- store:  ``SessionScenarioStore`` with negative caching, LRU/TTL bounds and
+          a decode of the ``corememory`` field only
+
+Usage:
+    python -m tests.load.session_scenarios_benchmark
+    python -m tests.load.session_scenarios_benchmark --sessions 10000 --latency-ms 0.5
+
+Redis is faked in-process; ``--latency-ms`` is added to every read so the
+numbers show how much loop time each variant spends waiting on Redis.
+"""
+
+import argparse
+import json
+import logging
+import random
+import statistics
+import time
+import tracemalloc
+
+from apps.artagent.backend.src.orchestration import session_scenarios
+from apps.artagent.backend.src.orchestration.naming import SCENARIO_KEY_ACTIVE, SCENARIO_KEY_ALL
+from apps.artagent.backend.src.orchestration.session_scenarios import (
+    SessionScenarioStore,
+    _scenarios_from_corememory,
+)
+from src.stateful.state_managment import MemoManager  # noqa: F401  (imported lazily by the store)
+
+
+class FakeRedis:
+    def __init__(self, hashes: dict[str, dict], latency_s: float):
+        self.hashes = hashes
+        self.latency_s = latency_s
+        self.reads = 0
+
+    def get_session_data(self, key):
+        self.reads += 1
+        if self.latency_s:
+            time.sleep(self.latency_s)
+        return dict(self.hashes.get(key, {}))
+
+
+def build_sessions(count: int, with_scenario_ratio: float) -> dict[str, dict]:
+    """Session hashes with chat history; a fraction carry a saved scenario."""
+    rng = random.Random(7)
+    history = json.dumps(
+        {"Concierge": [{"role": "user", "content": "x" * 120} for _ in range(20)]}
+    )
+    hashes = {}
+    for i in range(count):
+        core: dict = {"caller_name": f"caller-{i}"}
+        if rng.random() < with_scenario_ratio:
+            name = f"custom-{i}"
+            core[SCENARIO_KEY_ALL] = {
+                name: {"name": name, "agents": ["Concierge"], "start_agent": "Concierge"}
+            }
+            core[SCENARIO_KEY_ACTIVE] = name
+        hashes[f"session:{i}"] = {"corememory": json.dumps(core), "chat_history": history}
+    return hashes
+
+
+def legacy_lookup(redis: FakeRedis, cache: dict, session_id: str):
+    cached = cache.get(session_id)
+    if cached is not None:
+        return cached
+    data = redis.get_session_data(f"session:{session_id}")
+    if not data:
+        return None
+    core = json.loads(data.get("corememory", "{}"))
+    json.loads(data.get("chat_history", "{}"))  # MemoManager.from_redis decodes the whole hash
+    scenarios, active = _scenarios_from_corememory(core)
+    if not scenarios:
+        return None
+    cache[session_id] = scenarios
+    return scenarios.get(active) if active else next(iter(scenarios.values()))
+
+
+def store_lookup(redis: FakeRedis, cache: SessionScenarioStore, session_id: str):
+    return session_scenarios.get_session_scenario(session_id)
+
+
+def run(variant: str, hashes: dict, lookups: list[str], latency_s: float, max_sessions: int) -> dict:
+    redis = FakeRedis(hashes, latency_s)
+    if variant == "legacy":
+        cache: object = {}
+        lookup = legacy_lookup
+    else:
+        cache = SessionScenarioStore(max_sessions=max_sessions)
+        session_scenarios._store = cache
+        session_scenarios._redis_manager = redis
+        lookup = store_lookup
+
+    timings = []
+    tracemalloc.start()
+    start = time.perf_counter()
+    for session_id in lookups:
+        t0 = time.perf_counter()
+        lookup(redis, cache, session_id)
+        timings.append((time.perf_counter() - t0) * 1e6)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    timings.sort()
+    return {
+        "elapsed_s": elapsed,
+        "p50_us": statistics.median(timings),
+        "p99_us": timings[int(len(timings) * 0.99) - 1],
+        "redis_reads": redis.reads,
+        "peak_kib": peak / 1024,
+        "cached": len(cache),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark session scenario lookups")
+    parser.add_argument("--sessions", type=int, default=10000, help="Concurrent sessions")
+    parser.add_argument("--lookups", type=int, default=5, help="Lookups per session (turns)")
+    parser.add_argument("--with-scenario", type=float, default=0.05, help="Share with a saved scenario")
+    parser.add_argument("--latency-ms", type=float, default=0.1, help="Added latency per Redis read")
+    parser.add_argument("--max-sessions", type=int, default=10000, help="Store LRU bound")
+    args = parser.parse_args()
+
+    hashes = build_sessions(args.sessions, args.with_scenario)
+    lookups = [str(i) for _ in range(args.lookups) for i in range(args.sessions)]
+    random.Random(11).shuffle(lookups)
+
+    logging.getLogger(session_scenarios.__name__).setLevel(logging.WARNING)
+    original = session_scenarios._store, session_scenarios._redis_manager
+    try:
+        results = {
+            name: run(name, hashes, lookups, args.latency_ms / 1000, args.max_sessions)
+            for name in ("legacy", "store")
+        }
+    finally:
+        session_scenarios._store, session_scenarios._redis_manager = original
+
+    print(
+        f"Sessions: {args.sessions}  lookups: {len(lookups)}  "
+        f"with scenario: {args.with_scenario:.0%}  redis latency: {args.latency_ms} ms"
+    )
+    baseline = results["legacy"]["elapsed_s"]
+    for name, r in results.items():
+        print(
+            f"{name:>7}: p50 {r['p50_us']:8.1f} us  p99 {r['p99_us']:8.1f} us  "
+            f"redis reads {r['redis_reads']:6d}  cached {r['cached']:6d}  "
+            f"peak {r['peak_kib']:8.0f} KiB  speedup x{baseline / r['elapsed_s']:.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Session Statistics Disconnect-Burst Benchmark
+
+Measures event-loop lag while a burst of sessions disconnects, with a Cosmos
+fake whose ``update_one`` blocks for a fixed round trip:
+
+- inline:    the previous behaviour, a synchronous ``update_one`` per
+             disconnect on the event loop
+- coalesced: in-memory increments with a periodic off-loop ``$inc`` flush
+
+Lag is sampled by a ticker task that sleeps 1 ms and records the overshoot.
+
+Usage:
+    python -m tests.load.session_statistics_benchmark
+    python -m tests.load.session_statistics_benchmark --disconnects 500 --rtt-ms 8
+"""
+
+import argparse
+import asyncio
+import logging
+import statistics
+import time
+
+from apps.artagent.backend.src.sessions.session_statistics import SessionStatisticsManager
+
+
+class BlockingCollection:
+    def __init__(self, rtt_s: float):
+        self.rtt_s = rtt_s
+        self.writes = 0
+
+    def find_one(self, query):
+        time.sleep(self.rtt_s)
+        return None
+
+    def update_one(self, query, update, upsert=False):
+        time.sleep(self.rtt_s)
+        self.writes += 1
+
+
+class InlinePersistManager(SessionStatisticsManager):
+    """Previous behaviour: blocking upsert inside every remove."""
+
+    async def remove_media_session(self, call_connection_id: str) -> bool:
+        removed = await super().remove_media_session(call_connection_id)
+        if removed:
+            self._cosmos_manager.database[self._stats_collection_name].update_one(
+                {"_id": "global_session_stats"},
+                {"$set": {"total_disconnected": self._total_disconnected_count}},
+                upsert=True,
+            )
+        return removed
+
+
+async def _ticker(samples: list[float], stop: asyncio.Event) -> None:
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(0.001)
+        samples.append((time.perf_counter() - start - 0.001) * 1000)
+
+
+async def run(manager_cls, disconnects: int, rtt_s: float):
+    collection = BlockingCollection(rtt_s)
+    manager = manager_cls(
+        cosmos_manager=type("Cosmos", (), {"database": {"session_statistics": collection}})(),
+        flush_interval_s=0.25,
+    )
+    await manager.initialize()
+    for i in range(disconnects):
+        await manager.add_media_session(f"call-{i}", handler=None)
+
+    samples: list[float] = []
+    stop = asyncio.Event()
+    ticker = asyncio.create_task(_ticker(samples, stop))
+    await asyncio.sleep(0.01)
+    start = time.perf_counter()
+    await asyncio.gather(*(manager.remove_media_session(f"call-{i}") for i in range(disconnects)))
+    burst = time.perf_counter() - start
+    await asyncio.sleep(0.3)
+    stop.set()
+    await ticker
+    await manager.stop()
+    return samples, burst, collection.writes
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark disconnect-burst event-loop lag")
+    parser.add_argument("--disconnects", type=int, default=200, help="Sessions disconnecting at once")
+    parser.add_argument("--rtt-ms", type=float, default=5.0, help="Simulated Cosmos round trip")
+    args = parser.parse_args()
+    logging.getLogger("apps.artagent.backend.src.sessions.session_statistics").setLevel(logging.WARNING)
+
+    print(f"Disconnects: {args.disconnects}  rtt: {args.rtt_ms} ms")
+    for name, cls in (("inline", InlinePersistManager), ("coalesced", SessionStatisticsManager)):
+        samples, burst, writes = asyncio.run(run(cls, args.disconnects, args.rtt_ms / 1000))
+        samples.sort()
+        print(
+            f"{name:>10}: burst {burst * 1000:9.1f} ms  loop lag p50 {statistics.median(samples):7.2f} ms  "
+            f"max {samples[-1]:9.2f} ms  cosmos writes {writes:5d}"
+        )
+
+
+if __name__ == "__main__":
+    main()
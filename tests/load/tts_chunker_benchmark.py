@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+TTS Chunker Benchmark
+
+Compares the incremental ``StreamingTTSChunker`` against the legacy
+rescan-the-buffer loop (``find_tts_boundary`` + ``split_tts_buffer``) on
+recorded LLM token streams.
+
+Reports per-strategy CPU time per stream and how many tokens arrive before
+the first chunk is ready for TTS (the main driver of first-audio latency).
+
+Usage:
+    python -m tests.load.tts_chunker_benchmark
+    python -m tests.load.tts_chunker_benchmark --streams recorded_streams.jsonl --repeat 500
+
+Stream file format (JSONL): one object per line with a ``tokens`` list of
+strings, as captured from ``delta.content`` of a streaming completion.
+"""
+
+import argparse
+import json
+import statistics
+import time
+from pathlib import Path
+
+from apps.artagent.backend.voice.speech_cascade.tts_processor import (
+    StreamingTTSChunker,
+    TTSTextProcessor,
+)
+
+# Representative assistant responses; tokenized to ~4 characters per token.
+SAMPLE_RESPONSES = [
+    "Thanks for calling, I can see your policy here and I'm pulling up the details of "
+    "your most recent claim so we can walk through the next steps together. Your claim "
+    "number is CLM-2024-00123 and the adjuster, Dr. Patel, reviewed it on Jan. 5 at "
+    "10:30 a.m. The estimate came in at $4,250.75. Would you like me to schedule the "
+    "inspection for this week?",
+    "Sure. Your current balance is $1,204.33 and your next payment of $89.99 is due on "
+    "the 15th. Is there anything else I can help you with today?",
+    "I understand how stressful an accident can be, so let's take this one step at a "
+    "time: first I'll confirm everyone is safe, then I'll collect the vehicle details, "
+    "and finally we'll file the first notice of loss together. Are you and your "
+    "passengers okay right now?",
+    "I've verified your identity using the last four digits of your Social Security "
+    "number and your date of birth, which means I can now share account details with "
+    "you. Your savings account ending in 4821 has an available balance of $12,430.18, "
+    "and your checking account ending in 0097 has $2,115.60. Which account would you "
+    "like to transfer from?",
+]
+
+
+def tokenize(text: str, size: int = 4) -> list[str]:
+    """Split text into fixed-size pseudo-tokens."""
+    return [text[i : i + size] for i in range(0, len(text), size)]
+
+
+def load_streams(path: Path | None) -> list[list[str]]:
+    if path is None:
+        return [tokenize(text) for text in SAMPLE_RESPONSES]
+    streams = []
+    with path.open() as f:
+        for line in f:
+            if line.strip():
+                streams.append(json.loads(line)["tokens"])
+    return streams
+
+
+def legacy_chunk(tokens: list[str]) -> tuple[list[str], int]:
+    """Legacy loop: rescan the whole sentence buffer on every token."""
+    chunks: list[str] = []
+    first_at = -1
+    sentence_buffer = ""
+    for i, token in enumerate(tokens):
+        sentence_buffer += TTSTextProcessor.sanitize_tts_text(token)
+        while True:
+            idx = TTSTextProcessor.find_tts_boundary(sentence_buffer, ".!?", 0)
+            if idx < 0:
+                break
+            chunk, sentence_buffer = TTSTextProcessor.split_tts_buffer(sentence_buffer, idx + 1)
+            chunks.append(chunk)
+            if first_at < 0:
+                first_at = i
+    if sentence_buffer.strip():
+        chunks.append(sentence_buffer)
+    return chunks, first_at if first_at >= 0 else len(tokens)
+
+
+def incremental_chunk(tokens: list[str]) -> tuple[list[str], int]:
+    """Incremental chunker with adaptive first chunk."""
+    chunker = StreamingTTSChunker()
+    chunks: list[str] = []
+    first_at = -1
+    for i, token in enumerate(tokens):
+        ready = chunker.feed(token)
+        if ready:
+            chunks.extend(ready)
+            if first_at < 0:
+                first_at = i
+    tail = chunker.flush()
+    if tail:
+        chunks.append(tail)
+    return chunks, first_at if first_at >= 0 else len(tokens)
+
+
+def run_benchmark(streams: list[list[str]], repeat: int) -> dict[str, dict[str, float]]:
+    results = {}
+    for name, func in (("legacy", legacy_chunk), ("incremental", incremental_chunk)):
+        per_stream_us = []
+        first_chunk_tokens = []
+        for tokens in streams:
+            start = time.perf_counter()
+            for _ in range(repeat):
+                _, first_at = func(tokens)
+            per_stream_us.append((time.perf_counter() - start) / repeat * 1e6)
+            first_chunk_tokens.append(first_at)
+        results[name] = {
+            "mean_us_per_stream": round(statistics.mean(per_stream_us), 1),
+            "max_us_per_stream": round(max(per_stream_us), 1),
+            "mean_tokens_to_first_chunk": round(statistics.mean(first_chunk_tokens), 1),
+        }
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark TTS chunking strategies")
+    parser.add_argument("--streams", type=Path, help="JSONL file of recorded token streams")
+    parser.add_argument("--repeat", type=int, default=200, help="Iterations per stream")
+    args = parser.parse_args()
+
+    streams = load_streams(args.streams)
+    results = run_benchmark(streams, args.repeat)
+
+    print(f"Streams: {len(streams)}  tokens: {sum(len(s) for s in streams)}  repeat: {args.repeat}")
+    for name, stats in results.items():
+        print(
+            f"{name:>12}: {stats['mean_us_per_stream']:>8.1f} us/stream "
+            f"(max {stats['max_us_per_stream']:.1f})  "
+            f"first chunk after {stats['mean_tokens_to_first_chunk']:.1f} tokens"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,420 @@
+#!/usr/bin/env python3
+"""
+Deterministic Speech/OpenAI/Redis Fakes for Offline Benchmarks
+==============================================================
+
+Drop-in stand-ins for the external services the voice pipeline talks to,
+so the backend can be driven in-process without Azure credentials:
+
+- ``FakeSpeechRecognizer``: ``StreamingSpeechRecognizerFromBytes`` surface.
+  Energy-based end-of-speech detection on the PCM written to it; partial and
+  final results fire from timer threads like the Speech SDK callbacks.
+- ``FakeSynthesizer``: ``SpeechSynthesizer.synthesize_to_pcm`` with a
+  configurable first-byte latency, returning silence sized to the text.
+- ``FakeOpenAIClient``: ``client.chat.completions.create(stream=True)`` with
+  configurable time-to-first-token and token rate.
+- ``FakeRedisManager``: in-memory ``AzureRedisManager`` (async methods go
+  through the default executor, as the real manager's do).
+
+Every fake records timestamps into a shared ``BenchTrace`` keyed by
+``(call_connection_id, turn)``. Recognizers and synthesizers learn their call
+from the session context they are created in; the LLM and TTS see the turn
+through a ``[bench:<call>/<turn>]`` marker the recognizer appends to each
+transcript and the LLM echoes at the start of its reply. Synthesized audio
+starts with ``BENCH/<turn>`` so the client can spot the turn's first frame.
+"""
+
+import asyncio
+import re
+import threading
+import time
+from array import array
+from collections import defaultdict
+from dataclasses import dataclass
+from types import SimpleNamespace
+from typing import Any
+
+from utils.session_context import get_session_correlation
+
+MARKER_RE = re.compile(r"\[bench:([\w.-]+)/(\d+)\]")
+AUDIO_TAG = b"BENCH/"
+
+
+def make_marker(call_id: str, turn: int) -> str:
+    return f"[bench:{call_id}/{turn}]"
+
+
+def _current_call_id() -> str | None:
+    correlation = get_session_correlation()
+    return getattr(correlation, "call_connection_id", None) if correlation else None
+
+
+@dataclass
+class FakeLatencies:
+    """Latency profile for the fake services (milliseconds unless noted)."""
+
+    stt_partial_interval_ms: float = 300.0
+    stt_end_silence_ms: float = 500.0
+    stt_final_ms: float = 150.0
+    llm_ttft_ms: float = 250.0
+    llm_tokens_per_s: float = 60.0
+    tts_first_byte_ms: float = 120.0
+    redis_ms: float = 1.0
+
+
+class BenchTrace:
+    """Thread-safe timestamps shared by the fakes and the driver."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.scripts: dict[str, list[str]] = {}
+        self.turns: dict[tuple[str, int], dict[str, float]] = defaultdict(dict)
+        self.writes: dict[str, list[tuple[int, float]]] = defaultdict(list)
+
+    def mark(self, call_id: str | None, turn: int, stage: str, at: float | None = None) -> None:
+        """Record the first time ``stage`` happened for a turn."""
+        if not call_id:
+            return
+        with self._lock:
+            self.turns[(call_id, turn)].setdefault(stage, at or time.perf_counter())
+
+    def record_write(self, call_id: str | None, total_bytes: int) -> None:
+        if call_id:
+            with self._lock:
+                self.writes[call_id].append((total_bytes, time.perf_counter()))
+
+    def transcript(self, call_id: str | None, turn: int) -> str:
+        script = self.scripts.get(call_id or "", [])
+        text = script[turn - 1] if 0 < turn <= len(script) else "Hello, I need some help."
+        return f"{text} {make_marker(call_id or 'unknown', turn)}"
+
+
+# ============================================================================
+# Speech-to-text
+# ============================================================================
+
+
+class FakeSpeechRecognizer:
+    """Streaming recognizer that segments utterances by signal energy."""
+
+    def __init__(
+        self,
+        trace: BenchTrace,
+        latencies: FakeLatencies,
+        *,
+        sample_rate: int = 16000,
+        voice_threshold: int = 500,
+    ) -> None:
+        self._trace = trace
+        self._latencies = latencies
+        self._bytes_per_ms = sample_rate * 2 / 1000
+        self._threshold = voice_threshold
+        self.call_id = _current_call_id()
+        self.push_stream: object | None = None
+        self.is_ready = True
+
+        self._on_partial = None
+        self._on_final = None
+        self._on_cancel = None
+        self._lock = threading.Lock()
+        self._running = False
+        self._total_bytes = 0
+        self._turn = 0
+        self._in_speech = False
+        self._voiced_ms = 0.0
+        self._silence_ms = 0.0
+        self._next_partial_ms = 0.0
+        self._timers: set[threading.Timer] = set()
+
+    # -- SDK surface --------------------------------------------------------
+
+    def create_push_stream(self) -> None:
+        self.push_stream = object()
+
+    def set_partial_result_callback(self, callback) -> None:
+        self._on_partial = callback
+
+    def set_final_result_callback(self, callback) -> None:
+        self._on_final = callback
+
+    def set_cancel_callback(self, callback) -> None:
+        self._on_cancel = callback
+
+    def warm_connection(self) -> bool:
+        return True
+
+    def start(self) -> None:
+        self._running = True
+
+    def stop(self) -> None:
+        with self._lock:
+            self._running = False
+            timers, self._timers = self._timers, set()
+        for timer in timers:
+            timer.cancel()
+
+    def write_bytes(self, audio: bytes) -> None:
+        if self.call_id is None:
+            self.call_id = _current_call_id()
+        with self._lock:
+            if not self._running:
+                return
+            self._total_bytes += len(audio)
+            self._trace.record_write(self.call_id, self._total_bytes)
+            duration_ms = len(audio) / self._bytes_per_ms
+            voiced = self._peak(audio) >= self._threshold
+
+            if voiced:
+                if not self._in_speech:
+                    self._in_speech = True
+                    self._turn += 1
+                    self._voiced_ms = 0.0
+                    self._next_partial_ms = self._latencies.stt_partial_interval_ms
+                self._silence_ms = 0.0
+                self._voiced_ms += duration_ms
+                if self._voiced_ms >= self._next_partial_ms:
+                    self._next_partial_ms += self._latencies.stt_partial_interval_ms
+                    self._schedule(0.0, self._emit_partial, self._turn, self._voiced_ms)
+            elif self._in_speech:
+                self._silence_ms += duration_ms
+                if self._silence_ms >= self._latencies.stt_end_silence_ms:
+                    self._end_utterance()
+
+    # -- internals ----------------------------------------------------------
+
+    @staticmethod
+    def _peak(audio: bytes) -> int:
+        samples = array("h", audio[: len(audio) // 2 * 2])
+        return max(map(abs, samples[::4]), default=0)
+
+    def _end_utterance(self) -> None:
+        self._in_speech = False
+        self._trace.mark(self.call_id, self._turn, "speech_end")
+        self._schedule(self._latencies.stt_final_ms / 1000, self._emit_final, self._turn)
+
+    def _schedule(self, delay_s: float, fn, *args) -> None:
+        timer = threading.Timer(delay_s, self._fire, (fn, args))
+        timer.daemon = True
+        self._timers.add(timer)
+        timer.start()
+
+    def _fire(self, fn, args) -> None:
+        with self._lock:
+            self._timers = {t for t in self._timers if t.is_alive() and t is not threading.current_thread()}
+            if not self._running:
+                return
+        fn(*args)
+
+    def _emit_partial(self, turn: int, voiced_ms: float) -> None:
+        words = self._trace.transcript(self.call_id, turn).split()[:-1]
+        count = max(1, min(len(words), int(voiced_ms / 250)))
+        if self._on_partial:
+            self._on_partial(" ".join(words[:count]), "en-US", None)
+
+    def _emit_final(self, turn: int) -> None:
+        self._trace.mark(self.call_id, turn, "stt_final")
+        if self._on_final:
+            self._on_final(self._trace.transcript(self.call_id, turn), "en-US", None)
+
+
+# ============================================================================
+# Text-to-speech
+# ============================================================================
+
+
+class FakeSynthesizer:
+    """Synthesizer returning tagged silence after a fixed first-byte latency."""
+
+    def __init__(self, trace: BenchTrace, latencies: FakeLatencies, *, chars_per_s: float = 15.0):
+        self._trace = trace
+        self._latencies = latencies
+        self._chars_per_s = chars_per_s
+        self.call_id = _current_call_id()
+        self.is_ready = True
+
+    def warm_connection(self) -> bool:
+        return True
+
+    def stop_speaking(self) -> None:
+        pass
+
+    def synthesize_to_pcm(
+        self,
+        text: str,
+        voice: str | None = None,
+        sample_rate: int = 16000,
+        style: str | None = None,
+        rate: str | None = None,
+    ) -> bytes:
+        match = MARKER_RE.search(text or "")
+        turn = int(match.group(2)) if match else 0
+        if match:
+            self._trace.mark(self.call_id, turn, "tts_start")
+        time.sleep(self._latencies.tts_first_byte_ms / 1000)
+
+        seconds = max(0.2, len(text or "") / self._chars_per_s)
+        pcm = bytearray(int(sample_rate * seconds) * 2)
+        if match:
+            tag = AUDIO_TAG + str(turn).encode()
+            pcm[: len(tag)] = tag
+            self._trace.mark(self.call_id, turn, "tts_done")
+        return bytes(pcm)
+
+
+# ============================================================================
+# Azure OpenAI
+# ============================================================================
+
+
+_REPLY = (
+    "Thanks, I have noted that. Let me check the details on your account for you now. "
+    "Is there anything else I can help you with today?"
+)
+
+
+class _Completions:
+    def __init__(self, trace: BenchTrace, latencies: FakeLatencies):
+        self._trace = trace
+        self._latencies = latencies
+        self.calls = 0
+
+    def create(self, **params: Any):
+        self.calls += 1
+        call_id, turn = None, 0
+        for message in reversed(params.get("messages") or []):
+            content = message.get("content") if isinstance(message, dict) else None
+            match = MARKER_RE.search(content) if isinstance(content, str) else None
+            if match:
+                call_id, turn = match.group(1), int(match.group(2))
+                break
+        self._trace.mark(call_id, turn, "llm_request")
+        return self._stream(call_id, turn)
+
+    def _stream(self, call_id: str | None, turn: int):
+        reply = f"{make_marker(call_id, turn)} {_REPLY}" if call_id else _REPLY
+        tokens = [word + " " for word in reply.split()]
+        delay = 1.0 / self._latencies.llm_tokens_per_s if self._latencies.llm_tokens_per_s else 0.0
+
+        time.sleep(self._latencies.llm_ttft_ms / 1000)
+        for index, token in enumerate(tokens):
+            if index:
+                time.sleep(delay)
+            else:
+                self._trace.mark(call_id, turn, "llm_first_token")
+            delta = SimpleNamespace(content=token, tool_calls=None, role="assistant")
+            yield SimpleNamespace(
+                choices=[SimpleNamespace(index=0, delta=delta, finish_reason=None)], usage=None
+            )
+        yield SimpleNamespace(
+            choices=[],
+            usage=SimpleNamespace(prompt_tokens=200, completion_tokens=len(tokens)),
+        )
+
+
+class FakeOpenAIClient:
+    """Minimal ``AzureOpenAI`` client: streaming chat completions only."""
+
+    def __init__(self, trace: BenchTrace, latencies: FakeLatencies):
+        self.chat = SimpleNamespace(completions=_Completions(trace, latencies))
+
+
+# ============================================================================
+# Redis
+# ============================================================================
+
+
+class _FakeRedisClient:
+    def __init__(self, manager: "FakeRedisManager"):
+        self._manager = manager
+
+    def expire(self, key: str, ttl_seconds: int) -> bool:
+        self._manager._pause()
+        return True
+
+
+class FakeRedisManager:
+    """In-memory ``AzureRedisManager`` with a fixed per-operation latency."""
+
+    def __init__(self, latencies: FakeLatencies):
+        self._latency_s = latencies.redis_ms / 1000
+        self._values: dict[str, str] = {}
+        self._hashes: dict[str, dict[str, str]] = defaultdict(dict)
+        self._lock = threading.Lock()
+        self.redis_client = _FakeRedisClient(self)
+        self.operations = 0
+
+    @property
+    def is_connected(self) -> bool:
+        return True
+
+    def _pause(self) -> None:
+        self.operations += 1
+        if self._latency_s:
+            time.sleep(self._latency_s)
+
+    async def _offload(self, fn, *args):
+        return await asyncio.get_running_loop().run_in_executor(None, fn, *args)
+
+    # -- sync API -----------------------------------------------------------
+
+    def set_value(self, key: str, value: str, ttl_seconds: int | None = None) -> bool:
+        self._pause()
+        with self._lock:
+            self._values[key] = value
+        return True
+
+    def get_value(self, key: str) -> str | None:
+        self._pause()
+        with self._lock:
+            return self._values.get(key)
+
+    def publish_channel(self, channel: str, message: str) -> int:
+        return 0
+
+    def store_session_data(self, session_id: str, data: dict[str, Any]) -> bool:
+        self._pause()
+        with self._lock:
+            self._hashes[session_id].update({k: str(v) for k, v in data.items()})
+        return True
+
+    def get_session_data(self, session_id: str) -> dict[str, str]:
+        self._pause()
+        with self._lock:
+            return dict(self._hashes.get(session_id, {}))
+
+    def update_session_field(self, session_id: str, field: str, value: str) -> bool:
+        self._pause()
+        with self._lock:
+            self._hashes[session_id][field] = value
+        return True
+
+    def delete_session(self, session_id: str) -> int:
+        self._pause()
+        with self._lock:
+            return 1 if self._hashes.pop(session_id, None) is not None else 0
+
+    # -- async API ----------------------------------------------------------
+
+    async def ping(self) -> bool:
+        return True
+
+    async def set_value_async(self, key: str, value: str, ttl_seconds: int | None = None) -> bool:
+        return await self._offload(self.set_value, key, value, ttl_seconds)
+
+    async def get_value_async(self, key: str) -> str | None:
+        return await self._offload(self.get_value, key)
+
+    async def publish_channel_async(self, channel: str, message: str) -> int:
+        return 0
+
+    async def store_session_data_async(self, session_id: str, data: dict[str, Any]) -> bool:
+        return await self._offload(self.store_session_data, session_id, data)
+
+    async def get_session_data_async(self, session_id: str) -> dict[str, str]:
+        return await self._offload(self.get_session_data, session_id)
+
+    async def update_session_field_async(self, session_id: str, field: str, value: str) -> bool:
+        return await self._offload(self.update_session_field, session_id, field, value)
+
+    async def delete_session_async(self, session_id: str) -> int:
+        return await self._offload(self.delete_session, session_id)
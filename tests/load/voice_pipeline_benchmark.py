@@ -0,0 +1,543 @@
+#!/usr/bin/env python3
+"""
+Offline Voice Pipeline Benchmark
+
+Boots the backend's v1 API in-process with deterministic fakes for Speech
+STT/TTS, Azure OpenAI and Redis (``tests/load/utils/fake_services.py``), then
+drives N concurrent ACS media WebSocket sessions at ``/api/v1/media/stream``
+with the cached PCM in ``tests/load/audio_cache``. The real media endpoint,
+VoiceHandler, speech pools, route-turn thread, cascade orchestrator and TTS
+playback all run; only the network services are replaced. Nothing leaves the
+process, so this measures our own overhead on a laptop or in CI.
+
+Per-turn stages (server-side, fake service time excluded):
+
+- ingest:           client sends last voiced frame -> recognizer receives it
+- final_to_llm:     STT final callback -> LLM request issued
+- token_to_tts:     first LLM token -> synthesis of the first chunk starts
+                    (includes waiting for the chunker's first clause)
+- tts_to_wire:      synthesis returns -> first audio frame reaches the client
+- server_total:     final_to_llm + token_to_tts + tts_to_wire
+- turn_response:    STT final -> first audio frame (includes fake LLM/TTS latency)
+
+Also reported: event-loop lag (10 ms sampler) and process CPU per call.
+
+Usage:
+    python -m tests.load.voice_pipeline_benchmark
+    python -m tests.load.voice_pipeline_benchmark --calls 50 --llm-ttft-ms 400 --speed 2
+    python -m tests.load.voice_pipeline_benchmark --update-baseline
+    python -m tests.load.voice_pipeline_benchmark --baseline other.json --tolerance 0.3
+
+Exits with status 1 when a metric regresses past the baseline tolerance.
+Baselines are machine-specific: regenerate on the runner that compares them.
+"""
+
+import argparse
+import asyncio
+import base64
+import json
+import logging
+import os
+import statistics
+import sys
+import time
+from bisect import bisect_left
+from dataclasses import asdict
+from pathlib import Path
+
+os.environ.setdefault("DISABLE_CLOUD_TELEMETRY", "true")
+os.environ.setdefault("AZURE_OPENAI_ENDPOINT", "https://bench.openai.azure.com")
+os.environ.setdefault("AZURE_OPENAI_KEY", "bench-key")
+os.environ.setdefault("ACS_STREAMING_MODE", "media")
+
+from tests.load.utils.fake_services import (
+    AUDIO_TAG,
+    BenchTrace,
+    FakeLatencies,
+    FakeOpenAIClient,
+    FakeRedisManager,
+    FakeSpeechRecognizer,
+    FakeSynthesizer,
+)
+
+AUDIO_CACHE = Path(__file__).parent / "audio_cache"
+DEFAULT_BASELINE = Path(__file__).parent / "voice_pipeline_baseline.json"
+FRAME_BYTES = 640  # 20 ms of 16 kHz PCM16 mono
+FRAME_S = 0.02
+VOICE_PEAK = 500
+
+STAGES = (
+    ("ingest", None, None),
+    ("final_to_llm", "stt_final", "llm_request"),
+    ("token_to_tts", "llm_first_token", "tts_start"),
+    ("tts_to_wire", "tts_done", "wire"),
+    ("server_total", None, None),
+    ("turn_response", "stt_final", "wire"),
+)
+
+
+# ============================================================================
+# Conversations
+# ============================================================================
+
+
+def load_conversations(cache_dir: Path) -> list[list[tuple[str, bytes]]]:
+    """Group cached utterances by scenario, ordered by turn."""
+    scenarios: dict[str, list[tuple[int, str, bytes]]] = {}
+    with (cache_dir / "manifest.jsonl").open() as f:
+        for line in f:
+            if not line.strip():
+                continue
+            entry = json.loads(line)
+            pcm_path = cache_dir / entry["filename"]
+            if not pcm_path.exists():
+                continue
+            scenarios.setdefault(entry.get("scenario", "default"), []).append(
+                (entry.get("turn_index", 0), entry["text"], pcm_path.read_bytes())
+            )
+    return [
+        [(text, pcm) for _, text, pcm in sorted(turns, key=lambda t: t[0])]
+        for _, turns in sorted(scenarios.items())
+    ]
+
+
+# ============================================================================
+# App under test
+# ============================================================================
+
+
+def build_app(trace: BenchTrace, latencies: FakeLatencies):
+    """Build the v1 API with the production agents step and faked Azure services."""
+    from apps.artagent.backend.api.v1.router import v1_router
+    from apps.artagent.backend.lifecycle.manager import LifecycleManager
+    from apps.artagent.backend.lifecycle.steps import register_agents_step
+    from fastapi import FastAPI
+    from src.aoai import client as aoai_client
+    from src.pools.connection_manager import ThreadSafeConnectionManager
+    from src.pools.session_manager import ThreadSafeSessionManager
+    from src.pools.session_metrics import ThreadSafeSessionMetrics
+    from src.pools.warmable_pool import WarmableResourcePool
+
+    async def lifespan(app: FastAPI):
+        manager = LifecycleManager()
+
+        async def start_core() -> None:
+            from apps.artagent.backend.src.orchestration.session_scenarios import (
+                set_redis_manager,
+            )
+
+            app.state.redis = FakeRedisManager(latencies)
+            set_redis_manager(app.state.redis)
+            import apps.artagent.backend.src.orchestration.unified  # noqa: F401
+
+            app.state.conn_manager = ThreadSafeConnectionManager()
+            app.state.session_manager = ThreadSafeSessionManager()
+            app.state.session_metrics = ThreadSafeSessionMetrics()
+            app.state.greeted_call_ids = set()
+
+        async def start_speech() -> None:
+            async def make_stt() -> FakeSpeechRecognizer:
+                return FakeSpeechRecognizer(trace, latencies, voice_threshold=VOICE_PEAK)
+
+            async def make_tts() -> FakeSynthesizer:
+                return FakeSynthesizer(trace, latencies)
+
+            app.state.stt_pool = WarmableResourcePool(factory=make_stt, name="speech-stt")
+            app.state.tts_pool = WarmableResourcePool(
+                factory=make_tts, name="speech-tts", session_awareness=True
+            )
+            await asyncio.gather(app.state.tts_pool.prepare(), app.state.stt_pool.prepare())
+
+        async def start_aoai() -> None:
+            aoai_client._client_instance = FakeOpenAIClient(trace, latencies)
+            app.state.aoai_client = aoai_client._client_instance
+
+        async def stop_core() -> None:
+            await app.state.conn_manager.stop()
+
+        manager.add_step("core", start_core, stop_core)
+        manager.add_step("speech", start_speech)
+        manager.add_step("aoai", start_aoai, depends_on=("core",))
+        register_agents_step(manager, app)
+
+        await manager.run_startup()
+        yield
+        await manager.run_shutdown()
+
+    app = FastAPI(lifespan=lifespan)
+    app.include_router(v1_router)
+    return app
+
+
+# ============================================================================
+# In-process ACS client
+# ============================================================================
+
+
+class MediaClient:
+    """ACS media WebSocket driven straight through the ASGI interface (same loop)."""
+
+    def __init__(self, app, call_id: str):
+        self.call_id = call_id
+        self.sent: list[tuple[int, float]] = []  # (cumulative bytes, t) at end of each utterance
+        self.wire: dict[int, float] = {}  # turn -> first tagged audio frame
+        self.audio_frames = 0
+        self._app = app
+        self._inbox: asyncio.Queue = asyncio.Queue()
+        self._accepted = asyncio.Event()
+        self._closed = asyncio.Event()
+        self._task: asyncio.Task | None = None
+        self._bytes = 0
+
+    async def connect(self) -> None:
+        path = "/api/v1/media/stream"
+        scope = {
+            "type": "websocket",
+            "asgi": {"version": "3.0"},
+            "scheme": "ws",
+            "path": path,
+            "raw_path": path.encode(),
+            "root_path": "",
+            "query_string": f"call_connection_id={self.call_id}".encode(),
+            "headers": [(b"host", b"bench")],
+            "client": ("127.0.0.1", 0),
+            "server": ("bench", 80),
+            "subprotocols": [],
+            "state": {},
+        }
+        self._task = asyncio.create_task(self._app(scope, self._inbox.get, self._on_send))
+        await self._inbox.put({"type": "websocket.connect"})
+        await asyncio.wait_for(self._accepted.wait(), timeout=10)
+        await self._send_json(
+            {
+                "kind": "AudioMetadata",
+                "audioMetadata": {
+                    "subscriptionId": self.call_id,
+                    "encoding": "PCM",
+                    "sampleRate": 16000,
+                    "channels": 1,
+                    "length": FRAME_BYTES,
+                },
+            }
+        )
+
+    async def stream(self, pcm: bytes, frame_interval_s: float) -> float:
+        """Send PCM as ACS AudioData frames at the given pace; returns when the last was sent."""
+        next_at = sent_at = time.perf_counter()
+        for offset in range(0, len(pcm), FRAME_BYTES):
+            if self._closed.is_set():
+                break
+            frame = pcm[offset : offset + FRAME_BYTES]
+            await self._send_json(
+                {
+                    "kind": "AudioData",
+                    "audioData": {
+                        "timestamp": "2024-05-01T12:00:00.000Z",
+                        "participantRawID": "8:acs:bench",
+                        "data": base64.b64encode(frame).decode(),
+                        "silent": not any(frame),
+                    },
+                }
+            )
+            self._bytes += len(frame)
+            sent_at = time.perf_counter()
+            next_at += frame_interval_s
+            delay = next_at - sent_at
+            await asyncio.sleep(delay if delay > 0 else 0)
+        return sent_at
+
+    def mark_utterance_end(self, sent_at: float) -> None:
+        self.sent.append((self._bytes, sent_at))
+
+    async def stream_until_answered(
+        self, turn: int, frame_interval_s: float, timeout_s: float
+    ) -> None:
+        """Keep the line open with silence until ``turn`` gets audio back, like a caller would."""
+        deadline = time.perf_counter() + timeout_s
+        while turn not in self.wire and not self._closed.is_set():
+            if time.perf_counter() >= deadline:
+                return
+            await self.stream(bytes(FRAME_BYTES), frame_interval_s)
+
+    async def close(self) -> None:
+        if self._task is None:
+            return
+        await self._inbox.put({"type": "websocket.disconnect", "code": 1000})
+        try:
+            await asyncio.wait_for(self._task, timeout=15)
+        except Exception:
+            self._task.cancel()
+
+    async def _send_json(self, payload: dict) -> None:
+        await self._inbox.put({"type": "websocket.receive", "text": json.dumps(payload)})
+
+    async def _on_send(self, message: dict) -> None:
+        kind = message["type"]
+        if kind == "websocket.accept":
+            self._accepted.set()
+        elif kind == "websocket.close":
+            self._closed.set()
+        elif kind == "websocket.send":
+            text = message.get("text")
+            if text and '"AudioData"' in text:
+                self.audio_frames += 1
+                data = json.loads(text).get("audioData", {}).get("data", "")
+                head = base64.b64decode(data[:16]) if data else b""
+                if head.startswith(AUDIO_TAG):
+                    turn = int(head[len(AUDIO_TAG) :].split(b"\x00", 1)[0] or 0)
+                    self.wire.setdefault(turn, time.perf_counter())
+
+
+async def run_call(app, call_id: str, conversation, trace: BenchTrace, args) -> MediaClient:
+    trace.scripts[call_id] = [text for text, _ in conversation]
+    frame_s = FRAME_S / args.speed
+    silence = bytes(FRAME_BYTES * int(args.turn_gap_s / FRAME_S))
+    client = MediaClient(app, call_id)
+    await client.connect()
+    await client.stream(bytes(FRAME_BYTES * int(args.lead_in_s / FRAME_S)), frame_s)
+    for turn, (_, pcm) in enumerate(conversation, start=1):
+        # Trim trailing silence so the marker is the last voiced frame
+        end = _last_voiced_offset(pcm)
+        client.mark_utterance_end(await client.stream(pcm[:end], frame_s))
+        await client.stream(pcm[end:] + silence, frame_s)
+        # At --speed > 1 the gap can be shorter than the (real-time) fake service latencies
+        await client.stream_until_answered(turn, frame_s, args.answer_timeout_s)
+    await client.close()
+    return client
+
+
+def _last_voiced_offset(pcm: bytes) -> int:
+    from array import array
+
+    for offset in range(len(pcm) - len(pcm) % FRAME_BYTES, -1, -FRAME_BYTES):
+        samples = array("h", pcm[offset : offset + FRAME_BYTES][: FRAME_BYTES // 2 * 2])
+        if samples and max(map(abs, samples)) >= VOICE_PEAK:
+            return min(len(pcm), offset + FRAME_BYTES)
+    return len(pcm)
+
+
+async def sample_loop_lag(stop: asyncio.Event, out: list[float], interval_s: float = 0.01) -> None:
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(interval_s)
+        out.append((time.perf_counter() - start - interval_s) * 1000)
+
+
+# ============================================================================
+# Reporting
+# ============================================================================
+
+
+def percentiles(values: list[float]) -> dict[str, float]:
+    if not values:
+        return {}
+    ordered = sorted(values)
+
+    def pick(q: float) -> float:
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+    return {
+        "count": len(ordered),
+        "p50": round(pick(0.50), 2),
+        "p95": round(pick(0.95), 2),
+        "p99": round(pick(0.99), 2),
+        "max": round(ordered[-1], 2),
+        "mean": round(statistics.fmean(ordered), 2),
+    }
+
+
+def collect_stages(trace: BenchTrace, clients: list[MediaClient]) -> dict[str, list[float]]:
+    samples: dict[str, list[float]] = {name: [] for name, _, _ in STAGES}
+    for client in clients:
+        writes = trace.writes.get(client.call_id, [])
+        written_bytes = [total for total, _ in writes]
+        for total, sent_at in client.sent:
+            index = bisect_left(written_bytes, total)
+            if index < len(writes):
+                samples["ingest"].append((writes[index][1] - sent_at) * 1000)
+
+        for turn in range(1, len(client.sent) + 1):
+            marks = dict(trace.turns.get((client.call_id, turn), {}))
+            if turn in client.wire:
+                marks["wire"] = client.wire[turn]
+            server = []
+            for name, start, end in STAGES:
+                if start and start in marks and end in marks:
+                    value = (marks[end] - marks[start]) * 1000
+                    samples[name].append(value)
+                    if name in ("final_to_llm", "token_to_tts", "tts_to_wire"):
+                        server.append(value)
+            if len(server) == 3:
+                samples["server_total"].append(sum(server))
+    return samples
+
+
+def summarize(samples, lags, cpu_s, wall_s, clients, conversations_audio_s, latencies) -> dict:
+    completed = sum(1 for c in clients for turn in range(1, len(c.sent) + 1) if turn in c.wire)
+    expected = sum(len(c.sent) for c in clients)
+    return {
+        "calls": len(clients),
+        "turns": expected,
+        "turns_answered": completed,
+        "wall_s": round(wall_s, 2),
+        "latencies": asdict(latencies),
+        "stages_ms": {name: percentiles(values) for name, values in samples.items()},
+        "loop_lag_ms": percentiles(lags),
+        "cpu_ms_per_call": round(cpu_s * 1000 / max(1, len(clients)), 2),
+        "cpu_ms_per_audio_s": round(cpu_s * 1000 / max(1e-9, conversations_audio_s), 2),
+    }
+
+
+def flatten(report: dict) -> dict[str, float]:
+    """Metrics compared against the baseline (lower is better)."""
+    metrics = {"cpu_ms_per_call": report["cpu_ms_per_call"]}
+    for name, stats in report["stages_ms"].items():
+        # Tails of the individual stages are too noisy at benchmark sample sizes
+        for q in ("p50", "p95") if name in ("server_total", "turn_response") else ("p50",):
+            if q in stats:
+                metrics[f"{name}.{q}"] = stats[q]
+    for q in ("p50", "p99"):
+        if q in report["loop_lag_ms"]:
+            metrics[f"loop_lag.{q}"] = report["loop_lag_ms"][q]
+    return metrics
+
+
+def compare(current: dict[str, float], baseline: dict[str, float], tolerance: float, floor_ms: float):
+    rows, regressions = [], []
+    for key, base in sorted(baseline.items()):
+        if key not in current:
+            continue
+        value = current[key]
+        limit = base * (1 + tolerance) + floor_ms
+        regressed = value > limit
+        rows.append((key, base, value, regressed))
+        if regressed:
+            regressions.append(key)
+    return rows, regressions
+
+
+def print_report(report: dict) -> None:
+    print(
+        f"Calls: {report['calls']}  turns answered: {report['turns_answered']}/{report['turns']}  "
+        f"wall: {report['wall_s']}s"
+    )
+    print(f"{'stage':>14}  {'n':>5}  {'p50':>8}  {'p95':>8}  {'p99':>8}  {'max':>8}")
+    for name, stats in report["stages_ms"].items():
+        if stats:
+            print(
+                f"{name:>14}  {stats['count']:>5}  {stats['p50']:>8.2f}  {stats['p95']:>8.2f}  "
+                f"{stats['p99']:>8.2f}  {stats['max']:>8.2f}"
+            )
+    lag = report["loop_lag_ms"]
+    if lag:
+        print(f"{'loop_lag':>14}  {lag['count']:>5}  {lag['p50']:>8.2f}  {lag['p95']:>8.2f}  {lag['p99']:>8.2f}  {lag['max']:>8.2f}")
+    print(
+        f"CPU: {report['cpu_ms_per_call']:.1f} ms/call  "
+        f"{report['cpu_ms_per_audio_s']:.2f} ms per second of caller audio"
+    )
+
+
+# ============================================================================
+# Entry point
+# ============================================================================
+
+
+async def run_benchmark(args) -> dict:
+    latencies = FakeLatencies(
+        stt_final_ms=args.stt_final_ms,
+        llm_ttft_ms=args.llm_ttft_ms,
+        llm_tokens_per_s=args.llm_tokens_per_s,
+        tts_first_byte_ms=args.tts_first_byte_ms,
+        redis_ms=args.redis_ms,
+    )
+    trace = BenchTrace()
+    conversations = load_conversations(args.audio_cache)
+    if not conversations:
+        raise SystemExit(f"No cached audio found in {args.audio_cache}")
+    app = build_app(trace, latencies)
+
+    async with app.router.lifespan_context(app):
+        stop, lags = asyncio.Event(), []
+        sampler = asyncio.create_task(sample_loop_lag(stop, lags))
+        cpu_start, wall_start = time.process_time(), time.perf_counter()
+
+        async def staggered(index: int) -> MediaClient:
+            await asyncio.sleep(args.ramp_s * index / max(1, args.calls))
+            conversation = conversations[index % len(conversations)][: args.turns or None]
+            return await run_call(app, f"bench-{index:04d}", conversation, trace, args)
+
+        clients = await asyncio.gather(*(staggered(i) for i in range(args.calls)))
+        cpu_s, wall_s = time.process_time() - cpu_start, time.perf_counter() - wall_start
+        stop.set()
+        await sampler
+
+    audio_s = sum(
+        len(pcm) / (FRAME_BYTES / FRAME_S)
+        for i in range(args.calls)
+        for _, pcm in conversations[i % len(conversations)][: args.turns or None]
+    )
+    samples = collect_stages(trace, clients)
+    return summarize(samples, lags, cpu_s, wall_s, clients, audio_s, latencies)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Offline end-to-end voice pipeline benchmark")
+    parser.add_argument("--calls", type=int, default=10, help="Concurrent ACS media sessions")
+    parser.add_argument("--turns", type=int, default=0, help="Caller turns per call (0 = all cached)")
+    parser.add_argument("--speed", type=float, default=1.0, help="Audio pace (1.0 = real time)")
+    parser.add_argument("--ramp-s", type=float, default=1.0, help="Spread call starts over this many seconds")
+    parser.add_argument("--lead-in-s", type=float, default=1.0, help="Silence before the first utterance")
+    parser.add_argument("--turn-gap-s", type=float, default=3.0, help="Silence after each utterance")
+    parser.add_argument(
+        "--answer-timeout-s",
+        type=float,
+        default=10.0,
+        help="After the gap, keep sending silence up to this long until the turn is answered",
+    )
+    parser.add_argument("--stt-final-ms", type=float, default=150.0)
+    parser.add_argument("--llm-ttft-ms", type=float, default=250.0)
+    parser.add_argument("--llm-tokens-per-s", type=float, default=60.0)
+    parser.add_argument("--tts-first-byte-ms", type=float, default=120.0)
+    parser.add_argument("--redis-ms", type=float, default=1.0)
+    parser.add_argument("--audio-cache", type=Path, default=AUDIO_CACHE)
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--update-baseline", action="store_true", help="Write results as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=0.5, help="Allowed relative regression")
+    parser.add_argument("--floor-ms", type=float, default=10.0, help="Absolute slack added to each limit")
+    parser.add_argument("--json", type=Path, help="Also write the full report here")
+    parser.add_argument("--log-level", default="WARNING", help="Backend log level during the run")
+    args = parser.parse_args()
+    if args.speed <= 0:
+        parser.error("--speed must be positive")
+
+    logging.disable(logging.getLevelName(args.log_level.upper()) - 1)
+    report = asyncio.run(run_benchmark(args))
+    print_report(report)
+
+    if args.json:
+        args.json.write_text(json.dumps(report, indent=2))
+
+    metrics = flatten(report)
+    if args.update_baseline:
+        args.baseline.write_text(
+            json.dumps({"calls": report["calls"], "latencies": report["latencies"], "metrics": metrics}, indent=2)
+            + "\n"
+        )
+        print(f"Baseline written to {args.baseline}")
+        return
+    if not args.baseline.exists():
+        print(f"No baseline at {args.baseline}; run with --update-baseline to create one")
+        return
+
+    baseline = json.loads(args.baseline.read_text())
+    rows, regressions = compare(metrics, baseline.get("metrics", {}), args.tolerance, args.floor_ms)
+    print(f"\nBaseline: {args.baseline} (tolerance {args.tolerance:.0%} + {args.floor_ms} ms)")
+    for key, base, value, regressed in rows:
+        print(f"{key:>22}: {base:>9.2f} -> {value:>9.2f}  {'REGRESSED' if regressed else 'ok'}")
+    if regressions:
+        print(f"\n{len(regressions)} metric(s) regressed: {', '.join(regressions)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
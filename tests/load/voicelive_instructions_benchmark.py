@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+VoiceLive Session Instruction Benchmark
+
+Replays a scripted call through ``LiveOrchestrator._update_session_context``
+against a fake VoiceLive connection and compares:
+
+- legacy:  every update re-renders the prompt, rebuilds handoff instructions
+           and recap, and sends ``session.update``
+- cached:  ``InstructionComposer`` reuses unchanged sections and skips the
+           update when the instructions did not change
+
+Each turn adds a user utterance and an assistant response; every third turn
+runs a tool (slots change, extra update) and every fifth turn has a
+barge-in that triggers an update with nothing new.
+
+Usage:
+    python -m tests.load.voicelive_instructions_benchmark
+    python -m tests.load.voicelive_instructions_benchmark --turns 30 --scenario banking
+"""
+
+import argparse
+import asyncio
+import logging
+import time
+from types import SimpleNamespace
+
+from apps.artagent.backend.registries.agentstore.loader import discover_agents
+from apps.artagent.backend.registries.scenariostore.loader import load_scenario
+from apps.artagent.backend.voice.voicelive.instructions import InstructionComposer
+from apps.artagent.backend.voice.voicelive.orchestrator import LiveOrchestrator
+
+
+class FakeSession:
+    def __init__(self):
+        self.payloads = 0
+        self.bytes = 0
+
+    async def update(self, session):
+        self.payloads += 1
+        self.bytes += len(session.instructions.encode())
+
+
+def build_orchestrator(scenario_name: str) -> LiveOrchestrator:
+    scenario = load_scenario(scenario_name)
+    agents = discover_agents()
+    start = scenario.start_agent
+    orchestrator = LiveOrchestrator(
+        conn=SimpleNamespace(session=FakeSession()),
+        agents={name: SimpleNamespace(name=name, _agent=agent) for name, agent in agents.items()},
+        start_agent=start,
+    )
+    orchestrator._cached_orchestrator_config = SimpleNamespace(
+        scenario=scenario, scenario_name=scenario_name
+    )
+    orchestrator._system_vars = {"caller_name": "Ada Lovelace", "client_id": "C-1001"}
+    return orchestrator
+
+
+async def replay(orchestrator: LiveOrchestrator, turns: int, legacy: bool) -> list[float]:
+    timings: list[float] = []
+
+    async def update():
+        if legacy:
+            orchestrator._instruction_composer = InstructionComposer()
+        start = time.perf_counter()
+        await orchestrator._update_session_context()
+        timings.append((time.perf_counter() - start) * 1e6)
+
+    for turn in range(1, turns + 1):
+        orchestrator._user_message_history.append(f"Turn {turn}: I have a question about my account")
+        if turn % 3 == 0:
+            slots = dict(orchestrator._system_vars.get("slots", {}))
+            slots[f"fact_{turn}"] = f"value {turn}"
+            orchestrator._system_vars["slots"] = slots
+            await update()  # after tool output
+        orchestrator._last_assistant_message = f"Here is the answer for turn {turn}."
+        await update()  # response.done
+        if turn % 5 == 0:
+            await update()  # barge-in, nothing new
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark VoiceLive session instruction updates")
+    parser.add_argument("--turns", type=int, default=30, help="Conversation turns")
+    parser.add_argument("--scenario", default="banking", help="Scenario providing agents and handoffs")
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    print(f"Scenario: {args.scenario}  turns: {args.turns}")
+    baseline = None
+    for name in ("legacy", "cached"):
+        orchestrator = build_orchestrator(args.scenario)
+        timings = asyncio.run(replay(orchestrator, args.turns, legacy=name == "legacy"))
+        session = orchestrator.conn.session
+        cpu_per_turn = sum(timings) / args.turns
+        baseline = baseline or cpu_per_turn
+        print(
+            f"{name:>7}: updates {len(timings):3d}  payloads {session.payloads:3d}  "
+            f"sent {session.bytes / 1024:8.1f} KiB  {cpu_per_turn:8.1f} us/turn  "
+            f"speedup x{baseline / cpu_per_turn:.2f}"
+        )
+        orchestrator.cleanup()
+
+
+if __name__ == "__main__":
+    main()
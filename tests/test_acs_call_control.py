@@ -0,0 +1,292 @@
+"""
+Tests for the async ACS call-control facade.
+
+Covers:
+- Call Automation operations against a local fake ACS HTTP server
+- Per-operation timeouts and retry rules (idempotent vs. not)
+- Cached CallConnectionClient per call
+- Event-loop lag during an inbound call burst through AcsCaller
+"""
+
+import asyncio
+import base64
+import gc
+import threading
+import time
+from contextlib import contextmanager
+from types import SimpleNamespace
+
+import pytest
+from aiohttp import web
+from azure.communication.callautomation import PhoneNumberIdentifier, TextSource
+from azure.communication.callautomation.aio import CallAutomationClient
+from azure.core.credentials import AzureKeyCredential
+from azure.core.exceptions import HttpResponseError
+from src.acs import call_control as call_control_module
+from src.acs.acs_helper import AcsCaller
+from src.acs.call_control import AcsCallControl, OperationPolicy
+
+_KEY = base64.b64encode(b"key").decode()
+
+
+class FakeAcsServer:
+    """
+    Minimal Call Automation REST surface with injectable latency and failures.
+
+    Runs on its own thread and loop so loop-lag measurements only see the
+    client side.
+    """
+
+    def __init__(self):
+        self.delay_s = 0.0
+        self.requests: list[tuple[str, str]] = []
+        # path suffix -> HTTP statuses to return before succeeding
+        self.failures: dict[str, list[int]] = {}
+        self.port = None
+        self._runner = None
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+
+    def start(self):
+        self._thread.start()
+        asyncio.run_coroutine_threadsafe(self._serve(), self._loop).result(5)
+
+    def stop(self):
+        asyncio.run_coroutine_threadsafe(self._runner.cleanup(), self._loop).result(5)
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(5)
+        self._loop.close()
+
+    async def _serve(self):
+        app = web.Application()
+        app.router.add_route("*", "/{tail:.*}", self._handle)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        self.port = site._server.sockets[0].getsockname()[1]
+
+    @property
+    def endpoint(self):
+        return f"http://127.0.0.1:{self.port}"
+
+    async def _handle(self, request):
+        path = request.path
+        self.requests.append((request.method, path))
+        await asyncio.sleep(self.delay_s)
+        for suffix, statuses in self.failures.items():
+            if path.endswith(suffix) and statuses:
+                return web.json_response(
+                    {"error": {"code": "Failure", "message": "injected"}}, status=statuses.pop(0)
+                )
+
+        call = {
+            "callConnectionId": "call-1",
+            "serverCallId": "srv-1",
+            "callConnectionState": "connected",
+        }
+        if path.endswith(":answer"):
+            return web.json_response(call)
+        if path == "/calling/callConnections":
+            return web.json_response(call, status=201)
+        if path.endswith("/participants"):
+            phone = {
+                "rawId": "4:+15550100",
+                "kind": "phoneNumber",
+                "phoneNumber": {"value": "+15550100"},
+            }
+            return web.json_response({"value": [{"identifier": phone, "isMuted": False}]})
+        if path.endswith((":terminate", ":startContinuousDtmfRecognition")):
+            return web.Response(status=204 if path.endswith(":terminate") else 200)
+        if path.endswith(":play"):
+            return web.Response(status=202)
+        return web.json_response(call)
+
+
+@pytest.fixture
+def server():
+    fake = FakeAcsServer()
+    fake.start()
+    yield fake
+    fake.stop()
+
+
+@pytest.fixture
+async def control(server):
+    client = CallAutomationClient(server.endpoint, AzureKeyCredential(_KEY), retry_total=0)
+    facade = AcsCallControl(client, backoff_base_s=0.01)
+    yield facade
+    await facade.close()
+
+
+@pytest.fixture(autouse=True)
+def no_jitter(monkeypatch):
+    monkeypatch.setattr(call_control_module.random, "uniform", lambda a, b: 1.0)
+
+
+class TestOperations:
+    async def test_call_lifecycle_round_trip(self, control, server):
+        answered = await control.answer_call("incoming-ctx", callback_url="https://cb")
+        created = await control.create_call(
+            PhoneNumberIdentifier("+15550100"),
+            callback_url="https://cb",
+            source_caller_id_number=PhoneNumberIdentifier("+15550199"),
+        )
+        participants = await control.list_participants("call-1")
+        await control.start_continuous_dtmf_recognition("call-1", participants[0].identifier)
+        await control.play_media("call-1", TextSource(text="hi", voice_name="en-US-AvaNeural"))
+        properties = await control.get_call_properties("call-1")
+        await control.hang_up("call-1")
+
+        assert answered.call_connection_id == created.call_connection_id == "call-1"
+        assert participants[0].identifier.raw_id == "4:+15550100"
+        assert properties.server_call_id == "srv-1"
+        assert [path.rsplit("/", 1)[-1] for _, path in server.requests] == [
+            "callConnections:answer",
+            "callConnections",
+            "participants",
+            "call-1:startContinuousDtmfRecognition",
+            "call-1:play",
+            "call-1",
+            "call-1:terminate",
+        ]
+
+
+class TestTimeoutsAndRetries:
+    async def test_idempotent_operation_retried_after_5xx(self, control, server):
+        server.failures[":terminate"] = [503]
+
+        await control.hang_up("call-1")
+
+        assert len(server.requests) == 2
+        assert control.get_stats()["retries"] == 1
+
+    async def test_retry_count_recorded_on_span(self, control, server, monkeypatch):
+        attributes = []
+
+        class _Tracer:
+            @contextmanager
+            def start_as_current_span(self, name, **kwargs):
+                span = {}
+                attributes.append(span)
+                yield SimpleNamespace(set_attribute=span.__setitem__)
+
+        monkeypatch.setattr(call_control_module, "tracer", _Tracer())
+        server.failures[":terminate"] = [503]
+
+        await control.get_call_properties("call-1")
+        await control.hang_up("call-1")
+
+        assert [span["retry.count"] for span in attributes] == [0, 1]
+
+    async def test_non_idempotent_operation_not_retried_after_5xx(self, control, server):
+        server.failures["callConnections"] = [503]
+
+        with pytest.raises(HttpResponseError):
+            await control.create_call(PhoneNumberIdentifier("+15550100"), callback_url="https://cb")
+
+        assert len(server.requests) == 1
+
+    async def test_throttling_retried_for_any_operation(self, control, server):
+        server.failures[":answer"] = [429]
+
+        result = await control.answer_call("incoming-ctx", callback_url="https://cb")
+
+        assert result.call_connection_id == "call-1"
+        assert len(server.requests) == 2
+
+    async def test_per_operation_timeout(self, server):
+        server.delay_s = 0.5
+        client = CallAutomationClient(server.endpoint, AzureKeyCredential(_KEY), retry_total=0)
+        control = AcsCallControl(
+            client,
+            policies={
+                "get_call_properties": OperationPolicy(timeout_s=0.05, retries=1, idempotent=True)
+            },
+            backoff_base_s=0.01,
+        )
+
+        start = time.perf_counter()
+        with pytest.raises(TimeoutError):
+            await control.get_call_properties("call-1")
+
+        assert time.perf_counter() - start < 0.3
+        assert control.get_stats() == {
+            "calls": 1,
+            "retries": 1,
+            "failures": 1,
+            "cached_connections": 1,
+        }
+        await control.close()
+
+
+class TestConnectionCache:
+    async def test_connection_client_cached_per_call(self, control):
+        first = control.get_call_connection("call-1")
+
+        assert control.get_call_connection("call-1") is first
+        assert control.get_call_connection("call-2") is not first
+
+    async def test_hang_up_releases_connection(self, control):
+        control.get_call_connection("call-1")
+
+        await control.hang_up("call-1")
+
+        assert control.get_stats()["cached_connections"] == 0
+
+    async def test_cache_is_bounded(self, server):
+        client = CallAutomationClient(server.endpoint, AzureKeyCredential(_KEY))
+        control = AcsCallControl(client, max_cached_connections=2)
+        for i in range(5):
+            control.get_call_connection(f"call-{i}")
+
+        assert list(control._connections) == ["call-3", "call-4"]
+        await control.close()
+
+
+class TestInboundBurst:
+    async def test_answer_burst_does_not_stall_event_loop(self, control, server):
+        server.delay_s = 0.05
+        caller = AcsCaller(
+            source_number="+15550199",
+            callback_url="https://cb",
+            websocket_url="wss://ws",
+            acs_connection_string=f"endpoint=https://acs.test/;accesskey={_KEY}",
+        )
+        await caller.call_control.close()
+        caller.call_control = control
+        await caller.answer_incoming_call("warmup")  # open the HTTP session
+
+        lag = []
+        stop = asyncio.Event()
+
+        async def monitor():
+            loop = asyncio.get_running_loop()
+            while not stop.is_set():
+                start = loop.time()
+                await asyncio.sleep(0.005)
+                lag.append(loop.time() - start - 0.005)
+
+        # Keep full collections of the test session's heap out of the measurement
+        gc.collect()
+        gc.freeze()
+        try:
+            monitor_task = asyncio.create_task(monitor())
+            start = time.perf_counter()
+            answers = []
+            for i in range(40):
+                # IncomingCall webhooks arriving 2 ms apart
+                answers.append(asyncio.create_task(caller.answer_incoming_call(f"ctx-{i}")))
+                await asyncio.sleep(0.002)
+            results = await asyncio.gather(*answers)
+            elapsed = time.perf_counter() - start
+            stop.set()
+            await monitor_task
+        finally:
+            gc.unfreeze()
+
+        assert all(r.call_connection_id == "call-1" for r in results)
+        # 40 x 50 ms answers overlap instead of serialising on the loop (2 s)
+        assert elapsed < 1.0
+        # The loop never waits on the service's 50 ms response time
+        assert max(lag) < 0.05
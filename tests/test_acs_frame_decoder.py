@@ -0,0 +1,78 @@
+"""
+Tests for the fast-path ACS media frame decoder.
+
+Covers:
+- Compact AudioData envelopes decoded without json.loads
+- Silent flag detection regardless of field order
+- Fallback to full JSON for other kinds, spacing and escaped payloads
+- Invalid input
+"""
+
+import base64
+import json
+from unittest.mock import patch
+
+import pytest
+from apps.artagent.backend.voice.shared import acs_frames
+from apps.artagent.backend.voice.shared.acs_frames import AUDIO_DATA_KIND, decode_acs_frame
+
+AUDIO_B64 = base64.b64encode(bytes(range(256)) * 3).decode()
+
+
+def _audio_frame(silent: bool = False, compact: bool = True) -> str:
+    audio = {
+        "timestamp": "2024-05-01T12:00:00.000Z",
+        "participantRawID": "8:acs:abc",
+        "data": AUDIO_B64,
+        "silent": silent,
+    }
+    separators = (",", ":") if compact else None
+    return json.dumps({"kind": "AudioData", "audioData": audio}, separators=separators)
+
+
+class TestFastPath:
+    @pytest.mark.parametrize("silent", [False, True])
+    def test_audio_data_skips_json(self, silent):
+        with patch.object(acs_frames.json, "loads", side_effect=AssertionError("slow path")):
+            frame = decode_acs_frame(_audio_frame(silent=silent))
+
+        assert frame.kind == AUDIO_DATA_KIND
+        assert frame.data == AUDIO_B64
+        assert frame.silent is silent
+        assert frame.message is None
+
+    def test_silent_before_data(self):
+        text = '{"kind":"AudioData","audioData":{"silent":true,"data":"AAAA"}}'
+        frame = decode_acs_frame(text)
+        assert (frame.data, frame.silent, frame.message) == ("AAAA", True, None)
+
+    def test_missing_silent_defaults_false(self):
+        frame = decode_acs_frame('{"kind":"AudioData","audioData":{"data":"AAAA"}}')
+        assert frame.silent is False
+
+
+class TestFallback:
+    def test_spaced_envelope_matches_fast_path(self):
+        frame = decode_acs_frame(_audio_frame(silent=True, compact=False))
+        assert frame.message is not None
+        assert (frame.kind, frame.data, frame.silent) == (AUDIO_DATA_KIND, AUDIO_B64, True)
+
+    def test_escaped_payload_uses_json(self):
+        frame = decode_acs_frame('{"kind":"AudioData","audioData":{"data":"ab\\/cd","silent":false}}')
+        assert frame.data == "ab/cd"
+        assert frame.message is not None
+
+    def test_other_kinds_return_message(self):
+        text = json.dumps({"kind": "DtmfData", "dtmfData": {"data": "5"}})
+        frame = decode_acs_frame(text)
+        assert frame.kind == "DtmfData"
+        assert frame.data is None
+        assert frame.message == {"kind": "DtmfData", "dtmfData": {"data": "5"}}
+
+    def test_capitalized_keys(self):
+        frame = decode_acs_frame('{"Kind": "AudioData", "AudioData": {"data": "AAAA"}}')
+        assert (frame.kind, frame.data) == (AUDIO_DATA_KIND, "AAAA")
+
+    @pytest.mark.parametrize("text", ["not json", "[1, 2]", ""])
+    def test_invalid_returns_none(self, text):
+        assert decode_acs_frame(text) is None
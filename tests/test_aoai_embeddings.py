@@ -0,0 +1,178 @@
+"""
+Tests for the micro-batching embedding service.
+
+Covers:
+- Concurrent requests coalesced into one backend call
+- In-flight de-duplication and LRU cache hits
+- Normalized-text cache keys and float32 results
+- Redis-backed persistence across service instances
+- Backend failures propagated to every waiter
+- AzureOpenAIManager.embed_texts batching a single API request
+"""
+
+import asyncio
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+from src.aoai.embeddings import EmbeddingService
+from src.aoai.manager import AzureOpenAIManager
+
+
+class _Backend:
+    """Fake embeddings API: fixed latency per request, vector derived from text."""
+
+    def __init__(self, latency_s=0.0, fail=False):
+        self.latency_s = latency_s
+        self.fail = fail
+        self.calls = []
+
+    async def __call__(self, texts, model):
+        self.calls.append(list(texts))
+        await asyncio.sleep(self.latency_s)
+        if self.fail:
+            raise RuntimeError("throttled")
+        return [[float(len(t)), float(sum(map(ord, t)) % 97), 1.0] for t in texts]
+
+
+class _Redis:
+    def __init__(self):
+        self.values = {}
+
+    async def get_value_async(self, key):
+        return self.values.get(key)
+
+    async def set_value_async(self, key, value, ttl_seconds=None):
+        self.values[key] = value
+        return True
+
+
+class TestBatching:
+    async def test_concurrent_requests_share_one_call(self):
+        backend = _Backend(latency_s=0.01)
+        service = EmbeddingService(backend, "text-embedding-3-small", batch_window_ms=5)
+
+        vectors = await service.embed_many([f"question {i}" for i in range(10)])
+
+        assert len(backend.calls) == 1
+        assert len(backend.calls[0]) == 10
+        assert all(v.dtype == np.float32 and v.shape == (3,) for v in vectors)
+
+    async def test_batch_size_cap_splits_requests(self):
+        backend = _Backend()
+        service = EmbeddingService(backend, "m", max_batch_size=4, batch_window_ms=5)
+
+        await service.embed_many([f"q{i}" for i in range(10)])
+
+        assert sorted(len(c) for c in backend.calls) == [2, 4, 4]
+
+    async def test_duplicate_inputs_embedded_once(self):
+        backend = _Backend(latency_s=0.01)
+        service = EmbeddingService(backend, "m")
+
+        a, b, c = await service.embed_many(["What is my deductible?", "What is  my deductible? ", "other"])
+
+        assert backend.calls == [["What is my deductible?", "other"]]
+        assert a is b
+        assert service.get_stats()["inflight_joins"] == 1
+
+
+class TestCaching:
+    async def test_repeat_query_served_from_lru(self):
+        backend = _Backend()
+        service = EmbeddingService(backend, "m")
+
+        first = await service.embed("reset my password")
+        second = await service.embed("reset   my password")
+
+        assert first is second
+        assert len(backend.calls) == 1
+        assert not first.flags.writeable
+
+    async def test_lru_is_bounded_and_keyed_by_model(self):
+        backend = _Backend()
+        service = EmbeddingService(backend, "m", cache_size=2)
+
+        await service.embed_many(["a", "b", "c"])
+        await service.embed("c", model="other-model")
+
+        assert service.get_stats()["cached"] == 2
+        assert len(backend.calls) == 2
+
+    async def test_redis_persists_across_instances(self):
+        redis = _Redis()
+        backend = _Backend()
+        await EmbeddingService(backend, "m", redis_manager=redis).embed("claim status")
+
+        restarted = EmbeddingService(backend, "m", redis_manager=redis)
+        vector = await restarted.embed("claim status")
+
+        assert len(backend.calls) == 1
+        assert restarted.get_stats()["redis_hits"] == 1
+        assert vector.dtype == np.float32 and vector[0] == len("claim status")
+
+
+class TestFailures:
+    async def test_failure_reaches_all_waiters_and_is_not_cached(self):
+        backend = _Backend(fail=True)
+        service = EmbeddingService(backend, "m")
+
+        results = await asyncio.gather(service.embed("x"), service.embed("x"), return_exceptions=True)
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+        backend.fail = False
+        assert (await service.embed("x")).shape == (3,)
+
+
+class TestThroughput:
+    async def test_fewer_requests_and_lower_latency_than_per_call(self):
+        phrasings = [f"faq {i % 20}" for i in range(200)]
+
+        naive = _Backend(latency_s=0.01)
+        start = time.perf_counter()
+        for text in phrasings:
+            await naive([text], "m")
+        naive_elapsed = time.perf_counter() - start
+
+        batched = _Backend(latency_s=0.01)
+        service = EmbeddingService(batched, "m")
+        start = time.perf_counter()
+        await service.embed_many(phrasings)
+        await service.embed_many(phrasings)
+        batched_elapsed = time.perf_counter() - start
+
+        assert len(naive.calls) == 200
+        assert len(batched.calls) <= 2
+        assert batched_elapsed < naive_elapsed / 10
+
+
+class TestManagerBackend:
+    async def test_embed_texts_single_request_in_order(self):
+        manager = AzureOpenAIManager(
+            api_key="test-key",
+            azure_endpoint="https://test.openai.azure.com",
+            api_version="2024-02-01",
+            embedding_model_name="text-embedding-3-small",
+            enable_tracing=False,
+        )
+        fake_client = MagicMock()
+        fake_client.embeddings.create = MagicMock(
+            return_value=SimpleNamespace(
+                data=[
+                    SimpleNamespace(index=1, embedding=[0.2]),
+                    SimpleNamespace(index=0, embedding=[0.1]),
+                ],
+                usage=SimpleNamespace(prompt_tokens=4, total_tokens=4),
+            )
+        )
+        manager.openai_client = fake_client
+
+        service = manager.create_embedding_service()
+        first, second = await service.embed_many(["one", "two"])
+
+        fake_client.embeddings.create.assert_called_once_with(
+            input=["one", "two"], model="text-embedding-3-small"
+        )
+        assert first[0] == pytest.approx(0.1) and second[0] == pytest.approx(0.2)
@@ -0,0 +1,188 @@
+"""
+Tests for streaming, chunked blob uploads.
+
+Covers:
+- Files uploaded in fixed-size staged blocks, never read whole
+- Bounded parallel block staging and per-process upload limit
+- Live WAV upload with the header committed first but staged last
+- Failed blocks abort the upload without committing
+- AzureBlobHelper routing through the pipeline, concurrent artifact uploads
+"""
+
+import asyncio
+import io
+import wave
+
+import pytest
+from src.blob import blob_helper
+from src.blob.blob_helper import AzureBlobHelper
+from src.blob.upload import BlobUploadPipeline, wav_header
+
+
+class FakeBlobClient:
+    """Block blob with the staged/committed semantics of the real service."""
+
+    def __init__(self, service, name, stage_delay_s=0.0, fail_block=None):
+        self.service = service
+        self.name = name
+        self.staged = {}
+        self.stage_delay_s = stage_delay_s
+        self.fail_block = fail_block
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def stage_block(self, block_id, data, length=None):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        self.service.staging += 1
+        self.service.max_staging = max(self.service.max_staging, self.service.staging)
+        try:
+            await asyncio.sleep(self.stage_delay_s)
+            if self.fail_block is not None and len(self.staged) == self.fail_block:
+                raise ConnectionError("stage failed")
+            assert length == len(data)
+            self.staged[block_id] = bytes(data)
+        finally:
+            self.in_flight -= 1
+            self.service.staging -= 1
+
+    async def commit_block_list(self, block_list, content_settings=None, metadata=None):
+        self.service.blobs[self.name] = b"".join(self.staged[block_id] for block_id in block_list)
+        self.service.content_types[self.name] = content_settings.content_type if content_settings else None
+
+    async def upload_blob(self, data, overwrite=False, content_settings=None, metadata=None):
+        await asyncio.sleep(self.stage_delay_s)
+        self.service.blobs[self.name] = bytes(data)
+        self.service.content_types[self.name] = content_settings.content_type if content_settings else None
+
+
+class FakeBlobService:
+    def __init__(self, **client_kwargs):
+        self.blobs = {}
+        self.content_types = {}
+        self.clients = {}
+        self.client_kwargs = client_kwargs
+        self.staging = 0
+        self.max_staging = 0
+
+    def get_blob_client(self, container, blob):
+        client = FakeBlobClient(self, f"{container}/{blob}", **self.client_kwargs)
+        self.clients[client.name] = client
+        return client
+
+
+def _pcm(n_bytes):
+    return bytes(i % 251 for i in range(n_bytes))
+
+
+class TestPipeline:
+    async def test_file_uploaded_in_blocks(self, tmp_path):
+        path = tmp_path / "call.wav"
+        payload = _pcm(10_000)
+        path.write_bytes(payload)
+        service = FakeBlobService()
+        client = service.get_blob_client("acs", "call.wav")
+
+        size = await BlobUploadPipeline(block_size=1024).upload_file(client, path, content_type="audio/wav")
+
+        assert size == 10_000
+        assert service.blobs["acs/call.wav"] == payload
+        assert len(client.staged) == 10
+        assert service.content_types["acs/call.wav"] == "audio/wav"
+
+    async def test_block_staging_is_bounded(self):
+        service = FakeBlobService(stage_delay_s=0.005)
+        client = service.get_blob_client("acs", "x")
+        pipeline = BlobUploadPipeline(block_size=100, max_block_concurrency=3)
+
+        await pipeline.upload_stream(client, [_pcm(100)] * 20)
+
+        assert client.max_in_flight == 3
+        assert len(service.blobs["acs/x"]) == 2000
+
+    async def test_uploads_limited_per_process(self):
+        service = FakeBlobService(stage_delay_s=0.01)
+        pipeline = BlobUploadPipeline(block_size=10, max_concurrent_uploads=2)
+
+        await asyncio.gather(
+            *(pipeline.upload_stream(service.get_blob_client("acs", f"b{i}"), [_pcm(10)]) for i in range(6))
+        )
+
+        assert service.max_staging == 2
+        assert len(service.blobs) == 6
+
+    async def test_failed_block_aborts_without_commit(self):
+        service = FakeBlobService(fail_block=1)
+        client = service.get_blob_client("acs", "x")
+
+        with pytest.raises(ConnectionError):
+            await BlobUploadPipeline(block_size=10).upload_stream(client, [_pcm(50)])
+
+        assert "acs/x" not in service.blobs
+
+
+class TestLiveWav:
+    async def test_header_written_at_end_is_committed_first(self):
+        service = FakeBlobService()
+        client = service.get_blob_client("acs", "live.wav")
+        upload = BlobUploadPipeline(block_size=4096).live_wav(client, sample_rate=8000)
+
+        for _ in range(10):
+            await upload.write(_pcm(1600))  # 100 ms frames
+        total = await upload.finish()
+
+        blob = service.blobs["acs/live.wav"]
+        assert total == len(blob) == 44 + 16_000
+        with wave.open(io.BytesIO(blob)) as wav:
+            assert wav.getframerate() == 8000
+            assert wav.getnframes() == 8000
+            assert wav.readframes(8000) == _pcm(1600) * 10
+
+    def test_wav_header_layout(self):
+        header = wav_header(32_000, sample_rate=16000)
+
+        assert len(header) == 44
+        assert header[:4] == b"RIFF" and header[8:12] == b"WAVE"
+
+
+class TestBlobHelper:
+    @pytest.fixture
+    def helper(self, monkeypatch):
+        monkeypatch.setattr(blob_helper, "get_credential", lambda: object())
+        helper = AzureBlobHelper(account_name="acct", container_name="acs", block_size=1024)
+        helper._blob_service = FakeBlobService(stage_delay_s=0.01)
+        return helper
+
+    async def test_save_wav_streams_blocks(self, helper, tmp_path):
+        path = tmp_path / "call.wav"
+        path.write_bytes(_pcm(5000))
+
+        result = await helper.save_wav_to_blob("call-1", str(path))
+
+        assert result.success and result.size_bytes == 5000
+        client = helper._blob_service.clients[f"acs/{result.blob_name}"]
+        assert len(client.staged) == 5
+
+    async def test_stream_accepts_file_like(self, helper):
+        result = await helper.stream_wav_to_blob("call-2", io.BytesIO(_pcm(3000)))
+
+        assert result.success and result.size_bytes == 3000
+
+    async def test_artifacts_uploaded_concurrently(self, helper, tmp_path):
+        path = tmp_path / "call.wav"
+        path.write_bytes(_pcm(1000))
+        helper._blob_service.client_kwargs["stage_delay_s"] = 0.1
+
+        start = asyncio.get_running_loop().time()
+        results = await helper.save_call_artifacts("call-3", '{"turns": []}', str(path))
+        elapsed = asyncio.get_running_loop().time() - start
+
+        assert [r.success for r in results] == [True, True]
+        assert elapsed < 0.19  # two 100 ms uploads overlapped
+
+    async def test_live_upload_via_helper(self, helper):
+        blob_name, upload = await helper.start_live_wav_upload("call-4")
+        await upload.write(_pcm(320))
+        await upload.finish()
+
+        assert len(helper._blob_service.blobs[f"acs/{blob_name}"]) == 44 + 320
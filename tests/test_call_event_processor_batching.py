@@ -0,0 +1,235 @@
+"""
+Tests for batched ACS webhook processing in CallEventProcessor.
+
+Covers:
+- Per-call ordering with cross-call concurrency
+- Concurrency limit across calls (per-call lock lifetime while queued)
+- Background recording start (webhook acknowledged first) with retry
+- Per-event-type latency statistics
+"""
+
+import asyncio
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from apps.artagent.backend.api.v1.events.processor import CallEventProcessor
+from apps.artagent.backend.api.v1.events.side_effects import SideEffectQueue
+from apps.artagent.backend.api.v1.events.types import (
+    ACSEventTypes,
+    CallEventContext,
+    RecordingPreferences,
+)
+from azure.core.messaging import CloudEvent
+
+
+def _event(event_type: str, call_id: str, **data) -> CloudEvent:
+    return CloudEvent(
+        source="azure.communication.callautomation",
+        type=event_type,
+        data={"callConnectionId": call_id, **data},
+    )
+
+
+def _state(**kwargs) -> SimpleNamespace:
+    return SimpleNamespace(redis=None, **kwargs)
+
+
+class TestPerCallOrdering:
+    async def test_events_ordered_within_call_and_concurrent_across_calls(self):
+        processor = CallEventProcessor(max_concurrency=8)
+        seen: list[tuple[str, int]] = []
+
+        async def handler(context: CallEventContext):
+            await asyncio.sleep(0.05)
+            seen.append((context.call_connection_id, context.get_event_data()["seq"]))
+
+        processor.register_handler(ACSEventTypes.PLAY_COMPLETED, handler)
+
+        events = [
+            _event(ACSEventTypes.PLAY_COMPLETED, call_id, seq=seq)
+            for seq in range(3)
+            for call_id in ("call-a", "call-b", "call-c")
+        ]
+
+        start = time.perf_counter()
+        result = await processor.process_events(events, _state())
+        elapsed = time.perf_counter() - start
+
+        assert result["processed"] == 9
+        for call_id in ("call-a", "call-b", "call-c"):
+            assert [seq for cid, seq in seen if cid == call_id] == [0, 1, 2]
+        # 3 calls x 3 sequential 50ms events => ~150ms, not 450ms serial
+        assert elapsed < 0.35
+
+    async def test_concurrency_limit_across_calls(self):
+        processor = CallEventProcessor(max_concurrency=2)
+        in_flight = 0
+        peak = 0
+
+        async def handler(context: CallEventContext):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.02)
+            in_flight -= 1
+
+        processor.register_handler(ACSEventTypes.PLAY_COMPLETED, handler)
+        events = [_event(ACSEventTypes.PLAY_COMPLETED, f"call-{i}") for i in range(6)]
+
+        await processor.process_events(events, _state())
+
+        assert peak == 2
+
+    async def test_concurrent_batches_for_same_call_stay_ordered(self):
+        processor = CallEventProcessor()
+        seen: list[int] = []
+
+        async def handler(context: CallEventContext):
+            await asyncio.sleep(0.02)
+            seen.append(context.get_event_data()["seq"])
+
+        processor.register_handler(ACSEventTypes.PLAY_COMPLETED, handler)
+        first = [_event(ACSEventTypes.PLAY_COMPLETED, "call-x", seq=i) for i in range(3)]
+        second = [_event(ACSEventTypes.PLAY_COMPLETED, "call-x", seq=i) for i in range(3, 5)]
+
+        await asyncio.gather(
+            processor.process_events(first, _state()),
+            processor.process_events(second, _state()),
+        )
+
+        assert seen == [0, 1, 2, 3, 4]
+
+    async def test_lock_kept_for_batch_waiting_on_concurrency_limit(self):
+        processor = CallEventProcessor(max_concurrency=2)
+        in_flight = 0
+        peak = 0
+
+        async def handler(context: CallEventContext):
+            nonlocal in_flight, peak
+            data = context.get_event_data()
+            if context.call_connection_id == "call-x":
+                in_flight += 1
+                peak = max(peak, in_flight)
+            await asyncio.sleep(data["delay"])
+            if context.call_connection_id == "call-x":
+                in_flight -= 1
+
+        processor.register_handler(ACSEventTypes.PLAY_COMPLETED, handler)
+
+        def batch(call_id: str, *delays: float) -> list[CloudEvent]:
+            return [_event(ACSEventTypes.PLAY_COMPLETED, call_id, delay=d) for d in delays]
+
+        async def late_batch():
+            # Arrives while the second call-x batch is running and a slot frees up
+            await asyncio.sleep(0.05)
+            await processor.process_events(batch("call-x", 0.03), _state())
+
+        # Both slots busy, so the two call-x batches queue on the semaphore;
+        # the first finishing must not drop the lock the second already holds
+        await asyncio.gather(
+            processor.process_events(batch("call-y", 0.1), _state()),
+            processor.process_events(batch("call-z", 0.01), _state()),
+            processor.process_events(batch("call-x", 0.03), _state()),
+            processor.process_events(batch("call-x", 0.03, 0.03, 0.03), _state()),
+            late_batch(),
+        )
+
+        assert peak == 1
+        assert not processor._call_locks
+
+
+class TestBackgroundRecording:
+    @pytest.fixture
+    def acs_caller(self):
+        async def slow_start(_server_call_id):
+            await asyncio.sleep(0.2)
+
+        caller = MagicMock()
+        caller.start_recording = AsyncMock(side_effect=slow_start)
+        return caller
+
+    async def test_webhook_not_blocked_by_recording_start(self, acs_caller):
+        processor = CallEventProcessor()
+        state = _state(
+            acs_caller=acs_caller, recording_preferences=RecordingPreferences(enabled=True)
+        )
+
+        start = time.perf_counter()
+        result = await processor.process_events(
+            [_event(ACSEventTypes.CALL_CONNECTED, "call-rec", serverCallId="srv-1")], state
+        )
+        elapsed = time.perf_counter() - start
+
+        assert result["processed"] == 1
+        assert elapsed < 0.15
+        assert await processor.drain_side_effects(timeout=2.0)
+        acs_caller.start_recording.assert_awaited_once_with("srv-1")
+        assert processor.get_stats()["side_effects"]["succeeded"] == 1
+        await processor.shutdown()
+
+    async def test_recording_start_is_retried(self):
+        processor = CallEventProcessor()
+        processor._side_effects = SideEffectQueue(max_retries=2, base_backoff_s=0.01)
+        attempts = {"count": 0}
+
+        async def flaky_start(_server_call_id):
+            attempts["count"] += 1
+            if attempts["count"] == 1:
+                raise RuntimeError("ACS 503")
+
+        acs_caller = MagicMock()
+        acs_caller.start_recording = AsyncMock(side_effect=flaky_start)
+        state = _state(
+            acs_caller=acs_caller, recording_preferences=RecordingPreferences(enabled=True)
+        )
+
+        await processor.process_events(
+            [_event(ACSEventTypes.CALL_CONNECTED, "call-retry", serverCallId="srv-2")], state
+        )
+        assert await processor.drain_side_effects(timeout=2.0)
+
+        stats = processor.get_stats()["side_effects"]
+        assert attempts["count"] == 2
+        assert stats["retried"] == 1
+        assert stats["succeeded"] == 1
+        await processor.shutdown()
+
+    async def test_duplicate_connected_events_start_recording_once(self, acs_caller):
+        processor = CallEventProcessor()
+        state = _state(
+            acs_caller=acs_caller, recording_preferences=RecordingPreferences(enabled=True)
+        )
+        events = [
+            _event(ACSEventTypes.CALL_CONNECTED, "call-dup", serverCallId="srv-3"),
+            _event(ACSEventTypes.CALL_CONNECTED, "call-dup", serverCallId="srv-3"),
+        ]
+
+        await processor.process_events(events, state)
+        assert await processor.drain_side_effects(timeout=2.0)
+
+        acs_caller.start_recording.assert_awaited_once()
+        await processor.shutdown()
+
+
+class TestLatencyStats:
+    async def test_latency_histogram_per_event_type(self):
+        processor = CallEventProcessor()
+
+        async def slow(context: CallEventContext):
+            await asyncio.sleep(0.03)
+
+        processor.register_handler(ACSEventTypes.PLAY_COMPLETED, slow)
+        await processor.process_events(
+            [
+                _event(ACSEventTypes.PLAY_COMPLETED, "c1"),
+                _event(ACSEventTypes.PARTICIPANTS_UPDATED, "c1"),
+            ],
+            _state(),
+        )
+
+        latency = processor.get_stats()["event_latency_ms"]
+        assert latency[ACSEventTypes.PLAY_COMPLETED]["count"] == 1
+        assert latency[ACSEventTypes.PLAY_COMPLETED]["p50_ms"] >= 25
+        assert latency[ACSEventTypes.PARTICIPANTS_UPDATED]["count"] == 1
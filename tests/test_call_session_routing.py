@@ -0,0 +1,159 @@
+"""
+Tests for the in-process call → session routing table.
+
+Covers:
+- Local hits after bind without Redis reads
+- Redis read-through, negative caching and single-flight lookups
+- LRU bound
+- Disconnect invalidation over the distributed bus
+- ACS event handlers resolving through the router
+"""
+
+import asyncio
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from apps.artagent.backend.api.v1.events import call_routing
+from apps.artagent.backend.api.v1.events.acs_events import CallEventHandlers
+from apps.artagent.backend.api.v1.events.call_routing import (
+    CallSessionRouter,
+    get_call_session_router,
+    reset_call_session_router,
+)
+from src.pools.connection_manager import ThreadSafeConnectionManager
+
+
+def _redis(mapping: dict[str, str], delay: float = 0.0) -> MagicMock:
+    async def get_value_async(key):
+        await asyncio.sleep(delay)
+        return mapping.get(key)
+
+    redis = MagicMock()
+    redis.get_value_async = AsyncMock(side_effect=get_value_async)
+    return redis
+
+
+class TestCallSessionRouter:
+    async def test_bound_call_skips_redis(self):
+        router = CallSessionRouter()
+        redis = _redis({})
+        router.bind("call-1", "browser-1")
+
+        assert await router.resolve("call-1", redis_mgr=redis) == "browser-1"
+        redis.get_value_async.assert_not_called()
+
+    async def test_redis_read_through_is_cached(self):
+        router = CallSessionRouter()
+        redis = _redis({"call_session_mapping:call-1": "browser-1"})
+
+        assert await router.resolve("call-1", redis_mgr=redis) == "browser-1"
+        assert await router.resolve("call-1", redis_mgr=redis) == "browser-1"
+
+        assert redis.get_value_async.await_count == 2  # both key spellings, once
+        assert router.get_stats()["hits"] == 1
+
+    async def test_miss_is_negatively_cached(self, monkeypatch):
+        router = CallSessionRouter(negative_ttl_s=2.0)
+        redis = _redis({})
+        now = [100.0]
+        monkeypatch.setattr(call_routing.time, "monotonic", lambda: now[0])
+
+        assert await router.resolve("call-1", redis_mgr=redis) is None
+        assert await router.resolve("call-1", redis_mgr=redis) is None
+        assert redis.get_value_async.await_count == 2
+
+        now[0] += 3
+        await router.resolve("call-1", redis_mgr=redis)
+        assert redis.get_value_async.await_count == 4
+
+    async def test_bind_replaces_cached_miss(self):
+        router = CallSessionRouter()
+        await router.resolve("call-1", redis_mgr=_redis({}))
+
+        router.bind("call-1", "browser-1")
+
+        assert await router.resolve("call-1") == "browser-1"
+
+    async def test_concurrent_lookups_share_one_read(self):
+        router = CallSessionRouter()
+        redis = _redis({"call_session_map:call-1": "browser-1"}, delay=0.02)
+
+        results = await asyncio.gather(*(router.resolve("call-1", redis_mgr=redis) for _ in range(10)))
+
+        assert results == ["browser-1"] * 10
+        assert redis.get_value_async.await_count == 1
+
+    async def test_conn_manager_fallback(self):
+        router = CallSessionRouter()
+        conn_manager = MagicMock()
+        conn_manager.get_call_context = AsyncMock(return_value={"browser_session_id": "b-9"})
+
+        assert await router.resolve("call-1", redis_mgr=_redis({}), conn_manager=conn_manager) == "b-9"
+
+    def test_lru_bound(self):
+        router = CallSessionRouter(max_routes=2)
+        router.bind("a", "1")
+        router.bind("b", "2")
+        router.peek("a")
+        router.bind("c", "3")
+
+        assert router.peek("b") == (False, None)
+        assert router.peek("a") == (True, "1")
+
+
+class TestBusInvalidation:
+    async def test_invalidate_publishes_and_remote_forgets(self):
+        local, remote = CallSessionRouter(), CallSessionRouter()
+        local_bus, remote_bus = MagicMock(), MagicMock()
+        local_bus.publish_control = AsyncMock()
+        remote_handlers = {}
+        remote_bus.add_control_handler = lambda topic, fn: remote_handlers.setdefault(topic, fn)
+        local.attach_bus(local_bus)
+        remote.attach_bus(remote_bus)
+        local.bind("call-1", "browser-1")
+        remote.bind("call-1", "browser-1")
+
+        await local.invalidate("call-1")
+
+        topic, data = local_bus.publish_control.await_args.args
+        assert local.peek("call-1") == (False, None)
+        remote_handlers[topic](data)  # what the bus delivers on the other replica
+        assert remote.peek("call-1") == (False, None)
+        assert remote.get_stats()["invalidations"] == 1
+
+    async def test_connection_manager_dispatches_control_messages(self):
+        manager = ThreadSafeConnectionManager()
+        router = CallSessionRouter()
+        router.attach_bus(manager)
+        router.bind("call-1", "browser-1")
+        redis = MagicMock()
+        redis.publish_channel_async = AsyncMock()
+        manager._redis_mgr = redis
+
+        assert await manager.publish_control(call_routing.INVALIDATE_TOPIC, {"call_connection_id": "call-1"})
+
+        channel, raw = redis.publish_channel_async.await_args.args
+        payload = json.loads(raw)
+        assert channel == "session:_control"
+        manager._dispatch_control(payload["control"], payload["data"])
+        assert router.peek("call-1") == (False, None)
+
+
+class TestEventHandlersUseRouter:
+    @pytest.fixture(autouse=True)
+    def fresh_router(self):
+        reset_call_session_router()
+        yield
+        reset_call_session_router()
+
+    async def test_lookup_uses_bound_route(self):
+        redis = _redis({})
+        get_call_session_router().bind("call-1", "browser-1")
+        context = SimpleNamespace(call_connection_id="call-1", redis_mgr=redis, app_state=SimpleNamespace())
+
+        for _ in range(5):
+            assert await CallEventHandlers._lookup_browser_session_id(context) == "browser-1"
+
+        redis.get_value_async.assert_not_called()
@@ -0,0 +1,169 @@
+"""
+Tests for sliding-window conversation history budgeting.
+
+Covers:
+- Pass-through when history fits the budget
+- Default settings keep the full history (no silent trimming without a summary)
+- Recent turns kept within the token budget, tool call/result pairs intact
+- Background rolling summary cached in corememory and reused
+- Incremental summary refresh and single-flight scheduling
+"""
+
+import asyncio
+
+from apps.artagent.backend.voice.speech_cascade.history import (
+    SUMMARY_KEY_PREFIX,
+    HistoryBudget,
+    HistoryBudgeter,
+    estimate_tokens,
+    split_turns,
+)
+
+
+class FakeMemo:
+    def __init__(self):
+        self.core = {}
+
+    def get_value_from_corememory(self, key, default=None):
+        return self.core.get(key, default)
+
+    def set_corememory(self, key, value):
+        self.core[key] = value
+
+
+def _history(turns: int, words: int = 40) -> list[dict]:
+    history = []
+    for i in range(turns):
+        history.append({"role": "user", "content": f"question {i} " + "word " * words})
+        history.append({"role": "assistant", "content": f"answer {i} " + "word " * words})
+    return history
+
+
+class RecordingSummarizer:
+    def __init__(self):
+        self.calls: list[tuple[str | None, int]] = []
+
+    async def __call__(self, previous, messages):
+        self.calls.append((previous, len(messages)))
+        await asyncio.sleep(0.01)
+        return f"summary v{len(self.calls)}"
+
+
+class TestBudgeting:
+    def test_small_history_is_unchanged(self):
+        history = _history(3)
+        budgeter = HistoryBudgeter(HistoryBudget(max_tokens=10_000))
+        assert budgeter.apply(history) is history
+
+    def test_keeps_recent_turns_within_budget(self):
+        history = _history(30)
+        per_turn = sum(estimate_tokens(m) for m in history[-2:])
+        budgeter = HistoryBudgeter(
+            HistoryBudget(max_tokens=per_turn * 5, min_recent_turns=2, trim_without_summary=True)
+        )
+
+        trimmed = budgeter.apply(history)
+
+        assert trimmed == history[-10:]
+
+    def test_min_recent_turns_wins_over_budget(self):
+        history = _history(10, words=500)
+        budgeter = HistoryBudgeter(
+            HistoryBudget(max_tokens=100, min_recent_turns=3, trim_without_summary=True)
+        )
+        assert len(split_turns(budgeter.apply(history))) == 3
+
+    def test_tool_messages_stay_with_their_turn(self):
+        history = _history(10)
+        history.insert(-1, {"role": "assistant", "content": '{"role": "assistant", "tool_calls": []}'})
+        history.insert(-1, {"role": "tool", "content": '{"role": "tool", "content": "ok"}'})
+        budgeter = HistoryBudgeter(
+            HistoryBudget(max_tokens=1, min_recent_turns=1, trim_without_summary=True)
+        )
+
+        trimmed = budgeter.apply(history)
+
+        assert trimmed[0]["role"] == "user"
+        assert [m["role"] for m in trimmed] == ["user", "assistant", "tool", "assistant"]
+
+
+class TestRollingSummary:
+    async def test_summary_generated_in_background_and_reused(self):
+        memo = FakeMemo()
+        summarizer = RecordingSummarizer()
+        budgeter = HistoryBudgeter(
+            HistoryBudget(max_tokens=400, min_recent_turns=2, max_recent_turns=2, summarize=True),
+            summarizer,
+        )
+        history = _history(6)
+
+        first = budgeter.apply(history, cm=memo, agent="Concierge")
+        # Hot path does not wait for the summary
+        assert first == history[-4:]
+        await budgeter.wait_pending()
+
+        cached = memo.core[SUMMARY_KEY_PREFIX + "Concierge"]
+        assert cached["text"] == "summary v1"
+        assert cached["covered"] == 8
+
+        second = budgeter.apply(history, cm=memo, agent="Concierge")
+        assert second[0] == {
+            "role": "system",
+            "content": "Summary of the earlier conversation: summary v1",
+        }
+        assert second[1:] == history[-4:]
+        assert len(summarizer.calls) == 1
+
+    async def test_summary_refreshed_incrementally(self):
+        memo = FakeMemo()
+        summarizer = RecordingSummarizer()
+        budgeter = HistoryBudgeter(
+            HistoryBudget(max_tokens=400, min_recent_turns=2, max_recent_turns=2, summarize=True),
+            summarizer,
+        )
+        history = _history(6)
+        budgeter.apply(history, cm=memo, agent="A")
+        await budgeter.wait_pending()
+
+        history.extend(_history(1))
+        budgeter.apply(history, cm=memo, agent="A")
+        await budgeter.wait_pending()
+
+        # Second refresh folds only the newly dropped turn into the previous summary
+        assert summarizer.calls[1] == ("summary v1", 2)
+        assert memo.core[SUMMARY_KEY_PREFIX + "A"]["covered"] == 10
+
+    async def test_summary_refresh_is_single_flight(self):
+        memo = FakeMemo()
+        summarizer = RecordingSummarizer()
+        budgeter = HistoryBudgeter(
+            HistoryBudget(max_tokens=400, min_recent_turns=2, max_recent_turns=2, summarize=True),
+            summarizer,
+        )
+        history = _history(6)
+        for _ in range(5):
+            budgeter.apply(history, cm=memo, agent="A")
+        await budgeter.wait_pending()
+
+        assert len(summarizer.calls) == 1
+
+    async def test_defaults_keep_early_turns(self):
+        memo = FakeMemo()
+        summarizer = RecordingSummarizer()
+        budgeter = HistoryBudgeter(HistoryBudget.from_settings(), summarizer)
+        history = _history(40)
+        history[0] = {"role": "user", "content": "I'm Ada Lovelace, SSN ending 1234"}
+
+        sent = budgeter.apply(history, cm=memo, agent="A")
+        await budgeter.wait_pending()
+
+        # Summary is opt-in, and without it nothing is dropped
+        assert sent is history
+        assert sent[0]["content"].startswith("I'm Ada Lovelace")
+        assert summarizer.calls == []
+
+    def test_no_trimming_without_summarizer_unless_opted_in(self):
+        history = _history(40)
+        budget = HistoryBudget(max_tokens=100, min_recent_turns=2, summarize=True)
+
+        assert HistoryBudgeter(budget).apply(history) is history
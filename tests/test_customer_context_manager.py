@@ -0,0 +1,177 @@
+"""
+Tests for the async, write-behind CustomerContextManager.
+
+Covers:
+- Local, Redis and Cosmos read path with single-flight loads
+- Per-customer coalescing of Cosmos upserts
+- Flush on interval, at session end and on stop
+- Failed upserts requeued
+- write_through durability
+"""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from apps.artagent.backend.channels.context import CustomerContext, CustomerContextManager
+
+
+def _redis(store: dict[str, str] | None = None) -> MagicMock:
+    store = {} if store is None else store
+
+    async def get_value_async(key):
+        await asyncio.sleep(0.01)
+        return store.get(key)
+
+    async def set_value_async(key, value, ttl_seconds=None):
+        store[key] = value
+        return True
+
+    redis = MagicMock()
+    redis.get_value_async = AsyncMock(side_effect=get_value_async)
+    redis.set_value_async = AsyncMock(side_effect=set_value_async)
+    redis.store = store
+    return redis
+
+
+def _cosmos(docs: dict[str, dict] | None = None) -> MagicMock:
+    docs = {} if docs is None else docs
+    cosmos = MagicMock()
+    cosmos.read_document = MagicMock(side_effect=lambda query: docs.get(query["customer_id"]))
+    cosmos.upsert_document = MagicMock(
+        side_effect=lambda document, query: docs.__setitem__(query["customer_id"], document)
+    )
+    cosmos.docs = docs
+    return cosmos
+
+
+class TestReadPath:
+    async def test_local_hit_skips_redis(self):
+        redis = _redis()
+        manager = CustomerContextManager(redis_manager=redis)
+
+        first = await manager.get_or_create("+15550001")
+        second = await manager.get_or_create("+15550001")
+
+        assert second is first
+        assert redis.get_value_async.await_count == 1
+        assert manager.get_stats()["local_hits"] == 1
+
+    async def test_redis_hit_populates_local(self):
+        context = CustomerContext(customer_id="+15550001", name="Ada")
+        redis = _redis({"customer_context:+15550001": json.dumps(context.to_dict())})
+        cosmos = _cosmos()
+        manager = CustomerContextManager(cosmos_manager=cosmos, redis_manager=redis)
+
+        loaded = await manager.get_or_create("+15550001")
+
+        assert loaded.name == "Ada"
+        cosmos.read_document.assert_not_called()
+        assert await manager.get_or_create("+15550001") is loaded
+
+    async def test_cosmos_fallback_uses_document_api(self):
+        doc = CustomerContext(customer_id="+15550001", name="Ada").to_dict()
+        cosmos = _cosmos({"+15550001": doc})
+        redis = _redis()
+        manager = CustomerContextManager(cosmos_manager=cosmos, redis_manager=redis)
+
+        loaded = await manager.get_or_create("+15550001")
+
+        assert loaded.name == "Ada"
+        assert "customer_context:+15550001" in redis.store
+
+    async def test_concurrent_lookups_share_one_load(self):
+        redis = _redis()
+        manager = CustomerContextManager(redis_manager=redis)
+
+        contexts = await asyncio.gather(*(manager.get_or_create("+15550001") for _ in range(5)))
+
+        assert all(c is contexts[0] for c in contexts)
+        assert redis.get_value_async.await_count == 1
+
+    async def test_local_entries_expire(self):
+        redis = _redis()
+        manager = CustomerContextManager(redis_manager=redis, local_ttl_s=0.0)
+
+        await manager.get_or_create("+15550001")
+        await manager.get_or_create("+15550001")
+
+        assert redis.get_value_async.await_count == 2
+
+
+class TestWriteBehind:
+    async def test_burst_of_saves_coalesces_to_one_upsert(self):
+        cosmos = _cosmos()
+        manager = CustomerContextManager(cosmos_manager=cosmos, redis_manager=_redis())
+
+        for i in range(10):
+            await manager.update_customer_data("+15550001", {f"k{i}": i})
+
+        cosmos.upsert_document.assert_not_called()
+        assert await manager.flush() == 1
+        assert cosmos.upsert_document.call_count == 1
+        assert cosmos.docs["+15550001"]["collected_data"]["k9"] == 9
+        assert manager.get_stats()["coalesced"] == 10  # create + 10 updates, one pending
+
+    async def test_session_end_flushes_that_customer(self):
+        cosmos = _cosmos()
+        manager = CustomerContextManager(cosmos_manager=cosmos)
+        await manager.add_session_to_customer("+15550001", "whatsapp", "wa-1")
+        await manager.add_session_to_customer("+15550002", "webchat", "web-1")
+
+        await manager.end_customer_session("+15550001", "wa-1")
+
+        assert set(cosmos.docs) == {"+15550001"}
+        assert cosmos.docs["+15550001"]["sessions"][0]["status"] == "completed"
+        assert manager.get_stats()["pending"] == 1
+
+    async def test_flush_loop_and_stop(self):
+        cosmos = _cosmos()
+        manager = CustomerContextManager(cosmos_manager=cosmos, flush_interval_s=0.02)
+        manager.start()
+        await manager.update_customer_data("+15550001", {"a": 1})
+
+        await asyncio.sleep(0.08)
+        assert "+15550001" in cosmos.docs
+
+        await manager.update_customer_data("+15550001", {"b": 2})
+        await manager.stop()
+        assert cosmos.docs["+15550001"]["collected_data"] == {"a": 1, "b": 2}
+        assert manager.get_stats()["pending"] == 0
+
+    async def test_failed_upsert_is_requeued(self):
+        cosmos = _cosmos()
+        manager = CustomerContextManager(cosmos_manager=cosmos)
+        await manager.update_customer_data("+15550001", {"a": 1})
+        cosmos.upsert_document.side_effect = RuntimeError("throttled")
+
+        assert await manager.flush() == 0
+
+        stats = manager.get_stats()
+        assert stats["flush_failures"] == 1
+        assert stats["pending"] == 1
+
+
+class TestWriteThrough:
+    async def test_every_save_upserts(self):
+        cosmos = _cosmos()
+        manager = CustomerContextManager(cosmos_manager=cosmos, durability="write_through")
+
+        await manager.update_customer_data("+15550001", {"a": 1})
+        await manager.update_customer_data("+15550001", {"b": 2})
+
+        assert cosmos.upsert_document.call_count == 3  # create + 2 updates
+        assert manager.get_stats()["pending"] == 0
+
+    async def test_save_failure_raises(self):
+        cosmos = _cosmos()
+        cosmos.upsert_document.side_effect = RuntimeError("down")
+        manager = CustomerContextManager(cosmos_manager=cosmos, durability="write_through")
+
+        with pytest.raises(RuntimeError):
+            await manager.save(CustomerContext(customer_id="+15550001"))
+
+    def test_unknown_durability_rejected(self):
+        with pytest.raises(ValueError):
+            CustomerContextManager(durability="eventually")
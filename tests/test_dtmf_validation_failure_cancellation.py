@@ -137,14 +137,13 @@ async def test_cancel_call_fallback_direct_hangup(mock_context):
     """Test call cancellation fallback when session terminator is not available."""
     # Arrange - no websocket available, simulate fallback
     mock_context.websocket = None
-    mock_call_conn = MagicMock()
-    mock_context.acs_caller.get_call_connection.return_value = mock_call_conn
+    mock_context.acs_caller.call_control.hang_up = AsyncMock()
 
     # Act
     await DTMFValidationLifecycle._cancel_call_for_validation_failure(mock_context)
 
     # Assert - should use direct hang_up as fallback
-    mock_call_conn.hang_up.assert_called_once_with(is_for_everyone=True)
+    mock_context.acs_caller.call_control.hang_up.assert_awaited_once_with("test-call-123")
 
 
 @pytest.mark.asyncio
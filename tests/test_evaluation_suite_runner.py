@@ -0,0 +1,333 @@
+"""
+Test suite for the parallel evaluation runner and replay backend.
+
+Tests cover:
+- Deterministic replay of recorded and synthesized turns
+- Strict replay by default; synthesized turns counted per scenario
+- In-memory event streaming (no JSONL round-trip)
+- Comparison variants built in memory and run concurrently
+- Suite concurrency limits, failure isolation and sharding
+"""
+
+import json
+import time
+
+import pytest
+from apps.artagent.backend.evaluation.recorder import EventRecorder
+from apps.artagent.backend.evaluation.replay import (
+    RecordedToolCall,
+    RecordedTurn,
+    RecordingOrchestrator,
+    ReplayBackend,
+    ReplayOrchestratorFactory,
+)
+from apps.artagent.backend.evaluation.scenario_runner import ComparisonRunner, ScenarioRunner
+from apps.artagent.backend.evaluation.suite_runner import (
+    EvaluationJob,
+    SuiteRunner,
+    check_unique_names,
+    expand_jobs,
+    shard_jobs,
+)
+
+
+def _scenario(
+    name: str, turns: int = 2, agent: str = "Concierge", recorded: bool = True
+) -> dict:
+    scenario = {
+        "scenario_name": name,
+        "agent": agent,
+        "turns": [
+            {
+                "turn_id": f"{name}_{i}",
+                "user_input": f"question {i} for {name}",
+                "expectations": {"tools_called": ["lookup"] if i % 2 else []},
+            }
+            for i in range(turns)
+        ],
+    }
+    if recorded:
+        for i, turn in enumerate(scenario["turns"]):
+            turn["replay"] = {
+                "response_text": f"answer {i}",
+                "tool_calls": [{"name": "lookup"}] if i % 2 else [],
+            }
+    return scenario
+
+
+class TestReplayBackend:
+    def test_recorded_turn_is_replayed(self):
+        backend = ReplayBackend(
+            [RecordedTurn(agent="A", user_text="Hello there", response_text="Hi!")]
+        )
+        turn = backend.lookup("A", "  hello   THERE ")
+        assert turn.response_text == "Hi!"
+        assert backend.hits == 1
+
+    def test_synthesized_turn_is_deterministic(self):
+        backend = ReplayBackend(strict=False)
+        backend.expect_tools("A", "check balance", ["get_balance"])
+        first = backend.lookup("A", "check balance")
+        second = ReplayBackend(strict=False)
+        second.expect_tools("A", "check balance", ["get_balance"])
+        assert first == second.lookup("A", "check balance")
+        assert [tc.name for tc in first.tool_calls] == ["get_balance"]
+        assert first.synthesized and backend.misses == 1
+
+    def test_miss_raises_by_default(self):
+        with pytest.raises(KeyError):
+            ReplayBackend().lookup("A", "unknown")
+
+    def test_jsonl_roundtrip(self, tmp_path):
+        backend = ReplayBackend(
+            [
+                RecordedTurn(
+                    agent="A",
+                    user_text="q",
+                    response_text="r",
+                    tool_calls=[RecordedToolCall(name="t", arguments={"x": 1}, result="ok")],
+                )
+            ]
+        )
+        path = tmp_path / "rec.jsonl"
+        backend.dump(path)
+        loaded = ReplayBackend.from_jsonl(path)
+        assert loaded.lookup("A", "q").tool_calls[0].arguments == {"x": 1}
+
+    async def test_recording_orchestrator_captures_turn(self):
+        class LiveOrchestrator:
+            _active_agent = "A"
+
+            async def process_turn(self, context, on_tool_start=None, on_tool_end=None, **_):
+                await on_tool_start("lookup", {"id": 7})
+                await on_tool_end("lookup", {"found": True})
+                return type("R", (), {"response_text": "done", "input_tokens": 3})()
+
+        recorder = RecordingOrchestrator(LiveOrchestrator())
+        ctx = type("Ctx", (), {"user_text": "find 7"})()
+        await recorder.process_turn(ctx)
+
+        turn = recorder.backend.lookup("A", "find 7")
+        assert turn.response_text == "done"
+        assert turn.tool_calls[0].result == {"found": True}
+
+    def test_repeated_utterance_keeps_each_recording(self):
+        backend = ReplayBackend()
+        backend.load_scenario(
+            {
+                "agent": "A",
+                "turns": [
+                    {"user_input": "yes", "replay": {"response_text": "first"}},
+                    {"user_input": "yes", "replay": {"response_text": "second"}},
+                ],
+            }
+        )
+
+        assert len(backend) == 2
+        assert backend.lookup("A", "yes").response_text == "first"
+        assert backend.lookup("A", "yes").response_text == "second"
+        # A further repeat falls back to the latest recording
+        assert backend.lookup("A", "yes").response_text == "second"
+
+    async def test_recording_keeps_repeats_and_concurrent_tool_calls(self, tmp_path):
+        class LiveOrchestrator:
+            _active_agent = "A"
+
+            async def process_turn(self, context, on_tool_start=None, on_tool_end=None, **_):
+                await on_tool_start("lookup", {"id": 1}, tool_call_id="call_1")
+                await on_tool_start("lookup", {"id": 2}, tool_call_id="call_2")
+                await on_tool_end("lookup", "two", tool_call_id="call_2")
+                await on_tool_end("lookup", "one", tool_call_id="call_1")
+                return type("R", (), {"response_text": context.user_text})()
+
+        recorder = RecordingOrchestrator(LiveOrchestrator())
+        for _ in range(2):
+            await recorder.process_turn(type("Ctx", (), {"user_text": "yes"})())
+
+        recorder.backend.dump(tmp_path / "rec.jsonl")
+        replay = ReplayBackend.from_jsonl(tmp_path / "rec.jsonl", strict=True)
+        first, second = replay.lookup("A", "yes"), replay.lookup("A", "yes")
+        assert (first.occurrence, second.occurrence) == (0, 1)
+        assert [(tc.arguments, tc.result) for tc in first.tool_calls] == [
+            ({"id": 2}, "two"),
+            ({"id": 1}, "one"),
+        ]
+
+
+class TestScenarioRunner:
+    async def test_events_scored_in_memory(self, tmp_path):
+        runner = ScenarioRunner(
+            scenario=_scenario("mem"),
+            output_dir=tmp_path,
+            orchestrator_factory=ReplayOrchestratorFactory(),
+            persist_events=False,
+        )
+        summary = await runner.run()
+
+        assert summary.total_turns == 2
+        assert summary.tool_metrics["recall"] == 1.0
+        assert not list(tmp_path.glob("*_events.jsonl"))
+
+    async def test_scenario_context_cannot_override_run_id(self, tmp_path):
+        contexts = []
+        factory = ReplayOrchestratorFactory()
+
+        class _Capturing:
+            def __init__(self, *args):
+                self._inner = factory(*args)
+                self.agents = self._inner.agents
+
+            async def process_turn(self, context, **kwargs):
+                contexts.append(context)
+                return await self._inner.process_turn(context, **kwargs)
+
+        scenario = _scenario("ctx", turns=1)
+        scenario["metadata"] = {"context": {"run_id": "from-scenario", "tier": "gold"}}
+        await ScenarioRunner(
+            scenario=scenario, output_dir=tmp_path, orchestrator_factory=_Capturing
+        ).run()
+
+        assert contexts[0].metadata["run_id"] == "ctx_0"
+        assert contexts[0].metadata["tier"] == "gold"
+
+    async def test_inline_replay_handoff(self, tmp_path):
+        scenario = _scenario("handoff", turns=2)
+        scenario["turns"][0]["replay"] = {
+            "response_text": "Transferring you.",
+            "handoff_to": "Specialist",
+        }
+        runner = ScenarioRunner(
+            scenario=scenario,
+            output_dir=tmp_path,
+            orchestrator_factory=ReplayOrchestratorFactory(),
+        )
+        summary = await runner.run()
+        events = [
+            json.loads(line)
+            for path in tmp_path.glob("*_events.jsonl")
+            for line in path.read_text().splitlines()
+        ]
+        assert summary.total_turns == 2
+        assert [e["agent_name"] for e in events] == ["Specialist", "Specialist"]
+        assert events[0]["response_text"] == "Transferring you."
+
+    def test_recorder_on_event_callback(self):
+        seen = []
+        recorder = EventRecorder(run_id="cb", on_event=seen.append)
+        recorder.record_turn_start("t1", "A", "hi", timestamp=1.0)
+        recorder.record_turn_end("t1", "A", "hello", e2e_ms=5.0, timestamp=1.005)
+        assert recorder.output_path is None
+        assert [e.turn_id for e in seen] == ["t1"]
+        assert recorder.get_events() == seen
+
+
+class TestComparisonRunner:
+    async def test_variants_run_concurrently_without_temp_yaml(self, tmp_path):
+        comparison = {
+            "comparison_name": "ab",
+            "variants": [
+                {"variant_id": "a", "agent": "A", "model_override": {"deployment_id": "m1"}},
+                {"variant_id": "b", "agent": "A", "model_override": {"deployment_id": "m2"}},
+            ],
+            "turns": _scenario("x", turns=1)["turns"],
+        }
+        runner = ComparisonRunner(
+            comparison=comparison,
+            output_dir=tmp_path,
+            orchestrator_factory=ReplayOrchestratorFactory(default_latency_ms=100),
+        )
+        start = time.perf_counter()
+        results = await runner.run()
+        elapsed = time.perf_counter() - start
+
+        assert list(results) == ["a", "b"]
+        assert results["b"].eval_model_config.model_name == "m2"
+        assert elapsed < 0.19  # two 100ms variants overlapped
+        assert not list(tmp_path.rglob("*_scenario.yaml"))
+
+
+class TestSuiteRunner:
+    def test_expand_comparison_into_variant_jobs(self):
+        jobs = expand_jobs(
+            {
+                "comparison_name": "cmp",
+                "variants": [{"variant_id": "v1"}, {"variant_id": "v2"}],
+                "turns": [],
+            }
+        )
+        assert [(j.name, j.variant_id) for j in jobs] == [("cmp_v1", "v1"), ("cmp_v2", "v2")]
+
+    def test_shards_are_balanced_and_deterministic(self):
+        jobs = [EvaluationJob(name=f"s{i}", scenario=_scenario(f"s{i}", turns=i + 1)) for i in range(6)]
+        shards = shard_jobs(jobs, 2)
+        loads = [sum(j.weight for j in shard) for shard in shards]
+        assert abs(loads[0] - loads[1]) <= 1
+        assert shards == shard_jobs(list(reversed(jobs)), 2)
+
+    async def test_concurrency_limit_and_speedup(self, tmp_path):
+        jobs = [EvaluationJob(name=f"s{i}", scenario=_scenario(f"s{i}", turns=1)) for i in range(8)]
+        runner = SuiteRunner(
+            output_dir=tmp_path,
+            orchestrator_factory=ReplayOrchestratorFactory(default_latency_ms=50),
+            max_concurrency=4,
+        )
+        result = await runner.run(jobs)
+
+        assert len(result.summaries) == 8
+        assert not result.failures
+        # 8 x 50ms with 4 in flight -> ~2 waves, well under the 400ms serial time
+        assert result.duration_s < 0.3
+
+    async def test_failure_is_isolated(self, tmp_path):
+        jobs = [
+            EvaluationJob(name="ok", scenario=_scenario("ok")),
+            EvaluationJob(name="bad", scenario=_scenario("bad", recorded=False)),
+        ]
+        factory = ReplayOrchestratorFactory()
+
+        result = await SuiteRunner(output_dir=tmp_path, orchestrator_factory=factory).run(jobs)
+
+        assert set(result.summaries) == {"ok"}
+        assert "KeyError" in result.failures["bad"]
+
+    async def test_synthesized_turns_flagged_per_scenario(self, tmp_path):
+        jobs = [
+            EvaluationJob(name="recorded", scenario=_scenario("recorded")),
+            EvaluationJob(name="unrecorded", scenario=_scenario("unrecorded", recorded=False)),
+        ]
+        factory = ReplayOrchestratorFactory(strict=False)
+
+        result = await SuiteRunner(output_dir=tmp_path, orchestrator_factory=factory).run(jobs)
+
+        assert set(result.summaries) == {"recorded", "unrecorded"}
+        assert result.replay_misses == {"unrecorded": 2}
+        assert result.flagged == ["unrecorded"]
+
+    async def test_sharded_across_processes(self, tmp_path):
+        jobs = [EvaluationJob(name=f"p{i}", scenario=_scenario(f"p{i}")) for i in range(4)]
+        runner = SuiteRunner(
+            output_dir=tmp_path,
+            orchestrator_factory=ReplayOrchestratorFactory(),
+            processes=2,
+        )
+        result = await runner.run(jobs)
+        assert sorted(result.summaries) == ["p0", "p1", "p2", "p3"]
+
+    def test_discover_loads_yaml(self, tmp_path):
+        import yaml
+
+        (tmp_path / "one.yaml").write_text(yaml.safe_dump(_scenario("one")))
+        (tmp_path / "schema.yaml").write_text(yaml.safe_dump({"unrelated": True}))
+        jobs = SuiteRunner.discover([tmp_path])
+        assert [j.name for j in jobs] == ["one"]
+
+    def test_duplicate_names_rejected(self, tmp_path):
+        import yaml
+
+        (tmp_path / "a.yaml").write_text(yaml.safe_dump(_scenario("same")))
+        (tmp_path / "b.yaml").write_text(yaml.safe_dump(_scenario("same")))
+
+        with pytest.raises(ValueError, match="same"):
+            SuiteRunner.discover([tmp_path])
+        with pytest.raises(ValueError, match="dup"):
+            check_unique_names([EvaluationJob(name="dup", scenario=_scenario("dup"))] * 2)
@@ -0,0 +1,145 @@
+"""
+Tests for the readiness health monitor.
+
+Covers:
+- Concurrent checks and per-component staleness bounds
+- Probe storms sharing one in-flight check
+- Timeouts reported as unhealthy
+- Status-change events for subscribers
+- /readiness served from the cached snapshot
+"""
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+from apps.artagent.backend.api.v1.schemas.health import ServiceCheck
+from apps.artagent.backend.api.v1.utils.health_monitor import HealthComponent, HealthMonitor
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _component(name: str, calls: dict, *, status="healthy", delay=0.0, max_age_s=10.0):
+    async def check() -> ServiceCheck:
+        calls[name] = calls.get(name, 0) + 1
+        await asyncio.sleep(delay)
+        return ServiceCheck(component=name, status=calls.get(f"{name}.status", status), check_time_ms=0)
+
+    return HealthComponent(name, check, max_age_s=max_age_s, timeout_s=0.5)
+
+
+class TestHealthMonitor:
+    async def test_checks_run_concurrently(self):
+        calls: dict = {}
+        monitor = HealthMonitor([_component(f"c{i}", calls, delay=0.1) for i in range(6)])
+
+        start = time.perf_counter()
+        checks = await monitor.get_checks()
+
+        assert time.perf_counter() - start < 0.3
+        assert [c.component for c in checks] == [f"c{i}" for i in range(6)]
+
+    async def test_only_stale_components_refreshed(self):
+        calls: dict = {}
+        clock = FakeClock()
+        monitor = HealthMonitor(
+            [_component("redis", calls, max_age_s=5.0), _component("auth", calls, max_age_s=60.0)],
+            clock=clock,
+        )
+        await monitor.get_checks()
+
+        clock.now += 3
+        checks = await monitor.get_checks()
+        assert calls == {"redis": 1, "auth": 1}
+        assert checks[0].age_ms == 3000.0
+
+        clock.now += 3
+        await monitor.get_checks()
+        assert calls == {"redis": 2, "auth": 1}
+
+    async def test_probe_storm_shares_one_check(self):
+        calls: dict = {}
+        monitor = HealthMonitor([_component("redis", calls, delay=0.05)])
+
+        await asyncio.gather(*(monitor.get_checks() for _ in range(20)))
+
+        assert calls == {"redis": 1}
+
+    async def test_timeout_reported_unhealthy(self):
+        calls: dict = {}
+        component = _component("redis", calls, delay=1.0)
+        component.timeout_s = 0.05
+        monitor = HealthMonitor([component])
+
+        (check,) = await monitor.get_checks()
+
+        assert check.status == "unhealthy"
+        assert "timed out" in check.error
+
+    async def test_status_change_published(self):
+        calls: dict = {}
+        clock = FakeClock()
+        monitor = HealthMonitor([_component("redis", calls, max_age_s=5.0)], clock=clock)
+        queue = monitor.subscribe()
+        await monitor.get_checks()
+        assert queue.empty()
+
+        calls["redis.status"] = "unhealthy"
+        clock.now += 10
+        await monitor.get_checks()
+
+        event = queue.get_nowait()
+        assert (event["component"], event["status"], event["previous_status"]) == (
+            "redis",
+            "unhealthy",
+            "healthy",
+        )
+        monitor.unsubscribe(queue)
+
+    async def test_background_loop_refreshes_before_stale(self):
+        calls: dict = {}
+        monitor = HealthMonitor([_component("redis", calls, max_age_s=0.05)], interval_s=0.02)
+
+        monitor.start()
+        await asyncio.sleep(0.1)
+        await monitor.stop()
+
+        assert calls["redis"] >= 2
+        assert not monitor.running
+
+
+class TestReadinessEndpoint:
+    async def test_readiness_uses_cached_snapshot(self):
+        from apps.artagent.backend.api.v1.endpoints import health
+
+        calls: dict = {}
+        app = SimpleNamespace(state=SimpleNamespace())
+        app.state.health_monitor = HealthMonitor(
+            [_component("redis", calls), _component("acs_caller", calls, status="unhealthy")]
+        )
+        request = SimpleNamespace(app=app)
+
+        first = await health.readiness_check(request)
+        await health.readiness_check(request)
+
+        assert first.status_code == 200
+        assert b'"degraded"' in first.body
+        assert calls == {"redis": 1, "acs_caller": 1}
+
+    async def test_monitor_created_from_app_state(self):
+        from apps.artagent.backend.api.v1.endpoints import health
+
+        app = SimpleNamespace(state=SimpleNamespace(redis=None))
+
+        monitor = health.get_health_monitor(app)
+        checks = {c.component: c for c in await monitor.get_checks()}
+
+        assert health.get_health_monitor(app) is monitor
+        assert checks["redis"].error == "not initialized"
+        assert "app_configuration" in checks
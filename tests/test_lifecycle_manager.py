@@ -0,0 +1,140 @@
+"""
+Tests for dependency-graph startup in LifecycleManager.
+
+Covers:
+- Independent steps run concurrently; dependents wait
+- Default sequential ordering when no dependencies are declared
+- Non-critical steps finishing after ready, and their failures
+- Critical failures abort startup and cancel in-flight steps
+- Critical path reporting and graph validation
+"""
+
+import asyncio
+
+import pytest
+from apps.artagent.backend.lifecycle.manager import LifecycleManager
+
+
+def _sleeper(log: list[str], name: str, delay: float):
+    async def start() -> None:
+        log.append(f"start:{name}")
+        await asyncio.sleep(delay)
+        log.append(f"end:{name}")
+
+    return start
+
+
+class TestStartupOrdering:
+    async def test_independent_steps_overlap(self):
+        log: list[str] = []
+        manager = LifecycleManager()
+        manager.add_step("a", _sleeper(log, "a", 0.05), depends_on=())
+        manager.add_step("b", _sleeper(log, "b", 0.05), depends_on=())
+        manager.add_step("c", _sleeper(log, "c", 0.01), depends_on=("a", "b"))
+
+        await manager.run_startup()
+
+        assert log[:2] == ["start:a", "start:b"]
+        assert log.index("start:c") > max(log.index("end:a"), log.index("end:b"))
+        assert manager.ready_time < 0.1
+
+    async def test_undeclared_dependencies_run_sequentially(self):
+        log: list[str] = []
+        manager = LifecycleManager()
+        for name in ("a", "b", "c"):
+            manager.add_step(name, _sleeper(log, name, 0))
+
+        results = await manager.run_startup()
+
+        assert log == ["start:a", "end:a", "start:b", "end:b", "start:c", "end:c"]
+        assert [name for name, _ in results] == ["a", "b", "c"]
+
+
+class TestNonCriticalSteps:
+    async def test_ready_before_non_critical_finishes(self):
+        log: list[str] = []
+        manager = LifecycleManager()
+        manager.add_step("core", _sleeper(log, "core", 0), depends_on=())
+        manager.add_step("warmup", _sleeper(log, "warmup", 0.05), depends_on=("core",), critical=False)
+
+        await manager.run_startup()
+        assert "end:warmup" not in log
+
+        await manager.wait_background()
+        assert "end:warmup" in log
+        assert [s.name for s in manager.executed_steps] == ["core", "warmup"]
+
+    async def test_non_critical_failure_is_logged_not_raised(self):
+        async def fail() -> None:
+            raise RuntimeError("boom")
+
+        manager = LifecycleManager()
+        manager.add_step("core", _sleeper([], "core", 0), depends_on=())
+        manager.add_step("warmup", fail, depends_on=(), critical=False)
+
+        await manager.run_startup()
+        await manager.wait_background()
+
+        assert [s.name for s in manager.executed_steps] == ["core"]
+        assert manager.steps[1].error == "boom"
+
+    async def test_shutdown_cancels_background_steps(self):
+        log: list[str] = []
+        manager = LifecycleManager()
+        manager.add_step("slow", _sleeper(log, "slow", 10), depends_on=(), critical=False)
+
+        await manager.run_startup()
+        await asyncio.sleep(0)
+        await manager.run_shutdown()
+
+        assert log == ["start:slow"]
+
+
+class TestFailures:
+    async def test_critical_failure_cancels_in_flight_steps(self):
+        log: list[str] = []
+
+        async def fail() -> None:
+            await asyncio.sleep(0.01)
+            raise RuntimeError("redis down")
+
+        manager = LifecycleManager()
+        manager.add_step("core", fail, depends_on=())
+        manager.add_step("speech", _sleeper(log, "speech", 1), depends_on=())
+        manager.add_step("aoai", _sleeper(log, "aoai", 0), depends_on=("core",))
+
+        with pytest.raises(RuntimeError, match="redis down"):
+            await manager.run_startup()
+
+        assert log == ["start:speech"]
+        assert manager.executed_steps == []
+
+    @pytest.mark.parametrize(
+        "deps, message",
+        [
+            ({"a": ("missing",)}, "unknown"),
+            ({"a": ("b",), "b": ("a",)}, "cycle"),
+        ],
+    )
+    async def test_invalid_graph_rejected(self, deps, message):
+        manager = LifecycleManager()
+        for name, depends_on in deps.items():
+            manager.add_step(name, _sleeper([], name, 0), depends_on=depends_on)
+
+        with pytest.raises(ValueError, match=message):
+            await manager.run_startup()
+
+
+class TestCriticalPath:
+    async def test_critical_path_follows_gating_dependencies(self):
+        manager = LifecycleManager()
+        manager.add_step("core", _sleeper([], "core", 0.01), depends_on=())
+        manager.add_step("speech", _sleeper([], "speech", 0.06), depends_on=())
+        manager.add_step("aoai", _sleeper([], "aoai", 0.01), depends_on=("core",))
+        manager.add_step("ready", _sleeper([], "ready", 0), depends_on=("aoai", "speech"))
+        manager.add_step("warmup", _sleeper([], "warmup", 0.2), depends_on=(), critical=False)
+
+        await manager.run_startup()
+
+        assert [name for name, _ in manager.get_critical_path()] == ["speech", "ready"]
+        await manager.run_shutdown()
@@ -0,0 +1,236 @@
+"""
+Tests for the batched post-call analytics writer.
+
+Covers:
+- Batching by size and by age
+- Retry with backoff before a batch succeeds
+- Spill to disk on overflow and replay on the next start
+- Graceful drain on stop with no lost documents
+- Fixed-memory quantile sketch used for latency summaries
+- build_and_flush routing through the writer
+"""
+
+import asyncio
+import json
+import random
+import time
+from types import SimpleNamespace
+
+import pytest
+from src.postcall import writer as writer_module
+from src.postcall.push import build_analytics_document, build_and_flush
+from src.postcall.sketch import QuantileSketch
+from src.postcall.writer import AnalyticsWriter
+
+
+class _Cosmos:
+    """Collection fake recording bulk upserts; optionally fails the first N calls."""
+
+    def __init__(self, fail_first=0, delay_s=0.0):
+        self.docs = {}
+        self.calls = []
+        self.fail_first = fail_first
+        self.delay_s = delay_s
+
+    def bulk_upsert_documents(self, documents):
+        if self.delay_s:
+            time.sleep(self.delay_s)
+        if self.fail_first:
+            self.fail_first -= 1
+            raise ConnectionError("transient")
+        self.calls.append(len(documents))
+        for doc in documents:
+            self.docs[doc["_id"]] = doc
+        return len(documents)
+
+
+def _doc(i):
+    return {"_id": f"session_{i}", "session_id": f"session_{i}"}
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch):
+    monkeypatch.setattr(writer_module.random, "uniform", lambda a, b: 0.0)
+
+
+class TestBatching:
+    async def test_full_batches_written_in_bulk(self):
+        cosmos = _Cosmos()
+        writer = AnalyticsWriter(cosmos, batch_size=10, max_batch_age_s=5)
+        for i in range(30):
+            writer.submit(_doc(i))
+        writer.start()
+
+        await writer.stop()
+
+        assert cosmos.calls == [10, 10, 10]
+        assert len(cosmos.docs) == 30
+
+    async def test_partial_batch_flushed_by_age(self):
+        cosmos = _Cosmos()
+        writer = AnalyticsWriter(cosmos, batch_size=50, max_batch_age_s=0.05)
+        writer.start()
+        writer.submit(_doc(1))
+        writer.submit(_doc(2))
+
+        await asyncio.sleep(0.2)
+
+        assert cosmos.calls == [2]
+        await writer.stop()
+
+    async def test_duplicate_ids_last_write_wins(self):
+        cosmos = _Cosmos()
+        writer = AnalyticsWriter(cosmos, batch_size=10, max_batch_age_s=5)
+        writer.submit({"_id": "s", "v": 1})
+        writer.submit({"_id": "s", "v": 2})
+        writer.start()
+
+        await writer.stop()
+
+        assert cosmos.calls == [1]
+        assert cosmos.docs["s"]["v"] == 2
+
+
+class TestFailures:
+    async def test_retries_then_succeeds(self):
+        cosmos = _Cosmos(fail_first=2)
+        writer = AnalyticsWriter(cosmos, batch_size=5, max_retries=3, retry_base_s=0.001)
+        for i in range(5):
+            writer.submit(_doc(i))
+        writer.start()
+
+        await writer.stop()
+
+        assert len(cosmos.docs) == 5
+        assert writer.get_stats()["retries"] == 2
+
+    async def test_exhausted_retries_spill_and_replay(self, tmp_path):
+        spill = tmp_path / "spill.jsonl"
+        cosmos = _Cosmos(fail_first=10)
+        writer = AnalyticsWriter(cosmos, batch_size=5, max_retries=1, retry_base_s=0.001, spill_path=spill)
+        for i in range(3):
+            writer.submit(_doc(i))
+        writer.start()
+        await writer.stop()
+
+        assert len(spill.read_text().splitlines()) == 3
+
+        cosmos.fail_first = 0
+        restarted = AnalyticsWriter(cosmos, spill_path=spill)
+        restarted.start()
+        await restarted.stop()
+
+        assert set(cosmos.docs) == {"session_0", "session_1", "session_2"}
+        assert not spill.exists()
+
+    async def test_overflow_spills_instead_of_blocking(self, tmp_path):
+        spill = tmp_path / "spill.jsonl"
+        writer = AnalyticsWriter(_Cosmos(), max_queue=2, spill_path=spill)
+
+        assert all(writer.submit(_doc(i)) for i in range(5))
+        spilled = [json.loads(line)["_id"] for line in spill.read_text().splitlines()]
+        assert spilled == ["session_2", "session_3", "session_4"]
+
+    def test_overflow_without_spill_path_drops(self):
+        writer = AnalyticsWriter(_Cosmos(), max_queue=1)
+
+        assert writer.submit(_doc(1)) is True
+        assert writer.submit(_doc(2)) is False
+        assert writer.get_stats()["dropped"] == 1
+
+
+class TestDrainAndThroughput:
+    async def test_hangup_storm_loses_nothing(self, tmp_path):
+        cosmos = _Cosmos(delay_s=0.005)
+        writer = AnalyticsWriter(
+            cosmos, max_queue=200, batch_size=50, max_batch_age_s=0.05, spill_path=tmp_path / "spill.jsonl"
+        )
+        writer.start()
+
+        start = time.perf_counter()
+        for i in range(1000):
+            writer.submit(_doc(i))
+            if i % 100 == 0:
+                await asyncio.sleep(0)
+        submit_elapsed = time.perf_counter() - start
+        await writer.stop()
+
+        # Replay anything that overflowed to disk
+        writer.start()
+        await writer.stop()
+
+        assert len(cosmos.docs) == 1000
+        assert len(cosmos.calls) <= 40
+        # 1000 sequential 5 ms writes would take 5 s; submission never waits on Cosmos
+        assert submit_elapsed < 2.0
+
+    async def test_stop_timeout_spills_remaining(self, tmp_path):
+        spill = tmp_path / "spill.jsonl"
+        cosmos = _Cosmos(delay_s=0.2)
+        writer = AnalyticsWriter(cosmos, batch_size=1, spill_path=spill)
+        for i in range(3):
+            writer.submit(_doc(i))
+        writer.start()
+        await asyncio.sleep(0)
+
+        await writer.stop(timeout=0.05)
+
+        spilled = {json.loads(line)["_id"] for line in spill.read_text().splitlines()}
+        assert spilled | set(cosmos.docs) == {"session_0", "session_1", "session_2"}
+
+
+class TestQuantileSketch:
+    def test_quantiles_within_relative_accuracy(self):
+        rng = random.Random(3)
+        values = [rng.lognormvariate(5, 1) for _ in range(20000)]
+        sketch = QuantileSketch(relative_accuracy=0.01)
+        sketch.extend(values)
+        values.sort()
+
+        for q in (0.5, 0.9, 0.99):
+            exact = values[int(q * (len(values) - 1))]
+            assert sketch.quantile(q) == pytest.approx(exact, rel=0.02)
+        assert len(sketch._buckets) <= 512
+
+    def test_bucket_count_is_bounded(self):
+        sketch = QuantileSketch(max_buckets=32)
+        sketch.extend(10 ** (i / 100) for i in range(1000))
+
+        assert len(sketch._buckets) == 32
+        assert sketch.quantile(1.0) == sketch.max
+
+    def test_summary_keeps_legacy_keys(self):
+        sketch = QuantileSketch()
+        sketch.extend([0.0, 1.0, 2.0, 3.0])
+
+        summary = sketch.summary()
+        assert summary["count"] == 4
+        assert summary["avg"] == 1.5
+        assert summary["min"] == 0.0 and summary["max"] == 3.0
+        assert QuantileSketch().summary()["p99"] == 0.0
+
+
+class TestBuildAndFlush:
+    def _cm(self):
+        return SimpleNamespace(
+            session_id="s1",
+            histories={"Concierge": []},
+            context={"latency_roundtrip": {"stt": [{"dur": 0.1}, {"dur": 0.3}, {}]}, "caller": "x"},
+        )
+
+    def test_document_shape(self):
+        doc = build_analytics_document(self._cm())
+
+        assert doc["_id"] == "s1"
+        assert "latency_roundtrip" not in doc["context"]
+        assert doc["latency_summary"]["stt"]["count"] == 2
+        assert doc["latency_summary"]["stt"]["max"] == 0.3
+
+    async def test_queued_when_writer_given(self):
+        cosmos = _Cosmos()
+        writer = AnalyticsWriter(cosmos)
+
+        await build_and_flush(self._cm(), cosmos, writer)
+
+        assert writer.get_stats()["queued"] == 1
+        assert cosmos.calls == []
@@ -0,0 +1,214 @@
+"""
+Tests for indexed profile lookups shared by the auth and insurance tools.
+
+Covers:
+- Normalized lookup keys written at ingest
+- Exact-match queries on lookup keys (no $regex)
+- Anchored $regex fallback for profiles written without lookup keys
+- Bounded LRU in front of Cosmos
+- Index creation and backfill of older profiles
+- Auth, subro and policy tools routed through the shared module
+"""
+
+import re
+from types import SimpleNamespace
+
+import pytest
+from apps.artagent.backend.registries.toolstore import auth, profile_lookup
+from apps.artagent.backend.registries.toolstore.insurance import policy, subro
+from apps.artagent.backend.registries.toolstore.profile_lookup import (
+    ProfileLookupCache,
+    build_lookup_keys,
+    ensure_lookup_indexes,
+    find_claim,
+    find_policy,
+    find_user_by_identity,
+    with_lookup_keys,
+)
+
+
+def _profile(client_id="ada_1234", name="Ada  Lovelace", claim="CLM-2024-000123", policy_no="POL-AUTO-77"):
+    return {
+        "_id": client_id,
+        "client_id": client_id,
+        "full_name": name,
+        "verification_codes": {"ssn4": "1234"},
+        "demo_metadata": {
+            "claims": [{"claim_number": claim, "status": "open"}],
+            "policies": [{"policy_number": policy_no}],
+        },
+    }
+
+
+def _get(document, path):
+    head, _, rest = path.partition(".")
+    value = document.get(head) if isinstance(document, dict) else None
+    if rest and isinstance(value, list):
+        return [_get(item, rest) for item in value]
+    return _get(value, rest) if rest else value
+
+
+def _matches(document, path, condition):
+    if isinstance(condition, dict) and "$exists" in condition:
+        return (_get(document, path) is not None) == condition["$exists"]
+    if isinstance(condition, dict) and "$regex" in condition:
+        pattern = re.compile(condition["$regex"], re.IGNORECASE)
+        value = _get(document, path)
+        values = value if isinstance(value, list) else [value]
+        return any(isinstance(v, str) and pattern.search(v) for v in values)
+    return condition == _get(document, path) or condition in (_get(document, path) or [])
+
+
+class _Manager:
+    """Users collection with exact-match, $regex and $exists reads, recording queries."""
+
+    def __init__(self, documents):
+        self.documents = documents
+        self.queries = []
+
+    def read_document(self, query):
+        self.queries.append(query)
+        for document in self.documents:
+            if all(_matches(document, path, value) for path, value in query.items()):
+                return document
+        return None
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache(monkeypatch):
+    monkeypatch.setattr(profile_lookup, "_cache", ProfileLookupCache())
+
+
+class TestLookupKeys:
+    def test_keys_are_normalized(self):
+        keys = build_lookup_keys(_profile())
+
+        assert keys == {
+            "full_name": "ada lovelace",
+            "claim_numbers": ["clm-2024-000123"],
+            "policy_numbers": ["pol-auto-77"],
+        }
+
+    def test_profile_without_insurance_data(self):
+        document = with_lookup_keys({"_id": "x", "full_name": "Grace Hopper", "demo_metadata": {"claims": None}})
+
+        assert document["lookup_keys"]["claim_numbers"] == []
+        assert document["lookup_keys"]["full_name"] == "grace hopper"
+
+
+class TestExactMatchLookups:
+    def test_claim_lookup_is_case_insensitive_without_regex(self):
+        manager = _Manager([with_lookup_keys(_profile())])
+
+        document, claim = find_claim(manager, "clm-2024-000123")
+
+        assert document["client_id"] == "ada_1234"
+        assert claim["status"] == "open"
+        assert manager.queries == [{"lookup_keys.claim_numbers": "clm-2024-000123"}]
+
+    def test_identity_lookup_tolerates_spacing_and_case(self):
+        manager = _Manager([with_lookup_keys(_profile())])
+
+        assert find_user_by_identity(manager, "ADA LOVELACE", "1234")["client_id"] == "ada_1234"
+        assert find_user_by_identity(manager, "Ada Byron", "1234") is None
+
+    def test_repeat_lookups_served_from_lru(self):
+        manager = _Manager([with_lookup_keys(_profile())])
+
+        for _ in range(3):
+            find_claim(manager, "CLM-2024-000123")
+
+        assert len(manager.queries) == 1
+        assert profile_lookup.get_profile_lookup_cache().get_stats()["hits"] == 2
+
+    def test_misses_are_not_cached(self):
+        manager = _Manager([])
+
+        find_claim(manager, "CLM-404")
+        manager.documents.append(with_lookup_keys(_profile(claim="CLM-404")))
+
+        assert find_claim(manager, "CLM-404")[1] is not None
+
+    def test_profiles_without_keys_found_by_regex_fallback(self):
+        # e.g. written by the azd seed scripts before the backfill has run
+        manager = _Manager([_profile()])
+
+        document, claim = find_claim(manager, "clm-2024-000123")
+
+        assert claim["status"] == "open"
+        assert manager.queries[1] == {
+            "demo_metadata.claims.claim_number": {
+                "$regex": "^clm\\-2024\\-000123$",
+                "$options": "i",
+            },
+            "lookup_keys": {"$exists": False},
+        }
+        assert find_user_by_identity(manager, "ada  LOVELACE", "1234")["client_id"] == "ada_1234"
+        assert find_policy(manager, "pol-auto-77")[1]["policy_number"] == "POL-AUTO-77"
+
+    def test_lru_bound_and_ttl(self, monkeypatch):
+        now = [0.0]
+        monkeypatch.setattr(profile_lookup.time, "monotonic", lambda: now[0])
+        cache = ProfileLookupCache(max_entries=2, ttl_s=10)
+        for key in ("a", "b", "c"):
+            cache.put("claim", key, {"_id": key})
+
+        assert len(cache) == 2
+        assert cache.get("claim", "a") is None
+        now[0] = 11
+        assert cache.get("claim", "c") is None
+
+
+class TestIndexes:
+    def test_creates_indexes_and_backfills(self):
+        old = _profile()
+        current = with_lookup_keys(_profile(client_id="grace_1", name="Grace Hopper"))
+        updates = []
+
+        class _Collection:
+            def __init__(self):
+                self.indexes = []
+
+            def create_index(self, keys):
+                self.indexes.append(keys)
+
+            def find(self, query, projection=None):
+                return [d for d in (old, current) if "lookup_keys" not in d]
+
+            def bulk_write(self, requests, ordered=True):
+                updates.extend(requests)
+                return SimpleNamespace(modified_count=len(requests))
+
+        collection = _Collection()
+
+        assert ensure_lookup_indexes(SimpleNamespace(collection=collection)) is True
+        assert [("lookup_keys.claim_numbers", 1)] in collection.indexes
+        assert len(updates) == 1
+        assert updates[0]._filter == {"_id": "ada_1234"}
+
+
+class TestToolsUseSharedLookups:
+    async def test_auth_claim_lookup(self, monkeypatch):
+        manager = _Manager([with_lookup_keys(_profile())])
+        monkeypatch.setattr(auth, "_get_demo_users_manager", lambda: manager)
+
+        document, claim, reason = await auth._lookup_claim_in_cosmos("clm-2024-000123")
+
+        assert reason is None and claim["claim_number"] == "CLM-2024-000123"
+
+    async def test_auth_identity_falls_back_to_ssn(self, monkeypatch):
+        manager = _Manager([with_lookup_keys(_profile())])
+        monkeypatch.setattr(auth, "_get_demo_users_manager", lambda: manager)
+
+        document, reason = await auth._lookup_user_in_cosmos("Ada Lovelase", "1234")
+
+        assert reason is None and document["client_id"] == "ada_1234"
+
+    def test_subro_and_policy_lookups(self, monkeypatch):
+        manager = _Manager([with_lookup_keys(_profile())])
+        monkeypatch.setattr(subro, "_get_demo_users_manager", lambda: manager)
+        monkeypatch.setattr(policy, "_get_demo_users_manager", lambda: manager)
+
+        assert subro._lookup_claim_in_cosmos_sync("CLM-2024-000123")["status"] == "open"
+        found, policies = policy._lookup_policy_by_number_in_cosmos("POL-AUTO-77")
+        assert found["policy_number"] == "POL-AUTO-77" and len(policies) == 1
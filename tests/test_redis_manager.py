@@ -104,3 +104,48 @@ def test_cluster_initialization_falls_back_to_standalone(monkeypatch):
 
     assert mgr.redis_client is standalone_client
     assert mgr.use_cluster is False
+
+
+class _FakePipelineRedis:
+    def __init__(self) -> None:
+        self.hashes: dict[str, dict[str, int]] = {}
+        self.round_trips = 0
+
+    def pipeline(self, transaction=True):
+        client = self
+        ops = []
+
+        class _Pipe:
+            def hincrby(self, key, field, amount):
+                ops.append((key, field, amount))
+
+            def execute(self):
+                client.round_trips += 1
+                results = []
+                for key, field, amount in ops:
+                    bucket = client.hashes.setdefault(key, {})
+                    bucket[field] = bucket.get(field, 0) + amount
+                    results.append(bucket[field])
+                return results
+
+        return _Pipe()
+
+
+def test_increment_hash_fields_single_round_trip(monkeypatch):
+    client = _FakePipelineRedis()
+    monkeypatch.setattr(redis_manager.redis, "Redis", lambda *args, **kwargs: client)
+
+    mgr = AzureRedisManager(
+        host="example.redis.local",
+        port=6380,
+        access_key="dummy",
+        ssl=False,
+        credential=object(),
+    )
+
+    mgr.increment_hash_fields("stats", {"total": 3, "media": 2, "realtime": 0})
+    result = mgr.increment_hash_fields("stats", {"total": 1})
+
+    assert result == {"total": 4}
+    assert client.hashes["stats"] == {"total": 4, "media": 2}
+    assert client.round_trips == 2
@@ -0,0 +1,156 @@
+"""
+Tests for the event-loop lag and executor saturation monitor.
+
+Covers:
+- Queue wait, run time and saturation of instrumented executors
+- Origin names for run_in_executor and asyncio.to_thread work
+- Replacing the loop's default executor without leaking its threads
+- Loop stalls attributed to the blocking code
+- /api/v1/metrics/runtime snapshot
+"""
+
+import asyncio
+import time
+from functools import partial
+from types import SimpleNamespace
+
+from apps.artagent.backend.api.v1.utils.runtime_monitor import (
+    InstrumentedExecutor,
+    LoopLagMonitor,
+    RuntimeMonitor,
+    callable_origin,
+)
+
+
+def _blocking_io(seconds: float) -> str:
+    time.sleep(seconds)
+    return "done"
+
+
+class TestInstrumentedExecutor:
+    async def test_records_queue_wait_when_saturated(self):
+        executor = InstrumentedExecutor("test", max_workers=1)
+        loop = asyncio.get_running_loop()
+        try:
+            results = await asyncio.gather(
+                *(loop.run_in_executor(executor, _blocking_io, 0.05) for _ in range(3))
+            )
+        finally:
+            executor.shutdown(wait=True)
+
+        snap = executor.snapshot()
+        assert results == ["done"] * 3
+        assert snap["completed"] == 3
+        assert snap["peak_queued"] >= 2
+        assert snap["peak_busy"] == 1
+        assert snap["queue_wait_ms"]["max_ms"] >= 90
+        assert snap["busy"] == 0 and snap["queued"] == 0
+
+    async def test_default_executor_covers_to_thread(self):
+        monitor = RuntimeMonitor(speech_workers=1)
+        monitor.start()
+        try:
+            await asyncio.to_thread(_blocking_io, 0.01)
+            snap = monitor.snapshot()
+        finally:
+            await monitor.stop()
+            asyncio.get_running_loop().set_default_executor(InstrumentedExecutor("reset"))
+
+        origins = [o["origin"] for o in snap["executors"]["default"]["top_origins"]]
+        assert origins == [f"{__name__}._blocking_io"]
+
+    async def test_replaced_default_executor_is_shut_down(self):
+        loop = asyncio.get_running_loop()
+        previous = InstrumentedExecutor("previous", max_workers=1)
+        loop.set_default_executor(previous)
+        await asyncio.to_thread(_blocking_io, 0)  # its worker thread is now running
+        monitor = RuntimeMonitor(speech_workers=1)
+
+        monitor.start()
+        try:
+            await asyncio.to_thread(_blocking_io, 0)
+        finally:
+            await monitor.stop()
+            loop.set_default_executor(InstrumentedExecutor("reset"))
+
+        assert previous._shutdown
+        assert previous.snapshot()["completed"] == 1
+
+    async def test_exception_still_counted(self):
+        executor = InstrumentedExecutor("test", max_workers=1)
+
+        def fail():
+            raise ValueError("boom")
+
+        try:
+            try:
+                await asyncio.get_running_loop().run_in_executor(executor, fail)
+            except ValueError:
+                pass
+        finally:
+            executor.shutdown(wait=True)
+
+        assert executor.snapshot()["completed"] == 1
+        assert executor.busy == 0
+
+
+class TestCallableOrigin:
+    def test_unwraps_partial_and_methods(self):
+        class Store:
+            def get(self):
+                pass
+
+        assert callable_origin(partial(_blocking_io, 1)).endswith("._blocking_io")
+        assert callable_origin(Store().get).endswith("Store.get")
+
+
+class TestLoopLagMonitor:
+    async def test_stall_attributed_to_blocking_code(self):
+        monitor = LoopLagMonitor(interval_s=0.01, slow_threshold_ms=40)
+        monitor.start()
+        try:
+            await asyncio.sleep(0.03)
+            time.sleep(0.15)  # block the loop
+            await asyncio.sleep(0.03)
+        finally:
+            await monitor.stop()
+
+        snap = monitor.snapshot()
+        assert snap["slow_callbacks"] == 1
+        (origin,) = snap["top_origins"]
+        assert origin["origin"].startswith("tests/test_runtime_monitor.py:test_stall_attributed")
+        assert origin["max_ms"] >= 100
+
+    async def test_idle_loop_has_no_stalls(self):
+        monitor = LoopLagMonitor(interval_s=0.01, slow_threshold_ms=100)
+        monitor.start()
+        await asyncio.sleep(0.1)
+        await monitor.stop()
+
+        snap = monitor.snapshot()
+        assert snap["lag_ms"]["count"] >= 5
+        assert snap["slow_callbacks"] == 0
+
+
+class TestRuntimeEndpoint:
+    async def test_runtime_snapshot_served(self):
+        from apps.artagent.backend.api.v1.endpoints import metrics
+
+        monitor = RuntimeMonitor(speech_workers=2)
+        request = SimpleNamespace(app=SimpleNamespace(state=SimpleNamespace(runtime_monitor=monitor)))
+
+        body = await metrics.get_runtime_metrics(request)
+
+        assert body["enabled"] is True
+        assert set(body["executors"]) == {"default", "speech"}
+        assert body["executors"]["speech"]["max_workers"] == 2
+        assert "lag_ms" in body["event_loop"]
+        monitor.speech_executor.shutdown()
+        monitor.default_executor.shutdown()
+
+    async def test_runtime_disabled_without_monitor(self):
+        from apps.artagent.backend.api.v1.endpoints import metrics
+
+        request = SimpleNamespace(app=SimpleNamespace(state=SimpleNamespace()))
+
+        assert await metrics.get_runtime_metrics(request) == {"enabled": False}
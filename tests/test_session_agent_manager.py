@@ -424,6 +424,75 @@ class TestSessionAgentManagerOverrides:
         assert config.modification_count == 3
 
 
+# ═══════════════════════════════════════════════════════════════════════════════
+# SessionAgentManager Tests - Resolution Cache
+# ═══════════════════════════════════════════════════════════════════════════════
+
+
+class TestSessionAgentManagerResolutionCache:
+    """Tests for memoized override resolution."""
+
+    def test_repeated_lookups_return_same_instance(self, session_manager):
+        """Lookups at the same override version should not rebuild the agent."""
+        session_manager.update_agent_prompt("EricaConcierge", "Custom prompt")
+
+        first = session_manager.get_agent("EricaConcierge")
+        first._cached_tools = [{"type": "function"}]
+
+        assert session_manager.get_agent("EricaConcierge") is first
+        assert first.get_tools() == [{"type": "function"}]
+
+    def test_update_invalidates_resolved_agent(self, session_manager):
+        """Each modification should produce a fresh resolved agent."""
+        session_manager.update_agent_prompt("EricaConcierge", "First change")
+        first = session_manager.get_agent("EricaConcierge")
+
+        session_manager.update_agent_greeting("EricaConcierge", "Hi!")
+        second = session_manager.get_agent("EricaConcierge")
+
+        assert second is not first
+        assert second.prompt_template == "First change"
+        assert second.greeting == "Hi!"
+        assert second.metadata["_modification_count"] == 2
+
+    def test_reset_returns_base_agent(self, session_manager, base_agents):
+        """Reset should drop the resolved agent and hand back the base."""
+        session_manager.update_agent_prompt("EricaConcierge", "Custom prompt")
+        session_manager.get_agent("EricaConcierge")
+
+        session_manager.reset_agent("EricaConcierge")
+        session_manager.update_agent_prompt("EricaConcierge", "Custom prompt")
+        session_manager.reset_agent("EricaConcierge")
+
+        assert session_manager.get_agent("EricaConcierge") is base_agents["EricaConcierge"]
+
+    def test_unchanged_fields_shared_with_base(self, session_manager, base_agents):
+        """Fields without overrides should reference the base objects."""
+        base = base_agents["EricaConcierge"]
+        session_manager.update_agent_greeting("EricaConcierge", "Hi!")
+
+        agent = session_manager.get_agent("EricaConcierge")
+
+        assert agent.template_vars is base.template_vars
+        assert agent.tool_names is base.tool_names
+        assert agent.model is base.model
+        assert agent.speech is base.speech
+
+    def test_model_override_wins_over_mode_models(self, base_agents, mock_memo_manager):
+        """A session model override should not be shadowed by cascade_model."""
+        base_agents["AuthAgent"].cascade_model = ModelConfig(deployment_id="gpt-4o")
+        manager = SessionAgentManager(
+            session_id="s",
+            base_agents=base_agents,
+            memo_manager=mock_memo_manager,
+        )
+        manager.update_agent_model("AuthAgent", ModelConfig(deployment_id="gpt-4o-mini"))
+
+        agent = manager.get_agent("AuthAgent")
+
+        assert agent.get_model_for_mode("cascade").deployment_id == "gpt-4o-mini"
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # SessionAgentManager Tests - Handoff Management
 # ═══════════════════════════════════════════════════════════════════════════════
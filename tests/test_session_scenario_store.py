@@ -0,0 +1,161 @@
+"""
+Tests for the bounded session scenario store.
+
+Covers:
+- Negative caching of sessions without a scenario
+- Single-flight async loads
+- LRU and TTL bounds
+- Teardown eviction and reload from Redis
+- Saving a scenario keeps the ones already persisted
+"""
+
+import asyncio
+import json
+from unittest.mock import MagicMock
+
+import pytest
+from apps.artagent.backend.src.orchestration import session_scenarios
+from apps.artagent.backend.src.orchestration.naming import SCENARIO_KEY_ACTIVE, SCENARIO_KEY_ALL
+from apps.artagent.backend.src.orchestration.session_scenarios import (
+    SessionScenarioStore,
+    _parse_scenario_data,
+    evict_session_scenarios,
+    get_active_scenario_name,
+    get_session_scenario,
+    get_session_scenario_store,
+    load_session_scenarios_async,
+    set_session_scenario_async,
+)
+
+
+def _scenario_doc(name: str, start_agent: str = "Concierge") -> dict:
+    return {"name": name, "agents": [start_agent], "start_agent": start_agent}
+
+
+class _Redis:
+    """Session-hash store with sync and async reads, counting both."""
+
+    def __init__(self, sessions: dict[str, dict] | None = None, delay: float = 0.0):
+        self.hashes = {
+            f"session:{sid}": {"corememory": json.dumps(core)} for sid, core in (sessions or {}).items()
+        }
+        self.delay = delay
+        self.reads = 0
+
+    def get_session_data(self, key):
+        self.reads += 1
+        return dict(self.hashes.get(key, {}))
+
+    async def get_session_data_async(self, key):
+        self.reads += 1
+        await asyncio.sleep(self.delay)
+        return dict(self.hashes.get(key, {}))
+
+    async def store_session_data_async(self, key, data):
+        self.hashes[key] = dict(data)
+        return True
+
+    @property
+    def redis_client(self):
+        return MagicMock()
+
+
+@pytest.fixture
+def redis(monkeypatch):
+    store = SessionScenarioStore()
+    monkeypatch.setattr(session_scenarios, "_store", store)
+    redis = _Redis(
+        {
+            "with-scenario": {
+                SCENARIO_KEY_ALL: {"banking": _scenario_doc("banking"), "claims": _scenario_doc("claims")},
+                SCENARIO_KEY_ACTIVE: "claims",
+            }
+        }
+    )
+    monkeypatch.setattr(session_scenarios, "_redis_manager", redis)
+    return redis
+
+
+class TestSessionScenarioLookups:
+    def test_session_without_scenario_is_negatively_cached(self, redis):
+        for _ in range(5):
+            assert get_session_scenario("plain-session") is None
+
+        assert redis.reads == 1
+        assert get_session_scenario_store().get_stats()["negative_hits"] >= 4
+
+    def test_loaded_scenarios_and_active_name(self, redis):
+        assert get_session_scenario("with-scenario").name == "claims"
+        assert get_session_scenario("with-scenario", "BANKING").name == "banking"
+        assert get_active_scenario_name("with-scenario") == "claims"
+        assert redis.reads == 1
+
+    async def test_concurrent_async_loads_share_one_read(self, redis):
+        redis.delay = 0.02
+
+        results = await asyncio.gather(
+            *(load_session_scenarios_async("with-scenario") for _ in range(10))
+        )
+
+        assert all(set(r) == {"banking", "claims"} for r in results)
+        assert redis.reads == 1
+        get_session_scenario("with-scenario")
+        assert redis.reads == 1  # sync getter served from the warmed store
+
+    def test_legacy_single_scenario_format(self, redis):
+        redis.hashes["session:legacy"] = {
+            "corememory": json.dumps({"session_scenario_config": _scenario_doc("old")})
+        }
+
+        assert get_session_scenario("legacy").name == "old"
+
+
+class TestEvictionAndBounds:
+    def test_lru_bound(self):
+        store = SessionScenarioStore(max_sessions=2)
+        store.put("a", {})
+        store.put("b", {})
+        store.get("a")
+        store.put("c", {})
+
+        assert store.peek("b") is None
+        assert store.peek("a") is not None
+        assert store.get_stats()["evictions"] == 1
+
+    def test_negative_entries_expire(self, monkeypatch):
+        now = [100.0]
+        monkeypatch.setattr(session_scenarios.time, "monotonic", lambda: now[0])
+        store = SessionScenarioStore(ttl_s=60, negative_ttl_s=5)
+        store.put("none", {})
+        store.put("some", {"x": _parse_scenario_data(_scenario_doc("x"))})
+
+        now[0] += 10
+
+        assert store.get("none") is None
+        assert store.get("some") is not None
+
+    def test_teardown_evicts_and_reloads_from_redis(self, redis):
+        get_session_scenario("with-scenario")
+
+        assert evict_session_scenarios("with-scenario") is True
+        assert len(get_session_scenario_store()) == 0
+        assert get_session_scenario("with-scenario").name == "claims"
+        assert redis.reads == 2
+
+    def test_no_eviction_without_redis(self, monkeypatch):
+        store = SessionScenarioStore()
+        monkeypatch.setattr(session_scenarios, "_store", store)
+        monkeypatch.setattr(session_scenarios, "_redis_manager", None)
+        store.put("s", {"x": _parse_scenario_data(_scenario_doc("x"))}, "x")
+
+        assert evict_session_scenarios("s") is False
+        assert get_session_scenario("s").name == "x"
+
+
+class TestSaveKeepsPersistedScenarios:
+    async def test_save_after_eviction_keeps_other_scenarios(self, redis):
+        await set_session_scenario_async("with-scenario", _parse_scenario_data(_scenario_doc("Fraud")))
+
+        core = json.loads(redis.hashes["session:with-scenario"]["corememory"])
+        assert {"banking", "claims", "fraud"} <= set(core[SCENARIO_KEY_ALL])
+        assert get_active_scenario_name("with-scenario") == "fraud"
@@ -0,0 +1,152 @@
+"""
+Tests for the session statistics manager.
+
+Covers:
+- Disconnect counting without I/O on the remove path
+- Coalesced Cosmos $inc flushes run off the event loop
+- Redis HINCRBY mirror and failure re-application per sink
+- Async hydration on startup and final flush on stop
+"""
+
+import asyncio
+import threading
+
+from apps.artagent.backend.src.sessions.session_statistics import (
+    STATS_DOCUMENT_ID,
+    STATS_REDIS_KEY,
+    SessionStatisticsManager,
+)
+
+
+class _Collection:
+    def __init__(self, document=None, fail=False):
+        self.document = document
+        self.fail = fail
+        self.updates = []
+        self.threads = set()
+
+    def find_one(self, query):
+        self.threads.add(threading.get_ident())
+        return self.document
+
+    def update_one(self, query, update, upsert=False):
+        self.threads.add(threading.get_ident())
+        if self.fail:
+            raise ConnectionError("cosmos down")
+        self.updates.append((query, update, upsert))
+
+
+class _Cosmos:
+    def __init__(self, collection):
+        self.database = {"session_statistics": collection}
+
+
+class _Redis:
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.hashes = {}
+
+    async def increment_hash_fields_async(self, key, increments):
+        if self.fail:
+            raise ConnectionError("redis down")
+        bucket = self.hashes.setdefault(key, {})
+        for field, amount in increments.items():
+            bucket[field] = bucket.get(field, 0) + amount
+        return dict(bucket)
+
+    async def get_session_data_async(self, key):
+        return {k: str(v) for k, v in self.hashes.get(key, {}).items()}
+
+
+async def _disconnect(manager, media=0, realtime=0):
+    for i in range(media):
+        await manager.add_media_session(f"call-{i}", handler=object())
+        await manager.remove_media_session(f"call-{i}")
+    for i in range(realtime):
+        await manager.add_realtime_session(f"rt-{i}", memory_manager=None, websocket=None)
+        await manager.remove_realtime_session(f"rt-{i}")
+
+
+class TestDisconnectCounting:
+    async def test_remove_does_no_io(self):
+        collection = _Collection()
+        manager = SessionStatisticsManager(cosmos_manager=_Cosmos(collection))
+
+        await _disconnect(manager, media=3, realtime=2)
+
+        assert await manager.get_total_disconnected_count() == 5
+        assert collection.updates == []
+
+    async def test_flush_coalesces_into_one_inc(self):
+        collection = _Collection()
+        manager = SessionStatisticsManager(cosmos_manager=_Cosmos(collection))
+        await _disconnect(manager, media=3, realtime=2)
+
+        await manager.flush()
+        await manager.flush()
+
+        assert len(collection.updates) == 1
+        query, update, upsert = collection.updates[0]
+        assert query == {"_id": STATS_DOCUMENT_ID} and upsert is True
+        assert update["$inc"] == {
+            "total_disconnected": 5,
+            "media_disconnected": 3,
+            "realtime_disconnected": 2,
+        }
+        assert threading.get_ident() not in collection.threads
+
+
+class TestSinks:
+    async def test_redis_mirror_and_cluster_view(self):
+        redis = _Redis()
+        manager = SessionStatisticsManager(redis_manager=redis)
+        await _disconnect(manager, media=2)
+
+        await manager.flush()
+
+        assert await manager.get_cluster_statistics() == {
+            "total_disconnected": 2,
+            "media_disconnected": 2,
+        }
+
+    async def test_failed_sink_keeps_its_increments_only(self):
+        collection = _Collection(fail=True)
+        redis = _Redis()
+        manager = SessionStatisticsManager(cosmos_manager=_Cosmos(collection), redis_manager=redis)
+        await _disconnect(manager, realtime=2)
+
+        await manager.flush()
+        collection.fail = False
+        await _disconnect(manager, realtime=1)
+        await manager.flush()
+
+        assert collection.updates[0][1]["$inc"]["total_disconnected"] == 3
+        assert redis.hashes[STATS_REDIS_KEY]["total_disconnected"] == 3
+
+
+class TestLifecycle:
+    async def test_hydrates_off_loop_and_keeps_early_disconnects(self):
+        collection = _Collection(document={"_id": STATS_DOCUMENT_ID, "total_disconnected": 40})
+        manager = SessionStatisticsManager(cosmos_manager=_Cosmos(collection), flush_interval_s=60)
+        await _disconnect(manager, media=2)
+
+        await manager.initialize()
+        try:
+            assert await manager.get_total_disconnected_count() == 42
+            assert threading.get_ident() not in collection.threads
+        finally:
+            await manager.stop()
+
+    async def test_periodic_flush_and_final_flush_on_stop(self):
+        collection = _Collection()
+        manager = SessionStatisticsManager(cosmos_manager=_Cosmos(collection), flush_interval_s=0.02)
+        await manager.initialize()
+
+        await _disconnect(manager, media=1)
+        await asyncio.sleep(0.1)
+        assert len(collection.updates) == 1
+
+        await _disconnect(manager, realtime=1)
+        await manager.stop()
+
+        assert sum(u[1]["$inc"]["total_disconnected"] for u in collection.updates) == 2
@@ -0,0 +1,283 @@
+"""
+Tests for speculative turn start on stable partial transcripts.
+
+Covers:
+- Stability window and end-of-utterance heuristic
+- Side effects held by the commit gate until the final transcript matches
+- Mismatch / invalidation cancels the speculative turn
+- RouteTurnThread adopts a committed speculative turn instead of restarting
+- Cascade adapter: a discarded speculative tool-call turn leaves history and
+  turn state untouched
+"""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from apps.artagent.backend.voice.speech_cascade.handler import (
+    RouteTurnThread,
+    SpeechEvent,
+    SpeechEventType,
+)
+from apps.artagent.backend.voice.speech_cascade.speculation import (
+    SpeculationConfig,
+    SpeculativeTurnController,
+    is_speculative,
+    looks_like_end_of_utterance,
+    normalize_transcript,
+    speculation_checkpoint,
+)
+from src.stateful.state_managment import MemoManager
+
+FAST = SpeculationConfig(enabled=True, stability_ms=30, eou_stability_ms=5, min_chars=4)
+
+
+class FakeOrchestrator:
+    """Orchestrator that 'streams' immediately and emits output after the gate."""
+
+    def __init__(self, llm_ms: float = 50):
+        self.llm_ms = llm_ms
+        self.started: list[str] = []
+        self.emitted: list[str] = []
+
+    async def __call__(self, cm=None, transcript: str = ""):
+        self.started.append(transcript)
+        await asyncio.sleep(self.llm_ms / 1000)
+        await speculation_checkpoint()
+        self.emitted.append(transcript)
+        return f"reply to {transcript}"
+
+
+class TestHeuristics:
+    def test_normalize_ignores_case_and_punctuation(self):
+        assert normalize_transcript("What's my  balance?") == normalize_transcript(
+            "what's my balance"
+        )
+
+    def test_end_of_utterance(self):
+        assert looks_like_end_of_utterance("Can you help me?")
+        assert looks_like_end_of_utterance("check my claim please")
+        assert not looks_like_end_of_utterance("I want to check my")
+
+
+class TestSpeculativeTurnController:
+    async def test_stable_partial_starts_turn_but_holds_side_effects(self):
+        orchestrator = FakeOrchestrator()
+        controller = SpeculativeTurnController(FAST, lambda text: orchestrator(transcript=text))
+
+        controller.observe_partial("check my balance")
+        await asyncio.sleep(0.12)
+
+        assert orchestrator.started == ["check my balance"]
+        assert orchestrator.emitted == []  # gated until commit
+
+        speculative = controller.claim("Check my balance.")
+        assert speculative is not None
+        speculative.commit()
+        assert await speculative.task == "reply to check my balance"
+        assert orchestrator.emitted == ["check my balance"]
+
+        stats = controller.stats.snapshot()
+        assert stats["committed"] == 1
+        assert stats["hit_rate"] == 1.0
+        assert stats["time_saved_ms_total"] > 0
+
+    async def test_mismatched_final_cancels_without_side_effects(self):
+        orchestrator = FakeOrchestrator()
+        outcomes = []
+        controller = SpeculativeTurnController(
+            FAST,
+            lambda text: orchestrator(transcript=text),
+            on_outcome=lambda outcome, saved: outcomes.append(outcome),
+        )
+
+        controller.observe_partial("transfer to savings")
+        await asyncio.sleep(0.06)
+        speculative = controller.current
+        assert controller.claim("transfer to checking") is None
+        await asyncio.sleep(0)
+
+        assert speculative.task.cancelled()
+        assert orchestrator.emitted == []
+        assert outcomes == ["mismatched"]
+        assert controller.stats.hit_rate == 0.0
+
+    async def test_changing_partial_invalidates_speculation(self):
+        orchestrator = FakeOrchestrator()
+        controller = SpeculativeTurnController(FAST, lambda text: orchestrator(transcript=text))
+
+        controller.observe_partial("I want to")
+        await asyncio.sleep(0.06)
+        first = controller.current
+        controller.observe_partial("I want to file a claim")
+        await asyncio.sleep(0)
+
+        assert first.task.cancelled()
+        assert controller.stats.invalidated == 1
+        await asyncio.sleep(0.06)
+        assert controller.current.text == "I want to file a claim"
+        controller.reset()
+
+    async def test_partial_still_changing_does_not_start(self):
+        orchestrator = FakeOrchestrator()
+        controller = SpeculativeTurnController(FAST, lambda text: orchestrator(transcript=text))
+
+        for words in ("what", "what is", "what is my", "what is my balance"):
+            controller.observe_partial(words)
+            await asyncio.sleep(0.01)
+
+        assert orchestrator.started == []
+        controller.reset()
+
+    async def test_gate_is_scoped_to_speculative_task(self):
+        seen = {}
+        controller = SpeculativeTurnController(FAST, lambda text: _capture(seen))
+
+        controller.observe_partial("hello there")
+        await asyncio.sleep(0.06)
+
+        assert seen["speculative"] is True
+        assert is_speculative() is False
+        controller.reset()
+
+
+async def _capture(seen: dict) -> None:
+    seen["speculative"] = is_speculative()
+    await speculation_checkpoint()
+
+
+class TestRouteTurnThreadSpeculation:
+    def _thread(self, orchestrator, speculation=FAST) -> RouteTurnThread:
+        thread = RouteTurnThread(
+            connection_id="conn-speculative",
+            speech_queue=asyncio.Queue(),
+            orchestrator_func=orchestrator,
+            memory_manager=SimpleNamespace(session_id="sess-1"),
+            speculation=speculation,
+        )
+        thread.running = True
+        return thread
+
+    async def test_final_adopts_speculative_turn(self):
+        orchestrator = FakeOrchestrator(llm_ms=150)
+        thread = self._thread(orchestrator)
+
+        thread.observe_partial("what is my claim status")
+        await asyncio.sleep(0.1)
+
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        await thread._process_final_speech(
+            SpeechEvent(event_type=SpeechEventType.FINAL, text="What is my claim status?")
+        )
+        elapsed = loop.time() - start
+        await thread._end_active_turn()
+
+        assert orchestrator.started == ["what is my claim status"]
+        assert orchestrator.emitted == ["what is my claim status"]
+        # LLM work overlapped with the recognizer's end-of-speech delay
+        assert elapsed < 0.13
+        assert thread.get_speculation_stats()["committed"] == 1
+
+    async def test_mismatch_restarts_with_final_transcript(self):
+        orchestrator = FakeOrchestrator(llm_ms=20)
+        thread = self._thread(orchestrator)
+
+        thread.observe_partial("book a flight")
+        await asyncio.sleep(0.06)
+        await thread._process_final_speech(
+            SpeechEvent(event_type=SpeechEventType.FINAL, text="book a hotel")
+        )
+        await thread._end_active_turn()
+
+        assert orchestrator.started == ["book a flight", "book a hotel"]
+        assert orchestrator.emitted == ["book a hotel"]
+        assert thread.get_speculation_stats()["mismatched"] == 1
+
+    async def test_disabled_by_default(self):
+        orchestrator = FakeOrchestrator()
+        thread = self._thread(orchestrator, speculation=None)
+
+        assert not thread.speculation_enabled
+        thread.observe_partial("what is my claim status")
+        await asyncio.sleep(0.06)
+
+        assert orchestrator.started == []
+        assert thread.get_speculation_stats() is None
+
+
+def _tool_call_stream(**kwargs):
+    """Fake chat-completions stream: one get_weather tool call, then a text reply."""
+    if kwargs["messages"][-1]["role"] == "tool":
+        delta = SimpleNamespace(content="It is sunny.", tool_calls=None)
+    else:
+        call = SimpleNamespace(
+            index=0,
+            id="call_1",
+            function=SimpleNamespace(name="get_weather", arguments="{}"),
+        )
+        delta = SimpleNamespace(content=None, tool_calls=[call])
+    return iter([SimpleNamespace(usage=None, choices=[SimpleNamespace(delta=delta)])])
+
+
+class TestAdapterSpeculation:
+    def _adapter(self):
+        from apps.artagent.backend.registries.agentstore.base import ModelConfig, UnifiedAgent
+        from apps.artagent.backend.voice.speech_cascade.orchestrator import (
+            CascadeConfig,
+            CascadeOrchestratorAdapter,
+        )
+
+        agent = UnifiedAgent(
+            name="Weather",
+            model=ModelConfig(deployment_id="gpt-4o"),
+            prompt_template="You report the weather.",
+            tool_names=["get_weather"],
+        )
+        agent.execute_tool = AsyncMock(return_value={"weather": "sunny"})
+        return CascadeOrchestratorAdapter(
+            config=CascadeConfig(start_agent="Weather", session_id="sess-spec"),
+            agents={"Weather": agent},
+            handoff_map={},
+        )
+
+    async def _speculate(self, adapter, cm, final_text):
+        controller = SpeculativeTurnController(
+            FAST, lambda text: adapter.process_turn(user_text=text, memo_manager=cm)
+        )
+        client = MagicMock()
+        client.chat.completions.create = MagicMock(side_effect=_tool_call_stream)
+        with patch("src.aoai.client.get_client", return_value=client):
+            controller.observe_partial("what's the weather")
+            await asyncio.sleep(0.15)  # LLM streamed its tool call; turn waits at the gate
+            speculative = controller.claim(final_text)
+            if speculative is None:
+                await asyncio.sleep(0.01)
+                return None
+            speculative.commit()
+            return await speculative.task
+
+    async def test_cancelled_turn_with_tool_calls_leaves_no_trace(self):
+        adapter = self._adapter()
+        adapter._cancel_event.set()  # barge-in on the previous turn still pending
+        cm = MemoManager(session_id="sess-spec")
+
+        result = await self._speculate(adapter, cm, "what's the weekend forecast")
+
+        assert result is None
+        assert cm.get_history("Weather") == []
+        adapter.agents["Weather"].execute_tool.assert_not_called()
+        assert adapter._metrics.turn_count == 0
+        assert adapter._cancel_event.is_set()
+
+    async def test_committed_turn_records_tool_round_trip(self):
+        adapter = self._adapter()
+        cm = MemoManager(session_id="sess-spec")
+
+        result = await self._speculate(adapter, cm, "What's the weather?")
+
+        assert result.response_text == "It is sunny."
+        history = cm.get_history("Weather")
+        assert [message["role"] for message in history[:3]] == ["user", "assistant", "tool"]
+        assert (history[-1]["role"], history[-1]["content"]) == ("assistant", "It is sunny.")
+        assert adapter._metrics.turn_count == 1
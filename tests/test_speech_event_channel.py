@@ -0,0 +1,168 @@
+"""
+Tests for the cross-thread speech event channel.
+
+Covers:
+- Ordered, lossless delivery of finals and TTS responses from many SDK threads
+- Latest-wins coalescing of partials and batched loop wakeups
+- Non-blocking producers (callback-thread latency)
+- ThreadBridge partial forwarding into speculative turn start
+"""
+
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+
+from apps.artagent.backend.voice.speech_cascade.handler import (
+    RouteTurnThread,
+    SpeechEvent,
+    SpeechEventChannel,
+    SpeechEventType,
+    ThreadBridge,
+)
+from apps.artagent.backend.voice.speech_cascade.speculation import SpeculationConfig
+
+
+def _event(event_type, text):
+    return SpeechEvent(event_type=event_type, text=text)
+
+
+class TestDelivery:
+    async def test_get_wakes_on_publish_from_another_thread(self):
+        channel = SpeechEventChannel()
+        getter = asyncio.create_task(channel.get())
+        await asyncio.sleep(0.01)
+
+        threading.Thread(
+            target=channel.put_nowait, args=(_event(SpeechEventType.FINAL, "hello"),)
+        ).start()
+        event = await asyncio.wait_for(getter, timeout=1.0)
+
+        assert event.text == "hello"
+        assert channel.get_stats()["wakeups"] == 1
+
+    async def test_cancelled_get_leaves_channel_usable(self):
+        channel = SpeechEventChannel()
+        with_timeout = asyncio.wait_for(channel.get(), timeout=0.01)
+        try:
+            await with_timeout
+        except TimeoutError:
+            pass
+
+        channel.put_nowait(_event(SpeechEventType.TTS_RESPONSE, "queued"))
+
+        assert (await asyncio.wait_for(channel.get(), timeout=0.1)).text == "queued"
+
+    def test_errors_shed_over_capacity_but_finals_kept(self):
+        channel = SpeechEventChannel(maxsize=2)
+        for i in range(3):
+            assert channel.put_nowait(_event(SpeechEventType.FINAL, f"final-{i}"))
+
+        assert not channel.put_nowait(_event(SpeechEventType.ERROR, "recognizer error"))
+        assert channel.put_nowait(_event(SpeechEventType.TTS_RESPONSE, "tts"))
+        assert channel.qsize() == 4
+        assert channel.get_stats()["dropped"] == 1
+
+    async def test_partials_coalesce_to_latest(self):
+        seen = []
+        channel = SpeechEventChannel(on_partial=lambda e: seen.append(e.text))
+        getter = asyncio.create_task(channel.get())
+        await asyncio.sleep(0)
+
+        for i in range(100):
+            channel.put_nowait(_event(SpeechEventType.PARTIAL, f"partial-{i}"))
+        channel.put_nowait(_event(SpeechEventType.FINAL, "final"))
+        event = await asyncio.wait_for(getter, timeout=1.0)
+
+        assert event.text == "final"
+        assert seen == ["partial-99"]
+        assert channel.qsize() == 0  # partials never enter the ordered stream
+
+
+class TestStress:
+    async def test_many_sdk_threads(self):
+        producers, per_thread = 8, 400
+        partial_texts = []
+        channel = SpeechEventChannel(on_partial=lambda e: partial_texts.append(e.text))
+        received = []
+        put_latencies = []
+
+        async def consume():
+            expected = producers * per_thread // 2
+            while len(received) < expected:
+                received.append(await channel.get())
+                if len(received) % 50 == 0:
+                    await asyncio.sleep(0.001)  # a busy turn loop
+
+        def sdk_thread(thread_id):
+            slowest = 0.0
+            for i in range(per_thread):
+                event_type = (
+                    SpeechEventType.PARTIAL
+                    if i % 2 == 0
+                    else (SpeechEventType.FINAL if i % 4 == 1 else SpeechEventType.TTS_RESPONSE)
+                )
+                start = time.perf_counter()
+                channel.put_nowait(_event(event_type, f"{thread_id}:{i}"))
+                slowest = max(slowest, time.perf_counter() - start)
+                if i % 20 == 0:
+                    time.sleep(0.001)  # recognition cadence; lets the loop interleave
+            put_latencies.append(slowest)
+
+        consumer = asyncio.create_task(consume())
+        await asyncio.sleep(0)
+        threads = [threading.Thread(target=sdk_thread, args=(t,)) for t in range(producers)]
+        for t in threads:
+            t.start()
+        await asyncio.wait_for(consumer, timeout=10.0)
+        for t in threads:
+            t.join()
+
+        # No final or TTS response lost, and each thread's order preserved
+        assert len(received) == producers * per_thread // 2
+        by_thread: dict[str, list[int]] = {}
+        for event in received:
+            thread_id, index = event.text.split(":")
+            by_thread.setdefault(thread_id, []).append(int(index))
+        assert all(indices == sorted(indices) for indices in by_thread.values())
+        assert all(len(indices) == per_thread // 2 for indices in by_thread.values())
+
+        # Partials coalesced; the loop was woken per batch, not per event
+        stats = channel.get_stats()
+        assert stats["partials_delivered"] == len(partial_texts) < stats["partials_published"]
+        assert 1 < stats["wakeups"] < stats["published"] + stats["partials_published"]
+
+        # SDK callback threads never waited on the loop or on each other for long
+        # (allowing for GIL hand-offs between eight busy producers)
+        assert max(put_latencies) < 0.05
+
+
+class TestThreadBridgePartials:
+    async def test_partial_burst_reaches_speculation_once(self):
+        channel = SpeechEventChannel()
+        thread = RouteTurnThread(
+            connection_id="conn-channel",
+            speech_queue=channel,
+            orchestrator_func=None,
+            memory_manager=SimpleNamespace(session_id="sess-1"),
+            speculation=SpeculationConfig(enabled=True, stability_ms=1000),
+        )
+        observed = []
+        thread.observe_partial = lambda text, language=None: observed.append(text)
+        bridge = ThreadBridge()
+        bridge.set_main_loop(asyncio.get_running_loop(), "conn-channel")
+        bridge.set_route_turn_thread(thread)
+        getter = asyncio.create_task(channel.get())
+        await asyncio.sleep(0)
+
+        def sdk_callbacks():
+            for words in ("I", "I want", "I want to", "I want to pay"):
+                bridge.forward_partial(words, "en-US")
+
+        worker = threading.Thread(target=sdk_callbacks)
+        worker.start()
+        worker.join()
+        await asyncio.sleep(0.05)
+        getter.cancel()
+
+        assert observed == ["I want to pay"]
@@ -0,0 +1,112 @@
+"""
+Tests for the STT audio ingest buffer.
+
+Covers:
+- Coalescing 20 ms frames into target-sized writes
+- Pass-through of large chunks in order
+- Flush on barge-in and end-of-stream via SpeechSDKThread
+- Metrics recorded per write
+"""
+
+import asyncio
+from unittest.mock import MagicMock, patch
+
+from apps.artagent.backend.voice.speech_cascade import audio_ingest
+from apps.artagent.backend.voice.speech_cascade.audio_ingest import AudioIngestBuffer
+from apps.artagent.backend.voice.speech_cascade.handler import SpeechSDKThread, ThreadBridge
+
+FRAME = 640  # 20 ms of 16 kHz PCM16
+
+
+def _frames(count: int) -> list[bytes]:
+    return [bytes([i % 256]) * FRAME for i in range(count)]
+
+
+class TestCoalescing:
+    def test_frames_coalesced_to_target(self):
+        writes: list[bytes] = []
+        buffer = AudioIngestBuffer(writes.append, coalesce_ms=80)
+        frames = _frames(10)
+
+        for frame in frames:
+            buffer.write(frame)
+
+        assert buffer.target_bytes == 4 * FRAME
+        assert [len(w) for w in writes] == [4 * FRAME, 4 * FRAME]
+        assert buffer.pending_bytes == 2 * FRAME
+        buffer.flush()
+        assert b"".join(writes) == b"".join(frames)
+        assert (buffer.frames_in, buffer.writes) == (10, 3)
+
+    def test_target_is_sample_aligned(self):
+        buffer = AudioIngestBuffer(lambda _: None, coalesce_ms=61, sample_rate=8000)
+        assert buffer.target_bytes % 2 == 0
+
+    def test_large_chunk_passes_through_in_order(self):
+        writes: list[bytes] = []
+        buffer = AudioIngestBuffer(writes.append, coalesce_ms=80)
+        small, large = b"\x01" * FRAME, b"\x02" * (8 * FRAME)
+
+        buffer.write(small)
+        buffer.write(large)
+
+        assert writes == [small, large]
+        assert buffer.pending_bytes == 0
+
+    def test_flush_when_empty_is_noop(self):
+        sink = MagicMock()
+        buffer = AudioIngestBuffer(sink, coalesce_ms=80)
+        buffer.flush("barge_in")
+        buffer.write(b"")
+        sink.assert_not_called()
+
+    def test_metrics_recorded_per_write(self):
+        buffer = AudioIngestBuffer(lambda _: None, coalesce_ms=60, session_id="s1")
+        with patch.object(audio_ingest, "record_stt_ingest_write") as record:
+            for frame in _frames(4):
+                buffer.write(frame)
+            buffer.flush("end_of_stream")
+
+        assert [c.args[0] for c in record.call_args_list] == [3, 1]
+        assert [c.kwargs["reason"] for c in record.call_args_list] == ["size", "end_of_stream"]
+        assert all(c.args[1] >= 0 for c in record.call_args_list)
+
+
+class TestSpeechSDKThreadIngest:
+    def _thread(self, coalesce_ms: int) -> tuple[SpeechSDKThread, MagicMock]:
+        recognizer = MagicMock()
+        thread = SpeechSDKThread(
+            connection_id="conn-ingest",
+            recognizer=recognizer,
+            thread_bridge=ThreadBridge(),
+            barge_in_handler=MagicMock(),
+            speech_queue=asyncio.Queue(),
+            ingest_coalesce_ms=coalesce_ms,
+        )
+        return thread, recognizer
+
+    def test_disabled_writes_every_frame(self):
+        thread, recognizer = self._thread(0)
+        for frame in _frames(5):
+            thread.write_audio(frame)
+        assert recognizer.write_bytes.call_count == 5
+
+    def test_barge_in_flushes_pending_audio(self):
+        thread, recognizer = self._thread(100)
+        for frame in _frames(2):
+            thread.write_audio(frame)
+        recognizer.write_bytes.assert_not_called()
+
+        thread.stop_stt_timer_for_barge_in()
+
+        recognizer.write_bytes.assert_called_once()
+        assert len(recognizer.write_bytes.call_args.args[0]) == 2 * FRAME
+
+    def test_stop_flushes_before_recognizer_stop(self):
+        thread, recognizer = self._thread(100)
+        thread.write_audio(_frames(1)[0])
+
+        thread.stop()
+
+        names = [c[0] for c in recognizer.method_calls]
+        assert names.index("write_bytes") < names.index("stop")
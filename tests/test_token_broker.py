@@ -0,0 +1,215 @@
+"""
+Tests for the proactive AAD token broker.
+
+Covers:
+- Cached tokens served without touching the credential
+- Background refresh ahead of expiry with no hot-path stalls
+- Single-flight forced refreshes
+- Backoff and fail-fast while the identity endpoint is down
+- Bearer token provider and SpeechTokenManager integration
+- Refresh thread stopped at shutdown even if warmup never finished
+"""
+
+import asyncio
+import threading
+import time
+from functools import lru_cache
+from types import SimpleNamespace
+
+import pytest
+from apps.artagent.backend.lifecycle.manager import LifecycleManager
+from apps.artagent.backend.lifecycle.steps import register_token_broker_step
+from azure.core.credentials import AccessToken
+from src.speech.auth_manager import SpeechTokenManager
+from utils import token_broker as broker_module
+from utils.token_broker import TokenBroker
+
+SCOPE = "https://cognitiveservices.azure.com/.default"
+
+
+class FakeCredential:
+    """Issues short-lived tokens after a configurable delay."""
+
+    def __init__(self, latency_s=0.0, lifetime_s=3600.0):
+        self.latency_s = latency_s
+        self.lifetime_s = lifetime_s
+        self.fail = False
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def get_token(self, *scopes, **kwargs):
+        with self._lock:
+            self.calls += 1
+            n = self.calls
+        time.sleep(self.latency_s)
+        if self.fail:
+            raise ConnectionError("identity endpoint unavailable")
+        return AccessToken(f"token-{n}", time.time() + self.lifetime_s)
+
+
+@pytest.fixture
+def make_broker():
+    brokers = []
+
+    def _make(credential, **kwargs):
+        broker = TokenBroker(credential, **kwargs)
+        brokers.append(broker)
+        return broker
+
+    yield _make
+    for broker in brokers:
+        broker.stop()
+
+
+class TestHotPath:
+    def test_cached_token_served_without_credential_call(self, make_broker):
+        credential = FakeCredential()
+        broker = make_broker(credential)
+        first = broker.force_refresh(SCOPE)
+
+        assert all(broker.get_token(SCOPE) is first for _ in range(100))
+        assert credential.calls == 1
+
+    def test_no_stalls_across_expiry(self, make_broker):
+        credential = FakeCredential(latency_s=0.1, lifetime_s=1.0)
+        broker = make_broker(credential, refresh_margin_s=0.6, min_validity_s=0.1)
+        broker.force_refresh(SCOPE)
+        worst = []
+        seen = set()
+
+        def _caller():
+            slowest = 0.0
+            deadline = time.time() + 1.6
+            while time.time() < deadline:
+                start = time.perf_counter()
+                token = broker.get_token(SCOPE)
+                slowest = max(slowest, time.perf_counter() - start)
+                assert token.expires_on - time.time() > 0.1
+                seen.add(token.token)
+                time.sleep(0.001)
+            worst.append(slowest)
+
+        threads = [threading.Thread(target=_caller) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        # Tokens rolled over at least twice, always ahead of the caller
+        assert len(seen) >= 3
+        assert broker.get_stats()["inline_fetches"] == 0
+        assert max(worst) < 0.05  # never waited on the 100 ms credential
+
+    def test_expired_token_fetched_inline(self, make_broker):
+        credential = FakeCredential(lifetime_s=0.0)
+        broker = make_broker(credential, min_validity_s=0.0)
+
+        broker.get_token(SCOPE)
+
+        assert credential.calls >= 1
+        assert broker.get_stats()["inline_fetches"] == 1
+
+
+class TestSingleFlight:
+    def test_concurrent_force_refreshes_share_one_call(self, make_broker):
+        credential = FakeCredential(latency_s=0.1)
+        broker = make_broker(credential)
+        broker.force_refresh(SCOPE)
+        calls_before = credential.calls
+        joined_before = broker.get_stats()["joined_fetches"]
+        barrier = threading.Barrier(8)
+        results = []
+
+        def _force():
+            barrier.wait()
+            results.append(broker.force_refresh(SCOPE))
+
+        threads = [threading.Thread(target=_force) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert credential.calls - calls_before == 1
+        assert len({token.token for token in results}) == 1
+        assert broker.get_stats()["joined_fetches"] - joined_before == 7
+
+
+class TestBackoff:
+    def test_failures_back_off_and_recover(self, make_broker, monkeypatch):
+        monkeypatch.setattr(broker_module.random, "uniform", lambda a, b: 1.0)
+        credential = FakeCredential()
+        credential.fail = True
+        broker = make_broker(credential, min_backoff_s=0.05, max_backoff_s=0.2)
+        broker.register(SCOPE)
+
+        time.sleep(0.6)
+        # 0, 50, 150, 350, 550 ms -> a handful of attempts, not a hot loop
+        assert 3 <= credential.calls <= 6
+        assert broker.get_stats()["scopes"][SCOPE]["failures"] == credential.calls
+
+        credential.fail = False
+        time.sleep(0.3)
+        assert broker.get_token(SCOPE).token.startswith("token-")
+        assert broker.get_stats()["scopes"][SCOPE]["failures"] == 0
+
+    def test_callers_fail_fast_while_backing_off(self, make_broker):
+        credential = FakeCredential(latency_s=0.05)
+        credential.fail = True
+        broker = make_broker(credential, min_backoff_s=10)
+        with pytest.raises(ConnectionError):
+            broker.force_refresh(SCOPE)
+        calls = credential.calls
+
+        start = time.perf_counter()
+        with pytest.raises(RuntimeError, match="backing off"):
+            broker.get_token(SCOPE)
+
+        assert time.perf_counter() - start < 0.01
+        assert credential.calls == calls
+
+
+class TestIntegration:
+    def test_bearer_token_provider(self, make_broker):
+        broker = make_broker(FakeCredential())
+
+        provider = broker.bearer_token_provider(SCOPE)
+
+        assert provider().startswith("token-")
+
+    def test_speech_manager_applies_broker_token(self, make_broker):
+        credential = FakeCredential()
+        broker = make_broker(credential)
+        manager = SpeechTokenManager(credential, "/subscriptions/x", broker=broker)
+        properties = {}
+        config = SimpleNamespace(
+            authorization_token=None,
+            set_property_by_name=lambda name, value: properties.__setitem__(name, value),
+        )
+
+        assert manager.warm_token()
+        manager.apply_to_config(config)
+        manager.apply_to_config(config)
+
+        assert config.authorization_token == "token-1"
+        assert properties["SpeechServiceConnection_AzureResourceId"] == "/subscriptions/x"
+        assert credential.calls == 1
+
+    async def test_lifecycle_stops_refresh_while_warmup_still_running(
+        self, make_broker, monkeypatch
+    ):
+        broker = make_broker(FakeCredential())
+        monkeypatch.setattr(broker_module, "get_token_broker", lru_cache(maxsize=1)(lambda: broker))
+        broker_module.get_token_broker().get_token(SCOPE)
+        assert broker._thread is not None
+
+        async def slow_warmup():
+            await asyncio.sleep(10)
+
+        manager = LifecycleManager()
+        register_token_broker_step(manager, SimpleNamespace(state=SimpleNamespace()))
+        manager.add_step("warmup", slow_warmup, depends_on=(), critical=False)
+        await manager.run_startup()
+        await manager.run_shutdown()
+
+        assert broker._thread is None
@@ -0,0 +1,170 @@
+"""
+Tests for manifest-driven lazy tool loading.
+
+Covers:
+- Schemas served from the manifest without importing tool modules
+- Module import on first execution (off the event loop) and on explicit preload
+- Eager fallback and broken-module handling
+- Committed manifest stays in sync with the tool modules
+"""
+
+import asyncio
+import json
+import subprocess
+import sys
+import textwrap
+
+import pytest
+from apps.artagent.backend.registries.toolstore import registry
+
+MODULE = "lazy_tool_pack_for_tests"
+
+
+@pytest.fixture
+def isolated_registry(tmp_path, monkeypatch):
+    """Empty registry pointed at a temporary manifest and tool module."""
+    saved = (dict(registry._TOOL_DEFINITIONS), dict(registry._MODULE_LOAD_TIMES), registry._INITIALIZED)
+    registry._TOOL_DEFINITIONS.clear()
+    registry._MODULE_LOAD_TIMES.clear()
+    registry._INITIALIZED = False
+
+    (tmp_path / f"{MODULE}.py").write_text(
+        textwrap.dedent(
+            """
+            from apps.artagent.backend.registries.toolstore.registry import register_tool
+
+            register_tool(
+                "lazy_echo",
+                {"name": "lazy_echo", "description": "Echo", "parameters": {"type": "object"}},
+                lambda args: {"success": True, "echo": args},
+                tags={"test"},
+            )
+            """
+        )
+    )
+    manifest = {
+        "version": 1,
+        "tools": [
+            {
+                "name": "lazy_echo",
+                "module": MODULE,
+                "is_handoff": False,
+                "tags": ["test"],
+                "schema": {"name": "lazy_echo", "description": "Echo", "parameters": {"type": "object"}},
+            },
+            {
+                "name": "broken_tool",
+                "module": "lazy_tool_pack_missing",
+                "is_handoff": True,
+                "tags": [],
+                "schema": {"name": "broken_tool", "description": "Broken"},
+            },
+        ],
+    }
+    manifest_path = tmp_path / "tool_manifest.json"
+    manifest_path.write_text(json.dumps(manifest))
+    monkeypatch.setattr(registry, "MANIFEST_PATH", manifest_path)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(sys.modules, MODULE, raising=False)
+    monkeypatch.delenv("TOOL_REGISTRY_LAZY", raising=False)
+
+    yield
+
+    sys.modules.pop(MODULE, None)
+    registry._TOOL_DEFINITIONS.clear()
+    registry._TOOL_DEFINITIONS.update(saved[0])
+    registry._MODULE_LOAD_TIMES.clear()
+    registry._MODULE_LOAD_TIMES.update(saved[1])
+    registry._INITIALIZED = saved[2]
+
+
+@pytest.mark.usefixtures("isolated_registry")
+class TestLazyLoading:
+    def test_schemas_served_without_import(self):
+        assert registry.initialize_tools() == 2
+
+        tools = registry.get_tools_for_agent(["lazy_echo"])
+
+        assert tools[0]["function"]["description"] == "Echo"
+        assert registry.is_handoff_tool("broken_tool")
+        assert MODULE not in sys.modules
+
+    async def test_first_execution_imports_module(self):
+        registry.initialize_tools()
+
+        result = await registry.execute_tool("lazy_echo", {"x": 1})
+
+        assert result == {"success": True, "echo": {"x": 1}}
+        assert MODULE in sys.modules
+        assert [m for m, _, _ in registry.get_tool_load_report()] == [MODULE]
+        assert registry.get_tool_definition("lazy_echo").tags == {"test"}
+
+    async def test_first_execution_import_does_not_block_loop(self, tmp_path):
+        (tmp_path / "lazy_slow_pack.py").write_text(
+            textwrap.dedent(
+                """
+                import time
+
+                from apps.artagent.backend.registries.toolstore.registry import register_tool
+
+                time.sleep(0.2)  # heavy SDK import
+                register_tool("slow_echo", {"name": "slow_echo"}, lambda args: {"ok": True})
+                """
+            )
+        )
+        registry._TOOL_DEFINITIONS["slow_echo"] = registry.ToolDefinition(
+            name="slow_echo", schema={"name": "slow_echo"}, executor=None, module="lazy_slow_pack"
+        )
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        ticking = asyncio.create_task(ticker())
+        try:
+            result = await registry.execute_tool("slow_echo", {})
+        finally:
+            ticking.cancel()
+            sys.modules.pop("lazy_slow_pack", None)
+
+        assert result == {"ok": True}
+        assert ticks >= 10  # the loop kept running during the 200 ms import
+
+    def test_load_tools_preloads_declared_modules(self):
+        registry.initialize_tools()
+
+        assert registry.load_tools(["lazy_echo", "unknown"]) == 1
+        assert registry.get_tool_definition("lazy_echo").executor is not None
+        # Already loaded: nothing left to import
+        assert registry.load_tools(["lazy_echo"]) == 0
+
+    async def test_broken_module_reports_failure(self):
+        registry.initialize_tools()
+
+        result = await registry.execute_tool("broken_tool", {})
+
+        assert result["success"] is False
+        assert registry.get_tool_executor("broken_tool") is None
+        assert registry.get_tool_load_report()[0][1] is None
+
+    def test_lazy_disabled_skips_manifest(self, monkeypatch):
+        monkeypatch.setenv("TOOL_REGISTRY_LAZY", "false")
+        monkeypatch.setattr(registry, "TOOL_MODULES", ())
+
+        assert registry.initialize_tools() == 0
+
+
+def test_manifest_matches_tool_modules():
+    """Regenerate with: python -m apps.artagent.backend.registries.toolstore.manifest --write"""
+    result = subprocess.run(
+        [sys.executable, "-m", "apps.artagent.backend.registries.toolstore.manifest"],
+        capture_output=True,
+        text=True,
+        timeout=300,
+    )
+    assert result.returncode == 0, result.stderr[-2000:]
+    committed = json.loads(registry.MANIFEST_PATH.read_text(encoding="utf-8"))
+    assert json.loads(result.stdout) == committed
@@ -0,0 +1,123 @@
+"""
+Tests for the incremental streaming TTS chunker.
+
+Covers:
+- Early clause-level first chunk, full sentences afterwards
+- Abbreviation, decimal and thousands-separator handling
+- Boundaries split across tokens
+- Parity with the stateless TTSTextProcessor helpers
+"""
+
+import pytest
+from apps.artagent.backend.voice.speech_cascade.tts_processor import (
+    StreamingTTSChunker,
+    TTSTextProcessor,
+)
+
+
+def _stream(text: str, chunker: StreamingTTSChunker | None = None, size: int = 3) -> list[str]:
+    chunker = chunker or StreamingTTSChunker()
+    chunks: list[str] = []
+    for i in range(0, len(text), size):
+        chunks.extend(chunker.feed(text[i : i + size]))
+    tail = chunker.flush()
+    if tail:
+        chunks.append(tail)
+    return chunks
+
+
+class TestFirstChunk:
+    def test_first_chunk_ends_at_clause_once_min_words_reached(self):
+        chunks = _stream(
+            "I can see your policy here, and I am pulling up your claim details now. "
+            "It was filed yesterday, which is great."
+        )
+        assert chunks[0] == "I can see your policy here, "
+        assert chunks[1] == "and I am pulling up your claim details now. "
+        # After the first chunk only full sentences are emitted
+        assert chunks[2] == "It was filed yesterday, which is great."
+
+    def test_short_leading_clause_is_not_split(self):
+        chunks = _stream("Sure, let me check that for you. One moment.")
+        assert chunks == ["Sure, let me check that for you. ", "One moment."]
+
+    def test_conjunction_boundary(self):
+        chunks = _stream("Your payment went through last night but the balance may lag.")
+        assert chunks[0] == "Your payment went through last night "
+
+    def test_adaptive_first_chunk_can_be_disabled(self):
+        chunker = StreamingTTSChunker(adaptive_first_chunk=False)
+        chunks = _stream("I can see your policy here, and the claim too. Done.", chunker)
+        assert chunks == ["I can see your policy here, and the claim too. ", "Done."]
+
+
+class TestSentenceBoundaries:
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "Dr. Smith will call you at 3 p.m. tomorrow.",
+            "The total is $1,000.50 for this month.",
+            "Meet me at 10:30 near St. Mary's hospital.",
+            "We cover many perils, e.g. fire, theft and flooding.",
+            "Your claim is No. 5 in the queue.",
+            "The invoice from Acme Co. Ltd arrived on Jan. 3 as expected.",
+        ],
+    )
+    def test_no_false_splits(self, text):
+        chunker = StreamingTTSChunker(adaptive_first_chunk=False)
+        assert _stream(text, chunker) == [text]
+
+    @pytest.mark.parametrize(
+        "text, expected",
+        [
+            (
+                "The answer is no. Let me check that for you.",
+                ["The answer is no. ", "Let me check that for you."],
+            ),
+            ("No. I cannot do that.", ["No. ", "I cannot do that."]),
+            ("We are open until Sat. Is that okay?", ["We are open until Sat. ", "Is that okay?"]),
+            (
+                "Bring forms, IDs, etc. Then we can start.",
+                ["Bring forms, IDs, etc. ", "Then we can start."],
+            ),
+        ],
+    )
+    def test_sentence_final_words_still_split(self, text, expected):
+        chunker = StreamingTTSChunker(adaptive_first_chunk=False)
+        assert _stream(text, chunker) == expected
+
+    def test_quoted_sentence_end(self):
+        chunker = StreamingTTSChunker(adaptive_first_chunk=False)
+        assert _stream('He said "yes." Then he left.', chunker) == [
+            'He said "yes." ',
+            "Then he left.",
+        ]
+
+    @pytest.mark.parametrize("size", [1, 2, 5, 50])
+    def test_token_size_does_not_change_output(self, size):
+        text = "Sure thing, I found two accounts for you. Savings has $12.50. Checking is empty!"
+        assert _stream(text, size=size) == _stream(text, size=len(text))
+
+    def test_markdown_formatting_removed(self):
+        chunks = _stream("Your **deductible** is `$500`. Anything else?")
+        assert "*" not in "".join(chunks) and "`" not in "".join(chunks)
+        assert len(chunks) == 2
+
+
+class TestStatelessHelpers:
+    def test_process_streaming_text_matches_chunker(self):
+        buffer = ""
+        sentences: list[str] = []
+        for token in ["Hello Dr. ", "Who. How ", "are you? Fine"]:
+            ready, buffer = TTSTextProcessor.process_streaming_text(token, buffer)
+            sentences.extend(ready)
+        assert sentences == ["Hello Dr. Who. ", "How are you? "]
+        assert buffer == "Fine"
+
+    def test_find_tts_boundary_splits_after_sentence_final_no(self):
+        assert TTSTextProcessor.find_tts_boundary("I said no. Then ok", ".!?", 0) == 9
+        assert TTSTextProcessor.find_tts_boundary("Item No. 5 is ready. Ok", ".!?", 0) == 19
+
+    def test_find_tts_boundary_skips_abbreviations(self):
+        text = "Mr. Jones is here. Thanks."
+        assert TTSTextProcessor.find_tts_boundary(text) == text.index("here.") + 4
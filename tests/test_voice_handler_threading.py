@@ -14,8 +14,8 @@ in voice handler components:
 3. Audio Resampling: Tests resampling quality with anti-aliasing filter,
    ensuring correct sample rate conversion without artifacts.
 
-4. Queue Thread Safety: Validates atomic queue eviction with threading.Lock
-   to prevent race conditions during concurrent access.
+4. Queue Thread Safety: Validates the lock-free SpeechEventChannel hand-off
+   from Speech SDK threads (finals never dropped, partials coalesced).
 
 Run with: pytest tests/test_voice_handler_threading.py -v
 """
@@ -320,15 +320,25 @@ class TestAudioResampling:
 
 
 class TestQueueEvictionThreadSafety:
-    """Tests for Issue 4: Thread-safe queue eviction in ThreadBridge."""
+    """Tests for Issue 4: Thread-safe speech event hand-off in ThreadBridge."""
 
-    def test_thread_bridge_has_queue_lock(self):
-        """ThreadBridge should have _queue_lock for atomic eviction."""
-        from apps.artagent.backend.voice.speech_cascade.handler import ThreadBridge
+    def test_thread_bridge_uses_speech_event_channel(self):
+        """ThreadBridge should hand events to a SpeechEventChannel without locking."""
+        from apps.artagent.backend.voice.speech_cascade.handler import (
+            SpeechEvent,
+            SpeechEventChannel,
+            SpeechEventType,
+            ThreadBridge,
+        )
 
         bridge = ThreadBridge()
-        assert hasattr(bridge, "_queue_lock")
-        assert isinstance(bridge._queue_lock, type(threading.Lock()))
+        channel = SpeechEventChannel(maxsize=10)
+        event = SpeechEvent(event_type=SpeechEventType.FINAL, text="Hello")
+
+        bridge.queue_speech_result(channel, event)
+
+        assert not hasattr(bridge, "_queue_lock")
+        assert channel.get_nowait() is event
 
     def test_queue_speech_result_basic(self):
         """queue_speech_result should enqueue events correctly."""
@@ -381,37 +391,34 @@ class TestQueueEvictionThreadSafety:
         # Queue should still have only the original event
         assert queue.qsize() == 1
 
-    def test_queue_eviction_prioritizes_important_events(self):
-        """Important events should evict PARTIAL events when queue is full."""
+    def test_channel_never_drops_important_events(self):
+        """Finals are kept past maxsize; partials coalesce instead of taking slots."""
         from apps.artagent.backend.voice.speech_cascade.handler import (
             ThreadBridge,
             SpeechEvent,
+            SpeechEventChannel,
             SpeechEventType,
         )
 
         bridge = ThreadBridge()
-        queue = asyncio.Queue(maxsize=1)
+        channel = SpeechEventChannel(maxsize=1)
 
-        # Fill queue with PARTIAL
-        partial = SpeechEvent(
-            event_type=SpeechEventType.PARTIAL,
-            text="Partial",
-            confidence=0.5,
+        bridge.queue_speech_result(
+            channel, SpeechEvent(event_type=SpeechEventType.PARTIAL, text="Partial")
         )
-        queue.put_nowait(partial)
-
-        # Add FINAL (should evict PARTIAL)
-        final = SpeechEvent(
-            event_type=SpeechEventType.FINAL,
-            text="Final transcript",
-            confidence=0.95,
+        for text in ("first", "second"):
+            bridge.queue_speech_result(
+                channel, SpeechEvent(event_type=SpeechEventType.FINAL, text=text)
+            )
+        bridge.queue_speech_result(
+            channel, SpeechEvent(event_type=SpeechEventType.ERROR, text="shed")
         )
-        bridge.queue_speech_result(queue, final)
 
-        # Queue should have FINAL event
-        assert queue.qsize() == 1
-        queued_event = queue.get_nowait()
-        assert queued_event.event_type == SpeechEventType.FINAL
+        assert [channel.get_nowait().text for _ in range(channel.qsize())] == [
+            "first",
+            "second",
+        ]
+        assert channel.get_stats()["dropped"] == 1
 
     def test_concurrent_queue_access(self):
         """Multiple threads should safely queue events without corruption."""
@@ -0,0 +1,155 @@
+"""
+Tests for change-aware VoiceLive session instruction updates.
+
+Covers:
+- Unchanged instructions skip session.update
+- Base prompt re-rendered only when a referenced template variable changes
+- Handoff instructions built once per scenario
+- Incremental conversation recap keeps the original format
+- Agent switches invalidate the last-sent instructions
+"""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+from apps.artagent.backend.voice.voicelive.instructions import InstructionComposer
+from apps.artagent.backend.voice.voicelive.orchestrator import LiveOrchestrator
+
+
+class _Agent:
+    """UnifiedAgent stand-in counting prompt renders."""
+
+    def __init__(self, name: str, prompt_template: str):
+        self.name = name
+        self.prompt_template = prompt_template
+        self.renders = 0
+
+    def render_prompt(self, context):
+        from jinja2 import Template
+
+        self.renders += 1
+        return Template(self.prompt_template).render(**context)
+
+
+class _Scenario:
+    def __init__(self):
+        self.builds = 0
+
+    def build_handoff_instructions(self, agent_name):
+        self.builds += 1
+        return f"Hand off from {agent_name} when asked."
+
+
+def _orchestrator(template: str = "You are {{ active_agent }} helping {{ caller_name }}."):
+    conn = MagicMock()
+    conn.session.update = AsyncMock()
+    agent = _Agent("Concierge", template)
+    orchestrator = LiveOrchestrator(
+        conn=conn,
+        agents={"Concierge": SimpleNamespace(name="Concierge", _agent=agent)},
+        start_agent="Concierge",
+    )
+    scenario = _Scenario()
+    orchestrator._cached_orchestrator_config = SimpleNamespace(scenario=scenario, scenario_name="banking")
+    return orchestrator, conn, agent, scenario
+
+
+class TestSkipUnchanged:
+    async def test_unchanged_context_skips_update(self):
+        orchestrator, conn, agent, _ = _orchestrator()
+        orchestrator._system_vars = {"caller_name": "Ada"}
+
+        for _ in range(3):
+            await orchestrator._update_session_context()
+
+        assert conn.session.update.await_count == 1
+        stats = orchestrator._instruction_composer.get_stats()
+        assert stats["sent"] == 1 and stats["skipped"] == 2
+        assert stats["bytes_saved"] > 0
+        assert agent.renders == 1
+
+    async def test_new_user_message_is_sent_without_rerender(self):
+        orchestrator, conn, agent, _ = _orchestrator()
+        await orchestrator._update_session_context()
+
+        orchestrator._user_message_history.append("I lost my card")
+        await orchestrator._update_session_context()
+
+        assert conn.session.update.await_count == 2
+        sent = conn.session.update.await_args.kwargs["session"].instructions
+        assert '1. "I lost my card"' in sent
+        assert agent.renders == 1  # template doesn't read recent_user_messages
+
+    async def test_agent_switch_invalidates(self):
+        orchestrator, conn, _, _ = _orchestrator()
+        await orchestrator._update_session_context()
+
+        orchestrator._instruction_composer.invalidate()  # as _switch_to does
+        await orchestrator._update_session_context()
+
+        assert conn.session.update.await_count == 2
+
+    async def test_update_scenario_clears_cached_sections(self):
+        orchestrator, _, _, _ = _orchestrator()
+        await orchestrator._update_session_context()
+
+        orchestrator.update_scenario(
+            agents=orchestrator.agents, handoff_map={}, start_agent="Concierge"
+        )
+
+        assert orchestrator._instruction_composer.get_stats()["base_renders"] == 1
+        assert not orchestrator._instruction_composer._base
+        orchestrator.cleanup()
+
+
+class TestComposerSections:
+    def test_referenced_variable_change_rerenders(self):
+        composer = InstructionComposer()
+        agent = _Agent("Concierge", "Hello {{ caller_name }}")
+
+        composer.base_instructions(agent, {"caller_name": "Ada", "slots": {}})
+        composer.base_instructions(agent, {"caller_name": "Ada", "slots": {"a": 1}})
+        assert agent.renders == 1
+
+        assert composer.base_instructions(agent, {"caller_name": "Grace"}) == "Hello Grace"
+        assert agent.renders == 2
+
+    def test_handoff_built_once_per_scenario(self):
+        composer = InstructionComposer()
+        first, second = _Scenario(), _Scenario()
+
+        for _ in range(3):
+            composer.handoff_instructions(first, "Concierge")
+        composer.handoff_instructions(second, "Concierge")
+
+        assert first.builds == 1
+        assert second.builds == 1
+
+    def test_recap_matches_original_format(self):
+        composer = InstructionComposer()
+
+        recap = composer.conversation_recap(
+            ["hi", "my card"], {"name": "Ada", "empty": ""}, "x" * 250
+        )
+
+        assert recap == (
+            "## CONVERSATION CONTEXT (DO NOT FORGET)\n"
+            "The user has said the following in this conversation:\n"
+            '  1. "hi"\n'
+            '  2. "my card"\n'
+            "\n"
+            "IMPORTANT: Remember and refer back to what the user has already told you. "
+            "Do NOT ask them to repeat information they've already provided.\n"
+            "\n"
+            "## COLLECTED INFORMATION\n"
+            "  - name: Ada\n"
+            "\n"
+            "## YOUR LAST RESPONSE\n"
+            f'You last said: "{"x" * 200}..."'
+        )
+
+    def test_recap_without_history(self):
+        composer = InstructionComposer()
+
+        assert composer.conversation_recap([], {}, None) == ""
+        assert composer.conversation_recap([], {"a": 1}, None) == "\n## COLLECTED INFORMATION\n  - a: 1"
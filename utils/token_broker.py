@@ -0,0 +1,237 @@
+"""
+Proactive Azure AD token broker.
+
+Tokens for every registered scope (Speech, Azure OpenAI, Redis, ...) are
+refreshed by one background thread well before they expire, so callers on the
+synthesis/recognition path read a cached token without taking a lock or
+waiting on the identity endpoint.
+
+- ``get_token`` serves the cached token while it has at least
+  ``min_validity_s`` left; only a missing or expired token is fetched inline.
+- Concurrent fetches for the same scope (inline or ``force_refresh``) share a
+  single credential call.
+- Failed refreshes are retried with capped exponential backoff; while a scope
+  is backing off and has no usable token, callers fail fast instead of piling
+  onto the identity endpoint.
+"""
+
+from __future__ import annotations
+
+import os
+import random
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future
+from functools import lru_cache
+
+from azure.core.credentials import AccessToken, TokenCredential
+
+from utils.azure_auth import get_credential
+from utils.ml_logging import get_logger
+
+logger = get_logger("utils.token_broker")
+
+# Refresh this long before expiry (or at half-life for short-lived tokens)
+_REFRESH_MARGIN_SEC = float(os.getenv("AZURE_TOKEN_REFRESH_MARGIN_SEC", "300"))
+# Cap for the retry delay after failed refreshes
+_REFRESH_MAX_BACKOFF_SEC = float(os.getenv("AZURE_TOKEN_REFRESH_MAX_BACKOFF_SEC", "60"))
+
+
+class TokenBroker:
+    """Caches AAD tokens per scope and refreshes them ahead of expiry."""
+
+    def __init__(
+        self,
+        credential: TokenCredential,
+        *,
+        refresh_margin_s: float = _REFRESH_MARGIN_SEC,
+        min_validity_s: float = 120.0,
+        min_backoff_s: float = 1.0,
+        max_backoff_s: float = _REFRESH_MAX_BACKOFF_SEC,
+    ) -> None:
+        self._credential = credential
+        self._refresh_margin_s = refresh_margin_s
+        self._min_validity_s = min_validity_s
+        self._min_backoff_s = min_backoff_s
+        self._max_backoff_s = max_backoff_s
+
+        # Read without locking on the hot path; entries are replaced, never mutated
+        self._tokens: dict[str, AccessToken] = {}
+        # Scheduling state, guarded by _lock (never held across a credential call)
+        self._lock = threading.Lock()
+        self._refresh_at: dict[str, float] = {}
+        self._failures: dict[str, int] = {}
+        self._last_error: dict[str, BaseException] = {}
+        self._flights: dict[str, Future] = {}
+
+        self._wake = threading.Event()
+        self._stopped = False
+        self._thread: threading.Thread | None = None
+
+        self.fetches = 0
+        self.inline_fetches = 0
+        self.joined_fetches = 0
+        self.failed_fetches = 0
+
+    # ------------------------------------------------------------------ #
+    # Public API
+    # ------------------------------------------------------------------ #
+
+    def register(self, scope: str) -> None:
+        """Keep ``scope`` refreshed in the background; fetched right away if new."""
+        with self._lock:
+            if scope in self._refresh_at:
+                return
+            self._refresh_at[scope] = 0.0
+        self.start()
+        self._wake.set()
+
+    def get_token(self, scope: str) -> AccessToken:
+        """Return a token for ``scope`` with at least ``min_validity_s`` left."""
+        token = self._tokens.get(scope)
+        if token is not None and token.expires_on - self._min_validity_s > time.time():
+            return token
+
+        if scope not in self._refresh_at:
+            self.register(scope)
+        elif self._failures.get(scope) and self._refresh_at.get(scope, 0.0) > time.time():
+            raise RuntimeError(
+                f"No valid token for {scope}; identity endpoint is backing off"
+            ) from self._last_error.get(scope)
+        self.inline_fetches += 1
+        return self._fetch(scope)
+
+    def force_refresh(self, scope: str) -> AccessToken:
+        """Fetch a new token now; concurrent callers share one credential call."""
+        if scope not in self._refresh_at:
+            self.register(scope)
+        return self._fetch(scope)
+
+    def bearer_token_provider(self, scope: str) -> Callable[[], str]:
+        """Drop-in for ``azure.identity.get_bearer_token_provider`` backed by this broker."""
+        self.register(scope)
+
+        def _provider() -> str:
+            return self.get_token(scope).token
+
+        return _provider
+
+    def start(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stopped = False
+        self._thread = threading.Thread(target=self._run, name="token-broker", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        self._stopped = True
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def get_stats(self) -> dict[str, object]:
+        now = time.time()
+        with self._lock:
+            schedule = dict(self._refresh_at)
+        scopes = {}
+        for scope, refresh_at in schedule.items():
+            token = self._tokens.get(scope)
+            scopes[scope] = {
+                "expires_in_s": round(token.expires_on - now, 1) if token else None,
+                "refresh_in_s": round(refresh_at - now, 1),
+                "failures": self._failures.get(scope, 0),
+            }
+        return {
+            "scopes": scopes,
+            "fetches": self.fetches,
+            "inline_fetches": self.inline_fetches,
+            "joined_fetches": self.joined_fetches,
+            "failed_fetches": self.failed_fetches,
+        }
+
+    # ------------------------------------------------------------------ #
+    # Fetching
+    # ------------------------------------------------------------------ #
+
+    def _fetch(self, scope: str, *, only_if_due: bool = False) -> AccessToken | None:
+        with self._lock:
+            flight = self._flights.get(scope)
+            if flight is None and only_if_due and self._refresh_at.get(scope, 0.0) > time.time():
+                return None  # refreshed by another caller since the scope came due
+            leader = flight is None
+            if leader:
+                flight = self._flights[scope] = Future()
+            else:
+                self.joined_fetches += 1
+        if not leader:
+            return flight.result()
+
+        try:
+            self.fetches += 1
+            token = self._credential.get_token(scope)
+        except BaseException as exc:
+            self._record_failure(scope, exc)
+            flight.set_exception(exc)
+            raise
+        else:
+            self._record_success(scope, token)
+            flight.set_result(token)
+            return token
+        finally:
+            with self._lock:
+                self._flights.pop(scope, None)
+
+    def _record_success(self, scope: str, token: AccessToken) -> None:
+        now = time.time()
+        lifetime = max(0.0, token.expires_on - now)
+        self._tokens[scope] = token
+        with self._lock:
+            self._failures.pop(scope, None)
+            self._last_error.pop(scope, None)
+            self._refresh_at[scope] = now + max(lifetime - self._refresh_margin_s, lifetime / 2)
+        self._wake.set()
+
+    def _record_failure(self, scope: str, exc: BaseException) -> None:
+        self.failed_fetches += 1
+        with self._lock:
+            failures = self._failures.get(scope, 0) + 1
+            self._failures[scope] = failures
+            self._last_error[scope] = exc
+            delay = min(self._max_backoff_s, self._min_backoff_s * 2 ** (failures - 1))
+            self._refresh_at[scope] = time.time() + delay * random.uniform(0.5, 1.0)
+        logger.warning("Token refresh for %s failed (attempt %d): %s", scope, failures, exc)
+        self._wake.set()
+
+    # ------------------------------------------------------------------ #
+    # Background refresh
+    # ------------------------------------------------------------------ #
+
+    def _run(self) -> None:
+        while not self._stopped:
+            now = time.time()
+            with self._lock:
+                due = [scope for scope, at in self._refresh_at.items() if at <= now]
+            for scope in due:
+                if self._stopped:
+                    return
+                try:
+                    if self._fetch(scope, only_if_due=True) is not None:
+                        logger.debug("Refreshed token for %s in background", scope)
+                except Exception:
+                    pass  # logged and rescheduled by _record_failure
+
+            with self._lock:
+                next_at = min(self._refresh_at.values(), default=now + self._max_backoff_s)
+            self._wake.wait(max(0.0, next_at - time.time()))
+            self._wake.clear()
+
+
+@lru_cache(maxsize=1)
+def get_token_broker() -> TokenBroker:
+    """Return the shared broker for the process-wide Azure credential."""
+    return TokenBroker(get_credential())
+
+
+__all__ = ["TokenBroker", "get_token_broker"]